@@ -83,6 +83,41 @@ def _require_sdk():
     return sdk
 
 
+def is_python_executable(path):
+    """True if ``path`` names a Python interpreter rather than a host binary."""
+    name = Path(path).name.lower()
+    return name in {
+        "python",
+        "python3",
+        "python.exe",
+        "pythonw.exe",
+        "termin_python",
+        "termin_python.exe",
+    } or name.startswith("python3.")
+
+
+def sdk_python_executable(prefix_root):
+    """The Python interpreter bundled with the SDK at ``prefix_root``, or None."""
+    prefix_root = Path(prefix_root)
+    if sys.platform == "win32":
+        candidates = (
+            prefix_root / "python" / "python.exe",
+            prefix_root / "bin" / "python.exe",
+            prefix_root / "bin" / "termin_python.exe",
+        )
+    else:
+        candidates = (
+            prefix_root / "bin" / "termin_python",
+            prefix_root / "bin" / "python3",
+            prefix_root / "bin" / "python",
+        )
+
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
 def _caller_lib_dirs():
     dirs = []
     try:
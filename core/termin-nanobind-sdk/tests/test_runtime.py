@@ -113,3 +113,27 @@ def test_windows_dll_directory_handles_are_retained_idempotently_and_can_close(t
 
     assert runtime._windows_dll_directory_handles == {}
     assert all(handle.closed for handle in handles)
+
+
+def test_sdk_python_discovery_prefers_venv_capable_windows_runtime(tmp_path: Path) -> None:
+    launcher_name = "termin_python.exe" if runtime.sys.platform == "win32" else "termin_python"
+    launcher = tmp_path / "bin" / launcher_name
+    launcher.parent.mkdir()
+    launcher.touch()
+
+    expected = launcher
+    if runtime.sys.platform == "win32":
+        expected = tmp_path / "python" / "python.exe"
+        expected.parent.mkdir()
+        expected.touch()
+
+    assert runtime.sdk_python_executable(tmp_path) == expected
+    assert runtime.is_python_executable(launcher)
+
+
+def test_sdk_python_discovery_does_not_accept_arbitrary_host(tmp_path: Path) -> None:
+    executable = tmp_path / "not-python"
+    executable.touch()
+
+    assert runtime.sdk_python_executable(tmp_path) is None
+    assert not runtime.is_python_executable(executable)
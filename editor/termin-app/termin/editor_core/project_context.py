@@ -13,11 +13,14 @@ def set_current_project_path(path: str | Path | None) -> None:
     _current_project_path = Path(path).resolve() if path is not None else None
 
     from termin.artifacts import ArtifactStore, set_artifact_store
+    from termin_assets import DerivedDataCache, set_derived_data_cache
 
     if _current_project_path is None:
         set_artifact_store(None)
+        set_derived_data_cache(None)
     else:
         set_artifact_store(ArtifactStore(_current_project_path))
+        set_derived_data_cache(DerivedDataCache(_current_project_path))
 
 
 def current_project_path() -> Path | None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
@@ -19,6 +20,9 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Preload threads for the initial project scan: file reads and JSON parsing
+EDITOR_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def _termin_editor_ignored_roots(project_root: Path) -> tuple[Path, ...]:
     from termin.project.ignored_paths import project_ignored_roots
@@ -33,6 +37,8 @@ class ProjectFileWatcher(BaseProjectFileWatcher):
         super().__init__(
             on_resource_reloaded=on_resource_reloaded,
             ignored_roots_provider=_termin_editor_ignored_roots,
+            scan_workers=EDITOR_SCAN_WORKERS,
+            use_scan_index=True,
         )
 
 
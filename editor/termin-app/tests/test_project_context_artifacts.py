@@ -15,3 +15,15 @@ def test_project_context_owns_artifact_store_instance(tmp_path):
     set_current_project_path(None)
     assert current_artifact_store() is None
     assert current_project_path() is None
+
+
+def test_project_context_owns_derived_data_cache(tmp_path):
+    from termin_assets import current_derived_data_cache
+
+    set_current_project_path(tmp_path)
+    cache = current_derived_data_cache()
+    assert cache is not None
+    assert cache.root == tmp_path.resolve() / ".termin" / "derived-data"
+
+    set_current_project_path(None)
+    assert current_derived_data_cache() is None
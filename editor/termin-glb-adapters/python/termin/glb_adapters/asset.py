@@ -13,11 +13,16 @@ from termin_assets import DataAsset, EmbeddedAssetSpec, get_resource_manager
 
 if TYPE_CHECKING:
     from termin_assets import Asset
-    from termin.glb.loader import GLBSceneData
+    from termin.glb.loader import GLBSceneData, GLBMeshData
+    from termin.glb_adapters.instantiator import MeshBuffers
     from termin.default_assets.mesh.asset import MeshAsset
     from termin.default_assets.animation.asset import AnimationClipAsset
     from termin.default_assets.skeleton.asset import SkeletonAsset
 
+# Bump when the Python-loader mesh buffers change: cached derived data of
+# older importers is then ignored.
+GLB_MESH_IMPORTER_VERSION = 1
+
 
 class GLBResourceManager(Protocol):
     """Resource-manager surface needed by GLB child asset registration."""
@@ -63,6 +68,9 @@ class GLBAsset(DataAsset["GLBSceneData"]):
         # JSON glTF keeps the Python external-resource loader. A concrete value
         # is an explicit migration override and never an error fallback.
         self._import_backend_override: Literal["python", "cgltf"] | None = None
+        # Hash of the document and its external buffers, set by the Python
+        # loader path when a derived-data cache is configured
+        self._derived_source_digest: str | None = None
 
         # Child assets (created during spec parsing)
         self._mesh_assets: Dict[str, "MeshAsset"] = {}
@@ -299,6 +307,19 @@ class GLBAsset(DataAsset["GLBSceneData"]):
 
     def _parse_content(self, content: bytes) -> "GLBSceneData | None":
         """Parse GLB/glTF content."""
+        return self._parse_decoded(self._decode_content(content))
+
+    def _parse_decoded(self, decoded: "tuple[GLBSceneData, str | None]") -> "GLBSceneData | None":
+        """Adopt a decoded scene; child resources are published in _on_loaded()."""
+        scene_data, self._derived_source_digest = decoded
+        return scene_data
+
+    def _decode_content(self, content: bytes) -> "tuple[GLBSceneData, str | None]":
+        """Parse GLB/glTF content into scene data (worker-thread safe).
+
+        Returns the scene and the derived-data source digest (None when no
+        derived-data cache is configured or for the native backend).
+        """
         if self._effective_import_backend() == "cgltf":
             from termin.glb.native import NativeGLBDocument, NativeGLBSceneData
 
@@ -309,29 +330,100 @@ class GLBAsset(DataAsset["GLBSceneData"]):
                     f"cgltf import currently supports binary .glb only: {self._source_path}"
                 )
             document = NativeGLBDocument(self._source_path)
-            return NativeGLBSceneData(
+            scene_data = NativeGLBSceneData(
                 document,
                 normalize_scale=self._normalize_scale,
                 convert_to_z_up=self._convert_to_z_up,
                 blender_z_up_fix=self._blender_z_up_fix,
             )
+            return scene_data, None
 
         from termin.glb.loader import load_glb_file_from_buffer, load_glb_file_normalized
+        from termin_assets import current_derived_data_cache
+
+        source_digest = None
+        if current_derived_data_cache() is not None and content:
+            source_digest = self._source_digest(content)
 
         if self._source_path is not None:
-            return load_glb_file_normalized(
+            scene_data = load_glb_file_normalized(
                 self._source_path,
                 normalize_scale=self._normalize_scale,
                 convert_to_z_up=self._convert_to_z_up,
                 blender_z_up_fix=self._blender_z_up_fix,
             )
+        else:
+            scene_data = load_glb_file_from_buffer(
+                content,
+                normalize_scale=self._normalize_scale,
+                convert_to_z_up=self._convert_to_z_up,
+                blender_z_up_fix=self._blender_z_up_fix,
+            )
+        return scene_data, source_digest
+
+    def _source_digest(self, content: bytes) -> str:
+        """Hash the glTF document together with the external buffers it references."""
+        import json
+        from urllib.parse import unquote
+
+        from termin_assets import derived_data_key
+
+        if content[:4] == b"glTF":
+            json_length = int.from_bytes(content[12:16], "little")
+            document = json.loads(content[20:20 + json_length])
+        else:
+            document = json.loads(content)
+
+        external_buffers = []
+        for buffer in document.get("buffers", []):
+            uri = buffer.get("uri")
+            if not uri or uri.startswith("data:"):
+                continue
+            if self._source_path is None:
+                raise RuntimeError(f"External glTF buffer '{uri}' requires a source path")
+            external_buffers.append((self._source_path.parent / unquote(uri)).read_bytes())
+        return derived_data_key("gltf-source", 1, {}, content, *external_buffers)
 
-        return load_glb_file_from_buffer(
-            content,
-            normalize_scale=self._normalize_scale,
-            convert_to_z_up=self._convert_to_z_up,
-            blender_z_up_fix=self._blender_z_up_fix,
+    def _derived_mesh_buffers(self, mesh_index: int, glb_mesh: "GLBMeshData") -> "MeshBuffers | None":
+        """Upload buffers for one mesh, reused from the derived-data cache when possible.
+
+        Returns None when no cache is configured; the instantiator then
+        builds the buffers itself.
+        """
+        from termin_assets import current_derived_data_cache, derived_data_key
+        from termin.glb_adapters.instantiator import _glb_mesh_vertex_buffer
+
+        cache = current_derived_data_cache()
+        if cache is None or self._derived_source_digest is None:
+            return None
+
+        key = derived_data_key(
+            "glb-mesh",
+            GLB_MESH_IMPORTER_VERSION,
+            {
+                "normalize_scale": self._normalize_scale,
+                "convert_to_z_up": self._convert_to_z_up,
+                "blender_z_up_fix": self._blender_z_up_fix,
+                "mesh_index": mesh_index,
+                "mesh_name": glb_mesh.name,
+            },
+            self._derived_source_digest.encode("ascii"),
         )
+        entry = cache.load(key)
+        if entry is not None:
+            layout_name = entry.meta.get("layout")
+            vertices = entry.arrays.get("vertices")
+            indices = entry.arrays.get("indices")
+            if layout_name in ("pos_normal_uv", "pos_normal_uv_tangent", "skinned") and (
+                vertices is not None and indices is not None
+            ):
+                return vertices, indices, layout_name
+            cache.discard(key)
+
+        buffers = _glb_mesh_vertex_buffer(glb_mesh)
+        vertices, indices, layout_name = buffers
+        cache.store(key, {"vertices": vertices, "indices": indices}, {"layout": layout_name})
+        return buffers
 
     def _on_loaded(self) -> None:
         """After loading, create any missing child assets and populate all with data."""
@@ -398,16 +490,20 @@ class GLBAsset(DataAsset["GLBSceneData"]):
         # Populate mesh assets
         for mesh_name, asset in self._mesh_assets.items():
             with self._load_stage("publish-mesh", child=mesh_name):
-                for glb_mesh in self._data.meshes:
+                for mesh_index, glb_mesh in enumerate(self._data.meshes):
                     if glb_mesh.name == mesh_name:
                         tc_mesh = asset.cached_data
                         if tc_mesh is not None and tc_mesh.is_valid:
                             # Mesh was declared, populate existing entry
                             if not tc_mesh_is_loaded(tc_mesh):
-                                _populate_tc_mesh_from_glb(tc_mesh, glb_mesh)
+                                _populate_tc_mesh_from_glb(
+                                    tc_mesh, glb_mesh, self._derived_mesh_buffers(mesh_index, glb_mesh)
+                                )
                         else:
                             # Create new mesh entry with asset's UUID
-                            tc_mesh = _glb_mesh_to_tc_mesh(glb_mesh, asset.uuid)
+                            tc_mesh = _glb_mesh_to_tc_mesh(
+                                glb_mesh, asset.uuid, self._derived_mesh_buffers(mesh_index, glb_mesh)
+                            )
                         asset.set_runtime_data(tc_mesh, loaded=True)
                         break
 
@@ -50,6 +50,8 @@ class GLBTextureImport:
 
 
 TextureLookup = dict[tuple[int, TextureEncodingName], object]
+# (flat interleaved float32 vertices, flat uint32 indices, TcVertexLayout factory name)
+MeshBuffers = tuple[np.ndarray, np.ndarray, str]
 
 
 class SceneLike(Protocol):
@@ -186,15 +188,13 @@ def _glb_submeshes_to_tc(glb_mesh: "GLBMeshData"):
     ]
 
 
-def _glb_mesh_to_tc_mesh(glb_mesh: "GLBMeshData", uuid: str = "") -> "TcMesh":
-    """Convert GLBMeshData to TcMesh directly (no intermediate Mesh3).
+def _glb_mesh_vertex_buffer(glb_mesh: "GLBMeshData") -> MeshBuffers:
+    """Build the upload buffers for a GLB mesh.
 
-    Args:
-        glb_mesh: Mesh data from GLB file
-        uuid: Optional UUID to use for TcMesh (if empty, generates new)
+    Returns:
+        (flat float32 interleaved vertices, flat uint32 indices, name of the
+        TcVertexLayout factory describing the interleaving)
     """
-    from tmesh import TcMesh, TcVertexLayout
-
     vertices = glb_mesh.vertices.astype(np.float32)
     indices = glb_mesh.indices.astype(np.uint32).ravel()
     num_verts = len(vertices)
@@ -215,15 +215,13 @@ def _glb_mesh_to_tc_mesh(glb_mesh: "GLBMeshData", uuid: str = "") -> "TcMesh":
     tangents = _mesh_tangents_for_material_layout(glb_mesh, vertices, normals, uvs, indices)
     has_tangents = tangents is not None
 
-    is_skinned = glb_mesh.is_skinned
-
-    if is_skinned:
+    if glb_mesh.is_skinned:
         # Skinned layout: pos(3) + normal(3) + uv(2) + tangent(4) +
         # joints(4) + weights(4) = 20 floats = 80 bytes. tangent is
         # included so PBR shaders that declare `in vec4 a_tangent (loc=3)`
         # can pair with skinned meshes without Vulkan vertex-input
         # mismatch (see tgfx_vertex_layout_skinned in tgfx_types.c).
-        layout = TcVertexLayout.skinned()
+        layout_name = "skinned"
 
         joint_indices = glb_mesh.joint_indices.astype(np.float32)  # stored as float for GPU
         joint_weights = glb_mesh.joint_weights.astype(np.float32)
@@ -239,9 +237,8 @@ def _glb_mesh_to_tc_mesh(glb_mesh: "GLBMeshData", uuid: str = "") -> "TcMesh":
         buffer[:, 16:20] = joint_weights
     elif has_tangents:
         # Layout with tangents: pos(3) + normal(3) + uv(2) + tangent(4) = 12 floats = 48 bytes
-        layout = TcVertexLayout.pos_normal_uv_tangent()
+        layout_name = "pos_normal_uv_tangent"
 
-        # Build interleaved buffer
         buffer = np.zeros((num_verts, 12), dtype=np.float32)
         buffer[:, 0:3] = vertices
         buffer[:, 3:6] = normals
@@ -249,87 +246,54 @@ def _glb_mesh_to_tc_mesh(glb_mesh: "GLBMeshData", uuid: str = "") -> "TcMesh":
         buffer[:, 8:12] = tangents
     else:
         # Standard layout: pos(3) + normal(3) + uv(2) = 8 floats = 32 bytes
-        layout = TcVertexLayout.pos_normal_uv()
+        layout_name = "pos_normal_uv"
 
-        # Build interleaved buffer
         buffer = np.zeros((num_verts, 8), dtype=np.float32)
         buffer[:, 0:3] = vertices
         buffer[:, 3:6] = normals
         buffer[:, 6:8] = uvs
 
-    # Flatten buffer for TcMesh
-    buffer_flat = buffer.ravel().astype(np.float32)
+    return buffer.ravel(), indices, layout_name
+
+
+def _glb_mesh_to_tc_mesh(
+    glb_mesh: "GLBMeshData",
+    uuid: str = "",
+    buffers: MeshBuffers | None = None,
+) -> "TcMesh":
+    """Convert GLBMeshData to TcMesh directly (no intermediate Mesh3).
+
+    Args:
+        glb_mesh: Mesh data from GLB file
+        uuid: Optional UUID to use for TcMesh (if empty, generates new)
+        buffers: Prebuilt _glb_mesh_vertex_buffer() result (e.g. from the
+            derived-data cache); built from glb_mesh when omitted
+    """
+    from tmesh import TcMesh, TcVertexLayout
+
+    buffer_flat, indices, layout_name = buffers or _glb_mesh_vertex_buffer(glb_mesh)
+    layout = getattr(TcVertexLayout, layout_name)()
+    num_verts = buffer_flat.size * 4 // layout.stride
 
     return TcMesh.from_interleaved_with_submeshes(
         buffer_flat, num_verts, indices, layout, _glb_submeshes_to_tc(glb_mesh), glb_mesh.name, uuid
     )
 
 
-def _populate_tc_mesh_from_glb(tc_mesh: TcMesh, glb_mesh: "GLBMeshData") -> bool:
+def _populate_tc_mesh_from_glb(
+    tc_mesh: TcMesh,
+    glb_mesh: "GLBMeshData",
+    buffers: MeshBuffers | None = None,
+) -> bool:
     """Populate an existing declared TcMesh with data from GLBMeshData.
 
     Returns True if successful, False otherwise.
     """
     from tmesh import TcVertexLayout, tc_mesh_set_data, tc_mesh_set_submeshes
 
-    vertices = glb_mesh.vertices.astype(np.float32)
-    indices = glb_mesh.indices.astype(np.uint32).ravel()
-    num_verts = len(vertices)
-
-    # Compute normals if not provided
-    if glb_mesh.normals is not None:
-        normals = glb_mesh.normals.astype(np.float32)
-    else:
-        normals = _compute_vertex_normals(vertices, indices)
-
-    # UVs (default to zeros)
-    if glb_mesh.uvs is not None:
-        uvs = glb_mesh.uvs.astype(np.float32)
-    else:
-        uvs = np.zeros((num_verts, 2), dtype=np.float32)
-
-    # Tangents (optional in glTF, generated when normal+uv are available)
-    tangents = _mesh_tangents_for_material_layout(glb_mesh, vertices, normals, uvs, indices)
-    has_tangents = tangents is not None
-
-    is_skinned = glb_mesh.is_skinned
-
-    if is_skinned:
-        # Skinned layout: pos(3) + normal(3) + uv(2) + tangent(4) +
-        # joints(4) + weights(4) = 20 floats = 80 bytes. See _glb_mesh_to_tc_mesh.
-        layout = TcVertexLayout.skinned()
-
-        joint_indices = glb_mesh.joint_indices.astype(np.float32)
-        joint_weights = glb_mesh.joint_weights.astype(np.float32)
-
-        buffer = np.zeros((num_verts, 20), dtype=np.float32)
-        buffer[:, 0:3] = vertices
-        buffer[:, 3:6] = normals
-        buffer[:, 6:8] = uvs
-        if has_tangents:
-            buffer[:, 8:12] = tangents
-        # else: zeros — fragment shader handles vec3(0) tangent.
-        buffer[:, 12:16] = joint_indices
-        buffer[:, 16:20] = joint_weights
-    elif has_tangents:
-        # Layout with tangents: pos(3) + normal(3) + uv(2) + tangent(4) = 12 floats
-        layout = TcVertexLayout.pos_normal_uv_tangent()
-
-        buffer = np.zeros((num_verts, 12), dtype=np.float32)
-        buffer[:, 0:3] = vertices
-        buffer[:, 3:6] = normals
-        buffer[:, 6:8] = uvs
-        buffer[:, 8:12] = tangents
-    else:
-        # Standard layout: pos(3) + normal(3) + uv(2) = 8 floats
-        layout = TcVertexLayout.pos_normal_uv()
-
-        buffer = np.zeros((num_verts, 8), dtype=np.float32)
-        buffer[:, 0:3] = vertices
-        buffer[:, 3:6] = normals
-        buffer[:, 6:8] = uvs
-
-    buffer_flat = buffer.ravel().astype(np.float32)
+    buffer_flat, indices, layout_name = buffers or _glb_mesh_vertex_buffer(glb_mesh)
+    layout = getattr(TcVertexLayout, layout_name)()
+    num_verts = buffer_flat.size * 4 // layout.stride
 
     if not tc_mesh_set_data(tc_mesh, buffer_flat, num_verts, layout, indices, glb_mesh.name):
         return False
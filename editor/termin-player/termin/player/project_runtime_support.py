@@ -150,9 +150,12 @@ def create_asset_import_plugin_map():
 def scan_project_assets(project_path: str | Path, *, log_prefix: str) -> int:
     """Scan project directory for source assets and register them."""
     from tcbase import log
+    from termin_assets import DerivedDataCache, set_derived_data_cache
 
     project_path = Path(project_path)
     rm = DefaultResourceManager.instance()
+    # Importers reuse derived mesh data from earlier opens of this project
+    set_derived_data_cache(DerivedDataCache(project_path))
     ext_map = create_asset_import_plugin_map()
     ignored_roots = _project_asset_ignored_roots(project_path)
 
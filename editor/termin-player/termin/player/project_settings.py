@@ -11,6 +11,7 @@ import json
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from termin.project.memory_budgets import normalize_asset_memory_budgets
 from termin.project.resource_paths import (
     SERVICE_RESOURCE_IGNORE_PATHS as SERVICE_RESOURCE_IGNORE_PATHS,
     normalize_project_resource_paths,
@@ -68,6 +69,7 @@ class ProjectRuntimeSettings:
         default_factory=lambda: ("",) * PROJECT_RENDER_PHASE_CAPACITY
     )
     player_window: ProjectPlayerWindowSettings = field(default_factory=ProjectPlayerWindowSettings)
+    asset_memory_budgets_mib: dict[str, int] = field(default_factory=dict)
 
     @staticmethod
     def from_dict(data: dict[str, object]) -> "ProjectRuntimeSettings":
@@ -86,6 +88,11 @@ class ProjectRuntimeSettings:
             ),
             render_phase_names=_render_phase_names(data.get("render_phase_names")),
             player_window=ProjectPlayerWindowSettings.from_dict(data.get("player_window")),
+            asset_memory_budgets_mib=normalize_asset_memory_budgets(
+                data.get("asset_memory_budgets_mib"),
+                field_name="asset_memory_budgets_mib",
+                warning=lambda message: _log_warning(f"[PlayerProjectSettings] {message}"),
+            ),
         )
 
 
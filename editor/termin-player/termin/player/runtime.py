@@ -28,6 +28,9 @@ if TYPE_CHECKING:
 
 _active_runtime: "PlayerRuntime | None" = None
 
+# Seconds per frame spent installing assets whose background loads finished
+ASYNC_LOAD_FRAME_BUDGET = 0.004
+
 
 def active_runtime() -> "PlayerRuntime | None":
     """Return the PlayerRuntime currently executing on this thread, if any."""
@@ -254,6 +257,7 @@ class PlayerRuntime:
         from termin.default_assets.render.pipeline_reload_binding import PipelineReloadBinding
 
         self._resource_manager = DefaultResourceManager.instance()
+        self._apply_asset_memory_budgets()
         self._pipeline_reload_binding = PipelineReloadBinding(
             self._resource_manager,
             self._engine.rendering_manager,
@@ -685,17 +689,35 @@ class PlayerRuntime:
         if self._mcp_executor is not None:
             self._mcp_executor.process_pending()
 
+        # Native handles of background-loaded assets are installed here,
+        # on the thread that owns them, before the frame renders
+        if self._resource_manager is not None:
+            self._resource_manager.pump_async_loads(ASYNC_LOAD_FRAME_BUDGET)
+
         if self._engine is not None:
             self._engine.tick_and_render(self.delta_time)
             self._reconcile_primary_scene()
         self._present()
 
+        # Assets used this frame are now the most recent; over-budget types
+        # release their least recently used unreferenced data
+        if self._resource_manager is not None:
+            self._resource_manager.end_residency_frame()
+
         # Frame rate limiting
         frame_time = time.perf_counter() - current_time
         target_time = 1.0 / self.target_fps
         if frame_time < target_time:
             time.sleep(target_time - frame_time)
 
+    def _apply_asset_memory_budgets(self) -> None:
+        from tcbase import log
+
+        budgets = load_project_runtime_settings(self.project_path).asset_memory_budgets_mib
+        for type_id, budget_mib in budgets.items():
+            self._resource_manager.set_residency_budget(type_id, budget_mib * 1024 * 1024)
+            log.info(f"[PlayerRuntime] Asset memory budget: {type_id} = {budget_mib} MiB")
+
     def _present(self):
         """Present the display rendered by EngineCore."""
         if self.window is not None and self._display is not None:
@@ -784,6 +806,9 @@ class PlayerRuntime:
             self._mcp_server = None
         self._mcp_executor = None
 
+        if self._resource_manager is not None:
+            self._resource_manager.shutdown_async_loads()
+
         if self._pipeline_reload_binding is not None:
             try:
                 self._pipeline_reload_binding.close()
@@ -6,18 +6,33 @@ import json
 import os
 import gc
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from termin.project_build.runtime_package.project_index import ProjectResourceIndex
 
-def find_project_or_standard_shader(project_root: Path, shader_name: str) -> Path:
+
+def find_project_or_standard_shader(
+    project_root: Path,
+    shader_name: str,
+    project_index: ProjectResourceIndex | None = None,
+) -> Path:
     """Resolve project-deployed stdlib overrides before the SDK fallback."""
-    matches = sorted(
-        path
-        for path in project_root.rglob(f"{shader_name}.shader")
-        if not any(
-            part in {".git", "__pycache__", "build", "dist"}
-            for part in path.relative_to(project_root).parts
+    if project_index is not None:
+        matches = [
+            path
+            for path in project_index.paths_named(shader_name, ".shader")
+            if path.suffix == ".shader"
+        ]
+    else:
+        matches = sorted(
+            path
+            for path in project_root.rglob(f"{shader_name}.shader")
+            if not any(
+                part in {".git", "__pycache__", "build", "dist"}
+                for part in path.relative_to(project_root).parts
+            )
         )
-    )
     if matches:
         return matches[0]
 
@@ -0,0 +1,148 @@
+"""Input digests of exported runtime package resources for incremental export.
+
+An incremental export keeps the previous run's payload files and regenerates
+only resources whose inputs changed. Each reusable resource is recorded under
+a key such as ``mesh:<uuid>``: a digest of its inputs and the package files
+it produced. Inputs are source files (size and mtime), their ``.meta``
+sidecars (content) and any settings the writer passes as JSON data.
+
+Source files are not hashed: for a multi-gigabyte package reading every
+texture would cost as much as copying it. Sidecars are small and are hashed,
+so import setting edits are detected even under an unchanged timestamp.
+
+The state lives next to the package directory, not inside it, so it never
+ships with the package.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+
+EXPORT_STATE_VERSION = 1
+
+
+def export_state_path(package_dir: Path) -> Path:
+    return package_dir.parent / f"{package_dir.name}.export-state.json"
+
+
+def resource_inputs_digest(source_paths: Iterable[Path], data: Any = None) -> str:
+    """Digest of source file signatures, their sidecars and JSON ``data``."""
+    digest = hashlib.sha256()
+    digest.update(f"v{EXPORT_STATE_VERSION}\n".encode("utf-8"))
+    for source_path in source_paths:
+        stat = source_path.stat()
+        digest.update(f"{source_path}\n{stat.st_size}\n{stat.st_mtime_ns}\n".encode("utf-8"))
+        try:
+            digest.update(Path(f"{source_path}.meta").read_bytes())
+        except FileNotFoundError:
+            digest.update(b"no-meta")
+        digest.update(b"\n")
+    digest.update(json.dumps(data, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RuntimePackageExportState:
+    """Reusable resources of the previous export and those of the current one.
+
+    Writers ask ``reuse(key, inputs)`` before generating a resource. A match
+    keeps the previous files; a mismatch deletes them so a failed rewrite
+    cannot leave stale payloads behind. After writing, ``record()`` stores
+    the new inputs and outputs. ``save()`` removes files of resources the
+    current export never asked about and persists the state.
+    """
+
+    def __init__(self, package_dir: Path) -> None:
+        self.package_dir = package_dir
+        self.path = export_state_path(package_dir)
+        self._previous: dict[str, dict[str, Any]] = {}
+        self._current: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self.reused: list[str] = []
+
+    def load(self) -> None:
+        """Read the previous state; a missing or foreign state is empty.
+
+        The state file is removed until ``save()``: an export that fails
+        halfway must not leave entries describing files it overwrote.
+        """
+        self._previous = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        finally:
+            self.path.unlink(missing_ok=True)
+        if not isinstance(data, dict) or data.get("version") != EXPORT_STATE_VERSION:
+            return
+        entries = data.get("resources")
+        if isinstance(entries, dict):
+            self._previous = {
+                key: entry
+                for key, entry in entries.items()
+                if isinstance(entry, dict)
+                and isinstance(entry.get("inputs"), str)
+                and isinstance(entry.get("outputs"), list)
+            }
+
+    def previous_outputs(self) -> set[str]:
+        return {output for entry in self._previous.values() for output in entry["outputs"]}
+
+    def reuse(self, key: str, inputs: str | None) -> bool:
+        """Whether the previous outputs of ``key`` are valid for ``inputs``.
+
+        Pass ``inputs=None`` for a resource that cannot be tracked; its
+        previous files are dropped and it is regenerated.
+        """
+        self._seen.add(key)
+        entry = self._previous.pop(key, None)
+        if entry is None:
+            return False
+        if (
+            inputs is not None
+            and entry["inputs"] == inputs
+            and all((self.package_dir / output).is_file() for output in entry["outputs"])
+        ):
+            self._current[key] = entry
+            self.reused.append(key)
+            return True
+        self._remove_outputs(entry["outputs"])
+        return False
+
+    def record(self, key: str, inputs: str, outputs: list[str]) -> None:
+        self._seen.add(key)
+        self._current[key] = {"inputs": inputs, "outputs": sorted(outputs)}
+
+    def save(self) -> None:
+        """Drop files of resources no longer exported and write the state."""
+        for key, entry in self._previous.items():
+            if key not in self._seen:
+                self._remove_outputs(entry["outputs"])
+        self._previous = {}
+
+        data = {
+            "version": EXPORT_STATE_VERSION,
+            "resources": dict(sorted(self._current.items())),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _remove_outputs(self, outputs: list[str]) -> None:
+        kept = {output for entry in self._current.values() for output in entry["outputs"]}
+        for output in outputs:
+            if output not in kept:
+                (self.package_dir / output).unlink(missing_ok=True)
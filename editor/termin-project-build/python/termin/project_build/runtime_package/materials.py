@@ -13,6 +13,7 @@ from termin.project_build.runtime_package.models import (
 )
 from termin.project_build.runtime_package.package_files import write_json
 from termin.project_build.runtime_package.package_files import project_relative_path
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
 from termin.project_build.runtime_package.shaders import shader_program_to_spec
 from termin.project_build.runtime_package.textures import (
     collect_material_texture_refs,
@@ -25,24 +26,21 @@ def prepare_project_material_resources(
     project_root: Path,
     materials: dict[str, str],
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> None:
     """Load referenced project materials after registering their shader assets."""
-    import json
-
     from termin.default_assets.render.material_asset import MaterialAsset
     from termin.default_assets.render.shader_asset import ShaderAsset
     from termin.default_assets.render.texture_asset import TextureAsset
     from termin.default_assets.resource_manager import DefaultResourceManager
     resource_manager = DefaultResourceManager.instance()
+    project_index = project_index or ProjectResourceIndex(project_root)
     material_paths: dict[str, Path] = {}
     material_documents: dict[str, dict[str, Any]] = {}
     texture_uuids: set[str] = set()
-    for path in project_root.rglob("*.material"):
-        rel = path.relative_to(project_root)
-        if any(part in {".git", "__pycache__", "build", "dist"} for part in rel.parts):
-            continue
+    for path in project_index.paths(".material"):
         try:
-            document = json.loads(path.read_text(encoding="utf-8"))
+            document = project_index.read_json(path)
         except Exception:
             continue
         if isinstance(document, dict) and document.get("uuid") in materials:
@@ -59,6 +57,7 @@ def prepare_project_material_resources(
         project_root,
         texture_uuids,
         diagnostics,
+        project_index=project_index,
     )
     for texture_uuid, texture_path in sorted(texture_sources.items()):
         if resource_manager.get_asset_by_uuid(texture_uuid) is not None:
@@ -95,7 +94,11 @@ def prepare_project_material_resources(
                 raise ValueError("material has no canonical shader name")
 
             if resource_manager.get_shader_asset(shader_name) is None:
-                shader_path = find_project_or_standard_shader(project_root, shader_name)
+                shader_path = find_project_or_standard_shader(
+                    project_root,
+                    shader_name,
+                    project_index=project_index,
+                )
                 shader_asset = ShaderAsset.from_file(shader_path, name=shader_name)
                 resource_manager.register_shader_asset(
                     shader_name,
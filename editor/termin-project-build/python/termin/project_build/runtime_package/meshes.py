@@ -1,4 +1,12 @@
-"""Runtime mesh asset export."""
+"""Runtime mesh asset export.
+
+Each exported mesh is a small JSON header ``meshes/<uuid>.tmesh.json`` with
+the layout and submeshes, plus a raw payload ``meshes/<uuid>.tmesh.bin``:
+little-endian float32 interleaved vertices followed by uint32 indices. Both
+blocks start at ``MESH_DATA_ALIGNMENT`` byte offsets, so a mapped payload can
+be handed to the GPU without conversion. The header field ``data`` describes
+the blocks; headers without it carry inline ``vertices``/``indices`` lists.
+"""
 
 from __future__ import annotations
 
@@ -6,13 +14,23 @@ import json
 from pathlib import Path
 from typing import Any
 
+from termin.project_build.runtime_package.export_state import (
+    RuntimePackageExportState,
+    resource_inputs_digest,
+)
 from termin.project_build.runtime_package.models import RuntimePackageExportDiagnostic
 from termin.project_build.runtime_package.package_files import (
     append_project_file_diagnostic,
     project_relative_path,
     write_json,
 )
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
+
 
+MESH_DATA_ALIGNMENT = 64
+# Bump on any change to the pack_mesh_data header or payload layout
+MESH_PAYLOAD_VERSION = 1
+MESH_SOURCE_SUFFIXES = (".obj", ".stl")
 
 PLACEHOLDER_MESH_VERTICES = [
     0.0, 0.65, 0.0, 1.0, 0.05, 0.05,
@@ -28,16 +46,57 @@ def write_meshes(
     resources: list[dict[str, str]],
     diagnostics: list[RuntimePackageExportDiagnostic],
     resource_policy: str,
+    project_index: ProjectResourceIndex | None = None,
+    export_state: RuntimePackageExportState | None = None,
 ) -> None:
     mesh_dir = package_dir / "meshes"
     mesh_dir.mkdir(parents=True, exist_ok=True)
+    project_index = project_index or ProjectResourceIndex(project_root)
 
     for uuid_value, name in sorted(meshes.items()):
         path = mesh_dir / f"{uuid_value}.tmesh.json"
-        mesh_spec = export_mesh_spec(project_root, uuid_value, name, diagnostics, resource_policy)
-        if mesh_spec is None:
-            continue
-        write_json(path, mesh_spec)
+        data_path = f"meshes/{uuid_value}.tmesh.bin"
+        mesh_source = find_mesh_source(
+            project_root,
+            uuid_value,
+            name,
+            diagnostics,
+            project_index=project_index,
+        )
+        # Only meshes read from a project source have trackable inputs
+        inputs = (
+            resource_inputs_digest(
+                (mesh_source,),
+                {
+                    "name": name,
+                    "importer": mesh_importer_version(),
+                    "payload": MESH_PAYLOAD_VERSION,
+                },
+            )
+            if export_state is not None and mesh_source is not None
+            else None
+        )
+        if export_state is None or not export_state.reuse(f"mesh:{uuid_value}", inputs):
+            diagnostic_count = len(diagnostics)
+            mesh_spec = _export_located_mesh_spec(
+                project_root,
+                mesh_source,
+                uuid_value,
+                name,
+                diagnostics,
+                resource_policy,
+            )
+            if mesh_spec is None:
+                continue
+            header, payload = pack_mesh_data(mesh_spec, data_path)
+            (package_dir / data_path).write_bytes(payload)
+            write_json(path, header)
+            if inputs is not None and len(diagnostics) == diagnostic_count:
+                export_state.record(
+                    f"mesh:{uuid_value}",
+                    inputs,
+                    [f"meshes/{uuid_value}.tmesh.json", data_path],
+                )
         resources.append(
             {
                 "type": "mesh",
@@ -51,11 +110,13 @@ def prepare_project_mesh_resources(
     project_root: Path,
     meshes: dict[str, str],
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> None:
     """Register project mesh sources needed by scene shader-usage collection."""
     from termin.default_assets.resource_manager import DefaultResourceManager
 
     resource_manager = DefaultResourceManager.instance()
+    project_index = project_index or ProjectResourceIndex(project_root)
     for uuid_value, name in sorted(meshes.items()):
         if resource_manager.get_mesh_asset_by_uuid(uuid_value) is not None:
             continue
@@ -65,6 +126,7 @@ def prepare_project_mesh_resources(
             uuid_value,
             name,
             diagnostics,
+            project_index=project_index,
         )
         if source_path is None:
             continue
@@ -104,8 +166,27 @@ def export_mesh_spec(
     name: str,
     diagnostics: list[RuntimePackageExportDiagnostic],
     resource_policy: str,
+    project_index: ProjectResourceIndex | None = None,
+) -> dict[str, Any] | None:
+    mesh_source = find_mesh_source(project_root, uuid_value, name, diagnostics, project_index=project_index)
+    return _export_located_mesh_spec(
+        project_root,
+        mesh_source,
+        uuid_value,
+        name,
+        diagnostics,
+        resource_policy,
+    )
+
+
+def _export_located_mesh_spec(
+    project_root: Path,
+    mesh_source: Path | None,
+    uuid_value: str,
+    name: str,
+    diagnostics: list[RuntimePackageExportDiagnostic],
+    resource_policy: str,
 ) -> dict[str, Any] | None:
-    mesh_source = find_mesh_source(project_root, uuid_value, name, diagnostics)
     if mesh_source is not None:
         try:
             return mesh_source_to_spec(mesh_source, uuid_value, name)
@@ -162,51 +243,37 @@ def find_mesh_source(
     uuid_value: str,
     name: str,
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> Path | None:
-    mesh_paths = list(iter_project_mesh_paths(project_root))
+    project_index = project_index or ProjectResourceIndex(project_root)
 
     if uuid_value:
-        for path in mesh_paths:
-            meta_path = Path(str(path) + ".meta")
-            if not meta_path.exists():
-                continue
-            try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                if isinstance(meta, dict) and meta.get("uuid") == uuid_value:
-                    return path
-                if not isinstance(meta, dict):
-                    append_project_file_diagnostic(
-                        diagnostics,
-                        project_root,
-                        meta_path,
-                        "Runtime exporter skipped mesh metadata because JSON root is not an object",
-                    )
-            except Exception as exc:
-                append_project_file_diagnostic(
-                    diagnostics,
-                    project_root,
-                    meta_path,
-                    f"Runtime exporter failed to inspect mesh metadata: {exc}",
-                )
+        for meta_path, exc in project_index.unreported_invalid_metadata(*MESH_SOURCE_SUFFIXES):
+            append_project_file_diagnostic(
+                diagnostics,
+                project_root,
+                meta_path,
+                "Runtime exporter skipped mesh metadata because JSON root is not an object"
+                if exc is None
+                else f"Runtime exporter failed to inspect mesh metadata: {exc}",
+            )
+        matches = project_index.paths_with_uuid(uuid_value, *MESH_SOURCE_SUFFIXES)
+        if matches:
+            return matches[0]
 
     if name:
-        for path in mesh_paths:
-            if path.stem == name:
-                return path
+        matches = project_index.paths_named(name, *MESH_SOURCE_SUFFIXES)
+        if matches:
+            return matches[0]
 
     return None
 
 
-def iter_project_mesh_paths(project_root: Path):
-    ignored_parts = {".git", "__pycache__", "build", "dist"}
-    supported_suffixes = {".obj", ".stl"}
-    for path in project_root.rglob("*"):
-        rel = path.relative_to(project_root)
-        if any(part in ignored_parts for part in rel.parts):
-            continue
-        if path.is_file() and path.suffix.lower() in supported_suffixes:
-            yield path
+def mesh_importer_version() -> int:
+    """Version of the importer ``mesh_source_to_spec`` reads sources with."""
+    from termin.default_assets.mesh.asset import MESH_IMPORTER_VERSION
+
+    return MESH_IMPORTER_VERSION
 
 
 def mesh_source_to_spec(source_path: Path, uuid_value: str, name: str) -> dict[str, Any]:
@@ -228,6 +295,8 @@ def mesh_source_to_spec(source_path: Path, uuid_value: str, name: str) -> dict[s
 
 
 def mesh_to_spec(mesh: Any) -> dict[str, Any]:
+    import numpy as np
+
     vertices_buffer = mesh.get_vertices_buffer()
     indices_buffer = mesh.get_indices_buffer()
     if vertices_buffer is None or indices_buffer is None:
@@ -238,14 +307,60 @@ def mesh_to_spec(mesh: Any) -> dict[str, Any]:
         "name": mesh.name or mesh.uuid,
         "draw_mode": draw_mode_to_json(mesh.draw_mode),
         "layout": mesh_layout_to_json(mesh),
-        "vertices": flat_number_list(vertices_buffer, float),
-        "indices": flat_number_list(indices_buffer, int),
+        "vertices": np.ascontiguousarray(vertices_buffer, dtype="<f4").reshape(-1),
+        "indices": np.ascontiguousarray(indices_buffer, dtype="<u4").reshape(-1),
         "submeshes": mesh_submeshes_to_json(mesh),
         "vertex_count": int(mesh.vertex_count),
         "stride": int(mesh.stride),
     }
 
 
+def pack_mesh_data(mesh_spec: dict[str, Any], data_path: str) -> tuple[dict[str, Any], bytes]:
+    """Split a mesh spec into its JSON header and aligned binary payload."""
+    import numpy as np
+
+    vertices = np.ascontiguousarray(mesh_spec["vertices"], dtype="<f4").reshape(-1)
+    indices = np.ascontiguousarray(mesh_spec["indices"], dtype="<u4").reshape(-1)
+    floats_per_vertex = sum(int(attribute["components"]) for attribute in mesh_spec["layout"])
+    if floats_per_vertex <= 0 or vertices.size % floats_per_vertex != 0:
+        raise ValueError(f"Mesh '{mesh_spec['uuid']}' vertex data does not match its layout")
+
+    vertex_bytes = vertices.tobytes()
+    index_offset = _align_offset(len(vertex_bytes))
+    index_bytes = indices.tobytes()
+    payload = b"".join((vertex_bytes, bytes(index_offset - len(vertex_bytes)), index_bytes))
+
+    header = {key: value for key, value in mesh_spec.items() if key not in ("vertices", "indices")}
+    header["vertex_count"] = vertices.size // floats_per_vertex
+    header["stride"] = floats_per_vertex * vertices.itemsize
+    header["index_count"] = int(indices.size)
+    header["data"] = {
+        "path": data_path,
+        "byte_order": "little",
+        "alignment": MESH_DATA_ALIGNMENT,
+        "vertices": {"type": "float32", "offset": 0, "size": len(vertex_bytes)},
+        "indices": {"type": "uint32", "offset": index_offset, "size": len(index_bytes)},
+    }
+    return header, payload
+
+
+def read_mesh_data(package_dir: Path, header: dict[str, Any]) -> tuple[Any, Any]:
+    """Return the float32 vertices and uint32 indices of an exported mesh."""
+    import numpy as np
+
+    data = header["data"]
+    payload = (package_dir / data["path"]).read_bytes()
+    blocks = []
+    for key, dtype in (("vertices", "<f4"), ("indices", "<u4")):
+        block = data[key]
+        blocks.append(np.frombuffer(payload, dtype=dtype, count=block["size"] // 4, offset=block["offset"]))
+    return blocks[0], blocks[1]
+
+
+def _align_offset(offset: int) -> int:
+    return -(-offset // MESH_DATA_ALIGNMENT) * MESH_DATA_ALIGNMENT
+
+
 def mesh_submeshes_to_json(mesh: Any) -> list[dict[str, Any]]:
     submeshes = []
     for submesh in mesh.submeshes:
@@ -326,16 +441,6 @@ def resource_policy_allows_fallback(resource_policy: str) -> bool:
     return resource_policy == "dev_smoke"
 
 
-def flat_number_list(values: Any, converter: Any) -> list[Any]:
-    import numpy as np
-
-    values = np.asarray(values).reshape(-1).tolist()
-    result: list[Any] = []
-    for value in values:
-        result.append(converter(value))
-    return result
-
-
 def draw_mode_to_json(value: Any) -> str:
     text = str(value)
     if text.endswith(".LINES"):
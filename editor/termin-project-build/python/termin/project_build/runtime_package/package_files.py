@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -14,9 +16,24 @@ def project_relative_path(project_root: Path, path: Path) -> str:
     return path.relative_to(project_root).as_posix()
 
 
-def write_clean_package_dir(output_dir: Path) -> None:
-    if output_dir.exists():
+def write_clean_package_dir(output_dir: Path, keep: Iterable[str] = ()) -> None:
+    """Empty the package directory, except package-relative ``keep`` files."""
+    keep = set(keep)
+    if output_dir.exists() and not keep:
         shutil.rmtree(output_dir)
+    elif output_dir.exists():
+        for root, dirs, files in os.walk(output_dir, topdown=False):
+            root_path = Path(root)
+            for filename in files:
+                path = root_path / filename
+                if project_relative_path(output_dir, path) not in keep:
+                    path.unlink()
+            for directory in dirs:
+                path = root_path / directory
+                if path.is_symlink():
+                    path.unlink()
+                elif not any(path.iterdir()):
+                    path.rmdir()
     output_dir.mkdir(parents=True, exist_ok=True)
 
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -12,6 +11,7 @@ from termin.project_build.runtime_package.package_files import (
     append_project_file_diagnostic,
     project_relative_path,
 )
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
 
 
 PIPELINE_TEMPLATE_SUFFIX = ".pipeline-template"
@@ -33,6 +33,7 @@ def write_pipelines(
     pipelines: dict[str, str],
     resources: list[dict[str, str]],
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> list[CompiledPipelineExport]:
     if not pipelines:
         return []
@@ -45,8 +46,9 @@ def write_pipelines(
     if resource_manager is None:
         return compiled
 
+    project_index = project_index or ProjectResourceIndex(project_root)
     for uuid_value, name in sorted(pipelines.items()):
-        source = find_pipeline_source(project_root, uuid_value, name, diagnostics)
+        source = find_pipeline_source(project_root, uuid_value, name, diagnostics, project_index=project_index)
         if source is None:
             diagnostics.append(
                 RuntimePackageExportDiagnostic(
@@ -150,37 +152,28 @@ def find_pipeline_source(
     uuid_value: str,
     name: str,
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> Path | None:
-    pipeline_paths = list(iter_project_pipeline_paths(project_root))
+    project_index = project_index or ProjectResourceIndex(project_root)
+    pipeline_paths = project_index.paths(".pipeline")
 
     if uuid_value:
-        for path in pipeline_paths:
-            meta_path = path.with_suffix(path.suffix + ".meta")
-            if meta_path.exists():
-                try:
-                    with open(meta_path, "r", encoding="utf-8") as f:
-                        meta = json.load(f)
-                    if isinstance(meta, dict) and meta.get("uuid") == uuid_value:
-                        return path
-                    if not isinstance(meta, dict):
-                        append_project_file_diagnostic(
-                            diagnostics,
-                            project_root,
-                            meta_path,
-                            "Runtime exporter skipped pipeline metadata because JSON root is not an object",
-                        )
-                except Exception as exc:
-                    append_project_file_diagnostic(
-                        diagnostics,
-                        project_root,
-                        meta_path,
-                        f"Runtime exporter failed to inspect pipeline metadata: {exc}",
-                    )
+        for meta_path, exc in project_index.unreported_invalid_metadata(".pipeline"):
+            append_project_file_diagnostic(
+                diagnostics,
+                project_root,
+                meta_path,
+                "Runtime exporter skipped pipeline metadata because JSON root is not an object"
+                if exc is None
+                else f"Runtime exporter failed to inspect pipeline metadata: {exc}",
+            )
+        matches = project_index.paths_with_uuid(uuid_value, ".pipeline")
+        if matches:
+            return matches[0]
 
         for path in pipeline_paths:
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = project_index.read_json(path)
                 if isinstance(data, dict) and data.get("uuid") == uuid_value:
                     return path
                 if not isinstance(data, dict):
@@ -205,12 +198,3 @@ def find_pipeline_source(
                 return path
 
     return None
-
-
-def iter_project_pipeline_paths(project_root: Path):
-    ignored_parts = {".git", "__pycache__", "build", "dist"}
-    for path in project_root.rglob("*.pipeline"):
-        rel = path.relative_to(project_root)
-        if any(part in ignored_parts for part in rel.parts):
-            continue
-        yield path
@@ -0,0 +1,127 @@
+"""Single-pass index of project resource sources for runtime export."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+IGNORED_PATH_PARTS = frozenset({".git", "__pycache__", "build", "dist"})
+_NOT_LOADED = object()
+
+
+class ProjectResourceIndex:
+    """Project source files and their ``.meta`` sidecars, scanned once.
+
+    Export stages look resources up by UUID, name and suffix here instead of
+    walking the project tree themselves. JSON documents and sidecars are read
+    at most once per export; a failed read is cached and re-raised to every
+    caller, so each stage still reports it in its own words.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = Path(project_root)
+        self._paths: list[Path] = []
+        self._by_suffix: dict[str, list[Path]] = {}
+        self._meta_paths: set[Path] = set()
+        self._json: dict[Path, Any] = {}
+        self._by_uuid: dict[str, list[Path]] | None = None
+        self._reported_metadata: set[Path] = set()
+
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = [directory for directory in dirs if directory not in IGNORED_PATH_PARTS]
+            root_path = Path(root)
+            for filename in files:
+                path = root_path / filename
+                if path.suffix.lower() == ".meta":
+                    self._meta_paths.add(path)
+                else:
+                    self._paths.append(path)
+        self._paths.sort()
+        for path in self._paths:
+            self._by_suffix.setdefault(path.suffix.lower(), []).append(path)
+
+    def paths(self, *suffixes: str) -> list[Path]:
+        """Sorted source files, optionally limited to lower-case suffixes."""
+        if not suffixes:
+            return list(self._paths)
+        if len(suffixes) == 1:
+            return list(self._by_suffix.get(suffixes[0], ()))
+        return sorted(path for suffix in suffixes for path in self._by_suffix.get(suffix, ()))
+
+    def paths_named(self, stem: str, *suffixes: str) -> list[Path]:
+        return [path for path in self.paths(*suffixes) if path.stem == stem]
+
+    def has_metadata(self, path: Path) -> bool:
+        return _meta_path(path) in self._meta_paths
+
+    def read_json(self, path: Path) -> Any:
+        """Parsed JSON content of a project file; read errors are re-raised."""
+        value = self._json.get(path, _NOT_LOADED)
+        if value is _NOT_LOADED:
+            try:
+                value = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                value = exc
+            self._json[path] = value
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def metadata(self, path: Path) -> Any:
+        """Parsed ``.meta`` sidecar of a source file, or None without one."""
+        if not self.has_metadata(path):
+            return None
+        return self.read_json(_meta_path(path))
+
+    def invalid_metadata(self, *suffixes: str) -> list[tuple[Path, Exception | None]]:
+        """Sidecars that cannot be read (with the error) or are not objects (None)."""
+        result: list[tuple[Path, Exception | None]] = []
+        for path in self.paths(*suffixes):
+            if not self.has_metadata(path):
+                continue
+            try:
+                metadata = self.metadata(path)
+            except (OSError, ValueError) as exc:
+                result.append((_meta_path(path), exc))
+                continue
+            if not isinstance(metadata, dict):
+                result.append((_meta_path(path), None))
+        return result
+
+    def unreported_invalid_metadata(self, *suffixes: str) -> list[tuple[Path, Exception | None]]:
+        """``invalid_metadata`` entries not yet returned by this method.
+
+        Per-resource source lookups call this so that each broken sidecar is
+        reported once per export, not once per referenced resource.
+        """
+        result = [
+            (meta_path, exc)
+            for meta_path, exc in self.invalid_metadata(*suffixes)
+            if meta_path not in self._reported_metadata
+        ]
+        self._reported_metadata.update(meta_path for meta_path, _exc in result)
+        return result
+
+    def paths_with_uuid(self, uuid_value: str, *suffixes: str) -> list[Path]:
+        """Sorted source files whose sidecar declares ``uuid_value``."""
+        if self._by_uuid is None:
+            self._by_uuid = {}
+            for path in self._paths:
+                try:
+                    metadata = self.metadata(path)
+                except (OSError, ValueError):
+                    continue
+                uuid = metadata.get("uuid") if isinstance(metadata, dict) else None
+                if isinstance(uuid, str) and uuid:
+                    self._by_uuid.setdefault(uuid, []).append(path)
+        matches = self._by_uuid.get(uuid_value, [])
+        if suffixes:
+            return [path for path in matches if path.suffix.lower() in suffixes]
+        return list(matches)
+
+
+def _meta_path(path: Path) -> Path:
+    return Path(f"{path}.meta")
@@ -11,6 +11,7 @@ from termin.project_build.runtime_package.models import (
     RuntimeRefs,
 )
 from termin.project_build.runtime_package.package_files import project_relative_path
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
 
 
 def resolve_entry_scene(project_root: Path, entry_scene: Path) -> Path:
@@ -164,11 +165,12 @@ def collect_project_material_refs(
     project_root: Path,
     refs: RuntimeRefs,
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> None:
-    for path in iter_project_material_paths(project_root):
+    project_index = project_index or ProjectResourceIndex(project_root)
+    for path in project_index.paths(".material"):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = project_index.read_json(path)
         except Exception as exc:
             diagnostics.append(
                 RuntimePackageExportDiagnostic(
@@ -203,16 +205,6 @@ def collect_project_material_refs(
         refs.materials[uuid_value] = path.stem
 
 
-def iter_project_material_paths(project_root: Path):
-    ignored_parts = {".git", "__pycache__", "build", "dist"}
-    for path in project_root.rglob("*.material"):
-        rel = path.relative_to(project_root)
-        if any(part in ignored_parts for part in rel.parts):
-            continue
-        if path.is_file():
-            yield path
-
-
 def looks_like_mesh_ref(value: dict[str, Any], field_name: str) -> bool:
     return resource_ref_match_reason(value, field_name, "mesh") is not None
 
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -191,16 +197,19 @@ def write_shaders(
     fxc: Path | None = None,
 ) -> None:
     compiler = resolve_shader_compiler(Path(shader_compiler) if shader_compiler is not None else None)
-    for shader in sorted(shaders.values(), key=lambda item: item.uuid):
-        write_shader(
-            package_dir,
-            resources,
-            diagnostics,
-            shader,
-            compiler,
-            requested_targets,
-            fxc,
-        )
+    with ShaderCompileScheduler(shader_compile_cache_root()) as scheduler:
+        for shader in sorted(shaders.values(), key=lambda item: item.uuid):
+            write_shader(
+                package_dir,
+                resources,
+                diagnostics,
+                shader,
+                compiler,
+                requested_targets,
+                fxc,
+                scheduler,
+            )
+        scheduler.wait()
 
 
 def shader_program_to_spec(program: Any) -> dict[str, Any]:
@@ -303,7 +312,23 @@ def write_shader(
     compiler: Path | None,
     requested_targets: tuple[str, ...] | None,
     fxc: Path | None = None,
+    scheduler: ShaderCompileScheduler | None = None,
 ) -> dict[str, Any]:
+    if scheduler is None:
+        with ShaderCompileScheduler(shader_compile_cache_root()) as scheduler:
+            shader_spec = write_shader(
+                package_dir,
+                resources,
+                diagnostics,
+                shader,
+                compiler,
+                requested_targets,
+                fxc,
+                scheduler,
+            )
+            scheduler.wait()
+        return shader_spec
+
     compile_artifacts = shader.artifact_role != "surface_producer"
     targets = (
         shader_targets_for_language(
@@ -391,7 +416,7 @@ def write_shader(
                 )
             )
             if vertex_source_path is not None:
-                compile_shader_stage(
+                scheduler.submit(
                     compiler,
                     shader.language,
                     target,
@@ -403,7 +428,7 @@ def write_shader(
                     program_source_paths,
                     fxc,
                 )
-            compile_shader_stage(
+            scheduler.submit(
                 compiler,
                 shader.language,
                 target,
@@ -416,7 +441,7 @@ def write_shader(
                 fxc,
             )
             if geometry_source_path is not None:
-                compile_shader_stage(
+                scheduler.submit(
                     compiler,
                     shader.language,
                     target,
@@ -526,15 +551,18 @@ def write_default_pipeline_shader_artifacts(
         )
 
     shaders = default_pipeline_engine_shaders()
-    for shader in shaders:
-        write_engine_shader_artifact(
-            package_dir,
-            diagnostics,
-            shader,
-            compiler,
-            requested_targets,
-            fxc,
-        )
+    with ShaderCompileScheduler(shader_compile_cache_root()) as scheduler:
+        for shader in shaders:
+            write_engine_shader_artifact(
+                package_dir,
+                diagnostics,
+                shader,
+                compiler,
+                requested_targets,
+                fxc,
+                scheduler,
+            )
+        scheduler.wait()
     return write_builtin_shader_contract(package_dir, shaders, requested_targets)
 
 
@@ -754,7 +782,22 @@ def write_engine_shader_artifact(
     compiler: Path,
     requested_targets: tuple[str, ...] | None = None,
     fxc: Path | None = None,
+    scheduler: ShaderCompileScheduler | None = None,
 ) -> None:
+    if scheduler is None:
+        with ShaderCompileScheduler(shader_compile_cache_root()) as scheduler:
+            write_engine_shader_artifact(
+                package_dir,
+                diagnostics,
+                shader,
+                compiler,
+                requested_targets,
+                fxc,
+                scheduler,
+            )
+            scheduler.wait()
+        return
+
     del diagnostics
     targets = shader_targets_for_language(
         shader.language,
@@ -783,7 +826,7 @@ def write_engine_shader_artifact(
         )
         vertex_source_path.write_text(shader.vertex_source, encoding="utf-8")
         for target in targets:
-            compile_shader_stage(
+            scheduler.submit(
                 compiler,
                 shader.language,
                 target,
@@ -806,7 +849,7 @@ def write_engine_shader_artifact(
     if vertex_source_path is None or fragment_source_path != vertex_source_path:
         fragment_source_path.write_text(shader.fragment_source, encoding="utf-8")
     for target in targets:
-        compile_shader_stage(
+        scheduler.submit(
             compiler,
             shader.language,
             target,
@@ -926,6 +969,276 @@ def compile_shader_stage(
             )
 
 
+SHADER_COMPILE_CACHE_VERSION = 2
+
+# Slang module references: ``import a.b;``, ``__include a;`` and ``#include "a.slang"``
+_SLANG_IMPORT_RE = re.compile(
+    r'^\s*(?:import|__include|__import)\s+"?([\w./-]+?)"?\s*;|^\s*#\s*include\s+"([^"]+)"',
+    re.MULTILINE,
+)
+
+
+def shader_compile_cache_root() -> Path | None:
+    """Directory of cached stage artifacts; an empty override disables the cache."""
+    configured = os.environ.get("TERMIN_SHADER_COMPILE_CACHE_ROOT")
+    if configured is not None:
+        return Path(configured) if configured else None
+
+    if os.name == "nt":
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        base = Path(local_app_data) if local_app_data else Path.home() / "AppData" / "Local"
+        return base / "Termin" / "Cache" / "shader-compile"
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "termin" / "shader-compile"
+
+
+class ShaderCompileScheduler:
+    """Runs ``compile_shader_stage`` calls concurrently, reusing cached artifacts.
+
+    Stages are compiled on at most ``os.cpu_count()`` workers. With a
+    ``cache_root`` every stage is keyed on the stage source, the program
+    sources, the target, stage, entry and debug name, and a digest of the
+    compiler (and ``fxc`` for d3d11) binary. Slang stages also key on the
+    ``slangc`` binary ``termin_shaderc`` will run and on the modules the
+    sources import from its include directories. A hit copies the artifact
+    and its ``.layout.json`` sidecar instead of running the compiler.
+
+    ``wait()`` re-raises the first failure in submission order.
+    """
+
+    def __init__(self, cache_root: Path | None = None, max_workers: int | None = None) -> None:
+        self.cache_root = cache_root
+        self.hits = 0
+        self.misses = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1,
+            thread_name_prefix="termin-shaderc",
+        )
+        self._futures: list[Future[None]] = []
+        self._tool_digests: dict[Path, str] = {}
+        self._slangc: Path | None = None
+        self._slangc_resolved = False
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> ShaderCompileScheduler:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def submit(
+        self,
+        compiler: Path,
+        language: str,
+        target: str,
+        stage: str,
+        input_path: Path,
+        output_path: Path,
+        debug_name: str,
+        entry: str = "main",
+        program_source_paths: tuple[Path, ...] = (),
+        fxc: Path | None = None,
+    ) -> Future[None]:
+        tool_digests: tuple[str, ...] = ()
+        include_dirs: tuple[Path, ...] = ()
+        if self.cache_root is not None:
+            tools = [compiler]
+            if target == "d3d11" and fxc is not None:
+                tools.append(fxc)
+            # Digested on the submitting thread, so workers never touch the memo
+            tool_digests = tuple(self._tool_digest(tool) for tool in tools)
+            if language == "slang":
+                if not self._slangc_resolved:
+                    self._slangc = shaderc_slangc_path(compiler)
+                    self._slangc_resolved = True
+                tool_digests += (self._tool_digest(self._slangc) if self._slangc is not None else "",)
+                include_dirs = shaderc_slang_include_dirs(compiler, input_path)
+        future = self._executor.submit(
+            self._compile,
+            tool_digests,
+            include_dirs,
+            (compiler, language, target, stage, input_path, output_path, debug_name, entry, program_source_paths, fxc),
+        )
+        self._futures.append(future)
+        return future
+
+    def wait(self) -> None:
+        futures, self._futures = self._futures, []
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            wait_futures(futures)
+            raise
+
+    def _compile(self, tool_digests: tuple[str, ...], include_dirs: tuple[Path, ...], args: tuple[Any, ...]) -> None:
+        if self.cache_root is None:
+            compile_shader_stage(*args)
+            return
+
+        _compiler, language, target, stage, input_path, output_path, debug_name, entry, program_source_paths, _fxc = args
+        digest = hashlib.sha256()
+        for part in (
+            str(SHADER_COMPILE_CACHE_VERSION),
+            *tool_digests,
+            language,
+            target,
+            stage,
+            entry,
+            debug_name,
+            input_path.name,
+            output_path.name,
+        ):
+            _hash_field(digest, part.encode("utf-8"))
+        _hash_field(digest, input_path.read_bytes())
+        for program_source_path in program_source_paths:
+            _hash_field(digest, program_source_path.name.encode("utf-8"))
+            _hash_field(digest, program_source_path.read_bytes())
+        if include_dirs:
+            _hash_slang_modules(digest, (input_path, *program_source_paths), include_dirs)
+        key = digest.hexdigest()
+
+        entry_dir = self.cache_root / key[:2] / key
+        layout_path = Path(f"{output_path}.layout.json")
+        try:
+            shutil.copyfile(entry_dir / "artifact", output_path)
+            shutil.copyfile(entry_dir / "artifact.layout.json", layout_path)
+        except OSError:
+            pass
+        else:
+            with self._lock:
+                self.hits += 1
+            return
+
+        compile_shader_stage(*args)
+        with self._lock:
+            self.misses += 1
+        _store_cache_entry(entry_dir, output_path, layout_path)
+
+    def _tool_digest(self, path: Path) -> str:
+        digest = self._tool_digests.get(path)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(block)
+            digest = hasher.hexdigest()
+            self._tool_digests[path] = digest
+        return digest
+
+
+def shaderc_slangc_path(compiler: Path) -> Path | None:
+    """The ``slangc`` that ``termin_shaderc`` resolves, in the same order."""
+    configured = os.environ.get("TERMIN_SLANGC")
+    if configured:
+        return existing_executable(Path(configured))
+
+    try:
+        from tcbase import Settings
+    except ImportError:
+        configured = ""
+    else:
+        configured = Settings("termin").get("Shader/slangCompiler", "")
+    if isinstance(configured, str) and configured.strip():
+        return existing_executable(Path(configured.strip()))
+
+    found = resolve_path_tool("slangc")
+    if found is not None:
+        return found
+    sdk = os.environ.get("TERMIN_SDK")
+    if sdk:
+        found = existing_executable(Path(sdk) / "bin" / "slangc")
+        if found is not None:
+            return found
+    return existing_executable(compiler.parent / "slangc")
+
+
+def shaderc_slang_include_dirs(compiler: Path, input_path: Path) -> tuple[Path, ...]:
+    """Include directories ``termin_shaderc`` passes to ``slangc``, in order."""
+    candidates = [input_path.parent]
+    sdk = os.environ.get("TERMIN_SDK")
+    if sdk:
+        candidates.append(Path(sdk) / "share" / "termin" / "builtin_shaders")
+    tool_dir = compiler.absolute().parent
+    candidates.append(tool_dir.parent / "share" / "termin" / "builtin_shaders")
+    candidates.append(tool_dir / "share" / "termin" / "builtin_shaders")
+    cwd = Path.cwd()
+    candidates.append(cwd / "share" / "termin" / "builtin_shaders")
+    candidates.append(cwd / "termin-graphics" / "resources" / "builtin_shaders")
+    return tuple(dict.fromkeys(path.absolute() for path in candidates if path.is_dir()))
+
+
+def _slang_module_candidates(name: str) -> tuple[str, ...]:
+    if name.endswith(".slang"):
+        return (name,)
+    relative = name.replace(".", "/")
+    # Slang resolves ``import foo_bar`` to foo_bar.slang or foo-bar.slang
+    return tuple(dict.fromkeys((f"{relative}.slang", f"{relative.replace('_', '-')}.slang")))
+
+
+def _hash_slang_modules(digest: Any, sources: tuple[Path, ...], include_dirs: tuple[Path, ...]) -> None:
+    """Hash every module the sources import, transitively, as slangc would find it."""
+    pending = list(sources)
+    seen = {path.absolute() for path in sources}
+    while pending:
+        source_path = pending.pop(0)
+        text = source_path.read_text(encoding="utf-8", errors="replace")
+        for module_name, include_name in _SLANG_IMPORT_RE.findall(text):
+            if include_name:
+                search = (source_path.parent, *include_dirs)
+                candidates: tuple[str, ...] = (include_name,)
+            else:
+                search = include_dirs
+                candidates = _slang_module_candidates(module_name)
+            resolved = next(
+                (
+                    directory / candidate
+                    for directory in search
+                    for candidate in candidates
+                    if (directory / candidate).is_file()
+                ),
+                None,
+            )
+            # Unresolved names still key the entry: a module appearing later changes it
+            _hash_field(digest, (module_name or include_name).encode("utf-8"))
+            if resolved is None:
+                continue
+            resolved = resolved.absolute()
+            if resolved in seen:
+                continue
+            seen.add(resolved)
+            _hash_field(digest, resolved.read_bytes())
+            pending.append(resolved)
+
+
+def _hash_field(digest: Any, data: bytes) -> None:
+    digest.update(len(data).to_bytes(8, "little"))
+    digest.update(data)
+
+
+def _store_cache_entry(entry_dir: Path, output_path: Path, layout_path: Path) -> None:
+    # The cache is best effort: a failed store only costs a later recompile
+    try:
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(tempfile.mkdtemp(dir=entry_dir.parent, prefix=".tmp-"))
+    except OSError:
+        return
+    try:
+        shutil.copyfile(output_path, staging_dir / "artifact")
+        shutil.copyfile(layout_path, staging_dir / "artifact.layout.json")
+        # Another export may have stored the same key concurrently; keep theirs
+        os.replace(staging_dir, entry_dir)
+    except OSError:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
 def executable_command(path: Path) -> list[str]:
     if os.name == "nt" and path.suffix.lower() == ".py":
         return [sys.executable]
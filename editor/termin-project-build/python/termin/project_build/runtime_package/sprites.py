@@ -7,6 +7,7 @@ from pathlib import Path
 
 from termin.project_build.runtime_package.models import RuntimePackageExportDiagnostic
 from termin.project_build.runtime_package.package_files import project_relative_path, write_json
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
 
 
 def write_sprites(
@@ -16,11 +17,13 @@ def write_sprites(
     textures: dict[str, str],
     resources: list[dict[str, str]],
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> None:
     if not sprites:
         return
 
-    sources = _index_sprite_sources(project_root, set(sprites), diagnostics)
+    project_index = project_index or ProjectResourceIndex(project_root)
+    sources = _index_sprite_sources(project_index, set(sprites), diagnostics)
     for uuid_value, name in sorted(sprites.items()):
         source = sources.get(uuid_value)
         output_rel = f"sprites/{uuid_value}.sprite.json"
@@ -69,33 +72,29 @@ def write_sprites(
 
 
 def _index_sprite_sources(
-    project_root: Path,
+    project_index: ProjectResourceIndex,
     required: set[str],
     diagnostics: list[RuntimePackageExportDiagnostic],
 ) -> dict[str, Path]:
-    result: dict[str, Path] = {}
-    ignored = {".git", "__pycache__", "build", "dist"}
-    for source in project_root.rglob("*.sprite"):
-        if any(part in ignored for part in source.relative_to(project_root).parts):
-            continue
-        meta_path = Path(f"{source}.meta")
-        if not meta_path.is_file():
+    project_root = project_index.project_root
+    for meta_path, exc in project_index.invalid_metadata(".sprite"):
+        if exc is None:
             continue
-        try:
-            metadata = json.loads(meta_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
-            diagnostics.append(
-                RuntimePackageExportDiagnostic(
-                    level="warning",
-                    path=project_relative_path(project_root, meta_path),
-                    message=f"Runtime exporter failed to inspect SpriteAsset metadata: {exc}",
-                )
+        diagnostics.append(
+            RuntimePackageExportDiagnostic(
+                level="warning",
+                path=project_relative_path(project_root, meta_path),
+                message=f"Runtime exporter failed to inspect SpriteAsset metadata: {exc}",
             )
+        )
+
+    result: dict[str, Path] = {}
+    for uuid_value in sorted(required):
+        sources = project_index.paths_with_uuid(uuid_value, ".sprite")
+        if not sources:
             continue
-        uuid_value = metadata.get("uuid") if isinstance(metadata, dict) else None
-        if uuid_value not in required:
-            continue
-        if uuid_value in result:
+        result[uuid_value] = sources[0]
+        for source in sources[1:]:
             diagnostics.append(
                 RuntimePackageExportDiagnostic(
                     level="error",
@@ -103,8 +102,6 @@ def _index_sprite_sources(
                     message=f"Duplicate SpriteAsset UUID '{uuid_value}'",
                 )
             )
-            continue
-        result[uuid_value] = source
     return result
 
 
@@ -6,14 +6,18 @@ import json
 import shutil
 from pathlib import Path
 
+from termin.project_build.runtime_package.export_state import (
+    RuntimePackageExportState,
+    resource_inputs_digest,
+)
 from termin.project_build.runtime_package.models import RuntimePackageExportDiagnostic
 from termin.project_build.runtime_package.package_files import project_relative_path, write_json
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
 
 
 # Keep this contract aligned with termin-image, which decodes package texture
 # bytes in both the Python and native runtime loaders.
 SUPPORTED_TEXTURE_SUFFIXES = {".jpeg", ".jpg", ".png", ".webp"}
-_IGNORED_PATH_PARTS = {".git", "__pycache__", "build", "dist"}
 _IMPORT_SETTING_NAMES = (
     "flip_x",
     "flip_y",
@@ -32,11 +36,18 @@ def write_textures(
     textures: dict[str, str],
     resources: list[dict[str, str]],
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
+    export_state: RuntimePackageExportState | None = None,
 ) -> None:
     if not textures:
         return
 
-    texture_sources, rejected_uuids = index_project_texture_sources(project_root, set(textures), diagnostics)
+    texture_sources, rejected_uuids = index_project_texture_sources(
+        project_root,
+        set(textures),
+        diagnostics,
+        project_index=project_index,
+    )
     texture_dir = package_dir / "textures"
     texture_dir.mkdir(parents=True, exist_ok=True)
 
@@ -64,17 +75,25 @@ def write_textures(
         source_rel_path = f"textures/{uuid_value}{source_path.suffix.lower()}"
         source_output_path = package_dir / source_rel_path
         spec_rel_path = f"textures/{uuid_value}.texture.json"
-        try:
-            shutil.copyfile(source_path, source_output_path)
-        except OSError as exc:
-            diagnostics.append(
-                RuntimePackageExportDiagnostic(
-                    level="error",
-                    path=project_relative_path(project_root, source_path),
-                    message=f"Runtime exporter failed to copy texture source: {exc}",
+        inputs = (
+            resource_inputs_digest((source_path,), import_settings)
+            if export_state is not None
+            else None
+        )
+        if export_state is None or not export_state.reuse(f"texture:{uuid_value}", inputs):
+            try:
+                shutil.copyfile(source_path, source_output_path)
+            except OSError as exc:
+                diagnostics.append(
+                    RuntimePackageExportDiagnostic(
+                        level="error",
+                        path=project_relative_path(project_root, source_path),
+                        message=f"Runtime exporter failed to copy texture source: {exc}",
+                    )
                 )
-            )
-            continue
+                continue
+            if export_state is not None:
+                export_state.record(f"texture:{uuid_value}", inputs, [source_rel_path])
 
         write_json(
             package_dir / spec_rel_path,
@@ -163,77 +182,58 @@ def index_project_texture_sources(
     project_root: Path,
     required_uuids: set[str],
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> tuple[dict[str, Path], set[str]]:
+    project_index = project_index or ProjectResourceIndex(project_root)
+    for metadata_path, exc in project_index.invalid_metadata():
+        diagnostics.append(
+            RuntimePackageExportDiagnostic(
+                level="warning",
+                path=project_relative_path(project_root, metadata_path),
+                message=(
+                    "Runtime exporter skipped asset metadata because JSON root is not an object"
+                    if exc is None
+                    else f"Runtime exporter failed to inspect asset metadata: {exc}"
+                ),
+            )
+        )
+
     result: dict[str, Path] = {}
     rejected_uuids: set[str] = set()
-    for source_path in iter_project_asset_paths(project_root):
-        metadata_path = Path(f"{source_path}.meta")
-        if not metadata_path.is_file():
-            continue
-        try:
-            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
-            diagnostics.append(
-                RuntimePackageExportDiagnostic(
-                    level="warning",
-                    path=project_relative_path(project_root, metadata_path),
-                    message=f"Runtime exporter failed to inspect asset metadata: {exc}",
-                )
-            )
-            continue
-        if not isinstance(metadata, dict):
-            diagnostics.append(
-                RuntimePackageExportDiagnostic(
-                    level="warning",
-                    path=project_relative_path(project_root, metadata_path),
-                    message="Runtime exporter skipped asset metadata because JSON root is not an object",
-                )
-            )
-            continue
-        uuid_value = metadata.get("uuid")
-        if not isinstance(uuid_value, str) or uuid_value not in required_uuids:
-            continue
-        if source_path.suffix.lower() not in SUPPORTED_TEXTURE_SUFFIXES:
-            diagnostics.append(
-                RuntimePackageExportDiagnostic(
-                    level="error",
-                    path=project_relative_path(project_root, source_path),
-                    message=(
-                        "Runtime exporter does not support texture source format "
-                        f"'{source_path.suffix.lower()}' for UUID '{uuid_value}'"
-                    ),
+    for uuid_value in sorted(required_uuids):
+        for source_path in project_index.paths_with_uuid(uuid_value):
+            if source_path.suffix.lower() not in SUPPORTED_TEXTURE_SUFFIXES:
+                diagnostics.append(
+                    RuntimePackageExportDiagnostic(
+                        level="error",
+                        path=project_relative_path(project_root, source_path),
+                        message=(
+                            "Runtime exporter does not support texture source format "
+                            f"'{source_path.suffix.lower()}' for UUID '{uuid_value}'"
+                        ),
+                    )
                 )
-            )
-            rejected_uuids.add(uuid_value)
-            continue
-        previous = result.get(uuid_value)
-        if previous is not None:
-            diagnostics.append(
-                RuntimePackageExportDiagnostic(
-                    level="error",
-                    path=project_relative_path(project_root, source_path),
-                    message=(
-                        f"Runtime exporter found duplicate project texture UUID '{uuid_value}' "
-                        f"also used by {project_relative_path(project_root, previous)}"
-                    ),
+                rejected_uuids.add(uuid_value)
+                continue
+            previous = result.get(uuid_value)
+            if previous is not None:
+                diagnostics.append(
+                    RuntimePackageExportDiagnostic(
+                        level="error",
+                        path=project_relative_path(project_root, source_path),
+                        message=(
+                            f"Runtime exporter found duplicate project texture UUID '{uuid_value}' "
+                            f"also used by {project_relative_path(project_root, previous)}"
+                        ),
+                    )
                 )
-            )
-            result.pop(uuid_value, None)
-            rejected_uuids.add(uuid_value)
-            continue
-        result[uuid_value] = source_path
+                result.pop(uuid_value, None)
+                rejected_uuids.add(uuid_value)
+                break
+            result[uuid_value] = source_path
     return result, rejected_uuids
 
 
-def iter_project_asset_paths(project_root: Path):
-    for path in sorted(project_root.rglob("*")):
-        relative_path = path.relative_to(project_root)
-        if any(part in _IGNORED_PATH_PARTS for part in relative_path.parts):
-            continue
-        if path.is_file() and path.suffix.lower() != ".meta":
-            yield path
-
-
 def read_texture_import_settings(
     project_root: Path,
     source_path: Path,
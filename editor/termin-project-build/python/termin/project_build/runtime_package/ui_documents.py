@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 from termin.project_build.runtime_package.models import RuntimePackageExportDiagnostic
 from termin.project_build.runtime_package.package_files import project_relative_path
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
 
 
 def write_ui_documents(
@@ -16,11 +16,13 @@ def write_ui_documents(
     ui_documents: dict[str, str],
     resources: list[dict[str, str]],
     diagnostics: list[RuntimePackageExportDiagnostic],
+    project_index: ProjectResourceIndex | None = None,
 ) -> None:
     if not ui_documents:
         return
 
-    sources = _index_ui_sources(project_root, set(ui_documents), diagnostics)
+    project_index = project_index or ProjectResourceIndex(project_root)
+    sources = _index_ui_sources(project_index, set(ui_documents), diagnostics)
     for uuid_value, name in sorted(ui_documents.items()):
         source = sources.get(uuid_value)
         output_rel = f"ui/{uuid_value}.ui-document.json"
@@ -119,36 +121,32 @@ def stage_ui_documents_for_scene_analysis(
 
 
 def _index_ui_sources(
-    project_root: Path,
+    project_index: ProjectResourceIndex,
     required: set[str],
     diagnostics: list[RuntimePackageExportDiagnostic],
 ) -> dict[str, Path]:
-    result: dict[str, Path] = {}
-    ignored = {".git", "__pycache__", "build", "dist"}
-    for source in project_root.rglob("*.uiscript"):
-        if any(part in ignored for part in source.relative_to(project_root).parts):
+    project_root = project_index.project_root
+    for meta_path, exc in project_index.invalid_metadata(".uiscript"):
+        if exc is None:
             continue
-        meta_path = Path(f"{source}.meta")
-        if not meta_path.is_file():
-            continue
-        try:
-            metadata = json.loads(meta_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
-            diagnostics.append(
-                RuntimePackageExportDiagnostic(
-                    level="warning",
-                    path=project_relative_path(project_root, meta_path),
-                    message=(
-                        "Runtime exporter failed to inspect native UI document "
-                        f"metadata: {exc}"
-                    ),
-                )
+        diagnostics.append(
+            RuntimePackageExportDiagnostic(
+                level="warning",
+                path=project_relative_path(project_root, meta_path),
+                message=(
+                    "Runtime exporter failed to inspect native UI document "
+                    f"metadata: {exc}"
+                ),
             )
+        )
+
+    result: dict[str, Path] = {}
+    for uuid_value in sorted(required):
+        sources = project_index.paths_with_uuid(uuid_value, ".uiscript")
+        if not sources:
             continue
-        uuid_value = metadata.get("uuid") if isinstance(metadata, dict) else None
-        if uuid_value not in required:
-            continue
-        if uuid_value in result:
+        result[uuid_value] = sources[0]
+        for source in sources[1:]:
             diagnostics.append(
                 RuntimePackageExportDiagnostic(
                     level="error",
@@ -156,6 +154,4 @@ def _index_ui_sources(
                     message=f"Duplicate native UI document UUID '{uuid_value}'",
                 )
             )
-            continue
-        result[uuid_value] = source
     return result
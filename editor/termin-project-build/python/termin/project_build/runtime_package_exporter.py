@@ -6,6 +6,7 @@ The exporter writes the package contract consumed by termin-runtime:
     scenes/<project-relative-scene-path>.json
     pipelines/*.pipeline-template
     meshes/*.tmesh.json
+    meshes/*.tmesh.bin
     materials/*.tmat.json
     textures/*.texture.json
     textures/*.{png,jpg,jpeg,tga,bmp}
@@ -28,6 +29,7 @@ from typing import Any
 
 from termin.project.scene_paths import project_scene_identity
 from termin.project.settings import load_project_settings
+from termin.project_build.runtime_package.export_state import RuntimePackageExportState
 from termin.project_build.runtime_package.models import (
     RuntimePackageExportDiagnostic,
     RuntimePackageExportResult,
@@ -54,6 +56,7 @@ from termin.project_build.runtime_package.pipelines import (
     CompiledPipelineExport as _CompiledPipelineExport,
     write_pipelines as _write_pipelines,
 )
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
 from termin.project_build.runtime_package.scene_refs import (
     collect_project_material_refs as _collect_project_material_refs,
     collect_runtime_refs as _collect_runtime_refs,
@@ -110,7 +113,14 @@ def export_runtime_package(
     resource_policy: str = DEFAULT_RESOURCE_POLICY,
     shader_targets: Iterable[str] | None = None,
     target_platform: tuple[str, str] | None = None,
+    incremental: bool = False,
 ) -> RuntimePackageExportResult:
+    """Export scenes and their resources into a runtime package directory.
+
+    With ``incremental=True`` mesh payloads and texture sources of the
+    previous export are kept when their inputs are unchanged; see
+    ``runtime_package.export_state``. Other resources are regenerated.
+    """
     _validate_resource_policy(resource_policy)
     requested_shader_targets = _normalize_shader_targets(shader_targets)
     project_root_path = Path(project_root).resolve()
@@ -148,14 +158,22 @@ def export_runtime_package(
             refs.ui_documents.update(scene_refs.ui_documents)
     if refs is None:
         raise ValueError("Runtime package must contain at least one scene root")
-    _collect_project_material_refs(project_root_path, refs, diagnostics)
+    # One walk of the project tree serves every source lookup below
+    project_index = ProjectResourceIndex(project_root_path)
+    _collect_project_material_refs(project_root_path, refs, diagnostics, project_index=project_index)
     try:
         _prepare_standard_resources(refs.meshes, refs.materials)
-        _prepare_project_mesh_resources(project_root_path, refs.meshes, diagnostics)
+        _prepare_project_mesh_resources(
+            project_root_path,
+            refs.meshes,
+            diagnostics,
+            project_index=project_index,
+        )
         _prepare_project_material_resources(
             project_root_path,
             refs.materials,
             diagnostics,
+            project_index=project_index,
         )
     except Exception as exc:
         diagnostics.append(
@@ -166,7 +184,12 @@ def export_runtime_package(
             )
         )
 
-    _write_clean_package_dir(output_dir_path)
+    export_state = RuntimePackageExportState(output_dir_path)
+    if incremental:
+        export_state.load()
+    else:
+        export_state.path.unlink(missing_ok=True)
+    _write_clean_package_dir(output_dir_path, keep=export_state.previous_outputs())
     packaged_scene_paths: dict[str, Path] = {}
     for identity, scene_data in scene_documents.items():
         packaged_path = output_dir_path / _packaged_scene_path(identity)
@@ -186,6 +209,8 @@ def export_runtime_package(
         resources,
         diagnostics,
         resource_policy,
+        project_index=project_index,
+        export_state=export_state,
     )
     _write_materials(
         output_dir_path,
@@ -205,6 +230,7 @@ def export_runtime_package(
         refs.textures,
         resources,
         diagnostics,
+        project_index=project_index,
     )
     _write_ui_documents(
         project_root_path,
@@ -212,10 +238,24 @@ def export_runtime_package(
         refs.ui_documents,
         resources,
         diagnostics,
+        project_index=project_index,
+    )
+    _write_textures(
+        project_root_path,
+        output_dir_path,
+        refs.textures,
+        resources,
+        diagnostics,
+        project_index=project_index,
+        export_state=export_state,
     )
-    _write_textures(project_root_path, output_dir_path, refs.textures, resources, diagnostics)
     compiled_pipelines = _write_pipelines(
-        project_root_path, output_dir_path, refs.pipelines, resources, diagnostics
+        project_root_path,
+        output_dir_path,
+        refs.pipelines,
+        resources,
+        diagnostics,
+        project_index=project_index,
     )
     temporary_ui_assets = _stage_ui_documents_for_scene_analysis(
         output_dir_path, resources, diagnostics
@@ -294,6 +334,7 @@ def export_runtime_package(
         manifest["target_requirements"] = target_requirements
     manifest_path = output_dir_path / "manifest.json"
     _write_json(manifest_path, manifest)
+    export_state.save()
 
     return RuntimePackageExportResult(
         package_dir=output_dir_path,
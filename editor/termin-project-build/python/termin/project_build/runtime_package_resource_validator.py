@@ -82,6 +82,8 @@ def _validate_resources(
             spec = _validate_shader_program_resource(path, resolved_path, diagnostics)
         elif resource_type == "material" and resolved_path is not None and isinstance(path, str):
             spec = _validate_material_resource(package_root, path, resolved_path, diagnostics)
+        elif resource_type == "mesh" and resolved_path is not None and isinstance(path, str):
+            spec = _validate_mesh_resource(package_root, path, resolved_path, diagnostics)
         elif resource_type == "texture" and resolved_path is not None and isinstance(path, str):
             spec = _validate_texture_resource(package_root, path, resolved_path, diagnostics)
         elif resource_type == "pipeline" and resolved_path is not None and isinstance(path, str):
@@ -845,6 +847,104 @@ def _validate_texture_resource(
     return texture_spec
 
 
+def _validate_mesh_resource(
+    package_root: Path,
+    resource_path: str,
+    mesh_spec_path: Path,
+    diagnostics: list[RuntimePackageExportDiagnostic],
+) -> dict[str, Any] | None:
+    mesh_spec = _read_json_file(mesh_spec_path, resource_path, diagnostics)
+    if mesh_spec is None:
+        return None
+    data = mesh_spec.get("data")
+    if data is None:
+        # Inline vertices/indices lists: the legacy text payload
+        return mesh_spec
+
+    def error(message: str) -> dict[str, Any]:
+        diagnostics.append(RuntimePackageExportDiagnostic("error", resource_path, message))
+        return mesh_spec
+
+    if not isinstance(data, dict):
+        return error("Runtime mesh field 'data' must be an object")
+    data_path = data.get("path")
+    if not isinstance(data_path, str) or data_path == "":
+        return error("Runtime mesh data must contain non-empty string field 'path'")
+    resolved_data = _validate_relative_existing_path(
+        package_root,
+        data_path,
+        f"{resource_path}:data.path",
+        diagnostics,
+    )
+    if data.get("byte_order") != "little":
+        return error("Runtime mesh data byte_order must be 'little'")
+    alignment = data.get("alignment")
+    if not _is_json_int(alignment) or alignment < 4 or alignment & (alignment - 1):
+        return error("Runtime mesh data alignment must be a power of two of at least 4")
+
+    layout = mesh_spec.get("layout")
+    if not isinstance(layout, list) or not layout:
+        return error("Runtime mesh spec must contain a non-empty list field 'layout'")
+    floats_per_vertex = 0
+    for attribute in layout:
+        components = attribute.get("components") if isinstance(attribute, dict) else None
+        if not _is_json_int(components) or components <= 0 or attribute.get("type", "float32") != "float32":
+            return error("Runtime mesh layout attributes must be float32 with positive components")
+        floats_per_vertex += components
+    for field_name in ("vertex_count", "index_count", "stride"):
+        if not _is_json_int(mesh_spec.get(field_name)) or mesh_spec[field_name] <= 0:
+            return error(f"Runtime mesh spec must contain positive integer field '{field_name}'")
+    if mesh_spec["stride"] != floats_per_vertex * 4:
+        return error(
+            f"Runtime mesh stride {mesh_spec['stride']} does not match layout stride {floats_per_vertex * 4}"
+        )
+
+    expected = {
+        "vertices": ("float32", mesh_spec["vertex_count"] * mesh_spec["stride"]),
+        "indices": ("uint32", mesh_spec["index_count"] * 4),
+    }
+    blocks: list[tuple[int, int]] = []
+    for block_name, (block_type, block_size) in expected.items():
+        block = data.get(block_name)
+        if not isinstance(block, dict):
+            return error(f"Runtime mesh data must contain object field '{block_name}'")
+        offset = block.get("offset")
+        size = block.get("size")
+        if block.get("type") != block_type:
+            return error(f"Runtime mesh {block_name} type must be '{block_type}'")
+        if not _is_json_int(offset) or offset < 0 or offset % alignment:
+            return error(f"Runtime mesh {block_name} offset must be a multiple of {alignment}")
+        if size != block_size:
+            return error(f"Runtime mesh {block_name} size {size!r} does not match expected {block_size} bytes")
+        blocks.append((offset, offset + size))
+    blocks.sort()
+    if blocks[0][1] > blocks[1][0]:
+        return error("Runtime mesh vertex and index blocks overlap")
+
+    if resolved_data is None:
+        return mesh_spec
+    payload_size = resolved_data.stat().st_size
+    if blocks[1][1] > payload_size:
+        return error(f"Runtime mesh data file is truncated: {payload_size} < {blocks[1][1]} bytes")
+
+    index_block = data["indices"]
+    with resolved_data.open("rb") as f:
+        f.seek(index_block["offset"])
+        indices = f.read(index_block["size"])
+    vertex_count = mesh_spec["vertex_count"]
+    # Walk in slices so huge meshes do not unpack into one Python list
+    step = 1 << 16
+    for start in range(0, len(indices), step * 4):
+        chunk = indices[start:start + step * 4]
+        if max(struct.unpack(f"<{len(chunk) // 4}I", chunk)) >= vertex_count:
+            return error(f"Runtime mesh index data references vertices beyond vertex_count {vertex_count}")
+    return mesh_spec
+
+
+def _is_json_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
 def _validate_pipeline_resource(
     package_root: Path,
     resource_path: str,
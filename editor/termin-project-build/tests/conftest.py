@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_shader_compile_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Keep exporter tests out of the user's shader compile cache
+    monkeypatch.setenv("TERMIN_SHADER_COMPILE_CACHE_ROOT", "")
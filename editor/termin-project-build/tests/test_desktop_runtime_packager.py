@@ -11,6 +11,7 @@ from termin.project_build.desktop_runtime_packager import package_desktop_runtim
 from termin.project_build.pipeline import ProjectBuildPipelineError
 import termin.project_build.desktop_build as desktop_build
 import termin.project_build.runtime_package.shaders as runtime_shaders
+from termin.project_build.runtime_package.meshes import read_mesh_data
 from termin.project_build.runtime_package_validator import validate_runtime_package
 
 from desktop_runtime_packager_test_support import (
@@ -1979,8 +1980,9 @@ def test_export_runtime_package_uses_live_mesh_material_shader(tmp_path: Path) -
         )
     )
 
-    assert mesh_data["vertices"] == vertices.astype(float).tolist()
-    assert mesh_data["indices"] == [0, 1, 2]
+    mesh_vertices, mesh_indices = read_mesh_data(result.package_dir, mesh_data)
+    np.testing.assert_array_equal(mesh_vertices, vertices.astype(np.float32).reshape(-1))
+    assert mesh_indices.tolist() == [0, 1, 2]
     assert mesh_data["submeshes"] == [
         {
             "first_index": 0,
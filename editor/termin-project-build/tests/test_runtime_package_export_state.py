@@ -0,0 +1,123 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from termin.project_build.runtime_package import meshes as runtime_meshes
+from termin.project_build.runtime_package.export_state import (
+    RuntimePackageExportState,
+    export_state_path,
+)
+from termin.project_build.runtime_package.meshes import write_meshes
+from termin.project_build.runtime_package.package_files import write_clean_package_dir
+from termin.project_build.runtime_package.textures import write_textures
+
+
+def _write_texture(project: Path, name: str, uuid_value: str, meta: dict | None = None) -> Path:
+    source_path = project / "Textures" / f"{name}.png"
+    source_path.parent.mkdir(parents=True, exist_ok=True)
+    source_path.write_bytes(f"{name} bytes".encode("utf-8"))
+    Path(f"{source_path}.meta").write_text(
+        json.dumps({"uuid": uuid_value, **(meta or {})}),
+        encoding="utf-8",
+    )
+    return source_path
+
+
+def _export(project: Path, package: Path, textures: dict[str, str], incremental: bool = True) -> RuntimePackageExportState:
+    state = RuntimePackageExportState(package)
+    if incremental:
+        state.load()
+    write_clean_package_dir(package, keep=state.previous_outputs())
+    diagnostics = []
+    write_textures(project, package, textures, [], diagnostics, export_state=state)
+    assert diagnostics == []
+    state.save()
+    return state
+
+
+def test_incremental_export_reuses_unchanged_payloads_and_drops_unreferenced(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    package = tmp_path / "package"
+    _write_texture(project, "Albedo", "albedo-uuid")
+    _write_texture(project, "Mask", "mask-uuid")
+    textures = {"albedo-uuid": "Albedo", "mask-uuid": "Mask"}
+
+    assert _export(project, package, textures, incremental=False).reused == []
+    assert export_state_path(package).is_file()
+    (package / "stale.json").write_text("{}", encoding="utf-8")
+
+    state = _export(project, package, textures)
+    assert sorted(state.reused) == ["texture:albedo-uuid", "texture:mask-uuid"]
+    assert not (package / "stale.json").exists()
+    assert (package / "textures" / "albedo-uuid.texture.json").is_file()
+
+    # An import setting edit re-exports only that texture
+    _write_texture(project, "Mask", "mask-uuid", {"filter": "nearest"})
+    state = _export(project, package, textures)
+    assert state.reused == ["texture:albedo-uuid"]
+    mask_spec = json.loads((package / "textures" / "mask-uuid.texture.json").read_text(encoding="utf-8"))
+    assert mask_spec["import_settings"]["filter"] == "nearest"
+
+    state = _export(project, package, {"mask-uuid": "Mask"})
+    assert state.reused == ["texture:mask-uuid"]
+    assert not (package / "textures" / "albedo-uuid.png").exists()
+    assert (package / "textures" / "mask-uuid.png").read_bytes() == b"Mask bytes"
+
+    # A missing payload is regenerated instead of trusted
+    (package / "textures" / "mask-uuid.png").unlink()
+    assert _export(project, package, {"mask-uuid": "Mask"}).reused == []
+    assert (package / "textures" / "mask-uuid.png").is_file()
+
+
+def _export_meshes(project: Path, package: Path, meshes: dict[str, str]) -> RuntimePackageExportState:
+    state = RuntimePackageExportState(package)
+    state.load()
+    write_clean_package_dir(package, keep=state.previous_outputs())
+    diagnostics = []
+    write_meshes(project, package, meshes, [], diagnostics, "strict", export_state=state)
+    assert diagnostics == []
+    state.save()
+    return state
+
+
+def test_incremental_export_invalidates_meshes_on_importer_or_payload_change(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project = tmp_path / "project"
+    package = tmp_path / "package"
+    source_path = project / "Meshes" / "Crate.obj"
+    source_path.parent.mkdir(parents=True)
+    source_path.write_text("v 0 0 0\n", encoding="utf-8")
+    Path(f"{source_path}.meta").write_text(json.dumps({"uuid": "crate-uuid"}), encoding="utf-8")
+    imported: list[str] = []
+
+    def fake_mesh_source_to_spec(path: Path, uuid_value: str, name: str) -> dict:
+        imported.append(uuid_value)
+        return {
+            "uuid": uuid_value,
+            "name": name,
+            "layout": [{"name": "position", "components": 3}],
+            "vertices": [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+            "indices": [0, 1, 2],
+            "submeshes": [],
+        }
+
+    monkeypatch.setattr(runtime_meshes, "mesh_source_to_spec", fake_mesh_source_to_spec)
+    monkeypatch.setattr(runtime_meshes, "mesh_importer_version", lambda: 2)
+    meshes = {"crate-uuid": "Crate"}
+
+    assert _export_meshes(project, package, meshes).reused == []
+    assert _export_meshes(project, package, meshes).reused == ["mesh:crate-uuid"]
+    assert (package / "meshes" / "crate-uuid.tmesh.bin").is_file()
+    assert imported == ["crate-uuid"]
+
+    monkeypatch.setattr(runtime_meshes, "mesh_importer_version", lambda: 3)
+    assert _export_meshes(project, package, meshes).reused == []
+    assert len(imported) == 2
+
+    monkeypatch.setattr(runtime_meshes, "MESH_PAYLOAD_VERSION", runtime_meshes.MESH_PAYLOAD_VERSION + 1)
+    assert _export_meshes(project, package, meshes).reused == []
+    assert _export_meshes(project, package, meshes).reused == ["mesh:crate-uuid"]
+    assert len(imported) == 3
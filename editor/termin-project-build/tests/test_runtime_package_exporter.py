@@ -1,5 +1,6 @@
 import json
 import shutil
+from dataclasses import replace
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -15,6 +16,8 @@ from termin.project_build.runtime_package_exporter import (
 )
 from termin.project_build.runtime_package.models import ShaderSpec
 from termin.project_build.runtime_package.materials import _shader_source_identity
+from termin.project_build.runtime_package import shaders as runtime_shaders
+from termin.project_build.runtime_package.meshes import read_mesh_data
 from termin.project_build.runtime_package.shaders import (
     ENGINE_MULTIVIEW_TONEMAP_SHADER_UUID,
     artifact_path_text,
@@ -723,6 +726,104 @@ def test_fragment_only_pipeline_variant_compiles_only_fragment_stage(
     assert resources == []
 
 
+def test_shader_stage_artifacts_are_reused_from_compile_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TERMIN_SHADER_COMPILE_CACHE_ROOT", str(tmp_path / "cache"))
+    compiled: list[str] = []
+    compile_shader_stage = runtime_shaders.compile_shader_stage
+
+    def counting_compile(*args, **kwargs) -> None:
+        compiled.append(args[5].name)
+        compile_shader_stage(*args, **kwargs)
+
+    monkeypatch.setattr(runtime_shaders, "compile_shader_stage", counting_compile)
+    compiler = _write_fake_shader_compiler(tmp_path)
+    shader = ShaderSpec(
+        uuid="shv_cached",
+        name="Cached",
+        source_path="runtime-registry",
+        vertex_source='[shader("vertex")] void vertex_main() {}',
+        fragment_source='[shader("fragment")] void fragment_main() {}',
+        language="slang",
+        vertex_entry="vertex_main",
+        fragment_entry="fragment_main",
+        source_identity="sha256:cached",
+        artifact_role="pipeline_variant",
+        register_in_runtime=False,
+    )
+    targets = ("vulkan", "webgpu")
+
+    first = write_shader(tmp_path / "first", [], [], shader, compiler, targets)
+    assert len(compiled) == 4
+
+    spec = write_shader(tmp_path / "second", [], [], shader, compiler, targets)
+    assert len(compiled) == 4
+    for artifacts in spec["artifacts"].values():
+        for artifact in artifacts.values():
+            for suffix in ("", ".layout.json"):
+                cached = tmp_path / "second" / f"{artifact}{suffix}"
+                assert cached.read_bytes() == (tmp_path / "first" / f"{artifact}{suffix}").read_bytes()
+    assert spec["artifacts"] == first["artifacts"]
+
+    # Any program source change invalidates every stage of the program
+    changed = replace(shader, fragment_source=shader.fragment_source + "\n")
+    write_shader(tmp_path / "third", [], [], changed, compiler, targets)
+    assert len(compiled) == 8
+
+
+def test_shader_compile_cache_keys_on_imported_modules_and_slangc(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sdk = tmp_path / "sdk"
+    modules = sdk / "share" / "termin" / "builtin_shaders"
+    (modules / "termin").mkdir(parents=True)
+    (modules / "termin" / "lighting.slang").write_text("import shadow_common;\n", encoding="utf-8")
+    (modules / "shadow-common.slang").write_text("float shadow() { return 1; }\n", encoding="utf-8")
+    slangc = tmp_path / "slangc"
+    slangc.write_bytes(b"slangc 2025.1")
+    monkeypatch.setenv("TERMIN_SDK", str(sdk))
+    monkeypatch.setenv("TERMIN_SLANGC", str(slangc))
+    monkeypatch.setenv("TERMIN_SHADER_COMPILE_CACHE_ROOT", str(tmp_path / "cache"))
+    compiled: list[str] = []
+    compile_shader_stage = runtime_shaders.compile_shader_stage
+
+    def counting_compile(*args, **kwargs) -> None:
+        compiled.append(args[5].name)
+        compile_shader_stage(*args, **kwargs)
+
+    monkeypatch.setattr(runtime_shaders, "compile_shader_stage", counting_compile)
+    compiler = _write_fake_shader_compiler(tmp_path)
+    shader = ShaderSpec(
+        uuid="shv_imports",
+        name="Imports",
+        source_path="runtime-registry",
+        vertex_source="",
+        fragment_source='import termin.lighting;\n[shader("fragment")] void fragment_main() {}',
+        language="slang",
+        fragment_entry="fragment_main",
+        source_identity="sha256:imports",
+        artifact_role="pipeline_variant",
+        register_in_runtime=False,
+    )
+
+    write_shader(tmp_path / "first", [], [], shader, compiler, ("vulkan",))
+    write_shader(tmp_path / "second", [], [], shader, compiler, ("vulkan",))
+    assert len(compiled) == 1
+
+    # A transitively imported builtin module changed
+    (modules / "shadow-common.slang").write_text("float shadow() { return 0; }\n", encoding="utf-8")
+    write_shader(tmp_path / "third", [], [], shader, compiler, ("vulkan",))
+    assert len(compiled) == 2
+
+    # slangc upgraded in place
+    slangc.write_bytes(b"slangc 2025.2")
+    write_shader(tmp_path / "fourth", [], [], shader, compiler, ("vulkan",))
+    assert len(compiled) == 3
+
+
 def test_constrained_gl_shader_targets_have_distinct_package_paths() -> None:
     assert normalize_shader_targets(["OpenGL330", "webgl2"]) == (
         "opengl330",
@@ -1249,7 +1350,9 @@ def test_export_runtime_package_reads_standalone_mesh_asset_by_meta_uuid(tmp_pat
     assert mesh_data["uuid"] == mesh_uuid
     assert mesh_data["name"] == "Triangle"
     assert mesh_data["vertex_count"] == 3
-    assert mesh_data["indices"] == [0, 1, 2]
+    assert mesh_data["data"]["path"] == f"meshes/{mesh_uuid}.tmesh.bin"
+    _, indices = read_mesh_data(result.package_dir, mesh_data)
+    assert indices.tolist() == [0, 1, 2]
     attribute_names = [attribute["name"] for attribute in mesh_data["layout"]]
     assert "position" in attribute_names
     assert "normal" in attribute_names
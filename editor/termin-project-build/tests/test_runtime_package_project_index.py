@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from termin.project_build.runtime_package.meshes import find_mesh_source
+from termin.project_build.runtime_package.project_index import ProjectResourceIndex
+from termin.project_build.runtime_package.textures import index_project_texture_sources
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _write_with_meta(path: Path, uuid_value: str) -> Path:
+    _write(Path(f"{path}.meta"), json.dumps({"uuid": uuid_value}))
+    return _write(path, "source")
+
+
+def test_project_index_maps_uuid_name_and_suffix_in_one_scan(tmp_path: Path) -> None:
+    project = tmp_path / "Game"
+    albedo = _write_with_meta(project / "Textures" / "albedo.png", "texture-uuid")
+    _write_with_meta(project / "dist" / "albedo.png", "texture-uuid")
+    _write_with_meta(project / "Textures" / "layered.psd", "layered-uuid")
+    cube = _write_with_meta(project / "Models" / "Cube.obj", "cube-uuid")
+    broken = _write(project / "Models" / "Broken.stl", "solid")
+    _write(Path(f"{broken}.meta"), "{")
+    triangle = _write(project / "Models" / "Triangle.stl", "solid")
+    material = _write(project / "Materials" / "Red.material", json.dumps({"uuid": "red"}))
+
+    index = ProjectResourceIndex(project)
+
+    assert index.paths(".obj", ".stl") == [broken, cube, triangle]
+    assert index.paths_with_uuid("texture-uuid") == [albedo]
+    assert index.paths_with_uuid("cube-uuid", ".stl") == []
+    assert [meta for meta, _exc in index.invalid_metadata()] == [Path(f"{broken}.meta")]
+
+    # Documents are read once per export
+    assert index.read_json(material) == {"uuid": "red"}
+    material.write_text(json.dumps({"uuid": "blue"}), encoding="utf-8")
+    assert index.read_json(material) == {"uuid": "red"}
+
+    diagnostics = []
+    assert find_mesh_source(project, "cube-uuid", "Cube", diagnostics, project_index=index) == cube
+    assert find_mesh_source(project, "missing-uuid", "Triangle", diagnostics, project_index=index) == triangle
+    # Reported once per export, not once per mesh lookup
+    assert [(item.path, item.message.split(":")[0]) for item in diagnostics] == [
+        ("Models/Broken.stl.meta", "Runtime exporter failed to inspect mesh metadata"),
+    ]
+
+    diagnostics = []
+    sources, rejected = index_project_texture_sources(
+        project,
+        {"texture-uuid", "layered-uuid"},
+        diagnostics,
+        project_index=index,
+    )
+    assert sources == {"texture-uuid": albedo}
+    assert rejected == {"layered-uuid"}
+    assert [(item.level, item.path) for item in diagnostics] == [
+        ("warning", "Models/Broken.stl.meta"),
+        ("error", "Textures/layered.psd"),
+    ]
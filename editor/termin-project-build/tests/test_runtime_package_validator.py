@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from termin.project_build import runtime_package_resource_validator
+from termin.project_build.runtime_package.meshes import pack_mesh_data
 from termin.project_build.runtime_package_resource_validator import (
     SceneComponentFactoryPolicy,
 )
@@ -632,6 +633,39 @@ def test_validate_runtime_package_reports_missing_resource_file(tmp_path: Path)
     ]
 
 
+def test_validate_runtime_package_checks_binary_mesh_payload(tmp_path: Path) -> None:
+    package_dir = _write_valid_package(tmp_path)
+    header, payload = pack_mesh_data(
+        {
+            "uuid": "mesh-uuid",
+            "name": "Triangle",
+            "draw_mode": "triangles",
+            "layout": [{"name": "position", "location": 0, "components": 3, "type": "float32"}],
+            "vertices": [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+            "indices": [0, 1, 2],
+            "submeshes": [],
+        },
+        "meshes/mesh-uuid.tmesh.bin",
+    )
+    _write_json(package_dir / "meshes" / "mesh-uuid.tmesh.json", header)
+    data_path = package_dir / "meshes" / "mesh-uuid.tmesh.bin"
+    data_path.write_bytes(payload)
+
+    assert header["stride"] == 12
+    assert header["data"]["indices"] == {"type": "uint32", "offset": 64, "size": 12}
+    assert validate_runtime_package(package_dir) == []
+
+    data_path.write_bytes(payload[:-4])
+    assert any("truncated" in item.message for item in validate_runtime_package(package_dir))
+
+    data_path.write_bytes(payload[:-4] + struct.pack("<I", 3))
+    assert any("beyond vertex_count 3" in item.message for item in validate_runtime_package(package_dir))
+
+    header["data"]["indices"]["offset"] = 40
+    _write_json(package_dir / "meshes" / "mesh-uuid.tmesh.json", header)
+    assert any("multiple of 64" in item.message for item in validate_runtime_package(package_dir))
+
+
 def test_validate_runtime_package_rejects_path_escape(tmp_path: Path) -> None:
     package_dir = _write_valid_package(tmp_path)
     _write_json(
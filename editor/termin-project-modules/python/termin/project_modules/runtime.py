@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Callable
 
 from tcbase import log
+from termin_nanobind.runtime import is_python_executable, sdk_python_executable
 from termin.engine import TermModulesIntegration
 from termin_modules import (
     CppModuleBackend,
@@ -31,38 +32,6 @@ class ModuleFileChange:
     reason: str
 
 
-def _is_python_executable(path: Path) -> bool:
-    name = path.name.lower()
-    return name in {
-        "python",
-        "python3",
-        "python.exe",
-        "pythonw.exe",
-        "termin_python",
-        "termin_python.exe",
-    } or name.startswith("python3.")
-
-
-def _sdk_python_executable(prefix_root: Path) -> Path | None:
-    if sys.platform == "win32":
-        candidates = (
-            prefix_root / "python" / "python.exe",
-            prefix_root / "bin" / "python.exe",
-            prefix_root / "bin" / "termin_python.exe",
-        )
-    else:
-        candidates = (
-            prefix_root / "bin" / "termin_python",
-            prefix_root / "bin" / "python3",
-            prefix_root / "bin" / "python",
-        )
-
-    for candidate in candidates:
-        if candidate.is_file():
-            return candidate
-    return None
-
-
 class ProjectModulesRuntime:
     """Coordinate project module discovery, loading, and live reload.
 
@@ -576,10 +545,10 @@ class ProjectModulesRuntime:
         if override:
             environment.python_executable = override
         else:
-            sdk_python = _sdk_python_executable(prefix_root)
+            sdk_python = sdk_python_executable(prefix_root)
             if sdk_python is not None:
                 environment.python_executable = str(sdk_python)
-            elif _is_python_executable(Path(sys.executable)):
+            elif is_python_executable(Path(sys.executable)):
                 environment.python_executable = sys.executable
             else:
                 log.error(
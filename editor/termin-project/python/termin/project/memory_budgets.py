@@ -0,0 +1,31 @@
+"""Canonical policy for per-asset-type memory budget settings."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+
+def normalize_asset_memory_budgets(
+    value: object,
+    *,
+    field_name: str,
+    warning: Callable[[str], None],
+) -> dict[str, int]:
+    """Return asset type id -> budget in MiB, dropping invalid entries.
+
+    Editor settings and the player both read budgets through this function so
+    a project cannot be accepted by one and interpreted differently by the
+    other.
+    """
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        warning(f"{field_name} must be an object, ignoring it")
+        return {}
+    budgets: dict[str, int] = {}
+    for type_id, budget in value.items():
+        if not isinstance(type_id, str) or not type_id or type(budget) is not int or budget <= 0:
+            warning(f"{field_name}.{type_id} must be a positive integer, ignoring it")
+            continue
+        budgets[type_id] = budget
+    return budgets
@@ -29,6 +29,7 @@ from termin.render import (
     configure_project_render_phases,
     set_render_sync_mode as c_set_render_sync_mode,
 )
+from termin.project.memory_budgets import normalize_asset_memory_budgets
 from termin.project.resource_paths import (
     SERVICE_RESOURCE_IGNORE_PATHS as SERVICE_RESOURCE_IGNORE_PATHS,
     normalize_project_resource_paths,
@@ -143,6 +144,9 @@ class ProjectSettings:
         default_factory=lambda: [""] * PROJECT_RENDER_PHASE_CAPACITY
     )
     player_window: ProjectPlayerWindowSettings = field(default_factory=ProjectPlayerWindowSettings)
+    # Player memory budgets in MiB by asset type id ("mesh", "texture", ...).
+    # Unlisted types keep loaded assets resident until they are unregistered.
+    asset_memory_budgets_mib: dict[str, int] = field(default_factory=dict)
     application: ProjectApplicationIdentity = field(
         default_factory=lambda: default_project_application_identity("Termin Project")
     )
@@ -158,6 +162,7 @@ class ProjectSettings:
             "ignored_resource_paths": list(self.ignored_resource_paths),
             "render_phase_names": list(self.render_phase_names),
             "player_window": self.player_window.to_dict(),
+            "asset_memory_budgets_mib": dict(self.asset_memory_budgets_mib),
             "application": self.application.to_dict(),
             "world_controller": (
                 self.world_controller.to_dict()
@@ -187,6 +192,11 @@ class ProjectSettings:
         )
         render_phase_names = _normalize_render_phase_names(data.get("render_phase_names"))
         player_window = ProjectPlayerWindowSettings.from_dict(data.get("player_window"))
+        asset_memory_budgets_mib = normalize_asset_memory_budgets(
+            data.get("asset_memory_budgets_mib"),
+            field_name="asset_memory_budgets_mib",
+            warning=lambda message: log.warning(f"[ProjectSettings] {message}"),
+        )
         application = ProjectApplicationIdentity.from_dict(
             data.get("application"),
             project_name=project_name,
@@ -201,6 +211,7 @@ class ProjectSettings:
             ignored_resource_paths=ignored_resource_paths,
             render_phase_names=render_phase_names,
             player_window=player_window,
+            asset_memory_budgets_mib=asset_memory_budgets_mib,
             application=application,
             world_controller=world_controller,
         )
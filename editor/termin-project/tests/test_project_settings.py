@@ -122,6 +122,29 @@ def test_ignored_resource_path_contract_is_shared_by_editor_build_and_player(tmp
     assert build_settings.ignored_resource_paths == expected
 
 
+def test_asset_memory_budget_contract_is_shared_by_editor_and_player() -> None:
+    data = {
+        "asset_memory_budgets_mib": {
+            "mesh": 256,
+            "texture": 512,
+            "audio": 0,
+            "voxel_grid": -4,
+            "animation": True,
+            "material": 1.5,
+            "": 64,
+        }
+    }
+    expected = {"mesh": 256, "texture": 512}
+
+    editor_settings = ProjectSettings.from_dict(data)
+    player_settings = ProjectRuntimeSettings.from_dict(data)
+
+    assert editor_settings.asset_memory_budgets_mib == expected
+    assert player_settings.asset_memory_budgets_mib == expected
+    assert ProjectSettings.from_dict({"asset_memory_budgets_mib": [1]}).asset_memory_budgets_mib == {}
+    assert ProjectRuntimeSettings.from_dict({"asset_memory_budgets_mib": [1]}).asset_memory_budgets_mib == {}
+
+
 def test_render_sync_mode_runtime_binding_belongs_to_render_package() -> None:
     set_render_sync_mode(CRenderSyncMode.FLUSH)
     try:
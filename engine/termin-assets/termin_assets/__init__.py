@@ -3,7 +3,15 @@
 from termin_assets.asset import Asset
 from termin_assets.asset_registry import AssetRegistry
 from termin_assets.asset_store import AssetStore
+from termin_assets.async_loading import AssetLoadScheduler
 from termin_assets.data_asset import DataAsset
+from termin_assets.derived_data import (
+    DerivedDataCache,
+    DerivedDataEntry,
+    current_derived_data_cache,
+    derived_data_key,
+    set_derived_data_cache,
+)
 from termin_assets.embedded_asset import EmbeddedAssetSpec
 from termin_assets.identifiable import Identifiable
 from termin_assets.plugin import (
@@ -33,6 +41,12 @@ from termin_assets.default_plugins import (
 from termin_assets.preload import AssetIdentityPolicy, AssetRegistration, PreLoadResult
 from termin_assets.plugin_preloader import PluginPreLoader
 from termin_assets.project_file_watcher import FilePreLoader, ProjectFileWatcher
+from termin_assets.residency import (
+    AssetResidencyManager,
+    ResidencyCounters,
+    current_residency_frame,
+)
+from termin_assets.scan_index import AssetScanIndex
 from termin_assets.resource_handle import (
     ResourceHandle,
     get_resource_manager,
@@ -54,6 +68,7 @@ __all__ = [
     "AssetCreationPlugin",
     "AssetIdentityPolicy",
     "AssetImportPlugin",
+    "AssetLoadScheduler",
     "Asset",
     "AssetRegistry",
     "AssetStore",
@@ -63,10 +78,17 @@ __all__ = [
     "AssetRuntimeManager",
     "AssetReloadEvent",
     "AssetReloadSubscription",
+    "AssetResidencyManager",
+    "AssetScanIndex",
     "AssetTypePlugin",
     "AssetTypeRegistry",
     "build_import_plugin_extension_map",
     "DataAsset",
+    "DerivedDataCache",
+    "DerivedDataEntry",
+    "current_derived_data_cache",
+    "current_residency_frame",
+    "derived_data_key",
     "EmbeddedAssetSpec",
     "ensure_uuid_in_spec",
     "Identifiable",
@@ -75,6 +97,7 @@ __all__ = [
     "FilePreLoader",
     "PluginPreLoader",
     "ProjectFileWatcher",
+    "ResidencyCounters",
     "ResourceHandle",
     "get_uuid_from_spec",
     "get_resource_manager",
@@ -85,6 +108,7 @@ __all__ = [
     "register_import_plugins_from_entry_points",
     "register_runtime_plugins_from_entry_points",
     "read_spec_file",
+    "set_derived_data_cache",
     "set_resource_manager_factory",
     "write_spec_file",
 ]
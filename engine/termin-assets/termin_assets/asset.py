@@ -5,9 +5,20 @@ from __future__ import annotations
 from pathlib import Path
 import threading
 import time
+from typing import TYPE_CHECKING
 
 from tcbase import log
 from termin_assets.identifiable import Identifiable
+from termin_assets.residency import current_residency_frame
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from termin_assets.async_loading import AssetLoadScheduler
+
+# Returned by Asset._load_off_main_thread() when the whole load has to run
+# on the main thread.
+MAIN_THREAD_LOAD = object()
 
 
 class Asset(Identifiable):
@@ -34,6 +45,7 @@ class Asset(Identifiable):
         self._loaded: bool = False
         self._last_save_mtime: float | None = None
         self._registry_owner: object | None = None
+        self._last_use_frame: int = current_residency_frame()
 
     @property
     def name(self) -> str:
@@ -67,6 +79,15 @@ class Asset(Identifiable):
         """True if asset data is loaded."""
         return self._loaded
 
+    @property
+    def last_use_frame(self) -> int:
+        """Residency frame of the last recorded use."""
+        return self._last_use_frame
+
+    def mark_used(self) -> None:
+        """Record a use in the current residency frame (LRU eviction order)."""
+        self._last_use_frame = current_residency_frame()
+
     def _bump_version(self) -> None:
         """Increment version counter."""
         self._version += 1
@@ -104,6 +125,7 @@ class Asset(Identifiable):
 
     def ensure_loaded(self) -> bool:
         """Ensure asset data is loaded."""
+        self._last_use_frame = current_residency_frame()
         if self._loaded:
             return True
         return self._run_load_operation("load")
@@ -121,6 +143,58 @@ class Asset(Identifiable):
         """Unload asset data."""
         self._loaded = False
 
+    def resident_bytes(self) -> int:
+        """Approximate memory held by the loaded data; 0 when not tracked."""
+        return 0
+
+    def has_live_references(self) -> bool:
+        """True while loaded data may be used outside the asset.
+
+        The base class cannot tell, so it never allows eviction.
+        """
+        return True
+
+    def _is_reloadable(self) -> bool:
+        """True if unloaded data can be loaded again on demand."""
+        return self._source_path is not None
+
+    def evict(self) -> bool:
+        """Unload data that nothing references and that can be reloaded lazily.
+
+        Returns True if the data was released.
+        """
+        if not self._loaded or not self._is_reloadable() or self.has_live_references():
+            return False
+        self.unload()
+        return not self._loaded
+
+    def load_async(self, scheduler: "AssetLoadScheduler | None" = None) -> "Future[bool]":
+        """Load in the background; the future resolves during scheduler.pump().
+
+        Uses the load scheduler of the configured resource manager by default.
+        """
+        if scheduler is None:
+            from termin_assets.resource_handle import get_resource_manager
+
+            resource_manager = get_resource_manager()
+            scheduler = getattr(resource_manager, "load_scheduler", None)
+            if scheduler is None:
+                log.error(f"[Asset] No asset load scheduler configured for '{self._name}'")
+                raise RuntimeError("Asset load scheduler is not configured")
+        return scheduler.load_async(self)
+
+    def _load_off_main_thread(self) -> object:
+        """Worker-thread part of a background load.
+
+        Must not touch native registries or mutate shared asset state.
+        The default defers the whole load to the main thread.
+        """
+        return MAIN_THREAD_LOAD
+
+    def _finish_load_on_main_thread(self, prepared: object) -> bool:
+        """Main-thread part of a background load."""
+        return self.ensure_loaded()
+
     def _run_load_operation(self, operation: str) -> bool:
         started_at = time.perf_counter()
         thread_id = threading.get_ident()
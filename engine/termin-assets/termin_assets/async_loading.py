@@ -0,0 +1,179 @@
+"""Background asset loading with main-thread installation.
+
+Loading an asset is split in two steps:
+
+- ``Asset._load_off_main_thread()`` runs on a worker pool: file reads and
+  CPU-side decoding that touch neither native registries nor shared state;
+- ``Asset._finish_load_on_main_thread(prepared)`` runs inside
+  ``AssetLoadScheduler.pump()``, which the application calls once per frame
+  from the thread that owns native handles.
+
+Assets that do not split their loading return ``MAIN_THREAD_LOAD`` from the
+worker step and are loaded synchronously during the pump.
+"""
+
+from __future__ import annotations
+
+import queue
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from tcbase import log
+
+from termin_assets.asset import MAIN_THREAD_LOAD
+
+if TYPE_CHECKING:
+    from termin_assets.asset import Asset
+
+_WORKER_FAILED = object()
+
+
+class AssetLoadScheduler:
+    """Worker pool for asset decoding plus a main-thread completion queue.
+
+    Futures resolve to the same bool that ``Asset.ensure_loaded()`` returns,
+    always on the pumping thread, so done-callbacks may touch native state.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: dict[str, Future] = {}
+        self._completed: queue.SimpleQueue = queue.SimpleQueue()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of loads submitted but not yet installed."""
+        return len(self._pending)
+
+    def load_async(self, asset: "Asset") -> "Future[bool]":
+        """Start loading ``asset`` in the background.
+
+        Loaded assets resolve immediately; a second request for an asset that
+        is already in flight returns the same future. Embedded assets wait
+        for their parent, which is loaded in the background first.
+        """
+        if asset.is_loaded:
+            return _resolved(True)
+
+        future = self._pending.get(asset.uuid)
+        if future is not None:
+            return future
+
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self._pending[asset.uuid] = future
+
+        parent = getattr(asset, "embedded_parent", None)
+        if parent is not None and not parent.is_loaded:
+            # Parent callbacks fire inside pump(), so the child install is
+            # queued behind it on the same thread
+            self.load_async(parent).add_done_callback(
+                lambda _parent_future: self._completed.put((asset, future, MAIN_THREAD_LOAD))
+            )
+            return future
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="termin-asset-load",
+            )
+        self._executor.submit(self._run_worker_step, asset, future)
+        return future
+
+    def prefetch(self, assets: Iterable["Asset"]) -> list["Future[bool]"]:
+        """Start background loads for every asset, keeping submission order."""
+        return [self.load_async(asset) for asset in assets]
+
+    def _run_worker_step(self, asset: "Asset", future: Future) -> None:
+        try:
+            prepared = asset._load_off_main_thread()
+        except Exception:
+            log.error(
+                f"[AssetLoadScheduler] Background load failed for "
+                f"{type(asset).__name__} '{asset.name}' ({asset.uuid})",
+                exc_info=True,
+            )
+            prepared = _WORKER_FAILED
+        self._completed.put((asset, future, prepared))
+
+    def pump(self, time_budget: float | None = None) -> int:
+        """Install finished loads on the calling thread.
+
+        Args:
+            time_budget: Seconds to spend installing. At least one completion
+                is processed per call, so loading always makes progress;
+                None drains the queue.
+
+        Returns:
+            Number of futures resolved.
+        """
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        resolved = 0
+        while True:
+            try:
+                asset, future, prepared = self._completed.get_nowait()
+            except queue.Empty:
+                break
+
+            if prepared is _WORKER_FAILED:
+                result = False
+            else:
+                try:
+                    result = bool(asset._finish_load_on_main_thread(prepared))
+                except Exception:
+                    log.error(
+                        f"[AssetLoadScheduler] Installing {type(asset).__name__} "
+                        f"'{asset.name}' ({asset.uuid}) failed",
+                        exc_info=True,
+                    )
+                    result = False
+
+            if self._pending.get(asset.uuid) is future:
+                del self._pending[asset.uuid]
+            if not future.done():
+                future.set_result(result)
+            resolved += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return resolved
+
+    def wait(self, futures: Iterable[Future], timeout: float | None = None) -> bool:
+        """Pump until all ``futures`` resolve. Returns False on timeout.
+
+        Intended for loading screens and tests; never call it per frame.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        futures = list(futures)
+        while not all(future.done() for future in futures):
+            if self.pump() == 0:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return False
+                time.sleep(0.001)
+        return True
+
+    def shutdown(self) -> None:
+        """Stop workers. Loads that never reached the pump resolve to False."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self.pump()
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_result(False)
+        # Drop child installs queued by the parent futures resolved above
+        while True:
+            try:
+                self._completed.get_nowait()
+            except queue.Empty:
+                break
+
+
+def _resolved(value: bool) -> "Future[bool]":
+    future: Future[bool] = Future()
+    future.set_result(value)
+    return future
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import sys
 from abc import abstractmethod
 from pathlib import Path
 from typing import Generic, TypeVar
 
 from tcbase import log
 
-from termin_assets.asset import Asset
+from termin_assets.asset import MAIN_THREAD_LOAD, Asset
+from termin_assets.residency import current_residency_frame
 
 T = TypeVar("T")
 
@@ -18,6 +20,10 @@ class DataAsset(Asset, Generic[T]):
     Generic base class for assets that store typed data.
 
     Subclasses must implement _parse_content().
+
+    Subclasses that can decode off the main thread also override
+    _decode_content() (worker-safe CPU work) and _parse_decoded()
+    (installation of native handles from the decoded result).
     """
 
     _uses_binary: bool = False
@@ -39,6 +45,7 @@ class DataAsset(Asset, Generic[T]):
     @property
     def data(self) -> T | None:
         """Get stored data, loading it if needed."""
+        self._last_use_frame = current_residency_frame()
         if not self._loaded:
             self._load()
         return self._data
@@ -123,10 +130,33 @@ class DataAsset(Asset, Generic[T]):
         with open(self._source_path, "r", encoding="utf-8") as f:
             return f.read()
 
+    def _load_off_main_thread(self) -> object:
+        """Read and decode the source file on a worker thread."""
+        if self._loaded or self._parent_asset is not None or self._source_path is None:
+            return MAIN_THREAD_LOAD
+        return _DecodedContent(self._decode_content(self._read_file()))
+
+    def _finish_load_on_main_thread(self, prepared: object) -> bool:
+        """Install decoded content unless a synchronous load got there first."""
+        if self._loaded:
+            return True
+        if not isinstance(prepared, _DecodedContent):
+            return self.ensure_loaded()
+        return self._install_decoded(prepared.value)
+
     def _load_content(self, content: bytes | str) -> bool:
         """Parse content and replace cached data only after a successful parse."""
         try:
-            parsed_data = self._parse_content(content)
+            decoded = self._decode_content(content)
+        except Exception:
+            log.error(f"[{self.__class__.__name__}] Failed to parse content: " + str(self.name), exc_info=True)
+            return False
+        return self._install_decoded(decoded)
+
+    def _install_decoded(self, decoded: object) -> bool:
+        """Build runtime data from decoded content and publish it."""
+        try:
+            parsed_data = self._parse_decoded(decoded)
         except Exception:
             log.error(f"[{self.__class__.__name__}] Failed to parse content: " + str(self.name), exc_info=True)
             return False
@@ -146,6 +176,7 @@ class DataAsset(Asset, Generic[T]):
             log.error(f"[{self.__class__.__name__}] Post-load hook failed: " + str(self.name), exc_info=True)
             return False
 
+        self._last_use_frame = current_residency_frame()
         if not self._has_uuid_in_spec and self._source_path:
             self.save_spec_file()
         return True
@@ -155,6 +186,17 @@ class DataAsset(Asset, Generic[T]):
         """Parse raw content into a data object."""
         ...
 
+    def _decode_content(self, content: bytes | str) -> object:
+        """CPU-side decoding that is safe to run on a worker thread.
+
+        The default leaves all work to _parse_content() on the main thread.
+        """
+        return content
+
+    def _parse_decoded(self, decoded: object) -> T | None:
+        """Turn the _decode_content() result into runtime data (main thread)."""
+        return self._parse_content(decoded)
+
     def _on_loaded(self) -> None:
         """Called after successful loading."""
         pass
@@ -207,6 +249,16 @@ class DataAsset(Asset, Generic[T]):
         self._data = None
         self._loaded = False
 
+    def _is_reloadable(self) -> bool:
+        return self._source_path is not None or self._parent_asset is not None
+
+    def has_live_references(self) -> bool:
+        """True if Python code outside the asset still holds the data object.
+
+        Subclasses wrapping native handles also check native reference counts.
+        """
+        return self._data is not None and sys.getrefcount(self._data) > _OWN_DATA_REFCOUNT
+
     def reload(self) -> bool:
         """Reload asset data from source_path."""
         if self._source_path is None:
@@ -227,3 +279,25 @@ class DataAsset(Asset, Generic[T]):
         if spec_data is not None:
             self.parse_spec(spec_data)
         return self._load_content(content)
+
+
+class _RefcountProbe:
+    def __init__(self) -> None:
+        self._data = object()
+
+    def count(self) -> int:
+        return sys.getrefcount(self._data)
+
+
+# References sys.getrefcount(self._data) sees when only the asset holds the
+# data; measured instead of hardcoded because it differs across interpreters
+_OWN_DATA_REFCOUNT = _RefcountProbe().count()
+
+
+class _DecodedContent:
+    """Worker result wrapper, distinct from any value _decode_content() returns."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object):
+        self.value = value
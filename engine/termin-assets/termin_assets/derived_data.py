@@ -0,0 +1,221 @@
+"""Content-addressed on-disk cache for import-derived asset data.
+
+Importers (STL/OBJ/glTF) turn source bytes into ready-to-upload arrays:
+interleaved vertex buffers, index buffers, animation keys. Re-deriving them
+on every project open is the dominant cost for large repositories, so the
+results are stored under the project directory keyed by a hash of the
+source content, the import settings and the importer version.
+
+Entry layout (little-endian)::
+
+    magic     4s   b"TDDC"
+    version   u32
+    header    u32  byte length of the JSON header
+    <JSON header: {"meta": {...}, "arrays": [{name, dtype, shape, offset}]}>
+    <array sections, each aligned to DERIVED_DATA_ALIGNMENT bytes>
+
+Entries are memory-mapped on load, so warm opens hand file-backed views
+straight to the native upload path without copying through Python.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+
+from tcbase import log
+
+DEFAULT_DERIVED_DATA_DIR = ".termin/derived-data"
+DERIVED_DATA_ALIGNMENT = 64
+
+_MAGIC = b"TDDC"
+_FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<4sII")
+
+
+def derived_data_key(
+    importer: str,
+    importer_version: int,
+    settings: Mapping[str, Any],
+    *sources: bytes,
+) -> str:
+    """Return the cache key for data derived from ``sources``.
+
+    ``settings`` must be JSON-serializable; key order does not matter.
+    Bumping ``importer_version`` invalidates every entry of that importer.
+    """
+    digest = hashlib.sha256()
+    digest.update(importer.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(str(int(importer_version)).encode("ascii"))
+    digest.update(b"\0")
+    digest.update(json.dumps(settings, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    for source in sources:
+        digest.update(b"\0")
+        digest.update(len(source).to_bytes(8, "little"))
+        digest.update(source)
+    return digest.hexdigest()
+
+
+@dataclass
+class DerivedDataEntry:
+    """Arrays and JSON metadata of one cached import result."""
+
+    arrays: dict[str, np.ndarray] = field(default_factory=dict)
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+class DerivedDataCache:
+    """Filesystem storage for import-derived arrays.
+
+    The cache never decides what to store: importers pick the key and the
+    arrays. A missing, truncated or foreign entry is a cache miss.
+    """
+
+    def __init__(
+        self,
+        project_root: str | Path,
+        cache_dir: str | Path = DEFAULT_DERIVED_DATA_DIR,
+    ) -> None:
+        self.project_root = Path(project_root).resolve()
+        cache_path = Path(cache_dir)
+        self.root = cache_path if cache_path.is_absolute() else self.project_root / cache_path
+
+    def entry_path(self, key: str) -> Path:
+        if len(key) < 3 or not all(c in "0123456789abcdef" for c in key):
+            raise ValueError(f"Invalid derived data key: {key!r}")
+        return self.root / key[:2] / f"{key}.bin"
+
+    def load(self, key: str) -> DerivedDataEntry | None:
+        """Memory-map a cached entry, or return None on a miss.
+
+        Arrays are copy-on-write views of the file: writable for native
+        bindings that require it, but never written back to disk.
+        """
+        path = self.entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            return _read_entry(path)
+        except Exception as exc:
+            log.warning(f"[DerivedDataCache] Discarding unreadable entry {path}: {exc}")
+            return None
+
+    def store(
+        self,
+        key: str,
+        arrays: Mapping[str, np.ndarray],
+        meta: Mapping[str, Any] | None = None,
+    ) -> bool:
+        """Write an entry atomically. Returns False if the write failed."""
+        path = self.entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".bin")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    _write_entry(f, arrays, dict(meta or {}))
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except Exception as exc:
+            log.warning(f"[DerivedDataCache] Failed to write {path}: {exc}")
+            return False
+        return True
+
+    def discard(self, key: str) -> None:
+        self.entry_path(key).unlink(missing_ok=True)
+
+
+def _write_entry(f, arrays: Mapping[str, np.ndarray], meta: dict[str, Any]) -> None:
+    contiguous = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    descriptors = []
+    # Offsets are relative to the first section so the header length does
+    # not depend on them
+    offset = 0
+    for name, array in contiguous.items():
+        if array.dtype.hasobject:
+            raise TypeError(f"Derived array '{name}' has object dtype")
+        descriptors.append(
+            {
+                "name": name,
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": offset,
+            }
+        )
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps({"meta": meta, "arrays": descriptors}, separators=(",", ":")).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header))
+    f.write(_PREAMBLE.pack(_MAGIC, _FORMAT_VERSION, len(header)))
+    f.write(header)
+    f.write(b"\0" * (data_start - _PREAMBLE.size - len(header)))
+
+    position = 0
+    for descriptor, array in zip(descriptors, contiguous.values(), strict=True):
+        f.write(b"\0" * (descriptor["offset"] - position))
+        f.write(array.tobytes())
+        position = descriptor["offset"] + array.nbytes
+    f.write(b"\0" * (offset - position))
+
+
+def _read_entry(path: Path) -> DerivedDataEntry:
+    with open(path, "rb") as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) != _PREAMBLE.size:
+            raise ValueError("truncated preamble")
+        magic, version, header_size = _PREAMBLE.unpack(preamble)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"unsupported format {magic!r} v{version}")
+        header = json.loads(f.read(header_size).decode("utf-8"))
+
+    data_start = _align(_PREAMBLE.size + header_size)
+    file_size = path.stat().st_size
+    descriptors = header["arrays"]
+    end = data_start
+    for descriptor in descriptors:
+        dtype = np.dtype(descriptor["dtype"])
+        nbytes = dtype.itemsize * int(np.prod(descriptor["shape"], dtype=np.int64))
+        end = max(end, data_start + int(descriptor["offset"]) + nbytes)
+    if end > file_size:
+        raise ValueError("truncated array data")
+
+    arrays: dict[str, np.ndarray] = {}
+    if file_size > data_start:
+        mapped = np.memmap(path, dtype=np.uint8, mode="c", offset=data_start, shape=(file_size - data_start,))
+        for descriptor in descriptors:
+            dtype = np.dtype(descriptor["dtype"])
+            shape = tuple(int(n) for n in descriptor["shape"])
+            start = int(descriptor["offset"])
+            nbytes = dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+            arrays[descriptor["name"]] = mapped[start:start + nbytes].view(dtype).reshape(shape)
+    else:
+        for descriptor in descriptors:
+            arrays[descriptor["name"]] = np.empty(descriptor["shape"], dtype=np.dtype(descriptor["dtype"]))
+    return DerivedDataEntry(arrays=arrays, meta=dict(header.get("meta", {})))
+
+
+def _align(offset: int) -> int:
+    return (offset + DERIVED_DATA_ALIGNMENT - 1) // DERIVED_DATA_ALIGNMENT * DERIVED_DATA_ALIGNMENT
+
+
+_current_derived_data_cache: DerivedDataCache | None = None
+
+
+def set_derived_data_cache(cache: DerivedDataCache | None) -> None:
+    global _current_derived_data_cache
+    _current_derived_data_cache = cache
+
+
+def current_derived_data_cache() -> DerivedDataCache | None:
+    return _current_derived_data_cache
@@ -17,12 +17,16 @@ import os
 import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import groupby
 from pathlib import Path
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Callable, Dict, Protocol, Set, runtime_checkable
 
 from tcbase import log
 from termin_assets.preload import AssetRegistration, PreLoadResult
+from termin_assets.scan_index import AssetScanIndex
 from termin_assets.spec_file import get_uuid_from_spec, read_spec_file, write_spec_file
 
 if TYPE_CHECKING:
@@ -131,12 +135,42 @@ class FilePreLoader(ABC):
         """Compatibility wrapper for termin_assets.get_uuid_from_spec."""
         return get_uuid_from_spec(path)
 
+    @property
+    def supports_parallel_preload(self) -> bool:
+        """
+        Whether the initial scan may run preload() apart from registration.
+
+        True for pre-loaders that keep the default preload-then-register
+        flow: preload() only reads files, so it may run on a worker thread
+        or be replaced by a scan index hit; registration stays on the
+        scanning thread via on_initial_file_preloaded(). Pre-loaders
+        overriding on_file_added/on_initial_file_added are scanned
+        sequentially and never cached.
+        """
+        cls = type(self)
+        return (
+            cls.preload is not FilePreLoader.preload
+            and cls.on_file_added is FilePreLoader.on_file_added
+            and cls.on_initial_file_added is FilePreLoader.on_initial_file_added
+        )
+
     def on_file_added(self, path: str) -> None:
         """
         Called when a new file is detected.
         Pre-loads the file and registers with ResourceManager.
         """
-        result = self.preload(path)
+        self._register_added_file(path, self.preload(path))
+
+    def on_initial_file_preloaded(self, path: str, result: PreLoadResult | None) -> None:
+        """
+        Called by the initial scan with a preload() result of path computed
+        on a worker thread or taken from the scan index.
+
+        Runs on the scanning thread, in the same order as a sequential scan.
+        """
+        self._register_added_file(path, result)
+
+    def _register_added_file(self, path: str, result: PreLoadResult | None) -> None:
         if result is None:
             log.warn(f"[FilePreLoader] preload returned None for {path}")
             return
@@ -264,12 +298,20 @@ class ProjectFileWatcher:
 
     Uses watchdog for live filesystem monitoring and os.walk for initial scan.
     Dispatches events to registered FilePreLoaders.
+
+    With scan_workers > 1 the initial scan runs preload() for the files of
+    each priority level on a thread pool, then registers the results on the
+    scanning thread in the same order as a sequential scan. With
+    use_scan_index, preload results of files unchanged since the previous
+    scan are reused from the project's AssetScanIndex.
     """
 
     def __init__(
         self,
         on_resource_reloaded: Callable[[str, str], None] | None = None,
         ignored_roots_provider: Callable[[Path], Iterable[Path | str]] | None = None,
+        scan_workers: int | None = None,
+        use_scan_index: bool = False,
     ):
         self._observer = None  # watchdog Observer
         self._project_path: str | None = None
@@ -282,6 +324,8 @@ class ProjectFileWatcher:
         self._external_asset_catalog = None
         self._ignored_roots_provider = ignored_roots_provider
         self._ignored_roots_cache: tuple[Path, ...] = ()
+        self._scan_workers = max(1, scan_workers or 1)
+        self._use_scan_index = use_scan_index
 
         # All project files by extension (for statistics)
         self._all_files_by_ext: Dict[str, Set[str]] = {}
@@ -374,7 +418,8 @@ class ProjectFileWatcher:
         scan_started_at = time.perf_counter()
         scan_thread_id = threading.get_ident()
         log.info(
-            f"[AssetScan] begin root='{path}' thread={scan_thread_id}"
+            f"[AssetScan] begin root='{path}' thread={scan_thread_id} "
+            f"workers={self._scan_workers}"
         )
         pending_files: list[tuple[int, str, str]] = []
 
@@ -412,21 +457,74 @@ class ProjectFileWatcher:
             f"root='{path}' thread={scan_thread_id}"
         )
 
+        scan_index = self._load_scan_index(path)
         processed_count = 0
-        for index, (_priority, file_path, _ext) in enumerate(pending_files, start=1):
-            if previously_watched_files is not None and file_path in previously_watched_files:
-                self._watched_files.add(file_path)
-            else:
-                self._add_file(
-                    file_path,
-                    initial_scan=True,
-                    progress=(index, len(pending_files)),
-                )
-                processed_count += 1
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=self._scan_workers,
+                thread_name_prefix="termin-asset-scan",
+            )
+            if self._scan_workers > 1
+            else None
+        )
+        try:
+            index = 0
+            # Files of one priority level are preloaded together; the next
+            # level starts only after this one is registered
+            for _priority, level in groupby(pending_files, key=lambda x: x[0]):
+                level = list(level)
+                # path -> (preload result getter, whether the result is fresh)
+                preloads: Dict[str, tuple[Callable[[], PreLoadResult | None], bool]] = {}
+                for _, file_path, ext in level:
+                    processor = self._processors[ext]
+                    if not processor.supports_parallel_preload:
+                        continue
+                    if previously_watched_files is not None and file_path in previously_watched_files:
+                        if scan_index is not None:
+                            scan_index.keep(file_path)
+                        continue
+                    cached = scan_index.lookup(file_path, processor) if scan_index is not None else None
+                    if cached is not None:
+                        preloads[file_path] = (partial(_cached_preload, cached), False)
+                    elif executor is not None:
+                        preloads[file_path] = (executor.submit(processor.preload, file_path).result, True)
+                    elif scan_index is not None:
+                        preloads[file_path] = (partial(processor.preload, file_path), True)
+
+                for _, file_path, _ext in level:
+                    index += 1
+                    if previously_watched_files is not None and file_path in previously_watched_files:
+                        self._watched_files.add(file_path)
+                    elif file_path in preloads:
+                        preload, fresh = preloads.pop(file_path)
+                        self._add_preloaded_file(
+                            file_path,
+                            preload,
+                            scan_index=scan_index if fresh else None,
+                            progress=(index, len(pending_files)),
+                        )
+                        processed_count += 1
+                    else:
+                        self._add_file(
+                            file_path,
+                            initial_scan=True,
+                            progress=(index, len(pending_files)),
+                        )
+                        processed_count += 1
 
-            sidecar_path = file_path + ".meta"
-            if os.path.isfile(sidecar_path):
-                self._watched_files.add(sidecar_path)
+                    sidecar_path = file_path + ".meta"
+                    if os.path.isfile(sidecar_path):
+                        self._watched_files.add(sidecar_path)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        if scan_index is not None:
+            scan_index.save()
+            log.info(
+                f"[AssetScan] index hits={scan_index.hits} misses={scan_index.misses} "
+                f"entries={len(scan_index)} path='{scan_index.path}'"
+            )
 
         log.info(
             f"[AssetScan] complete candidates={len(pending_files)} "
@@ -544,6 +642,47 @@ class ProjectFileWatcher:
             except Exception:
                 log.exception(f"[ProjectFileWatcher] Error processing {path}")
 
+    def _add_preloaded_file(
+        self,
+        path: str,
+        preload: Callable[[], PreLoadResult | None],
+        *,
+        scan_index: AssetScanIndex | None = None,
+        progress: tuple[int, int] | None = None,
+    ) -> None:
+        """Register an initial-scan file whose preload() ran apart from registration.
+
+        ``preload`` returns the result of a worker thread, a deferred call or
+        a scan index hit; fresh results are recorded in ``scan_index``.
+        """
+        self._watched_files.add(path)
+
+        processor = self._processors[os.path.splitext(path)[1].lower()]
+
+        def register() -> None:
+            result = preload()
+            if scan_index is not None:
+                scan_index.record(path, processor, result)
+            processor.on_initial_file_preloaded(path, result)
+
+        try:
+            self._run_processor_operation(
+                "initial",
+                processor,
+                path,
+                register,
+                progress=progress,
+            )
+        except Exception:
+            log.exception(f"[ProjectFileWatcher] Error processing {path}")
+
+    def _load_scan_index(self, project_path: str) -> AssetScanIndex | None:
+        if not self._use_scan_index:
+            return None
+        scan_index = AssetScanIndex(project_path)
+        scan_index.load()
+        return scan_index
+
     def _should_watch_file(self, path: str) -> bool:
         if self._is_ignored_path(path):
             return False
@@ -734,3 +873,7 @@ class ProjectFileWatcher:
     @property
     def is_enabled(self) -> bool:
         return self._observer is not None
+
+
+def _cached_preload(result: PreLoadResult) -> PreLoadResult:
+    return result
@@ -0,0 +1,156 @@
+"""Memory-budgeted residency of loaded assets.
+
+Loaded assets stay resident until something releases them. The residency
+manager gives selected asset types a byte budget and, once per frame,
+evicts the least recently used assets of an over-budget type until it fits.
+
+An asset is evicted only through ``Asset.evict()``, which refuses while its
+data is still referenced (native handles held by components, Python
+references outside the asset) or cannot be reloaded from its source. An
+evicted asset keeps its UUID registration and reloads lazily on next use.
+
+Use order comes from a process-wide frame clock: ``Asset.mark_used()``
+stamps the current frame, ``AssetResidencyManager.end_frame()`` advances it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from tcbase import log
+
+if TYPE_CHECKING:
+    from termin_assets.asset import Asset
+
+_current_frame = 0
+
+
+def current_residency_frame() -> int:
+    """Frame number stamped on assets by ``Asset.mark_used()``."""
+    return _current_frame
+
+
+@dataclass
+class ResidencyCounters:
+    """Residency state of one asset type after the last budget pass."""
+
+    budget_bytes: int | None = None
+    resident_bytes: int = 0
+    resident_count: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+
+
+class AssetResidencyManager:
+    """Per-type memory budgets with least-recently-used eviction.
+
+    Args:
+        assets_for_type: Returns the registered assets of a type id.
+        budgets: Initial byte budgets by type id.
+        min_idle_frames: Assets used within this many most recent frames
+            are never evicted, even when their type stays over budget.
+    """
+
+    def __init__(
+        self,
+        assets_for_type: Callable[[str], Iterable["Asset"]],
+        budgets: Mapping[str, int] | None = None,
+        min_idle_frames: int = 1,
+    ) -> None:
+        self._assets_for_type = assets_for_type
+        self._budgets: dict[str, int] = {}
+        self._counters: dict[str, ResidencyCounters] = {}
+        self._min_idle_frames = max(0, int(min_idle_frames))
+        for type_id, budget_bytes in (budgets or {}).items():
+            self.set_budget(type_id, budget_bytes)
+
+    @property
+    def frame(self) -> int:
+        return _current_frame
+
+    @property
+    def budgets(self) -> Mapping[str, int]:
+        return MappingProxyType(self._budgets)
+
+    @property
+    def counters(self) -> Mapping[str, ResidencyCounters]:
+        """Counters of budgeted types, refreshed by every budget pass."""
+        return MappingProxyType(self._counters)
+
+    def set_budget(self, type_id: str, budget_bytes: int | None) -> None:
+        """Set the byte budget of a type; None removes it."""
+        if budget_bytes is None:
+            self._budgets.pop(type_id, None)
+            counters = self._counters.get(type_id)
+            if counters is not None:
+                counters.budget_bytes = None
+            return
+        if budget_bytes < 0:
+            log.error(f"[AssetResidency] Negative budget for '{type_id}': {budget_bytes}")
+            raise ValueError(f"Residency budget must be non-negative: {budget_bytes}")
+        self._budgets[type_id] = int(budget_bytes)
+        self._counters.setdefault(type_id, ResidencyCounters()).budget_bytes = int(budget_bytes)
+
+    def resident_bytes(self, type_id: str | None = None) -> int:
+        """Bytes currently held by loaded assets of one or all budgeted types."""
+        type_ids = self._budgets if type_id is None else (type_id,)
+        return sum(
+            asset.resident_bytes()
+            for tid in type_ids
+            for asset in self._assets_for_type(tid)
+            if asset.is_loaded
+        )
+
+    def eviction_count(self, type_id: str | None = None) -> int:
+        if type_id is not None:
+            counters = self._counters.get(type_id)
+            return 0 if counters is None else counters.evictions
+        return sum(counters.evictions for counters in self._counters.values())
+
+    def end_frame(self) -> int:
+        """Advance the frame clock and enforce budgets. Returns evictions."""
+        global _current_frame
+        _current_frame += 1
+        return self.enforce_budgets()
+
+    def enforce_budgets(self) -> int:
+        """Evict least recently used assets of over-budget types."""
+        return sum(self._enforce_budget(type_id) for type_id in tuple(self._budgets))
+
+    def _enforce_budget(self, type_id: str) -> int:
+        budget = self._budgets[type_id]
+        counters = self._counters.setdefault(type_id, ResidencyCounters(budget_bytes=budget))
+
+        resident: list[tuple[int, int, "Asset"]] = []
+        total = 0
+        for asset in self._assets_for_type(type_id):
+            if not asset.is_loaded:
+                continue
+            size = asset.resident_bytes()
+            resident.append((asset.last_use_frame, size, asset))
+            total += size
+
+        evicted = 0
+        if total > budget:
+            resident.sort(key=lambda entry: entry[0])
+            for last_use_frame, size, asset in resident:
+                if total <= budget or _current_frame - last_use_frame <= self._min_idle_frames:
+                    break
+                if size <= 0 or not asset.evict():
+                    continue
+                total -= size
+                evicted += 1
+                counters.evicted_bytes += size
+            if total > budget:
+                log.debug(
+                    f"[AssetResidency] '{type_id}' stays over budget: "
+                    f"{total} > {budget} bytes after {evicted} evictions"
+                )
+
+        counters.evictions += evicted
+        counters.resident_bytes = total
+        counters.resident_count = len(resident) - evicted
+        return evicted
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -11,10 +12,12 @@ from tcbase import log
 
 from termin_assets.asset import Asset
 from termin_assets.asset_store import AssetStore
+from termin_assets.async_loading import AssetLoadScheduler
 from termin_assets.catalog import AssetCatalog
 from termin_assets.default_plugins import register_default_asset_plugins
 from termin_assets.embedded_asset import EmbeddedAssetSpec
 from termin_assets.plugin import AssetContext, AssetRuntimeUnregisterPlugin, AssetTypeRegistry
+from termin_assets.residency import AssetResidencyManager
 
 if TYPE_CHECKING:
     from termin_assets.asset_registry import AssetRegistry
@@ -65,6 +68,8 @@ class AssetRuntimeManager:
         self._runtime_asset_registries: dict[str, "AssetRegistry"] = {}
         self._asset_reload_subscribers: dict[int, Callable[[AssetReloadEvent], None]] = {}
         self._next_asset_reload_subscription_id = 1
+        self._load_scheduler: AssetLoadScheduler | None = None
+        self._residency: AssetResidencyManager | None = None
 
     @property
     def asset_type_plugins(self) -> AssetTypeRegistry:
@@ -245,6 +250,59 @@ class AssetRuntimeManager:
         """Get any registered asset by UUID."""
         return self._asset_store.get(uuid)
 
+    @property
+    def load_scheduler(self) -> AssetLoadScheduler:
+        """Background loader whose results are installed by pump_async_loads()."""
+        if self._load_scheduler is None:
+            self._load_scheduler = AssetLoadScheduler()
+        return self._load_scheduler
+
+    def load_async(self, uuid: str) -> "Future[bool]":
+        """Start a background load of a registered asset by UUID."""
+        asset = self._asset_store.get(uuid)
+        if asset is None:
+            log.error(f"[AssetRuntimeManager] Cannot load unknown asset UUID '{uuid}'")
+            future: Future[bool] = Future()
+            future.set_result(False)
+            return future
+        return self.load_scheduler.load_async(asset)
+
+    def prefetch(self, uuids: Iterable[str]) -> list["Future[bool]"]:
+        """Start background loads for upcoming content, in the given order."""
+        return [self.load_async(uuid) for uuid in uuids]
+
+    def pump_async_loads(self, time_budget: float | None = None) -> int:
+        """Install finished background loads; call from the main thread each frame."""
+        if self._load_scheduler is None:
+            return 0
+        return self._load_scheduler.pump(time_budget)
+
+    def shutdown_async_loads(self) -> None:
+        """Stop background loading workers; unfinished loads resolve to False."""
+        if self._load_scheduler is not None:
+            self._load_scheduler.shutdown()
+
+    @property
+    def residency(self) -> AssetResidencyManager:
+        """Per-type memory budgets over the typed runtime registries."""
+        if self._residency is None:
+            self._residency = AssetResidencyManager(self._registered_runtime_assets)
+        return self._residency
+
+    def set_residency_budget(self, type_id: str, budget_bytes: int | None) -> None:
+        """Bound the loaded data of one asset type; None lifts the bound."""
+        self.residency.set_budget(type_id, budget_bytes)
+
+    def end_residency_frame(self) -> int:
+        """Advance asset use tracking and evict over budget; call once per frame."""
+        if self._residency is None:
+            return 0
+        return self._residency.end_frame()
+
+    def _registered_runtime_assets(self, type_id: str) -> tuple[Asset, ...]:
+        registry = self._runtime_asset_registries.get(type_id)
+        return () if registry is None else registry.iter_assets()
+
     @property
     def assets_by_uuid(self):
         """Read-only view of canonical UUID-owned assets."""
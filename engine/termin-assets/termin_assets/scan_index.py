@@ -0,0 +1,270 @@
+"""Persistent index of preload results for the project asset scan.
+
+Preloading a file reads its sidecar and often its content. On project open
+most files are unchanged since the previous session, so the watcher keeps
+the serialized ``PreLoadResult`` of every file together with a stat
+signature of the file and its ``.meta`` sidecar:
+
+- file: size and mtime in nanoseconds;
+- sidecar: size, mtime and a SHA-1 of its bytes. A sidecar whose stat
+  changed but whose bytes did not (checkouts, touch) still matches.
+
+File content is never hashed, so a hit costs two ``stat`` calls. Entries
+modified within ``_RACY_WINDOW_NS`` of being recorded are not stored:
+a later write in the same timestamp tick would otherwise go unnoticed.
+
+Only results with text or no content and JSON-serializable ``extra`` data
+are cached; other files are preloaded on every scan.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tcbase import log
+
+from termin_assets.preload import AssetIdentityPolicy, PreLoadResult
+
+if TYPE_CHECKING:
+    from termin_assets.project_file_watcher import FilePreLoader
+
+DEFAULT_SCAN_INDEX_PATH = ".termin/asset-scan-index.json"
+
+_FORMAT_VERSION = 1
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class _SpecSignature:
+    size: int
+    mtime_ns: int
+    sha1: str
+
+
+@dataclass
+class _ScanIndexEntry:
+    preloader: str
+    size: int
+    mtime_ns: int
+    spec: _SpecSignature | None
+    result: dict[str, Any]
+
+
+class AssetScanIndex:
+    """Preload results of unchanged project files, persisted between sessions.
+
+    Paths are stored relative to the project root, so a moved project keeps
+    its index. ``save()`` drops entries of files not seen since ``load()``.
+    """
+
+    def __init__(
+        self,
+        project_root: str | Path,
+        index_path: str | Path = DEFAULT_SCAN_INDEX_PATH,
+    ) -> None:
+        self.project_root = Path(os.path.abspath(project_root))
+        path = Path(index_path)
+        self.path = path if path.is_absolute() else self.project_root / path
+        self._entries: dict[str, _ScanIndexEntry] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> None:
+        """Read the index file. A missing or unreadable index is empty."""
+        self._entries.clear()
+        self._seen.clear()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _FORMAT_VERSION:
+                log.info(f"[AssetScanIndex] Ignoring index of format {data.get('version')!r}: {self.path}")
+                return
+            for key, raw in data["entries"].items():
+                spec = raw.get("spec")
+                self._entries[key] = _ScanIndexEntry(
+                    preloader=raw["preloader"],
+                    size=int(raw["size"]),
+                    mtime_ns=int(raw["mtime_ns"]),
+                    spec=_SpecSignature(**spec) if spec is not None else None,
+                    result=raw["result"],
+                )
+        except Exception as exc:
+            log.warning(f"[AssetScanIndex] Discarding unreadable index {self.path}: {exc}")
+            self._entries.clear()
+
+    def save(self) -> bool:
+        """Write the index atomically if anything changed."""
+        stale = self._entries.keys() - self._seen
+        for key in stale:
+            del self._entries[key]
+        if not self._dirty and not stale:
+            return True
+
+        data = {
+            "version": _FORMAT_VERSION,
+            "entries": {key: asdict(entry) for key, entry in sorted(self._entries.items())},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except Exception as exc:
+            log.warning(f"[AssetScanIndex] Failed to write {self.path}: {exc}")
+            return False
+        self._dirty = False
+        return True
+
+    def lookup(self, path: str, preloader: "FilePreLoader") -> PreLoadResult | None:
+        """Return the cached preload result of an unchanged file."""
+        key = self._key(path)
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if entry is None or entry.preloader != _preloader_id(preloader):
+            self.misses += 1
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.misses += 1
+            return None
+        if stat.st_size != entry.size or stat.st_mtime_ns != entry.mtime_ns or not self._spec_matches(path, entry):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return _result_from_dict(entry.result, path)
+
+    def keep(self, path: str) -> None:
+        """Keep the entry of a file that this scan does not preload."""
+        self._seen.add(self._key(path))
+
+    def record(self, path: str, preloader: "FilePreLoader", result: PreLoadResult | None) -> None:
+        """Store a fresh preload result, if it can be reused later."""
+        key = self._key(path)
+        self._seen.add(key)
+        if self._entries.pop(key, None) is not None:
+            self._dirty = True
+
+        payload = _result_to_dict(result)
+        if payload is None:
+            return
+        try:
+            stat = os.stat(path)
+            spec = _spec_signature(path)
+        except OSError:
+            return
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
+        if stat.st_mtime_ns >= racy_after or (spec is not None and spec.mtime_ns >= racy_after):
+            return
+
+        self._entries[key] = _ScanIndexEntry(
+            preloader=_preloader_id(preloader),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            spec=spec,
+            result=payload,
+        )
+        self._dirty = True
+
+    def _key(self, path: str) -> str:
+        # Lexical only: resolving symlinks would cost syscalls per file
+        absolute = os.path.abspath(path)
+        relative = os.path.relpath(absolute, self.project_root)
+        if relative.startswith(os.pardir):
+            return Path(absolute).as_posix()
+        return Path(relative).as_posix()
+
+    def _spec_matches(self, path: str, entry: _ScanIndexEntry) -> bool:
+        try:
+            stat = os.stat(path + ".meta")
+        except FileNotFoundError:
+            return entry.spec is None
+        except OSError:
+            return False
+        spec = entry.spec
+        if spec is None or stat.st_size != spec.size:
+            return False
+        if stat.st_mtime_ns == spec.mtime_ns:
+            return True
+        current = _spec_signature(path)
+        if current is None or current.sha1 != spec.sha1:
+            return False
+        # Same bytes under a new timestamp: refresh the stat signature
+        entry.spec = current
+        self._dirty = True
+        return True
+
+
+def _preloader_id(preloader: "FilePreLoader") -> str:
+    cls = type(preloader)
+    return f"{cls.__module__}.{cls.__qualname__}:{preloader.resource_type}"
+
+
+def _spec_signature(path: str) -> _SpecSignature | None:
+    meta_path = path + ".meta"
+    try:
+        with open(meta_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return _SpecSignature(
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        sha1=hashlib.sha1(data).hexdigest(),
+    )
+
+
+def _result_to_dict(result: PreLoadResult | None) -> dict[str, Any] | None:
+    if result is None or not (result.content is None or isinstance(result.content, str)):
+        return None
+    payload = {
+        "resource_type": result.resource_type,
+        "content": result.content,
+        "uuid": result.uuid,
+        "spec_data": result.spec_data,
+        "identity_policy": result.identity_policy.value,
+        "extra": result.extra,
+    }
+    try:
+        # Round-trip to reject non-JSON extras and detach from the live result
+        return json.loads(json.dumps(payload))
+    except (TypeError, ValueError):
+        return None
+
+
+def _result_from_dict(payload: dict[str, Any], path: str) -> PreLoadResult:
+    return PreLoadResult(
+        resource_type=payload["resource_type"],
+        path=path,
+        content=payload["content"],
+        uuid=payload["uuid"],
+        spec_data=copy.deepcopy(payload["spec_data"]),
+        identity_policy=AssetIdentityPolicy(payload["identity_policy"]),
+        extra=copy.deepcopy(payload["extra"]),
+    )
@@ -0,0 +1,113 @@
+from pathlib import Path
+import threading
+
+from termin_assets import AssetLoadScheduler, DataAsset
+
+
+class SplitAsset(DataAsset[str]):
+    """Decodes on the worker, installs on the pumping thread."""
+
+    _uses_binary = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.decode_threads: list[int] = []
+        self.install_threads: list[int] = []
+        self.release_decode = threading.Event()
+        self.release_decode.set()
+
+    def _parse_content(self, content: bytes) -> str | None:
+        return self._parse_decoded(self._decode_content(content))
+
+    def _decode_content(self, content: bytes) -> str:
+        self.release_decode.wait(5.0)
+        self.decode_threads.append(threading.get_ident())
+        return content.decode("utf-8").upper()
+
+    def _parse_decoded(self, decoded: str) -> str | None:
+        self.install_threads.append(threading.get_ident())
+        return decoded or None
+
+    def save_spec_file(self) -> bool:
+        return False
+
+
+class ChildAsset(DataAsset[str]):
+    def _parse_content(self, content: bytes | str) -> str | None:
+        return None
+
+    def _extract_from_parent(self) -> bool:
+        self.set_runtime_data(f"{self._parent_asset.data}:{self._parent_key}")
+        return True
+
+
+def _asset(tmp_path: Path, name: str, text: str) -> SplitAsset:
+    path = tmp_path / f"{name}.txt"
+    path.write_text(text, encoding="utf-8")
+    return SplitAsset(name=name, source_path=path)
+
+
+def test_decode_runs_on_worker_and_install_on_pumping_thread(tmp_path: Path) -> None:
+    scheduler = AssetLoadScheduler(max_workers=2)
+    asset = _asset(tmp_path, "level", "terrain")
+    asset.release_decode.clear()
+
+    future = scheduler.load_async(asset)
+    assert scheduler.load_async(asset) is future
+    assert scheduler.pump() == 0
+    assert not future.done()
+    assert not asset.is_loaded
+
+    asset.release_decode.set()
+    assert scheduler.wait([future], timeout=5.0)
+    assert future.result() is True
+    assert asset.data == "TERRAIN"
+    assert asset.decode_threads[0] != threading.get_ident()
+    assert asset.install_threads == [threading.get_ident()]
+    assert scheduler.pending_count == 0
+    scheduler.shutdown()
+
+
+def test_synchronous_access_wins_over_pending_background_load(tmp_path: Path) -> None:
+    scheduler = AssetLoadScheduler(max_workers=1)
+    asset = _asset(tmp_path, "props", "crate")
+    asset.release_decode.clear()
+    future = scheduler.load_async(asset)
+
+    # The synchronous path decodes on this thread while the worker waits
+    asset.release_decode.set()
+    assert asset.data == "CRATE"
+    assert scheduler.wait([future], timeout=5.0)
+    assert future.result() is True
+    assert len(asset.install_threads) == 1
+    scheduler.shutdown()
+
+
+def test_prefetch_budget_and_failures(tmp_path: Path) -> None:
+    scheduler = AssetLoadScheduler(max_workers=4)
+    assets = [_asset(tmp_path, f"chunk{i}", f"chunk {i}") for i in range(6)]
+    missing = SplitAsset(name="missing", source_path=tmp_path / "missing.txt")
+
+    futures = scheduler.prefetch([*assets, missing])
+    while sum(future.done() for future in futures) < len(futures):
+        # A zero budget still installs one completion per call
+        scheduler.pump(time_budget=0.0)
+    assert [future.result() for future in futures] == [True] * 6 + [False]
+    assert [asset.data for asset in assets] == [f"CHUNK {i}" for i in range(6)]
+    assert scheduler.load_async(assets[0]).result() is True
+    scheduler.shutdown()
+
+
+def test_embedded_asset_waits_for_parent(tmp_path: Path) -> None:
+    scheduler = AssetLoadScheduler()
+    parent = _asset(tmp_path, "model", "mesh")
+    child = ChildAsset(name="model_body")
+    child.set_parent(parent, "body")
+
+    future = scheduler.load_async(child)
+    assert scheduler.wait([future], timeout=5.0)
+    assert future.result() is True
+    assert parent.is_loaded
+    assert child.data == "MESH:body"
+    assert parent.decode_threads[0] != threading.get_ident()
+    scheduler.shutdown()
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import numpy as np
+
+from termin_assets import DerivedDataCache, derived_data_key
+from termin_assets.derived_data import DERIVED_DATA_ALIGNMENT
+
+
+def _arrays() -> dict[str, np.ndarray]:
+    return {
+        "vertices": np.arange(36, dtype=np.float32),
+        "indices": np.array([0, 1, 2, 2, 1, 0], dtype=np.uint32),
+        "times": np.linspace(0.0, 1.0, 5),
+        "empty": np.zeros((0, 3), dtype=np.float32),
+    }
+
+
+def test_roundtrip_is_memory_mapped_and_aligned(tmp_path: Path) -> None:
+    cache = DerivedDataCache(tmp_path)
+    key = derived_data_key("mesh.stl", 1, {"scale": 1.0}, b"solid")
+    assert cache.load(key) is None
+
+    assert cache.store(key, _arrays(), {"vertex_count": 3, "stride": 48})
+    assert cache.entry_path(key).is_relative_to(tmp_path / ".termin" / "derived-data")
+
+    entry = cache.load(key)
+    assert entry is not None
+    assert entry.meta == {"vertex_count": 3, "stride": 48}
+    for name, expected in _arrays().items():
+        actual = entry.arrays[name]
+        assert actual.dtype == expected.dtype
+        np.testing.assert_array_equal(actual, expected)
+
+    vertices = entry.arrays["vertices"]
+    assert isinstance(vertices.base, np.memmap)
+    assert vertices.flags.c_contiguous and vertices.flags.writeable
+    for name in ("vertices", "indices", "times"):
+        assert entry.arrays[name].ctypes.data % DERIVED_DATA_ALIGNMENT == 0
+
+    # Copy-on-write: in-memory edits never reach the cache file
+    vertices[0] = 100.0
+    np.testing.assert_array_equal(cache.load(key).arrays["vertices"], _arrays()["vertices"])
+
+
+def test_key_depends_on_content_settings_and_version() -> None:
+    base = derived_data_key("mesh.obj", 1, {"scale": 1.0, "flip_uv_v": False}, b"v 0 0 0")
+    assert base == derived_data_key("mesh.obj", 1, {"flip_uv_v": False, "scale": 1.0}, b"v 0 0 0")
+    assert base != derived_data_key("mesh.obj", 1, {"scale": 2.0, "flip_uv_v": False}, b"v 0 0 0")
+    assert base != derived_data_key("mesh.obj", 2, {"scale": 1.0, "flip_uv_v": False}, b"v 0 0 0")
+    assert base != derived_data_key("mesh.stl", 1, {"scale": 1.0, "flip_uv_v": False}, b"v 0 0 0")
+    assert base != derived_data_key("mesh.obj", 1, {"scale": 1.0, "flip_uv_v": False}, b"v 0 0 1")
+    # Source boundaries are part of the key
+    assert derived_data_key("gltf", 1, {}, b"ab", b"c") != derived_data_key("gltf", 1, {}, b"a", b"bc")
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = DerivedDataCache(tmp_path)
+    key = derived_data_key("mesh.stl", 1, {}, b"data")
+    cache.store(key, _arrays())
+    path = cache.entry_path(key)
+    path.write_bytes(path.read_bytes()[:100])
+    assert cache.load(key) is None
+
+    path.write_bytes(b"XXXX" + path.read_bytes()[4:])
+    assert cache.load(key) is None
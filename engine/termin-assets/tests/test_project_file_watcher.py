@@ -1,4 +1,5 @@
 from pathlib import Path
+import threading
 from typing import Set
 
 from termin_assets import (
@@ -402,3 +403,72 @@ def test_initial_scan_logs_progress_and_per_asset_duration(
     assert messages[-1].startswith(
         "[AssetScan] complete candidates=2 processed=2 duration_ms="
     )
+
+
+class ParallelRecordingPreLoader(FilePreLoader):
+    def __init__(self, extension: str, priority: int, events: list[tuple[str, str]]) -> None:
+        super().__init__(resource_manager=None)
+        self._extension = extension
+        self._priority = priority
+        self.events = events
+        self.preload_threads: set[int] = set()
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def extensions(self) -> Set[str]:
+        return {self._extension}
+
+    @property
+    def resource_type(self) -> str:
+        return self._extension[1:]
+
+    def preload(self, path: str) -> PreLoadResult | None:
+        self.preload_threads.add(threading.get_ident())
+        self.events.append(("preload", Path(path).name))
+        if Path(path).name.startswith("broken"):
+            raise RuntimeError(f"cannot read {path}")
+        return PreLoadResult(resource_type=self.resource_type, path=path)
+
+    def on_initial_file_preloaded(self, path: str, result: PreLoadResult | None) -> None:
+        assert result is not None and result.path == path
+        self.events.append(("register", Path(path).name))
+
+
+def test_parallel_scan_preloads_on_workers_and_registers_in_priority_order(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    names = [f"tex{i}.tex" for i in range(8)] + ["broken.tex"] + [f"mat{i}.mat" for i in range(4)]
+    for name in names:
+        (tmp_path / name).write_text(name, encoding="utf-8")
+    events: list[tuple[str, str]] = []
+    exceptions: list[str] = []
+    monkeypatch.setattr(watcher_module.log, "exception", exceptions.append)
+
+    textures = ParallelRecordingPreLoader(".tex", 10, events)
+    materials = ParallelRecordingPreLoader(".mat", 20, events)
+    lifecycle = RecordingLifecyclePreLoader()
+    watcher = ProjectFileWatcher(scan_workers=4)
+    for processor in (materials, textures, lifecycle):
+        watcher.register_processor(processor)
+    (tmp_path / "legacy.asset").write_text("legacy", encoding="utf-8")
+    watcher._scan_directory(str(tmp_path))
+
+    registered = [name for kind, name in events if kind == "register"]
+    assert registered == sorted(n for n in names if n.endswith(".tex") and n != "broken.tex") + sorted(
+        n for n in names if n.endswith(".mat")
+    )
+    # Priority barrier: materials are preloaded only after every texture registered
+    first_material_preload = events.index(next(e for e in events if e == ("preload", "mat0.mat")))
+    last_texture_register = max(i for i, e in enumerate(events) if e[0] == "register" and e[1].endswith(".tex"))
+    assert first_material_preload > last_texture_register
+    assert threading.get_ident() not in textures.preload_threads | materials.preload_threads
+    assert exceptions == [f"[ProjectFileWatcher] Error processing {tmp_path / 'broken.tex'}"]
+
+    # Pre-loaders overriding the add hooks stay on the sequential path
+    assert not lifecycle.supports_parallel_preload
+    assert lifecycle.initial_added == [str(tmp_path / "legacy.asset")]
+    assert watcher.watched_files == {str(tmp_path / name) for name in names} | {str(tmp_path / "legacy.asset")}
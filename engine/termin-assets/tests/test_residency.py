@@ -0,0 +1,149 @@
+from pathlib import Path
+
+import pytest
+
+from termin_assets import AssetResidencyManager, AssetRuntimeManager, DataAsset
+
+
+class Payload:
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+
+class BlobAsset(DataAsset[Payload]):
+    _uses_binary = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.load_count = 0
+
+    def _parse_content(self, content: bytes) -> Payload | None:
+        self.load_count += 1
+        return Payload(len(content))
+
+    def resident_bytes(self) -> int:
+        return self._data.size if self._loaded and self._data is not None else 0
+
+    def save_spec_file(self) -> bool:
+        return False
+
+
+class NativeHandle:
+    """Stands in for a refcounted native handle such as TcMesh."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.is_valid = True
+        self.ref_count = 1
+
+
+class HandleAsset(BlobAsset):
+    def _parse_content(self, content: bytes) -> NativeHandle | None:
+        self.load_count += 1
+        return NativeHandle(len(content))
+
+    def has_live_references(self) -> bool:
+        # Same shape as the mesh/texture/animation assets
+        if self._data is not None and self._data.is_valid and self._data.ref_count > 1:
+            return True
+        return super().has_live_references()
+
+
+def _manager(
+    tmp_path: Path,
+    sizes: dict[str, int],
+    asset_class: type[BlobAsset] = BlobAsset,
+) -> tuple[AssetRuntimeManager, dict[str, BlobAsset]]:
+    manager = AssetRuntimeManager()
+    registry = manager.ensure_runtime_asset_registry("blob", asset_class, lambda asset: asset.data)
+    assets = {}
+    for name, size in sizes.items():
+        path = tmp_path / f"{name}.bin"
+        path.write_bytes(b"x" * size)
+        assets[name] = registry.get_or_create_asset(name, source_path=str(path))
+    return manager, assets
+
+
+def test_evicts_least_recently_used_until_within_budget(tmp_path: Path) -> None:
+    manager, assets = _manager(tmp_path, {"a": 100, "b": 200, "c": 300})
+    manager.set_residency_budget("blob", 450)
+    residency = manager.residency
+
+    for name in ("a", "b"):
+        assert assets[name].data is not None
+        assert manager.end_residency_frame() == 0
+    assert assets["c"].data is not None
+    assert residency.resident_bytes("blob") == 600
+
+    # "a" was used first, then "b": evicting "a" alone leaves 500 > 450
+    assert manager.end_residency_frame() == 2
+    assert residency.resident_bytes("blob") == 300
+    assert not assets["a"].is_loaded
+    assert not assets["b"].is_loaded
+    assert assets["c"].is_loaded
+    counters = residency.counters["blob"]
+    assert counters.evictions == 2
+    assert counters.evicted_bytes == 300
+    assert counters.resident_bytes == 300
+    assert residency.eviction_count() == 2
+
+    # Evicted assets keep their registration and reload lazily
+    assert manager.get_runtime_asset("blob", "a") is assets["a"]
+    assert assets["a"].data.size == 100
+    assert assets["a"].load_count == 2
+
+
+def test_recently_used_and_referenced_assets_stay_resident(tmp_path: Path) -> None:
+    manager, assets = _manager(tmp_path, {"old": 100, "held": 100, "fresh": 100})
+    manager.set_residency_budget("blob", 0)
+
+    held = assets["held"].data
+    assert assets["old"].data is not None
+    # Used during the frame that just ended: not idle long enough yet
+    manager.end_residency_frame()
+    assert assets["old"].is_loaded
+    manager.end_residency_frame()
+    assert not assets["old"].is_loaded
+    assert assets["held"].is_loaded
+
+    assert assets["fresh"].data is not None
+    manager.end_residency_frame()
+    assert assets["fresh"].is_loaded
+    manager.end_residency_frame()
+    assert not assets["fresh"].is_loaded
+
+    assert assets["held"].is_loaded and assets["held"].has_live_references()
+    del held
+    manager.end_residency_frame()
+    assert not assets["held"].is_loaded
+
+
+def test_native_handle_subclass_is_evicted_once_released(tmp_path: Path) -> None:
+    manager, assets = _manager(tmp_path, {"idle": 100, "shared": 100}, HandleAsset)
+    manager.set_residency_budget("blob", 0)
+
+    assert assets["idle"].data is not None
+    assert not assets["idle"].has_live_references()
+    # A native owner (renderer, material) adds a handle reference
+    assets["shared"].data.ref_count += 1
+    manager.end_residency_frame()
+    manager.end_residency_frame()
+    assert not assets["idle"].is_loaded
+    assert assets["shared"].is_loaded
+
+    assets["shared"].data.ref_count -= 1
+    manager.end_residency_frame()
+    manager.end_residency_frame()
+    assert not assets["shared"].is_loaded
+
+
+def test_unreloadable_assets_are_never_evicted() -> None:
+    residency = AssetResidencyManager(lambda type_id: [generated], budgets={"blob": 0})
+    generated = BlobAsset(data=Payload(64), name="generated")
+    generated.mark_used()
+    residency.end_frame()
+    residency.end_frame()
+    assert generated.is_loaded
+    assert residency.counters["blob"].resident_bytes == 64
+    with pytest.raises(ValueError):
+        residency.set_budget("blob", -1)
@@ -0,0 +1,107 @@
+import os
+from pathlib import Path
+
+from termin_assets import AssetIdentityPolicy, AssetRegistration, AssetScanIndex, PluginPreLoader, PreLoadResult
+from termin_assets.project_file_watcher import ProjectFileWatcher
+
+_PAST_NS = 1_600_000_000 * 1_000_000_000
+
+
+class CountingImportPlugin:
+    type_id = "counted"
+    extensions = {".counted"}
+    priority = 10
+
+    def __init__(self) -> None:
+        self.preloaded: list[str] = []
+
+    def preload(self, path: str) -> PreLoadResult:
+        self.preloaded.append(Path(path).name)
+        return PreLoadResult(
+            resource_type=self.type_id,
+            path=path,
+            content=Path(path).read_text(encoding="utf-8"),
+            identity_policy=AssetIdentityPolicy.GENERATE_SIDECAR,
+            extra={"lines": 1},
+        )
+
+
+class RecordingResourceManager:
+    def __init__(self) -> None:
+        self.registered: list[PreLoadResult] = []
+
+    def register_file(self, result: PreLoadResult) -> AssetRegistration:
+        self.registered.append(result)
+        return AssetRegistration(type_id=result.resource_type, uuid=result.uuid, name=Path(result.path).stem)
+
+
+def _age(*paths: Path) -> None:
+    for path in paths:
+        os.utime(path, ns=(_PAST_NS, _PAST_NS))
+
+
+def _scan(project: Path, plugin: CountingImportPlugin) -> RecordingResourceManager:
+    manager = RecordingResourceManager()
+    watcher = ProjectFileWatcher(use_scan_index=True)
+    watcher.register_processor(PluginPreLoader(plugin, manager))
+    watcher._scan_directory(str(project))
+    return manager
+
+
+def test_warm_scan_reuses_results_of_unchanged_files(tmp_path: Path) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.counted").write_text(name, encoding="utf-8")
+    plugin = CountingImportPlugin()
+    cold = _scan(tmp_path, plugin)
+    assert plugin.preloaded == ["a.counted", "b.counted", "c.counted"]
+    # Files written just now are too fresh to trust their timestamps
+    assert len(_loaded_index(tmp_path)) == 0
+
+    _age(*tmp_path.glob("*.counted"), *tmp_path.glob("*.meta"))
+    _scan(tmp_path, plugin)
+    plugin.preloaded.clear()
+    warm = _scan(tmp_path, plugin)
+
+    assert plugin.preloaded == []
+    assert [(r.path, r.uuid, r.content, r.extra) for r in warm.registered] == [
+        (r.path, r.uuid, r.content, r.extra) for r in cold.registered
+    ]
+
+    # Modified content, a changed sidecar and a new file are preloaded again
+    (tmp_path / "a.counted").write_text("aa", encoding="utf-8")
+    (tmp_path / "b.counted.meta").write_text('{"uuid": "b-new"}', encoding="utf-8")
+    (tmp_path / "d.counted").write_text("d", encoding="utf-8")
+    (tmp_path / "c.counted").unlink()
+    warm = _scan(tmp_path, plugin)
+    assert plugin.preloaded == ["a.counted", "b.counted", "d.counted"]
+    assert {r.uuid for r in warm.registered if r.path.endswith("b.counted")} == {"b-new"}
+    assert "c.counted" not in _loaded_index(tmp_path)._entries
+
+
+def test_sidecar_touched_without_changes_still_hits(tmp_path: Path) -> None:
+    asset_path = tmp_path / "rock.counted"
+    asset_path.write_text("rock", encoding="utf-8")
+    meta_path = tmp_path / "rock.counted.meta"
+    meta_path.write_text('{"uuid": "rock"}', encoding="utf-8")
+    _age(asset_path, meta_path)
+    plugin = CountingImportPlugin()
+    _scan(tmp_path, plugin)
+
+    os.utime(meta_path, ns=(_PAST_NS + 10**9, _PAST_NS + 10**9))
+    plugin.preloaded.clear()
+    _scan(tmp_path, plugin)
+    assert plugin.preloaded == []
+
+
+def test_unreadable_index_is_empty(tmp_path: Path) -> None:
+    index = AssetScanIndex(tmp_path)
+    index.path.parent.mkdir(parents=True)
+    index.path.write_text("{not json", encoding="utf-8")
+    index.load()
+    assert len(index) == 0
+
+
+def _loaded_index(project: Path) -> AssetScanIndex:
+    index = AssetScanIndex(project)
+    index.load()
+    return index
@@ -2,6 +2,9 @@
 VoxelDisplayComponent — компонент для отображения воксельной сетки.
 
 Реализует протокол Drawable и рендерит воксели напрямую.
+Меш строится по чанкам с отсечением скрытых граней и слиянием
+граней (VoxelChunkMeshCache); при изменении сетки перестраиваются
+только изменившиеся чанки.
 Выбирает сетку из ResourceManager через комбобокс.
 Использует TcVoxelGrid для поддержки hot-reload.
 Отсечка по оси выполняется в шейдере для производительности.
@@ -17,8 +20,7 @@ from termin.render import DrawableComponent
 from termin.materials import TcMaterial as Material
 from termin.render.drawable import RenderItem, RenderItemCollectContext
 from termin.voxels._voxels_native import TcVoxelGrid
-from termin.voxels.voxel_mesh import create_voxel_mesh
-from tmesh import TcMesh
+from termin.voxels.chunk_mesh import VoxelChunkMeshCache
 from termin.inspect import InspectField
 from tcbase import log
 
@@ -82,8 +84,7 @@ _CUBE_NORMALS = np.array([
 
 VERTS_PER_CUBE = 24
 TRIS_PER_CUBE = 12
-CUBE_SCALE = 0.85  # Размер кубика относительно ячейки
-MAX_VOXELS = 100_000
+CUBE_SCALE = 0.85  # Размер кубика относительно ячейки (отладочные меши)
 
 
 class VoxelDisplayComponent(DrawableComponent):
@@ -150,7 +151,7 @@ class VoxelDisplayComponent(DrawableComponent):
         self._voxel_grid_name = grid_name or voxel_grid_name
         self.voxel_grid: TcVoxelGrid = TcVoxelGrid()
         self._last_version: int = -1  # Версия handle для отслеживания hot-reload
-        self._voxel_mesh: Optional[TcMesh] = None
+        self._chunk_meshes = VoxelChunkMeshCache("voxel_display_mesh")
         self._material: Optional[Material] = None
         self._needs_rebuild = True
         self.active_in_editor = True  # Enable update() in editor mode
@@ -254,7 +255,8 @@ class VoxelDisplayComponent(DrawableComponent):
     def collect_render_items(self, context: RenderItemCollectContext) -> list[RenderItem]:
         """Возвращает RenderItems для рендеринга воксельного меша."""
         self._check_hot_reload()
-        if self._voxel_mesh is None or not self._voxel_mesh.is_valid:
+        meshes = [mesh for mesh in self._chunk_meshes.meshes if mesh.is_valid]
+        if not meshes:
             return []
 
         mat = self._get_or_create_material()
@@ -296,117 +298,30 @@ class VoxelDisplayComponent(DrawableComponent):
             phase.set_param("u_bounds_max", bounds_max)
 
         phases.sort(key=lambda p: p.priority)
-        return [RenderItem.mesh(mesh=self._voxel_mesh, phase=p) for p in phases]
+        return [RenderItem.mesh(mesh=mesh, phase=p) for p in phases for mesh in meshes]
 
     # --- Построение меша ---
 
-    def _compute_mesh_uuid(self) -> str | None:
-        """Compute deterministic UUID based on asset path and version."""
-        import hashlib
+    def _mesh_uuid_prefix(self) -> str:
+        """Prefix of deterministic per-chunk mesh UUIDs for this grid asset."""
         if not self.voxel_grid.is_valid:
-            return None
-        source_path = self.voxel_grid.source_path
-        key_source = source_path or self.voxel_grid.uuid
-        key = f"voxel_display:{key_source}:v{self.voxel_grid.version}"
-        return hashlib.sha256(key.encode()).hexdigest()[:32]
+            return ""
+        key_source = self.voxel_grid.source_path or self.voxel_grid.uuid
+        return f"voxel_display:{key_source}"
 
     def _rebuild_mesh(self) -> None:
-        """Перестроить меш из воксельной сетки (без фильтрации, вся сетка)."""
-        # Очищаем старый меш
-        self._voxel_mesh = None
-
+        """Обновить меши чанков; неизменившиеся чанки переиспользуются."""
         self.voxel_grid.ensure_loaded()
         grid = self.voxel_grid.grid
 
-        if grid is None:
-            return
-
-        voxel_count = grid.voxel_count
-        if voxel_count == 0:
-            return
-
-        # Собираем все воксели и вычисляем bounds
-        all_voxels: list[tuple[int, int, int, int]] = []
-        min_world = np.array([float('inf'), float('inf'), float('inf')], dtype=np.float32)
-        max_world = np.array([float('-inf'), float('-inf'), float('-inf')], dtype=np.float32)
-
-        for vx, vy, vz, vtype in grid.iter_non_empty():
-            all_voxels.append((vx, vy, vz, vtype))
-            center = grid.voxel_to_world(vx, vy, vz)
-            min_world = np.minimum(min_world, center)
-            max_world = np.maximum(max_world, center)
-
-        if not all_voxels:
+        if grid is None or grid.voxel_count == 0:
+            self._chunk_meshes.clear()
             return
 
-        # Расширяем bounds на половину размера куба
-        half_cell = grid.cell_size * CUBE_SCALE * 0.5
-        self._bounds_min = min_world - half_cell
-        self._bounds_max = max_world + half_cell
-
-        # Try to get cached mesh by deterministic UUID
-        mesh_uuid = self._compute_mesh_uuid()
-        if mesh_uuid:
-            cached = TcMesh.from_uuid(mesh_uuid)
-            if cached is not None and cached.is_valid:
-                self._voxel_mesh = cached
-                return
-
-        # Ограничение для производительности
-        display_count = len(all_voxels)
-        if display_count > MAX_VOXELS:
-            log.warning(f"VoxelDisplayComponent: too many voxels ({display_count}), showing first {MAX_VOXELS}")
-            all_voxels = all_voxels[:MAX_VOXELS]
-            display_count = MAX_VOXELS
-
-        # Выделяем массивы
-        vertices = np.zeros((display_count * VERTS_PER_CUBE, 3), dtype=np.float32)
-        triangles = np.zeros((display_count * TRIS_PER_CUBE, 3), dtype=np.int32)
-        normals = np.zeros((display_count * VERTS_PER_CUBE, 3), dtype=np.float32)
-        uvs = np.zeros((display_count * VERTS_PER_CUBE, 2), dtype=np.float32)
-        colors = np.ones((display_count * VERTS_PER_CUBE, 3), dtype=np.float32)  # default white
-
-        # Получаем карту нормалей
-        surface_normals = grid.surface_normals
-
-        cell_size = grid.cell_size
-        idx = 0
-
-        for vx, vy, vz, vtype in all_voxels:
-            # Позиция центра вокселя
-            center = grid.voxel_to_world(vx, vy, vz)
-
-            # Смещаем и масштабируем вершины куба
-            v_start = idx * VERTS_PER_CUBE
-            v_end = v_start + VERTS_PER_CUBE
-            vertices[v_start:v_end] = _CUBE_VERTICES * (cell_size * CUBE_SCALE) + center
-            normals[v_start:v_end] = _CUBE_NORMALS
-            uvs[v_start:v_end, 0] = float(vtype)  # UV.x = тип вокселя
-
-            # Если есть нормали для этого вокселя — кодируем первую в цвет
-            normals_list = surface_normals.get((vx, vy, vz))
-            if normals_list and len(normals_list) > 0:
-                # Берём первую нормаль и кодируем как RGB: [-1,1] -> [0,1]
-                first_normal = normals_list[0]
-                encoded_color = (first_normal + 1.0) * 0.5
-                colors[v_start:v_end] = encoded_color
-
-            # Смещаем индексы треугольников
-            t_start = idx * TRIS_PER_CUBE
-            t_end = t_start + TRIS_PER_CUBE
-            triangles[t_start:t_end] = _CUBE_TRIANGLES + v_start
-
-            idx += 1
-
-        self._voxel_mesh = create_voxel_mesh(
-            vertices=vertices,
-            triangles=triangles,
-            uvs=uvs,
-            vertex_colors=colors,
-            vertex_normals=normals,
-            name="voxel_display_mesh",
-            uuid=mesh_uuid or "",  # Use deterministic UUID for caching
-        )
+        self._chunk_meshes.update(grid, uuid_prefix=self._mesh_uuid_prefix())
+        # Fill percent нормируется по занятым вокселям, а не по чанкам
+        if self._chunk_meshes.bounds is not None:
+            self._bounds_min, self._bounds_max = self._chunk_meshes.bounds
 
     # --- Lifecycle ---
 
@@ -426,7 +341,7 @@ class VoxelDisplayComponent(DrawableComponent):
 
     def destroy(self) -> None:
         """Release all resources."""
-        self._voxel_mesh = None
+        self._chunk_meshes.clear()
         self._material = None
 
     def update(self, dt: float) -> None:
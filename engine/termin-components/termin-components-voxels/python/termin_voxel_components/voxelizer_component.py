@@ -15,6 +15,7 @@ from termin.geombase import SrgbColor
 from termin.materials import TcMaterial as Material
 from termin.mesh import TcMesh
 from termin.mesh.mesh import Mesh3
+from termin.voxels.chunk_mesh import VoxelChunkMeshCache
 from termin.voxels.voxel_mesh import create_voxel_mesh
 from termin.render.drawable import RenderItem, RenderItemCollectContext
 from termin.inspect import InspectField
@@ -169,6 +170,7 @@ class VoxelizerComponent(DrawableComponent):
         self.show_triangulated: bool = show_triangulated
         self._debug_regions: list[tuple[list[tuple[int, int, int]], np.ndarray]] = []
         self._debug_grid: Optional["VoxelGrid"] = None
+        self._voxel_display_meshes = VoxelChunkMeshCache("voxelizer_display_mesh")
         self._debug_region_voxels_mesh: Optional[TcMesh] = None
         self._debug_sparse_boundary_mesh: Optional[TcMesh] = None
         self._debug_inner_contour_mesh: Optional[TcMesh] = None
@@ -382,83 +384,27 @@ class VoxelizerComponent(DrawableComponent):
         return self._actions.build_navmesh(self)
 
     def _rebuild_voxel_display_mesh(self) -> None:
-        """Перестроить меш для отображения вокселей (после voxelize)."""
-        from termin_voxel_components.display_component import (
-            _CUBE_VERTICES, _CUBE_TRIANGLES, _CUBE_NORMALS,
-            VERTS_PER_CUBE, TRIS_PER_CUBE, CUBE_SCALE,
-        )
-
-        # Очищаем старый меш
-        self._debug_mesh = None
-
-        if self._debug_grid is None:
-            return
+        """Обновить меши отображения вокселей (после voxelize).
 
+        Меши строятся по чанкам; чанки, не изменившиеся с прошлой
+        вокселизации, переиспользуются.
+        """
         grid = self._debug_grid
-        voxel_count = grid.voxel_count
-        if voxel_count == 0:
+        if grid is None or grid.voxel_count == 0:
+            self._voxel_display_meshes.clear()
             return
 
-        cell_size = grid.cell_size
-        cube_size = cell_size * CUBE_SCALE
-
-        # Собираем все воксели
-        all_voxels: list[tuple[int, int, int, int]] = list(grid.iter_non_empty())
-        if not all_voxels:
-            return
-
-        # Вычисляем bounds
-        min_world = np.array([float('inf'), float('inf'), float('inf')], dtype=np.float32)
-        max_world = np.array([float('-inf'), float('-inf'), float('-inf')], dtype=np.float32)
-
-        for vx, vy, vz, _ in all_voxels:
-            center = grid.voxel_to_world(vx, vy, vz)
-            min_world = np.minimum(min_world, center)
-            max_world = np.maximum(max_world, center)
+        self._voxel_display_meshes.update(grid)
+        # Fill percent нормируется по занятым вокселям, а не по чанкам
+        if self._voxel_display_meshes.bounds is not None:
+            self._debug_bounds_min, self._debug_bounds_max = self._voxel_display_meshes.bounds
 
-        half_cube = cube_size * 0.5
-        self._debug_bounds_min = min_world - half_cube
-        self._debug_bounds_max = max_world + half_cube
-
-        # Выделяем массивы
-        count = len(all_voxels)
-        vertices = np.zeros((count * VERTS_PER_CUBE, 3), dtype=np.float32)
-        triangles = np.zeros((count * TRIS_PER_CUBE, 3), dtype=np.int32)
-        normals = np.zeros((count * VERTS_PER_CUBE, 3), dtype=np.float32)
-        uvs = np.zeros((count * VERTS_PER_CUBE, 2), dtype=np.float32)
-        colors = np.ones((count * VERTS_PER_CUBE, 3), dtype=np.float32)
-
-        surface_normals = grid.surface_normals
-
-        for i, (vx, vy, vz, vtype) in enumerate(all_voxels):
-            center = grid.voxel_to_world(vx, vy, vz)
-
-            v_offset = i * VERTS_PER_CUBE
-            t_offset = i * TRIS_PER_CUBE
-
-            vertices[v_offset:v_offset + VERTS_PER_CUBE] = _CUBE_VERTICES * cube_size + center
-            triangles[t_offset:t_offset + TRIS_PER_CUBE] = _CUBE_TRIANGLES + v_offset
-            normals[v_offset:v_offset + VERTS_PER_CUBE] = _CUBE_NORMALS
-            uvs[v_offset:v_offset + VERTS_PER_CUBE, 0] = float(vtype)
-
-            # Кодируем нормаль в цвет если есть
-            normals_list = surface_normals.get((vx, vy, vz))
-            if normals_list and len(normals_list) > 0:
-                first_normal = normals_list[0]
-                encoded_color = (first_normal + 1.0) * 0.5
-                colors[v_offset:v_offset + VERTS_PER_CUBE] = encoded_color
-
-        self._debug_mesh = create_voxel_mesh(
-            vertices=vertices,
-            triangles=triangles,
-            uvs=uvs,
-            vertex_colors=colors,
-            vertex_normals=normals,
-            name="voxelizer_display_mesh",
+        log.warning(
+            f"VoxelizerComponent: display meshes updated "
+            f"({self._voxel_display_meshes.rebuilt_chunk_count} chunks rebuilt, "
+            f"{self._voxel_display_meshes.reused_chunk_count} reused)"
         )
 
-        log.warning(f"VoxelizerComponent: display mesh built ({count} voxels)")
-
     def _rebuild_debug_mesh(self) -> None:
         """Перестроить отладочные меши для регионов."""
         from termin_voxel_components.display_component import (
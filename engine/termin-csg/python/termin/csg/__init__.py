@@ -33,7 +33,7 @@ from termin.csg.procedural_document import (  # noqa: E402
     SketchItemDocument,
     SketchPathDocument,
 )
-from termin.csg.document_eval import EvaluatedSolid, evaluate_document  # noqa: E402
+from termin.csg.document_eval import DocumentEvaluationCache, EvaluatedSolid, evaluate_document  # noqa: E402
 from termin.csg.document_mesh import document_to_mesh3, document_to_tc_mesh  # noqa: E402
 from termin.csg.editor_controller import CsgEditorCommandResult, CsgEditorController  # noqa: E402
 from termin.csg.operation_specs import (  # noqa: E402
@@ -94,6 +94,7 @@ __all__ = [
     "ProceduralPlane",
     "SketchItemDocument",
     "SketchPathDocument",
+    "DocumentEvaluationCache",
     "EvaluatedSolid",
     "CsgEditorCommandResult",
     "CsgEditorController",
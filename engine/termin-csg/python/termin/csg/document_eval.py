@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Callable
 
@@ -44,21 +47,92 @@ class EvaluatedSolid:
     contour_id: str
     solid: Solid
     point_transform: PointTransform
+    # Content hash of the operation result this solid belongs to; empty when
+    # the result could not be keyed (for example a boolean with a missing input).
+    result_key: str = ""
 
 
-def evaluate_document(document: ProceduralMeshDocument) -> list[EvaluatedSolid]:
+class DocumentEvaluationCache:
+    """Operation results reused across ``evaluate_document`` calls.
+
+    Each result is keyed by a hash of the operation itself (kind, inputs,
+    params, and for sketch-based operations the source sketch) combined with
+    the result keys of its input operations. Editing one extrude changes its
+    key and, through the input keys, those of the booleans downstream of it;
+    every other operation is a cache hit. Keys are recomputed from document
+    content on every call, so in-place document edits never serve stale
+    solids. Solids are immutable, so cached results are shared freely.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, list[EvaluatedSolid]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> list[EvaluatedSolid] | None:
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: list[EvaluatedSolid]) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_DEFAULT_EVALUATION_CACHE = DocumentEvaluationCache()
+
+
+def default_evaluation_cache() -> DocumentEvaluationCache:
+    """Cache shared by ``evaluate_document`` callers that pass none."""
+    return _DEFAULT_EVALUATION_CACHE
+
+
+def evaluate_document(
+    document: ProceduralMeshDocument,
+    cache: DocumentEvaluationCache | None = None,
+) -> list[EvaluatedSolid]:
     """Build enabled document operations into CSG solids.
 
     Solids are evaluated in their operation-local coordinates. The attached
     point transform maps those coordinates back into document-local 3D space,
     preserving sketch plane placement. Callers may apply additional scene or
     entity transforms after this point.
+
+    Unchanged operations are served from ``cache`` (the shared default cache
+    when omitted); see ``DocumentEvaluationCache``.
     """
 
+    if cache is None:
+        cache = _DEFAULT_EVALUATION_CACHE
     operations_by_id = {operation.id: operation for operation in document.operations}
     operation_results: dict[str, list[EvaluatedSolid]] = {}
+    operation_keys: dict[str, str] = {}
+    sketch_digests: dict[str, str] = {}
     visiting_operation_ids: set[str] = set()
 
+    def sketch_digest(sketch_id: str) -> str:
+        digest = sketch_digests.get(sketch_id)
+        if digest is None:
+            sketch = document.find_sketch(sketch_id)
+            digest = "missing" if sketch is None else _content_hash(sketch.to_dict())
+            sketch_digests[sketch_id] = digest
+        return digest
+
     def evaluate_operation(operation) -> list[EvaluatedSolid] | None:
         cached_result = operation_results.get(operation.id)
         if cached_result is not None:
@@ -77,26 +151,52 @@ def evaluate_document(document: ProceduralMeshDocument) -> list[EvaluatedSolid]:
             return None
 
         visiting_operation_ids.add(operation.id)
-        if operation.kind == "extrude":
-            result = _evaluate_extrude(document, operation)
-        elif operation.kind == OPERATION_KIND_WALL:
-            result = _evaluate_wall(document, operation)
-        elif operation.kind == PRIMITIVE_OPERATION_KIND:
-            result = _evaluate_primitive(operation)
-        elif operation.kind in BOOLEAN_OPERATION_KINDS:
-            result = _evaluate_boolean(
-                operation,
-                lambda input_id: evaluate_input_operation(operation.id, input_id),
-            )
-        else:
-            log.error(
-                "[ProceduralMeshDocument] cannot evaluate operation: "
-                f"unknown kind '{operation.kind}' operation='{operation.id}'"
-            )
-            result = []
+        dependency_keys: list[str] | None = []
+        input_results: dict[str, list[EvaluatedSolid]] = {}
+        if operation.kind in BOOLEAN_OPERATION_KINDS:
+            for input_id in operation.inputs:
+                evaluated_items = evaluate_input_operation(operation.id, input_id)
+                input_key = operation_keys.get(input_id)
+                if evaluated_items is None:
+                    dependency_keys = None
+                    break
+                if input_key is None:
+                    dependency_keys = None
+                elif dependency_keys is not None:
+                    dependency_keys.append(input_key)
+                input_results[input_id] = evaluated_items
+        elif operation.kind in ("extrude", OPERATION_KIND_WALL):
+            dependency_keys.append(sketch_digest(str(operation.params.get("source_sketch_id", ""))))
+
+        key = None
+        result = None
+        if dependency_keys is not None:
+            key = _operation_result_key(operation, dependency_keys)
+            result = cache.get(key)
+
+        if result is None:
+            if operation.kind == "extrude":
+                result = _evaluate_extrude(document, operation)
+            elif operation.kind == OPERATION_KIND_WALL:
+                result = _evaluate_wall(document, operation)
+            elif operation.kind == PRIMITIVE_OPERATION_KIND:
+                result = _evaluate_primitive(operation)
+            elif operation.kind in BOOLEAN_OPERATION_KINDS:
+                result = _evaluate_boolean(operation, input_results.get)
+            else:
+                log.error(
+                    "[ProceduralMeshDocument] cannot evaluate operation: "
+                    f"unknown kind '{operation.kind}' operation='{operation.id}'"
+                )
+                result = []
+            if key is not None:
+                for evaluated in result:
+                    evaluated.result_key = key
+                cache.put(key, result)
         visiting_operation_ids.remove(operation.id)
-        if result is not None:
-            operation_results[operation.id] = result
+        if key is not None:
+            operation_keys[operation.id] = key
+        operation_results[operation.id] = result
         return result
 
     def evaluate_input_operation(
@@ -123,6 +223,24 @@ def evaluate_document(document: ProceduralMeshDocument) -> list[EvaluatedSolid]:
     return results
 
 
+def _content_hash(data) -> str:
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _operation_result_key(operation, dependency_keys: list[str]) -> str:
+    """Hash of what an operation result depends on; the display name is excluded."""
+    return _content_hash(
+        {
+            "id": operation.id,
+            "kind": operation.kind,
+            "inputs": list(operation.inputs),
+            "params": operation.params,
+            "dependencies": dependency_keys,
+        }
+    )
+
+
 def _evaluate_primitive(operation) -> list[EvaluatedSolid]:
     primitive_kind = str(operation.params.get("primitive_kind", ""))
     try:
@@ -946,7 +1064,9 @@ def _param_vec3(params: dict, key: str, default: Vec3Data) -> Vec3Data:
 
 
 __all__ = [
+    "DocumentEvaluationCache",
     "EvaluatedSolid",
+    "default_evaluation_cache",
     "evaluate_document",
     "extrude_vector_for_operation",
     "sketch_extrude_point_transform",
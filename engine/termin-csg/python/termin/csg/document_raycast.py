@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 import numpy as np
 
 from tcbase import log
 
 from termin.csg._csg_native import to_mesh3
-from termin.csg.document_eval import evaluate_document
+from termin.csg.document_eval import DocumentEvaluationCache, EvaluatedSolid, evaluate_document
 from termin.csg.procedural_document import ProceduralMeshDocument, ProceduralPlane
+from termin.csg.triangle_bvh import TriangleBVH
 from termin.geombase import Ray3, Vec3
 
 Vec3Data = tuple[float, float, float]
@@ -30,65 +32,47 @@ class CsgRaycastHit:
 def raycast_document(
     document: ProceduralMeshDocument,
     ray: Ray3,
+    cache: DocumentEvaluationCache | None = None,
 ) -> CsgRaycastHit | None:
-    """Raycast all evaluated solids in document-local coordinates."""
+    """Raycast all evaluated solids in document-local coordinates.
+
+    Triangles of every evaluated solid are gathered into one ``TriangleBVH``.
+    The BVH is reused while the evaluation result keys are unchanged, so
+    repeated picks on an unedited document skip meshing and rebuilding.
+    """
 
     checked_ray = _checked_ray(ray, "document raycast")
     if checked_ray is None:
         return None
 
-    best_hit: CsgRaycastHit | None = None
-    for evaluated in evaluate_document(document):
-        try:
-            mesh = to_mesh3(evaluated.solid, "csg-raycast-solid", "", True)
-            vertices = np.asarray(mesh.vertices, dtype=np.float32).reshape(-1, 3)
-            triangles = np.asarray(mesh.triangles, dtype=np.uint32).reshape(-1)
-        except Exception as e:
-            log.error(
-                "[CsgRaycast] failed to build raycast mesh "
-                f"operation='{evaluated.operation_id}' contour='{evaluated.contour_id}': {e}"
-            )
-            continue
+    scene = _raycast_scene(evaluate_document(document, cache))
+    triangle_hit = scene.bvh.raycast(
+        _vec3_data(checked_ray.origin),
+        _vec3_data(checked_ray.direction),
+        epsilon=_RAY_TRIANGLE_EPSILON,
+        min_distance=_RAY_TRIANGLE_EPSILON,
+    )
+    if triangle_hit is None:
+        return None
 
-        transformed = [
-            Vec3(evaluated.point_transform((float(v[0]), float(v[1]), float(v[2]))))
-            for v in vertices
-        ]
-        if any(not vertex.is_finite() for vertex in transformed):
-            log.error(
-                "[CsgRaycast] rejected non-finite transformed geometry "
-                f"operation='{evaluated.operation_id}' contour='{evaluated.contour_id}'"
-            )
-            continue
-        for index in range(0, len(triangles), 3):
-            a = transformed[int(triangles[index])]
-            b = transformed[int(triangles[index + 1])]
-            c = transformed[int(triangles[index + 2])]
-            triangle_hit = checked_ray.try_intersect_triangle(
-                a,
-                b,
-                c,
-                epsilon=_RAY_TRIANGLE_EPSILON,
-            )
-            if triangle_hit is None or triangle_hit.ray_parameter < _RAY_TRIANGLE_EPSILON:
-                continue
-            distance = triangle_hit.ray_parameter
-            if best_hit is not None and distance >= best_hit.distance:
-                continue
-            point = _vec3_data(checked_ray.point_at(distance))
-            normal = triangle_hit.normal
-            if normal.dot(checked_ray.direction) > 0.0:
-                normal = -normal
-            best_hit = CsgRaycastHit(
-                operation_id=evaluated.operation_id,
-                contour_id=evaluated.contour_id,
-                triangle_index=index // 3,
-                point=point,
-                normal=_vec3_data(normal),
-                distance=distance,
-                vertices=(_vec3_data(a), _vec3_data(b), _vec3_data(c)),
-            )
-    return best_hit
+    index = triangle_hit.triangle_index
+    evaluated = scene.solids[int(scene.triangle_solids[index])]
+    normal = Vec3(triangle_hit.normal)
+    if normal.dot(checked_ray.direction) > 0.0:
+        normal = -normal
+    a, b, c = (
+        (float(vertex[0]), float(vertex[1]), float(vertex[2]))
+        for vertex in scene.triangles[index]
+    )
+    return CsgRaycastHit(
+        operation_id=evaluated.operation_id,
+        contour_id=evaluated.contour_id,
+        triangle_index=int(scene.local_triangle_indices[index]),
+        point=_vec3_data(checked_ray.point_at(triangle_hit.distance)),
+        normal=_vec3_data(normal),
+        distance=triangle_hit.distance,
+        vertices=(a, b, c),
+    )
 
 
 def sketch_plane_from_hit(hit: CsgRaycastHit) -> ProceduralPlane | None:
@@ -134,6 +118,116 @@ def ray_plane_intersection(
     return _vec3_data(point)
 
 
+@dataclass
+class _RaycastScene:
+    solids: list[EvaluatedSolid]
+    triangles: np.ndarray
+    triangle_solids: np.ndarray
+    local_triangle_indices: np.ndarray
+    bvh: TriangleBVH
+
+
+# Scenes keyed by the evaluation result keys they were built from. Result
+# keys are content hashes, so an edit that changes any solid changes the key.
+_SCENE_CACHE: OrderedDict[tuple, _RaycastScene] = OrderedDict()
+_SCENE_CACHE_SIZE = 4
+
+
+def _raycast_scene(evaluated_solids: list[EvaluatedSolid]) -> _RaycastScene:
+    key: tuple | None = tuple(
+        (evaluated.result_key, evaluated.operation_id, evaluated.contour_id)
+        for evaluated in evaluated_solids
+    )
+    if any(not evaluated.result_key for evaluated in evaluated_solids):
+        key = None
+    if key is not None:
+        scene = _SCENE_CACHE.get(key)
+        if scene is not None:
+            _SCENE_CACHE.move_to_end(key)
+            return scene
+
+    scene = _build_raycast_scene(evaluated_solids)
+    if key is not None:
+        _SCENE_CACHE[key] = scene
+        while len(_SCENE_CACHE) > _SCENE_CACHE_SIZE:
+            _SCENE_CACHE.popitem(last=False)
+    return scene
+
+
+def _build_raycast_scene(evaluated_solids: list[EvaluatedSolid]) -> _RaycastScene:
+    triangle_blocks = []
+    solid_blocks = []
+    local_blocks = []
+    for solid_index, evaluated in enumerate(evaluated_solids):
+        try:
+            mesh = to_mesh3(evaluated.solid, "csg-raycast-solid", "", True)
+            vertices = np.asarray(mesh.vertices, dtype=np.float32).reshape(-1, 3)
+            triangles = np.asarray(mesh.triangles, dtype=np.uint32).reshape(-1, 3)
+        except Exception as e:
+            log.error(
+                "[CsgRaycast] failed to build raycast mesh "
+                f"operation='{evaluated.operation_id}' contour='{evaluated.contour_id}': {e}"
+            )
+            continue
+
+        transformed = _transform_vertices(evaluated.point_transform, vertices)
+        if not np.all(np.isfinite(transformed)):
+            log.error(
+                "[CsgRaycast] rejected non-finite transformed geometry "
+                f"operation='{evaluated.operation_id}' contour='{evaluated.contour_id}'"
+            )
+            continue
+        triangle_blocks.append(transformed[triangles])
+        solid_blocks.append(np.full(len(triangles), solid_index, dtype=np.int64))
+        local_blocks.append(np.arange(len(triangles), dtype=np.int64))
+
+    if triangle_blocks:
+        triangles = np.concatenate(triangle_blocks)
+        triangle_solids = np.concatenate(solid_blocks)
+        local_triangle_indices = np.concatenate(local_blocks)
+    else:
+        triangles = np.zeros((0, 3, 3), dtype=np.float64)
+        triangle_solids = np.zeros(0, dtype=np.int64)
+        local_triangle_indices = np.zeros(0, dtype=np.int64)
+    return _RaycastScene(
+        solids=list(evaluated_solids),
+        triangles=triangles,
+        triangle_solids=triangle_solids,
+        local_triangle_indices=local_triangle_indices,
+        bvh=TriangleBVH(triangles),
+    )
+
+
+def _transform_vertices(point_transform, vertices: np.ndarray) -> np.ndarray:
+    """Map operation-local vertices into document space as float64 (N, 3).
+
+    Document point transforms are affine (placement on the sketch plane plus
+    operation translation and rotation), so the transform is probed at the
+    origin and unit axes and applied as one matrix product. Sample vertices
+    are checked against the callable; any mismatch falls back to per-vertex
+    calls.
+    """
+
+    points = vertices.astype(np.float64)
+    if len(points) == 0:
+        return points.reshape(0, 3)
+    try:
+        origin = np.asarray(point_transform((0.0, 0.0, 0.0)), dtype=np.float64)
+        axes = np.array(
+            [point_transform(axis) for axis in ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))],
+            dtype=np.float64,
+        ) - origin
+        transformed = origin + points @ axes
+        samples = np.unique(np.linspace(0, len(points) - 1, num=min(len(points), 8)).astype(np.int64))
+        expected = np.array([point_transform(tuple(points[index])) for index in samples], dtype=np.float64)
+        scale = max(1.0, float(np.max(np.abs(expected))))
+        if np.allclose(transformed[samples], expected, rtol=0.0, atol=1.0e-9 * scale):
+            return transformed
+    except (TypeError, ValueError):
+        pass
+    return np.array([point_transform((float(v[0]), float(v[1]), float(v[2]))) for v in points], dtype=np.float64)
+
+
 def _checked_ray(ray: Ray3, operation: str) -> Ray3 | None:
     direction = ray.direction.try_normalized()
     if not ray.origin.is_finite() or direction is None:
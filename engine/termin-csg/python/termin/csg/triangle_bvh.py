@@ -0,0 +1,237 @@
+"""Static triangle BVH with vectorized ray queries for CSG picking."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+import numpy as np
+
+_LEAF_SIZE = 32
+# Triangle bounds are padded by this fraction of the longest edge so boxes
+# also contain hits the barycentric tolerance accepts just outside an edge.
+_BOUNDS_PADDING = 1.0e-6
+
+
+@dataclass
+class TriangleRayHit:
+    triangle_index: int
+    distance: float
+    normal: tuple[float, float, float]
+
+
+class TriangleBVH:
+    """Bounding volume hierarchy over a fixed triangle soup.
+
+    Nodes split at the median centroid along their longest centroid extent
+    until at most ``leaf_size`` triangles remain. Each leaf references a
+    contiguous run of the reordered triangles, so leaf tests run as one
+    numpy batch. The ray-triangle test mirrors ``Ray3.try_intersect_triangle``
+    (two-sided, edge-scaled Moller-Trumbore), so hits match a brute-force scan
+    over the same triangles.
+    """
+
+    def __init__(self, triangles: np.ndarray, leaf_size: int = _LEAF_SIZE) -> None:
+        triangles = np.asarray(triangles, dtype=np.float64).reshape(-1, 3, 3)
+        self.triangle_count = len(triangles)
+        order = np.arange(self.triangle_count)
+
+        node_min: list[list[float]] = []
+        node_max: list[list[float]] = []
+        node_children: list[tuple[int, int]] = []
+        node_ranges: list[tuple[int, int]] = []
+
+        if self.triangle_count:
+            padding = _triangle_edge_scale(triangles)[:, None] * _BOUNDS_PADDING
+            tri_min = triangles.min(axis=1) - padding
+            tri_max = triangles.max(axis=1) + padding
+            centroids = triangles.mean(axis=1)
+
+            def add_node() -> int:
+                node_min.append([0.0, 0.0, 0.0])
+                node_max.append([0.0, 0.0, 0.0])
+                node_children.append((-1, -1))
+                node_ranges.append((0, 0))
+                return len(node_min) - 1
+
+            stack = [(add_node(), 0, self.triangle_count)]
+            while stack:
+                node, start, end = stack.pop()
+                indices = order[start:end]
+                node_min[node] = tri_min[indices].min(axis=0).tolist()
+                node_max[node] = tri_max[indices].max(axis=0).tolist()
+                node_ranges[node] = (start, end)
+                if end - start <= leaf_size:
+                    continue
+                node_centroids = centroids[indices]
+                extent = node_centroids.max(axis=0) - node_centroids.min(axis=0)
+                axis = int(np.argmax(extent))
+                if not extent[axis] > 0.0:
+                    continue
+                middle = (end - start) // 2
+                order[start:end] = indices[np.argpartition(node_centroids[:, axis], middle)]
+                left = add_node()
+                right = add_node()
+                node_children[node] = (left, right)
+                stack.append((left, start, start + middle))
+                stack.append((right, start + middle, end))
+
+        self._node_min = node_min
+        self._node_max = node_max
+        self._node_children = node_children
+        self._node_ranges = node_ranges
+        self._order = order
+
+        sorted_triangles = triangles[order]
+        a = sorted_triangles[:, 0]
+        edge1 = sorted_triangles[:, 1] - a
+        edge2 = sorted_triangles[:, 2] - a
+        edge_scale = _triangle_edge_scale(sorted_triangles)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            safe_scale = np.where(edge_scale > 0.0, edge_scale, 1.0)[:, None]
+            self._scaled_edge1 = edge1 / safe_scale
+            self._scaled_edge2 = edge2 / safe_scale
+            area_vector = np.cross(self._scaled_edge1, self._scaled_edge2)
+            self._scaled_double_area = np.linalg.norm(area_vector, axis=1)
+            self._normals = area_vector / np.where(
+                self._scaled_double_area > 0.0, self._scaled_double_area, 1.0
+            )[:, None]
+        self._a = a
+        self._edge_scale = edge_scale
+        self._usable = (edge_scale > 0.0) & np.all(np.isfinite(sorted_triangles), axis=(1, 2))
+
+    def raycast(
+        self,
+        origin: tuple[float, float, float],
+        direction: tuple[float, float, float],
+        epsilon: float = 1.0e-8,
+        min_distance: float = 0.0,
+    ) -> TriangleRayHit | None:
+        """Nearest hit with distance >= ``min_distance``.
+
+        ``direction`` need not be normalized; distances are measured along
+        the normalized direction. Equal distances resolve to the lowest
+        triangle index, as a front-to-back scan would.
+        """
+
+        if not self._node_min:
+            return None
+        direction_length = math.sqrt(sum(component * component for component in direction))
+        if not direction_length > 0.0 or not math.isfinite(direction_length):
+            return None
+        direction = tuple(component / direction_length for component in direction)
+        origin_array = np.asarray(origin, dtype=np.float64)
+        direction_array = np.asarray(direction, dtype=np.float64)
+        inverse = tuple(1.0 / component if component != 0.0 else math.inf for component in direction)
+
+        best_distance = math.inf
+        best_index = -1
+        best_slot = -1
+        stack = [(0, self._enter_distance(0, origin, direction, inverse))]
+        while stack:
+            node, enter = stack.pop()
+            if enter is None or enter > best_distance:
+                continue
+            left, right = self._node_children[node]
+            if left < 0:
+                start, end = self._node_ranges[node]
+                hit = self._intersect_range(start, end, origin_array, direction_array, epsilon, min_distance)
+                if hit is None:
+                    continue
+                slot, distance = hit
+                index = int(self._order[slot])
+                if distance < best_distance or (distance == best_distance and index < best_index):
+                    best_distance = distance
+                    best_index = index
+                    best_slot = slot
+                continue
+            left_enter = self._enter_distance(left, origin, direction, inverse)
+            right_enter = self._enter_distance(right, origin, direction, inverse)
+            if left_enter is not None and right_enter is not None and right_enter < left_enter:
+                stack.append((left, left_enter))
+                stack.append((right, right_enter))
+            else:
+                stack.append((right, right_enter))
+                stack.append((left, left_enter))
+
+        if best_index < 0:
+            return None
+        normal = self._normals[best_slot]
+        return TriangleRayHit(
+            triangle_index=best_index,
+            distance=best_distance,
+            normal=(float(normal[0]), float(normal[1]), float(normal[2])),
+        )
+
+    def _enter_distance(self, node, origin, direction, inverse) -> float | None:
+        """Slab test: parameter where the ray enters the node box, or None."""
+
+        box_min = self._node_min[node]
+        box_max = self._node_max[node]
+        near = -math.inf
+        far = math.inf
+        for axis in range(3):
+            if direction[axis] == 0.0:
+                if origin[axis] < box_min[axis] or origin[axis] > box_max[axis]:
+                    return None
+                continue
+            t0 = (box_min[axis] - origin[axis]) * inverse[axis]
+            t1 = (box_max[axis] - origin[axis]) * inverse[axis]
+            if t0 > t1:
+                t0, t1 = t1, t0
+            near = max(near, t0)
+            far = min(far, t1)
+        if near > far or far < 0.0:
+            return None
+        return max(near, 0.0)
+
+    def _intersect_range(
+        self,
+        start: int,
+        end: int,
+        origin: np.ndarray,
+        direction: np.ndarray,
+        epsilon: float,
+        min_distance: float,
+    ) -> tuple[int, float] | None:
+        scaled_edge1 = self._scaled_edge1[start:end]
+        scaled_edge2 = self._scaled_edge2[start:end]
+        scaled_double_area = self._scaled_double_area[start:end]
+        edge_scale = self._edge_scale[start:end]
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            p = np.cross(direction, scaled_edge2)
+            det = np.einsum("ij,ij->i", scaled_edge1, p)
+            valid = (
+                self._usable[start:end]
+                & (scaled_double_area > epsilon)
+                & (np.abs(det) > epsilon * scaled_double_area)
+            )
+            inverse_det = 1.0 / det
+            scaled_offset = (origin - self._a[start:end]) / np.where(edge_scale > 0.0, edge_scale, 1.0)[:, None]
+            u = np.einsum("ij,ij->i", scaled_offset, p) * inverse_det
+            q = np.cross(scaled_offset, scaled_edge1)
+            v = (q @ direction) * inverse_det
+            w = 1.0 - u - v
+            distance = edge_scale * np.einsum("ij,ij->i", scaled_edge2, q) * inverse_det
+            low = -epsilon
+            high = 1.0 + epsilon
+            valid &= (u >= low) & (u <= high) & (v >= low) & (v <= high) & (w >= low) & (w <= high)
+            valid &= np.isfinite(distance) & (distance >= 0.0) & (distance >= min_distance)
+        candidates = np.flatnonzero(valid)
+        if len(candidates) == 0:
+            return None
+        candidate_distances = distance[candidates]
+        nearest = candidates[candidate_distances == candidate_distances.min()]
+        slot = start + int(nearest[np.argmin(self._order[start + nearest])])
+        return slot, float(distance[slot - start])
+
+
+def _triangle_edge_scale(triangles: np.ndarray) -> np.ndarray:
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    return np.maximum(
+        np.linalg.norm(b - a, axis=1),
+        np.maximum(np.linalg.norm(c - a, axis=1), np.linalg.norm(c - b, axis=1)),
+    )
+
+
+__all__ = ["TriangleBVH", "TriangleRayHit"]
@@ -2,6 +2,8 @@ from contextlib import contextmanager
 from math import isclose
 from pathlib import Path
 
+import numpy as np
+
 from tcbase import Action, MouseButton
 from termin.gui_native import TreeDropPosition
 
@@ -26,6 +28,7 @@ from termin.csg.cad_app import CadApp
 from termin.csg.cad_model import StandaloneCsgModel
 from termin.csg.cad_state import CadState, load_cad_state, save_cad_state
 from termin.csg.cad_viewer import build_document_solid_meshes, document_bounds
+from termin.csg import document_raycast
 from termin.csg.document_raycast import ray_plane_intersection, raycast_document
 from termin.csg.document_tree_model import build_document_tree
 from termin.csg.document_visual_model import PATH_SELECTED_COLOR, build_document_visual_model
@@ -42,6 +45,7 @@ from termin.csg.document_edit import (
 )
 from termin.csg.procedural_document import CONTOUR_ROLE_HOLE, CONTOUR_ROLE_OUTER, ProceduralPlane
 from termin.csg.sketch_point_interaction import pick_selected_sketch_point
+from termin.csg.triangle_bvh import TriangleBVH
 from termin.csg.viewer_camera import OrbitCamera
 from termin.geombase import Ray3, Vec3
 
@@ -558,6 +562,47 @@ def test_procedural_document_evaluates_primitive_operations_and_booleans():
     assert roots[0].children[1].text.startswith("[Cut] [Cylinder]")
 
 
+def test_evaluation_cache_reruns_only_edited_operation_and_downstream_booleans():
+    from termin.csg.document_eval import DocumentEvaluationCache
+
+    document = ProceduralMeshDocument()
+    first_contour = document.add_contour_from_points(
+        [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+    )
+    second_contour = document.add_contour_from_points(
+        [(5.0, 0.0, 0.0), (6.0, 0.0, 0.0), (6.0, 1.0, 0.0), (5.0, 1.0, 0.0)]
+    )
+    assert first_contour is not None
+    assert second_contour is not None
+    edited = document.add_extrude_operation_for_sketch(
+        document.find_sketch_id_for_contour(first_contour.id), height=1.0
+    )
+    untouched = document.add_extrude_operation_for_sketch(
+        document.find_sketch_id_for_contour(second_contour.id), height=1.0
+    )
+    box_operation = document.add_primitive_operation("box", {"size": [0.5, 0.5, 4.0]})
+    assert edited is not None
+    assert untouched is not None
+    assert box_operation is not None
+    union = document.add_boolean_operation("union", [edited.id, box_operation.id])
+    assert union is not None
+
+    cache = DocumentEvaluationCache()
+    first = {item.operation_id: item for item in evaluate_document(document, cache)}
+    assert (cache.hits, cache.misses) == (0, 4)
+
+    again = {item.operation_id: item for item in evaluate_document(document, cache)}
+    assert (cache.hits, cache.misses) == (4, 4)
+    assert again[union.id].solid is first[union.id].solid
+
+    edited.params["vector"] = [0.0, 0.0, 2.0]
+    edited_result = {item.operation_id: item for item in evaluate_document(document, cache)}
+    assert (cache.hits, cache.misses) == (6, 6)
+    assert edited_result[untouched.id].solid is first[untouched.id].solid
+    assert edited_result[union.id].result_key != first[union.id].result_key
+    assert edited_result[union.id].solid.volume > first[union.id].solid.volume
+
+
 def test_operation_specs_drive_primitive_defaults_and_button_order():
     primitive_labels = [spec.label for spec in ordered_primitive_specs()]
     boolean_labels = [spec.label for spec in ordered_boolean_operation_specs()]
@@ -1026,6 +1071,71 @@ def test_document_raycast_uses_evaluated_solids_in_document_space():
     assert hit.normal == (0.0, 0.0, 1.0)
 
 
+def test_triangle_bvh_matches_brute_force_triangle_scan():
+    rng = np.random.default_rng(7)
+    triangles = rng.normal(size=(600, 1, 3)) * 4.0 + rng.normal(size=(600, 3, 3)) * 0.5
+    bvh = TriangleBVH(triangles, leaf_size=8)
+
+    for _ in range(64):
+        origin = rng.normal(size=3) * 6.0
+        direction = rng.normal(size=3)
+        ray = Ray3(Vec3(*origin), Vec3(*direction))
+        expected = None
+        for index, (a, b, c) in enumerate(triangles):
+            triangle_hit = ray.try_intersect_triangle(Vec3(*a), Vec3(*b), Vec3(*c), epsilon=1.0e-8)
+            if triangle_hit is None:
+                continue
+            if expected is None or triangle_hit.ray_parameter < expected[1]:
+                expected = (index, triangle_hit.ray_parameter)
+
+        hit = bvh.raycast(tuple(origin), tuple(direction), epsilon=1.0e-8)
+        if expected is None:
+            assert hit is None
+        else:
+            assert hit is not None
+            assert hit.triangle_index == expected[0]
+            assert isclose(hit.distance, expected[1], rel_tol=1.0e-9, abs_tol=1.0e-9)
+
+
+def test_document_raycast_rebuilds_scene_only_after_edit(monkeypatch):
+    document = ProceduralMeshDocument()
+    contour = document.add_contour_from_points(
+        [
+            (-1.0, -1.0, 0.0),
+            (1.0, -1.0, 0.0),
+            (1.0, 1.0, 0.0),
+            (-1.0, 1.0, 0.0),
+        ]
+    )
+    assert contour is not None
+    sketch_id = document.find_sketch_id_for_contour(contour.id)
+    operation = document.add_extrude_operation_for_sketch(sketch_id, height=2.0)
+    assert operation is not None
+    ray = Ray3(Vec3(0.0, 0.0, 5.0), Vec3(0.0, 0.0, -1.0))
+
+    mesh_calls = []
+    original_to_mesh3 = document_raycast.to_mesh3
+
+    def counting_to_mesh3(*args, **kwargs):
+        mesh_calls.append(args[1])
+        return original_to_mesh3(*args, **kwargs)
+
+    monkeypatch.setattr(document_raycast, "to_mesh3", counting_to_mesh3)
+
+    first = raycast_document(document, ray)
+    mesh_calls.clear()
+    second = raycast_document(document, ray)
+    assert first == second
+    assert mesh_calls == []
+
+    operation.params["height"] = 3.25
+    operation.params["vector"] = [0.0, 0.0, 3.25]
+    edited = raycast_document(document, ray)
+    assert mesh_calls == ["csg-raycast-solid"]
+    assert edited is not None
+    assert isclose(edited.distance, 1.75, abs_tol=1.0e-6)
+
+
 def test_ray_plane_intersection_reports_parallel_and_behind_rays():
     plane = ProceduralPlane()
 
@@ -38,6 +38,20 @@ class AnimationClipAsset(DataAsset["TcAnimationClip"]):
         data = self.data
         return data.duration if data else 0.0
 
+    def resident_bytes(self) -> int:
+        clip = self._data
+        if not self._loaded or clip is None or not clip.is_valid:
+            return 0
+        return clip.memory_bytes
+
+    def has_live_references(self) -> bool:
+        """Animation players hold native TcAnimationClip references."""
+        # The asset's own handle is one of the native references; dropping
+        # the last one destroys the clip in the registry
+        if self._data is not None and self._data.is_valid and self._data.ref_count > 1:
+            return True
+        return super().has_live_references()
+
     def _parse_content(self, content: str) -> "TcAnimationClip | None":
         from termin.animation.clip_io import parse_animation_content
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,8 +12,22 @@ from termin_assets import DataAsset
 from termin.default_assets.mesh.mesh_spec import DEFAULT_AXIS_X, DEFAULT_AXIS_Y, DEFAULT_AXIS_Z
 
 if TYPE_CHECKING:
+    from termin_assets import DerivedDataCache, DerivedDataEntry
     from termin.default_assets.mesh.mesh_spec import MeshSpec
 
+# Bump when STL/OBJ parsing or the produced vertex buffers change:
+# cached derived data of older importers is then ignored.
+MESH_IMPORTER_VERSION = 2
+
+
+@dataclass
+class _DecodedMesh:
+    """Worker-side result of MeshAsset._decode_content()."""
+
+    mesh3: Mesh3 | None = None
+    derived: "DerivedDataEntry | None" = None
+    cache_key: str | None = None
+
 
 class MeshAsset(DataAsset[TcMesh]):
     """
@@ -121,36 +136,88 @@ class MeshAsset(DataAsset[TcMesh]):
 
     def _parse_content(self, content: bytes) -> TcMesh | None:
         """Parse mesh content (STL or OBJ based on file extension)."""
+        return self._parse_decoded(self._decode_content(content))
+
+    def _decode_content(self, content: bytes) -> _DecodedMesh | None:
+        """Parse STL/OBJ into Mesh3 without touching the tc_mesh registry.
+
+        With a project derived-data cache configured, the interleaved buffers
+        of a previous import with identical content and settings are mapped
+        from disk instead of re-parsing the source.
+        """
         if self._source_path is None:
             return None
 
+        import dataclasses
         import os
 
+        from termin_assets import current_derived_data_cache, derived_data_key
+
         ext = os.path.splitext(str(self._source_path))[1].lower()
         spec = self._get_mesh_spec()
 
+        if ext not in (".stl", ".obj"):
+            log.warn(f"[MeshAsset] Unsupported format: {ext}")
+            return None
+
+        cache = current_derived_data_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = derived_data_key(
+                f"mesh{ext}", MESH_IMPORTER_VERSION, dataclasses.asdict(spec), content
+            )
+            entry = cache.load(cache_key)
+            if entry is not None:
+                return _DecodedMesh(derived=entry, cache_key=cache_key)
+
         if ext == ".stl":
             mesh3 = self._parse_stl_to_mesh3(content, spec)
-        elif ext == ".obj":
-            mesh3 = self._parse_obj_to_mesh3(content, spec)
         else:
-            log.warn(f"[MeshAsset] Unsupported format: {ext}")
-            return None
+            mesh3 = self._parse_obj_to_mesh3(content, spec)
 
         if mesh3 is None:
             return None
+        return _DecodedMesh(mesh3=mesh3, cache_key=cache_key)
 
-        return self._populate_or_create_tc_mesh(mesh3)
+    def _parse_decoded(self, decoded: _DecodedMesh | None) -> TcMesh | None:
+        """Install decoded mesh data into the declared or a new TcMesh."""
+        if decoded is None:
+            return None
 
-    def _populate_or_create_tc_mesh(self, mesh3: Mesh3) -> TcMesh | None:
-        """Populate existing declared TcMesh or create new one."""
+        from termin_assets import current_derived_data_cache
+
+        cache = current_derived_data_cache()
+        if decoded.derived is not None:
+            tc_mesh = self._populate_or_create_tc_mesh_from_derived(decoded.derived)
+            if tc_mesh is not None:
+                return tc_mesh
+            # Unusable entry: fall back to a full parse and rewrite it
+            if cache is not None and decoded.cache_key is not None:
+                cache.discard(decoded.cache_key)
+            return self._parse_decoded(self._decode_content(self._read_file()))
+
+        tc_mesh = self._populate_or_create_tc_mesh(decoded.mesh3)
+        if cache is not None and decoded.cache_key is not None and tc_mesh is not None:
+            self._store_derived_mesh(cache, decoded.cache_key, tc_mesh)
+        return tc_mesh
+
+    def _existing_tc_mesh(self) -> TcMesh | None:
+        """Declared or registered TcMesh to populate in place, if any."""
         from tmesh import TcMesh
 
         tc_mesh = self._data
         if (tc_mesh is None or not tc_mesh.is_valid) and self._uuid:
             tc_mesh = TcMesh.from_uuid(self._uuid)
-
         if tc_mesh is not None and tc_mesh.is_valid:
+            return tc_mesh
+        return None
+
+    def _populate_or_create_tc_mesh(self, mesh3: Mesh3) -> TcMesh | None:
+        """Populate existing declared TcMesh or create new one."""
+        from tmesh import TcMesh
+
+        tc_mesh = self._existing_tc_mesh()
+        if tc_mesh is not None:
             if tc_mesh.set_from_mesh3(mesh3):
                 return tc_mesh
             log.error(f"[MeshAsset] Failed to update TcMesh: {self._name}")
@@ -158,13 +225,52 @@ class MeshAsset(DataAsset[TcMesh]):
 
         return TcMesh.from_mesh3(mesh3, self._name, self._uuid)
 
+    def _populate_or_create_tc_mesh_from_derived(self, entry: "DerivedDataEntry") -> TcMesh | None:
+        """Populate or create TcMesh from cached interleaved buffers.
+
+        Mesh3 conversion always produces the pos_normal_uv_tangent layout,
+        so an entry with a different stride is treated as a miss.
+        """
+        from tmesh import TcMesh, TcVertexLayout, tc_mesh_set_data
+
+        layout = TcVertexLayout.pos_normal_uv_tangent()
+        vertices = entry.arrays.get("vertices")
+        indices = entry.arrays.get("indices")
+        vertex_count = int(entry.meta.get("vertex_count", -1))
+        if (
+            vertices is None
+            or indices is None
+            or entry.meta.get("stride") != layout.stride
+            or vertices.size * 4 != vertex_count * layout.stride
+        ):
+            return None
+
+        tc_mesh = self._existing_tc_mesh()
+        if tc_mesh is not None:
+            if tc_mesh_set_data(tc_mesh, vertices, vertex_count, layout, indices, self._name):
+                return tc_mesh
+            log.error(f"[MeshAsset] Failed to update TcMesh from derived data: {self._name}")
+            return None
+
+        return TcMesh.from_interleaved(vertices, vertex_count, indices, layout, self._name, self._uuid)
+
+    def _store_derived_mesh(self, cache: "DerivedDataCache", key: str, tc_mesh: TcMesh) -> None:
+        """Save the uploaded buffers of a freshly imported mesh."""
+        vertices = tc_mesh.get_vertices_buffer()
+        indices = tc_mesh.get_indices_buffer()
+        if vertices is None or indices is None:
+            return
+        cache.store(
+            key,
+            {"vertices": vertices, "indices": indices},
+            {"vertex_count": int(tc_mesh.vertex_count), "stride": int(tc_mesh.stride)},
+        )
+
     def _parse_stl_to_mesh3(self, content: bytes, spec: "MeshSpec") -> Mesh3 | None:
         """Parse STL content to Mesh3."""
         import io
 
-        from termin.default_assets.mesh.stl_loader import _load_binary_stl, _load_ascii_stl
-
-        f = io.BytesIO(content)
+        from termin.default_assets.mesh.stl_loader import _load_ascii_stl, _parse_binary_stl
 
         # Detect ASCII vs binary
         first_bytes = content[:80]
@@ -175,13 +281,12 @@ class MeshAsset(DataAsset[TcMesh]):
 
         if is_ascii:
             try:
-                mesh_data = _load_ascii_stl(f, self._name)
+                mesh_data = _load_ascii_stl(io.BytesIO(content), self._name)
             except Exception as e:
                 log.debug(f"[MeshAsset] ASCII STL load failed for {self._name}, trying binary: {e}")
-                f.seek(0)
-                mesh_data = _load_binary_stl(f, self._name)
+                mesh_data = _parse_binary_stl(content, self._name)
         else:
-            mesh_data = _load_binary_stl(f, self._name)
+            mesh_data = _parse_binary_stl(content, self._name)
 
         # Apply spec transformations
         mesh_data.vertices = spec.apply_to_vertices(mesh_data.vertices)
@@ -221,6 +326,31 @@ class MeshAsset(DataAsset[TcMesh]):
             mesh3.compute_normals()
         return mesh3
 
+    # --- Residency ---
+
+    def resident_bytes(self) -> int:
+        """CPU-side vertex and index bytes of the loaded tc_mesh."""
+        tc_mesh = self._data
+        if not self._loaded or tc_mesh is None or not tc_mesh.is_valid:
+            return 0
+        return tc_mesh.vertex_count * tc_mesh.stride + tc_mesh.index_count * 4
+
+    def has_live_references(self) -> bool:
+        """Renderers and components hold native TcMesh references."""
+        # The asset's own handle is one of the native references
+        if self._data is not None and self._data.is_valid and self._data.ref_count > 1:
+            return True
+        return super().has_live_references()
+
+    def unload(self) -> None:
+        """Free tc_mesh data; the registry entry reloads lazily by UUID."""
+        from tmesh import tc_mesh_unload
+
+        tc_mesh = self._data
+        if tc_mesh is not None and tc_mesh.is_valid:
+            tc_mesh_unload(tc_mesh)
+        self._loaded = False
+
     # --- Convenience methods for mesh manipulation ---
 
     def get_vertex_count(self) -> int:
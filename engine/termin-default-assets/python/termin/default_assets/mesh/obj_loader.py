@@ -1,8 +1,11 @@
 # termin/loaders/obj_loader.py
-"""Pure Python OBJ loader. No external dependencies."""
+"""OBJ loader with a batched NumPy tokenizer."""
 
 from __future__ import annotations
 
+import codecs
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -26,118 +29,276 @@ class OBJSceneData:
         self.meshes = []
 
 
+# Lines handed to the tokenizer per batch; bounds temporary token lists
+OBJ_CHUNK_LINES = 1 << 16
+# Bytes read from disk per chunk by load_obj_file()
+OBJ_READ_CHUNK_BYTES = 1 << 22
+
+_INDENT = " \t"
+_DROP_INDEX_CHARS = str.maketrans("", "", "0123456789+-")
+
+
 def load_obj_file(path, spec: "MeshSpec | None" = None) -> OBJSceneData:
-    """Load OBJ file."""
+    """Load OBJ file, streaming it in chunks."""
     path = Path(path)
 
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        text = f.read()
-
-    return parse_obj_text(text, name=path.stem, spec=spec)
+    with open(path, "rb") as f:
+        return parse_obj_chunks(_read_text_chunks(f), name=path.stem, spec=spec)
 
 
 def parse_obj_text(text: str, name: str = "mesh", spec: "MeshSpec | None" = None) -> OBJSceneData:
     """Parse OBJ from text content."""
-    scene_data = OBJSceneData()
+    return parse_obj_chunks((text,), name=name, spec=spec)
+
+
+def parse_obj_chunks(
+    chunks: Iterable[str],
+    name: str = "mesh",
+    spec: "MeshSpec | None" = None,
+) -> OBJSceneData:
+    """Parse OBJ from consecutive text chunks split at arbitrary positions."""
+    tokenizer = _OBJTokenizer()
+    tail = ""
+    for chunk in chunks:
+        lines = (tail + chunk).split("\n")
+        tail = lines.pop()
+        for start in range(0, len(lines), OBJ_CHUNK_LINES):
+            tokenizer.feed(lines[start:start + OBJ_CHUNK_LINES])
+    if tail:
+        tokenizer.feed([tail])
 
-    # Raw data from file
-    positions = []  # v
-    tex_coords = []  # vt
-    normals_raw = []  # vn
-    faces = []  # f
+    scene_data = OBJSceneData()
+    scene_data.meshes.append(tokenizer.build_mesh(name, spec))
+    return scene_data
 
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
 
-        parts = line.split()
-        if not parts:
-            continue
+def _read_text_chunks(f) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    while True:
+        data = f.read(OBJ_READ_CHUNK_BYTES)
+        if not data:
+            break
+        yield decoder.decode(data)
+    yield decoder.decode(b"", final=True)
 
-        cmd = parts[0]
 
-        if cmd == "v" and len(parts) >= 4:
-            positions.append((float(parts[1]), float(parts[2]), float(parts[3])))
+class _GrowableArray:
+    """Append-only 2D array with amortized O(1) block appends."""
 
-        elif cmd == "vt" and len(parts) >= 3:
-            tex_coords.append((float(parts[1]), float(parts[2])))
+    def __init__(self, width: int, dtype, capacity: int = 1024):
+        self._data = np.empty((capacity, width), dtype=dtype)
+        self._size = 0
 
-        elif cmd == "vn" and len(parts) >= 4:
-            normals_raw.append((float(parts[1]), float(parts[2]), float(parts[3])))
+    def __len__(self) -> int:
+        return self._size
 
-        elif cmd == "f" and len(parts) >= 4:
-            # Parse face vertices (can be triangles or quads)
-            face_verts = []
-            for vert in parts[1:]:
-                # Format: v, v/vt, v/vt/vn, v//vn
-                indices_str = vert.split("/")
-                v_idx = int(indices_str[0]) - 1  # OBJ is 1-indexed
+    def extend(self, block: np.ndarray) -> None:
+        needed = self._size + len(block)
+        if needed > len(self._data):
+            grown = np.empty((max(needed, 2 * len(self._data)), self._data.shape[1]), dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:needed] = block
+        self._size = needed
 
-                vt_idx = None
-                if len(indices_str) > 1 and indices_str[1]:
-                    vt_idx = int(indices_str[1]) - 1
+    def view(self) -> np.ndarray:
+        return self._data[:self._size]
 
-                vn_idx = None
-                if len(indices_str) > 2 and indices_str[2]:
-                    vn_idx = int(indices_str[2]) - 1
 
-                face_verts.append((v_idx, vt_idx, vn_idx))
+class _OBJTokenizer:
+    """Batch OBJ tokenizer.
 
-            # Triangulate (fan triangulation for convex polygons)
-            for i in range(1, len(face_verts) - 1):
-                faces.append(face_verts[0])
-                faces.append(face_verts[i])
-                faces.append(face_verts[i + 1])
+    Sorts lines by command and converts each command's numbers with one
+    NumPy call per batch. Face corners are stored as zero-based
+    (v, vt, vn) index triples with -1 for a missing attribute.
+    """
 
-    if not positions:
-        scene_data.meshes.append(OBJMeshData(
+    def __init__(self):
+        self._positions = _GrowableArray(3, np.float32)
+        self._tex_coords = _GrowableArray(2, np.float32)
+        self._normals = _GrowableArray(3, np.float32)
+        self._corners = _GrowableArray(3, np.int64)
+        self._face_sizes = _GrowableArray(1, np.int64)
+
+    def feed(self, lines: list[str]) -> None:
+        v_lines: list[str] = []
+        vt_lines: list[str] = []
+        vn_lines: list[str] = []
+        f_lines: list[str] = []
+        buckets = {
+            "v ": v_lines, "v\t": v_lines,
+            "vt": vt_lines, "vn": vn_lines,
+            "f ": f_lines, "f\t": f_lines,
+        }
+        for line in lines:
+            if line[:1] in _INDENT:
+                line = line.lstrip()
+            bucket = buckets.get(line[:2])
+            if bucket is not None:
+                bucket.append(line)
+
+        counts_before = np.array(
+            [len(self._positions), len(self._tex_coords), len(self._normals)], dtype=np.int64
+        )
+        if v_lines:
+            self._positions.extend(_parse_rows(v_lines, 3))
+        if vt_lines:
+            self._tex_coords.extend(_parse_rows(vt_lines, 2))
+        if vn_lines:
+            self._normals.extend(_parse_rows(vn_lines, 3))
+        if not f_lines:
+            return
+
+        sizes, corner_tokens = _split_faces(f_lines)
+        corners = _parse_face_corners(corner_tokens)
+        if (sizes < 3).any():
+            corners = corners[np.repeat(sizes >= 3, sizes)]
+            sizes = sizes[sizes >= 3]
+
+        # OBJ is 1-indexed; negative indices count back from the attribute
+        # count at their face line
+        resolved = corners - 1
+        relative = corners < 0
+        if relative.any():
+            counts = np.repeat(_face_attribute_counts(lines, counts_before), sizes, axis=0)
+            resolved[relative] = (counts + corners)[relative]
+        resolved[corners == 0] = -1
+        self._corners.extend(resolved)
+        self._face_sizes.extend(sizes.reshape(-1, 1))
+
+    def build_mesh(self, name: str, spec: "MeshSpec | None") -> OBJMeshData:
+        positions = self._positions.view()
+        if len(positions) == 0:
+            return OBJMeshData(
+                name=name,
+                vertices=np.array([], dtype=np.float32).reshape(0, 3),
+                normals=None,
+                uvs=None,
+                indices=np.array([], dtype=np.uint32),
+            )
+
+        corners = self._corners.view()[_fan_triangulate(self._face_sizes.view()[:, 0])]
+        v_idx, vt_idx, vn_idx = corners[:, 0], corners[:, 1], corners[:, 2]
+
+        vertices_np = positions[_checked(v_idx, len(positions), "vertex")]
+        # Attributes are kept only when every corner references them
+        normals_np = None
+        if len(self._normals) and len(vn_idx) and (vn_idx >= 0).all():
+            normals_np = self._normals.view()[_checked(vn_idx, len(self._normals), "normal")]
+        uvs_np = None
+        if len(self._tex_coords) and len(vt_idx) and (vt_idx >= 0).all():
+            uvs_np = self._tex_coords.view()[_checked(vt_idx, len(self._tex_coords), "texture coordinate")]
+        indices_np = np.arange(len(vertices_np), dtype=np.uint32)
+
+        mesh = OBJMeshData(
             name=name,
-            vertices=np.array([], dtype=np.float32).reshape(0, 3),
-            normals=None,
-            uvs=None,
-            indices=np.array([], dtype=np.uint32),
-        ))
-        return scene_data
-
-    # Build final vertex arrays (expand indexed data)
-    out_vertices = []
-    out_normals = []
-    out_uvs = []
-
-    has_normals = bool(normals_raw)
-    has_uvs = bool(tex_coords)
-
-    for v_idx, vt_idx, vn_idx in faces:
-        out_vertices.append(positions[v_idx])
-
-        if has_normals and vn_idx is not None:
-            out_normals.append(normals_raw[vn_idx])
-
-        if has_uvs and vt_idx is not None:
-            out_uvs.append(tex_coords[vt_idx])
-
-    vertices_np = np.array(out_vertices, dtype=np.float32)
-    normals_np = np.array(out_normals, dtype=np.float32) if out_normals else None
-    uvs_np = np.array(out_uvs, dtype=np.float32) if out_uvs else None
-    indices_np = np.arange(len(out_vertices), dtype=np.uint32)
-
-    mesh = OBJMeshData(
-        name=name,
-        vertices=vertices_np,
-        normals=normals_np,
-        uvs=uvs_np,
-        indices=indices_np,
-    )
-
-    # Apply spec transformations
-    if spec is not None:
-        mesh.vertices = spec.apply_to_vertices(mesh.vertices)
-        mesh.indices = spec.apply_to_triangle_indices(mesh.indices)
-        if mesh.normals is not None:
-            mesh.normals = spec.apply_to_normals(mesh.normals)
-        if mesh.uvs is not None:
-            mesh.uvs = spec.apply_to_uvs(mesh.uvs)
-
-    scene_data.meshes.append(mesh)
-    return scene_data
+            vertices=vertices_np,
+            normals=normals_np,
+            uvs=uvs_np,
+            indices=indices_np,
+        )
+
+        # Apply spec transformations
+        if spec is not None:
+            mesh.vertices = spec.apply_to_vertices(mesh.vertices)
+            mesh.indices = spec.apply_to_triangle_indices(mesh.indices)
+            if mesh.normals is not None:
+                mesh.normals = spec.apply_to_normals(mesh.normals)
+            if mesh.uvs is not None:
+                mesh.uvs = spec.apply_to_uvs(mesh.uvs)
+
+        return mesh
+
+
+def _parse_rows(lines: list[str], width: int) -> np.ndarray:
+    """Parse the first ``width`` numbers after the command of each line."""
+    tokens = " ".join(lines).split()
+    stride = width + 1
+    # Fast path: every line holds exactly ``width`` numbers
+    if len(tokens) == stride * len(lines) and tokens[::stride].count(tokens[0]) == len(lines):
+        del tokens[::stride]
+        return np.array(tokens, dtype=np.float32).reshape(-1, width)
+    # Optional components (v w, vertex colors, vt w) or short lines
+    tokens = [token for line in lines if len(fields := line.split()) > width for token in fields[1:stride]]
+    return np.array(tokens, dtype=np.float32).reshape(-1, width)
+
+
+def _split_faces(lines: list[str]) -> tuple[np.ndarray, list[str]]:
+    """Corner counts of face lines and their corner tokens in order."""
+    tokens = " ".join(lines).split()
+    stride = len(lines[0].split())
+    # Fast path: all faces have the first one's corner count
+    if len(tokens) == stride * len(lines) and tokens[::stride].count(tokens[0]) == len(lines):
+        del tokens[::stride]
+        return np.full(len(lines), stride - 1, dtype=np.int64), tokens
+    rows = [line.split() for line in lines]
+    sizes = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows)) - 1
+    return sizes, list(chain.from_iterable(row[1:] for row in rows))
+
+
+def _parse_face_corners(corners: list[str]) -> np.ndarray:
+    """Parse ``v``, ``v/vt``, ``v/vt/vn`` and ``v//vn`` corners to (N, 3) ints; 0 = missing."""
+    count = len(corners)
+    joined = " ".join(corners)
+    slashes = corners[0].count("/")
+    # All corners share the first one's layout: only separators remain
+    # once the index digits are dropped
+    layout = "/" * slashes
+    if slashes <= 2 and joined.translate(_DROP_INDEX_CHARS) == " ".join([layout] * count):
+        double = joined.count("//")
+        if slashes == 2 and double == count:
+            columns = [0, 2]
+        elif double == 0:
+            columns = list(range(slashes + 1))
+        else:
+            columns = None
+        if columns is not None:
+            tokens = joined.replace("/", " ").split()
+            if len(tokens) == len(columns) * count:
+                result = np.zeros((count, 3), dtype=np.int64)
+                result[:, columns] = np.array(tokens, dtype=np.int64).reshape(count, len(columns))
+                return result
+
+    # Corner formats mixed within the batch, or empty fields
+    result = np.zeros((count, 3), dtype=np.int64)
+    for i, corner in enumerate(corners):
+        for j, field in enumerate(corner.split("/")[:3]):
+            if field:
+                result[i, j] = int(field)
+    return result
+
+
+def _face_attribute_counts(lines: list[str], counts_before: np.ndarray) -> np.ndarray:
+    """(v, vt, vn) counts in effect at each face line of a batch."""
+    counts = counts_before.tolist()
+    result = []
+    for line in lines:
+        if line[:1] in _INDENT:
+            line = line.lstrip()
+        head = line[:2]
+        if head in ("v ", "v\t"):
+            counts[0] += 1
+        elif head == "vt":
+            counts[1] += 1
+        elif head == "vn":
+            counts[2] += 1
+        elif head in ("f ", "f\t") and len(line.split()) >= 4:
+            result.append(tuple(counts))
+    return np.array(result, dtype=np.int64).reshape(-1, 3)
+
+
+def _fan_triangulate(face_sizes: np.ndarray) -> np.ndarray:
+    """Corner indices of fan triangles (0, i, i + 1) for convex polygons."""
+    tri_counts = face_sizes - 2
+    face_starts = np.cumsum(face_sizes) - face_sizes
+    tri_face_starts = np.repeat(face_starts, tri_counts)
+    # Position of each triangle within its face: 1 .. size - 2
+    tri_starts = np.cumsum(tri_counts) - tri_counts
+    fan = np.arange(len(tri_face_starts), dtype=np.int64) - np.repeat(tri_starts, tri_counts) + 1
+    return np.stack([tri_face_starts, tri_face_starts + fan, tri_face_starts + fan + 1], axis=1).ravel()
+
+
+def _checked(indices: np.ndarray, count: int, kind: str) -> np.ndarray:
+    if len(indices) and (indices.min() < 0 or indices.max() >= count):
+        raise ValueError(f"OBJ face references a missing {kind} (have {count})")
+    return indices
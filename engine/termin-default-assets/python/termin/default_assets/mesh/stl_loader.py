@@ -1,5 +1,5 @@
 # termin/loaders/stl_loader.py
-"""Pure Python STL loader (binary and ASCII). No external dependencies."""
+"""STL loader (binary and ASCII). Depends only on NumPy."""
 
 from __future__ import annotations
 
@@ -66,36 +66,63 @@ def load_stl_file(path, spec: "MeshSpec | None" = None) -> STLSceneData:
     return scene_data
 
 
-def _load_binary_stl(f, name: str) -> STLMeshData:
-    """Load binary STL format."""
-    # Skip 80-byte header
-    f.seek(80)
+# Binary STL facet: normal, three vertices, attribute byte count (50 bytes, packed)
+STL_FACET_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+
+_STL_HEADER_SIZE = 80
+_STL_FACETS_OFFSET = _STL_HEADER_SIZE + 4
 
-    # Read triangle count
+
+def _load_binary_stl(f, name: str) -> STLMeshData:
+    """Load binary STL format from an open file or file-like object."""
+    f.seek(_STL_HEADER_SIZE)
     num_triangles = struct.unpack("<I", f.read(4))[0]
 
-    # Pre-allocate lists
-    vertices = []
-    normals = []
+    try:
+        f.fileno()
+    except (AttributeError, OSError):
+        facets = _facets_from_buffer(f.read(num_triangles * STL_FACET_DTYPE.itemsize), num_triangles, name)
+    else:
+        # Real file: read straight into the facet array, no intermediate bytes
+        facets = np.fromfile(f, dtype=STL_FACET_DTYPE, count=num_triangles)
+        _check_facet_count(len(facets), num_triangles, name)
 
-    # Read triangles
-    for _ in range(num_triangles):
-        # Normal (3 floats) + 3 vertices (9 floats) + attribute (2 bytes)
-        data = f.read(50)
-        values = struct.unpack("<12fH", data)
+    return _mesh_from_facets(facets, name)
 
-        nx, ny, nz = values[0:3]
-        v1 = values[3:6]
-        v2 = values[6:9]
-        v3 = values[9:12]
 
-        vertices.extend([v1, v2, v3])
-        normals.extend([(nx, ny, nz)] * 3)
+def _parse_binary_stl(content: bytes | memoryview, name: str) -> STLMeshData:
+    """Parse binary STL from an in-memory buffer without copying facet data."""
+    if len(content) < _STL_FACETS_OFFSET:
+        raise ValueError(f"Binary STL '{name}' is too short: {len(content)} bytes")
+    num_triangles = struct.unpack_from("<I", content, _STL_HEADER_SIZE)[0]
+    facets = _facets_from_buffer(memoryview(content)[_STL_FACETS_OFFSET:], num_triangles, name)
+    return _mesh_from_facets(facets, name)
 
-    # Convert to numpy
-    vertices_np = np.array(vertices, dtype=np.float32)
-    normals_np = np.array(normals, dtype=np.float32)
-    indices_np = np.arange(len(vertices), dtype=np.uint32)
+
+def _facets_from_buffer(buffer, num_triangles: int, name: str) -> np.ndarray:
+    available = len(buffer) // STL_FACET_DTYPE.itemsize
+    _check_facet_count(available, num_triangles, name)
+    count = min(available, num_triangles)
+    return np.frombuffer(buffer, dtype=STL_FACET_DTYPE, count=count)
+
+
+def _check_facet_count(available: int, num_triangles: int, name: str) -> None:
+    if available < num_triangles:
+        log.warning(
+            f"[STL] '{name}' is truncated: header declares {num_triangles} triangles, "
+            f"file holds {available}"
+        )
+
+
+def _mesh_from_facets(facets: np.ndarray, name: str) -> STLMeshData:
+    """Expand facet records to an unindexed triangle list."""
+    vertices_np = np.ascontiguousarray(facets["vertices"]).reshape(-1, 3)
+    normals_np = np.repeat(facets["normal"], 3, axis=0)
+    indices_np = np.arange(len(vertices_np), dtype=np.uint32)
 
     return STLMeshData(
         name=name,
@@ -227,6 +227,43 @@ class TextureAsset(DataAsset[TcTexture]):
         decoded = decode_rgba8(content, source_path or self._name)
         return self._texture_from_decoded(decoded, source_path)
 
+    def _decode_content(self, content: bytes):
+        """Decode image bytes to RGBA8 pixels (worker-thread safe)."""
+        from termin.image import decode_rgba8
+
+        source_path = str(self._source_path) if self._source_path else ""
+        return decode_rgba8(content, source_path or self._name)
+
+    def _parse_decoded(self, decoded) -> TcTexture | None:
+        """Create the native texture from decoded pixels."""
+        source_path = str(self._source_path) if self._source_path else ""
+        return self._texture_from_decoded(decoded, source_path)
+
+    # --- Residency ---
+
+    def resident_bytes(self) -> int:
+        """CPU pixel bytes of the loaded tc_texture."""
+        texture = self._data
+        if not self._loaded or texture is None or not texture.is_valid:
+            return 0
+        return texture.data_size
+
+    def has_live_references(self) -> bool:
+        """Materials and components hold native TcTexture references."""
+        # The asset's own handle is one of the native references
+        if self._data is not None and self._data.is_valid and self._data.ref_count > 1:
+            return True
+        return super().has_live_references()
+
+    def unload(self) -> None:
+        """Free tc_texture pixels; the registry entry reloads lazily by UUID."""
+        from tgfx import tc_texture_unload
+
+        texture = self._data
+        if texture is not None and texture.is_valid:
+            tc_texture_unload(texture)
+        self._loaded = False
+
     # --- Factory methods ---
 
     @classmethod
@@ -21,7 +21,7 @@ class VoxelGridAsset(DataAsset["VoxelGrid"]):
     Stores VoxelGrid (sparse voxel structure).
     """
 
-    _uses_binary = False  # JSON text format
+    _uses_binary = True  # Binary .voxels v2; JSON v1 is still accepted
 
     def __init__(
         self,
@@ -83,8 +83,32 @@ class VoxelGridAsset(DataAsset["VoxelGrid"]):
     def _on_loaded(self) -> None:
         self._sync_runtime_resource()
 
-    def _parse_content(self, content: str) -> "VoxelGrid | None":
-        """Parse JSON content into VoxelGrid."""
+    def resident_bytes(self) -> int:
+        """Chunk storage of the Python payload plus its registry copy."""
+        grid = self._data
+        if not self._loaded or grid is None:
+            return 0
+        from termin.voxels.chunk import CHUNK_VOLUME
+
+        return 2 * grid.chunk_count * CHUNK_VOLUME
+
+    def has_live_references(self) -> bool:
+        """Navmesh builders and components hold native TcVoxelGrid handles."""
+        from termin.voxels._voxels_native import voxel_grid_asset_ref_count
+
+        if voxel_grid_asset_ref_count(self.uuid) > 0:
+            return True
+        return super().has_live_references()
+
+    def unload(self) -> None:
+        """Drop the payload and its registry copy; the declaration stays."""
+        from termin.voxels._voxels_native import clear_voxel_grid_asset_data
+
+        super().unload()
+        clear_voxel_grid_asset_data(self.uuid)
+
+    def _parse_content(self, content: bytes) -> "VoxelGrid | None":
+        """Parse .voxels content (binary v2 or JSON v1) into VoxelGrid."""
         from termin.voxels.persistence import VoxelPersistence
 
         grid = VoxelPersistence.load_from_content(content)
@@ -0,0 +1,85 @@
+import io
+import struct
+
+import numpy as np
+
+from termin.default_assets.mesh.obj_loader import load_obj_file, parse_obj_chunks, parse_obj_text
+from termin.default_assets.mesh.stl_loader import _load_binary_stl, _parse_binary_stl, load_stl_file
+
+
+def _binary_stl(facets: np.ndarray) -> bytes:
+    out = io.BytesIO()
+    out.write(b"\0" * 80)
+    out.write(struct.pack("<I", len(facets)))
+    for row in facets:
+        out.write(struct.pack("<12fH", *row, 0))
+    return out.getvalue()
+
+
+def test_binary_stl_facets_expand_to_triangle_list(tmp_path) -> None:
+    facets = np.arange(24, dtype=np.float32).reshape(2, 12)
+    content = _binary_stl(facets)
+    path = tmp_path / "part.stl"
+    path.write_bytes(content)
+
+    for mesh in (
+        _parse_binary_stl(content, "part"),
+        _load_binary_stl(io.BytesIO(content), "part"),
+        load_stl_file(path).meshes[0],
+    ):
+        assert mesh.vertices.dtype == np.float32
+        np.testing.assert_array_equal(mesh.vertices, facets[:, 3:].reshape(-1, 3))
+        np.testing.assert_array_equal(mesh.normals, np.repeat(facets[:, :3], 3, axis=0))
+        assert mesh.indices.tolist() == list(range(6))
+
+    # A truncated file keeps its complete facets
+    truncated = _parse_binary_stl(content[:-10], "part")
+    assert len(truncated.vertices) == 3
+
+
+def test_obj_corner_formats_and_fan_triangulation() -> None:
+    text = "\n".join([
+        "# quad and triangle",
+        "v 0 0 0",
+        "v 1 0 0",
+        "v 1 1 0",
+        "v 0 1 0 1.0",
+        "vt 0 0",
+        "vt 1 0",
+        "vt 1 1",
+        "vt 0 1",
+        "vn 0 0 1",
+        "f 1/1/1 2/2/1 3/3/1 4/4/1",
+        "  f -4/-4/-1 -2/-2/-1 -1/-1/-1",
+    ])
+    mesh = parse_obj_text(text).meshes[0]
+
+    np.testing.assert_array_equal(
+        mesh.vertices,
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 0], [1, 1, 0], [0, 1, 0]],
+    )
+    np.testing.assert_array_equal(mesh.uvs[:3], [[0, 0], [1, 0], [1, 1]])
+    np.testing.assert_array_equal(mesh.normals, np.tile([0, 0, 1], (9, 1)))
+    assert mesh.indices.tolist() == list(range(9))
+
+    # Normals referenced by only some corners are dropped
+    mixed = parse_obj_text("v 0 0 0\nv 1 0 0\nv 1 1 0\nvn 0 0 1\nf 1//1 2 3//1\n").meshes[0]
+    assert mixed.normals is None
+    assert len(mixed.vertices) == 3
+
+
+def test_obj_streaming_matches_whole_text(tmp_path) -> None:
+    rng = np.random.default_rng(7)
+    lines = [f"v {x:.4f} {y:.4f} {z:.4f}" for x, y, z in rng.random((500, 3))]
+    lines += [f"f {a} {b} {c}" for a, b, c in rng.integers(1, 501, (800, 3))]
+    text = "\n".join(lines) + "\n"
+    path = tmp_path / "cloud.obj"
+    path.write_text(text, encoding="utf-8")
+
+    whole = parse_obj_text(text).meshes[0]
+    chunked = parse_obj_chunks(text[i:i + 37] for i in range(0, len(text), 37)).meshes[0]
+    from_file = load_obj_file(path).meshes[0]
+
+    assert whole.vertices.shape == (2400, 3)
+    np.testing.assert_array_equal(chunked.vertices, whole.vertices)
+    np.testing.assert_array_equal(from_file.vertices, whole.vertices)
@@ -1253,6 +1253,23 @@ namespace termin::runtime {
             return true;
         }
 
+        bool required_size_field(const nos::trent& object,
+                                 const char* field_name,
+                                 size_t& value,
+                                 std::string& error,
+                                 const std::string& context) {
+            const nos::trent* field = dict_get(object, field_name);
+            const double number = field && field->is_numer() ? static_cast<double>(field->as_numer()) : -1.0;
+            if (number < 0.0 || number > static_cast<double>(UINT32_MAX) * 4.0 ||
+                number != static_cast<double>(static_cast<size_t>(number))) {
+                error = context + " field '" + field_name + "' must be a non-negative integer";
+                tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                return false;
+            }
+            value = static_cast<size_t>(number);
+            return true;
+        }
+
         bool load_texture_resource(const RuntimePackageReader& reader,
                                    const nos::trent& entry,
                                    const std::string& spec_path,
@@ -1401,8 +1418,171 @@ namespace termin::runtime {
             return true;
         }
 
-        bool
-        load_mesh_resource(const nos::trent& spec, RuntimePackageResourceKeepalive& keepalive, std::string& error) {
+        // Vertex and index data of a mesh resource, either parsed from inline
+        // JSON lists or viewed in place inside a binary .tmesh.bin payload.
+        struct MeshPayload {
+            RuntimePackageBytes bytes;
+            std::vector<float> vertex_storage;
+            std::vector<uint32_t> index_storage;
+            const void* vertices = nullptr;
+            size_t vertex_count = 0;
+            const uint32_t* indices = nullptr;
+            size_t index_count = 0;
+        };
+
+        bool parse_inline_mesh_payload(const nos::trent& spec,
+                                       size_t floats_per_vertex,
+                                       MeshPayload& payload,
+                                       std::string& error,
+                                       const std::string& uuid) {
+            const nos::trent* vertex_spec = dict_get(spec, "vertices");
+            const nos::trent* index_spec = dict_get(spec, "indices");
+            if (!vertex_spec || !vertex_spec->is_list() || !index_spec || !index_spec->is_list()) {
+                error = "mesh '" + uuid + "' requires layout, vertices and indices";
+                tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                return false;
+            }
+
+            std::vector<float>& vertices = payload.vertex_storage;
+            vertices.reserve(vertex_spec->as_list().size());
+            for (const nos::trent& v : vertex_spec->as_list()) {
+                if (!v.is_numer()) {
+                    error = "mesh '" + uuid + "' has non-numeric vertex data";
+                    tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                    return false;
+                }
+                vertices.push_back(static_cast<float>(v.as_numer()));
+            }
+            if (vertices.size() % floats_per_vertex != 0) {
+                error = "mesh '" + uuid + "' vertex data does not match layout";
+                tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                return false;
+            }
+
+            std::vector<uint32_t>& indices = payload.index_storage;
+            indices.reserve(index_spec->as_list().size());
+            for (const nos::trent& idx : index_spec->as_list()) {
+                if (!idx.is_numer() || idx.as_numer() < 0) {
+                    error = "mesh '" + uuid + "' has invalid index data";
+                    tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                    return false;
+                }
+                indices.push_back(static_cast<uint32_t>(idx.as_numer()));
+            }
+
+            payload.vertices = vertices.data();
+            payload.vertex_count = vertices.size() / floats_per_vertex;
+            payload.indices = indices.data();
+            payload.index_count = indices.size();
+            return true;
+        }
+
+        bool read_binary_mesh_payload(const RuntimePackageReader& reader,
+                                      const nos::trent& spec,
+                                      const nos::trent& data,
+                                      size_t floats_per_vertex,
+                                      MeshPayload& payload,
+                                      std::string& error,
+                                      const std::string& uuid) {
+            const std::string context = "mesh '" + uuid + "' data";
+            std::string data_path;
+            size_t alignment = 0;
+            size_t vertex_count = 0;
+            size_t index_count = 0;
+            size_t stride = 0;
+            if (!required_string_field(data, "path", data_path, error, context) ||
+                !required_size_field(data, "alignment", alignment, error, context) ||
+                !required_size_field(spec, "vertex_count", vertex_count, error, "mesh '" + uuid + "'") ||
+                !required_size_field(spec, "index_count", index_count, error, "mesh '" + uuid + "'") ||
+                !required_size_field(spec, "stride", stride, error, "mesh '" + uuid + "'")) {
+                return false;
+            }
+            if (string_field(data, "byte_order") != "little" || alignment < alignof(uint32_t) ||
+                (alignment & (alignment - 1)) != 0) {
+                error = context + " must be little-endian with a power-of-two alignment";
+                tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                return false;
+            }
+            if (stride != floats_per_vertex * sizeof(float)) {
+                error = "mesh '" + uuid + "' stride does not match layout";
+                tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                return false;
+            }
+
+            if (vertex_count > SIZE_MAX / stride || index_count > SIZE_MAX / sizeof(uint32_t)) {
+                error = context + " is too large";
+                tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                return false;
+            }
+
+            struct Block {
+                const char* name;
+                const char* type;
+                size_t expected_size;
+                size_t offset = 0;
+            };
+            std::array<Block, 2> blocks{{
+                {"vertices", "float32", vertex_count * stride},
+                {"indices", "uint32", index_count * sizeof(uint32_t)},
+            }};
+
+            if (!reader.contains(data_path)) {
+                error = context + " file not found: " + reader.describe(data_path);
+                tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                return false;
+            }
+            payload.bytes = read_binary_file(reader, data_path);
+            for (Block& block : blocks) {
+                const std::string block_context = context + " " + block.name;
+                const nos::trent* block_spec = dict_get(data, block.name);
+                if (!block_spec || string_field(*block_spec, "type") != block.type) {
+                    error = block_context + " must be a " + block.type + " block";
+                    tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                    return false;
+                }
+                size_t size = 0;
+                if (!required_size_field(*block_spec, "offset", block.offset, error, block_context) ||
+                    !required_size_field(*block_spec, "size", size, error, block_context)) {
+                    return false;
+                }
+                if (size != block.expected_size || block.offset % alignment != 0 ||
+                    block.offset > payload.bytes.size || size > payload.bytes.size - block.offset) {
+                    error = block_context + " is out of bounds of " + reader.describe(data_path);
+                    tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                    return false;
+                }
+            }
+
+            // Package readers hand out file-backed memory directly; the blob
+            // container does not pad entries, so the index block may land
+            // unaligned there and is copied once.
+            const uint8_t* base = payload.bytes.data;
+            payload.vertices = base + blocks[0].offset;
+            payload.vertex_count = vertex_count;
+            const uint8_t* index_bytes = base + blocks[1].offset;
+            if (reinterpret_cast<uintptr_t>(index_bytes) % alignof(uint32_t) == 0) {
+                payload.indices = reinterpret_cast<const uint32_t*>(index_bytes);
+            } else {
+                payload.index_storage.resize(index_count);
+                std::memcpy(payload.index_storage.data(), index_bytes, index_count * sizeof(uint32_t));
+                payload.indices = payload.index_storage.data();
+            }
+            payload.index_count = index_count;
+
+            for (size_t i = 0; i < index_count; ++i) {
+                if (payload.indices[i] >= vertex_count) {
+                    error = "mesh '" + uuid + "' has invalid index data";
+                    tc_log_error("RuntimePackageLoader: %s", error.c_str());
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        bool load_mesh_resource(const RuntimePackageReader& reader,
+                                const nos::trent& spec,
+                                RuntimePackageResourceKeepalive& keepalive,
+                                std::string& error) {
             const std::string uuid = string_field(spec, "uuid");
             const std::string name = string_field(spec, "name", uuid);
             if (uuid.empty() || name.empty()) {
@@ -1412,10 +1592,7 @@ namespace termin::runtime {
             }
 
             const nos::trent* layout_spec = dict_get(spec, "layout");
-            const nos::trent* vertex_spec = dict_get(spec, "vertices");
-            const nos::trent* index_spec = dict_get(spec, "indices");
-            if (!layout_spec || !layout_spec->is_list() || !vertex_spec || !vertex_spec->is_list() || !index_spec ||
-                !index_spec->is_list()) {
+            if (!layout_spec || !layout_spec->is_list()) {
                 error = "mesh '" + uuid + "' requires layout, vertices and indices";
                 tc_log_error("RuntimePackageLoader: %s", error.c_str());
                 return false;
@@ -1444,48 +1621,42 @@ namespace termin::runtime {
                 return false;
             }
 
-            std::vector<float> vertices;
-            vertices.reserve(vertex_spec->as_list().size());
-            for (const nos::trent& v : vertex_spec->as_list()) {
-                if (!v.is_numer()) {
-                    error = "mesh '" + uuid + "' has non-numeric vertex data";
+            MeshPayload payload;
+            const nos::trent* data_spec = dict_get(spec, "data");
+            if (data_spec) {
+                if (!data_spec->is_dict()) {
+                    error = "mesh '" + uuid + "' field 'data' must be an object";
                     tc_log_error("RuntimePackageLoader: %s", error.c_str());
                     return false;
                 }
-                vertices.push_back(static_cast<float>(v.as_numer()));
-            }
-            if (vertices.size() % floats_per_vertex != 0) {
-                error = "mesh '" + uuid + "' vertex data does not match layout";
-                tc_log_error("RuntimePackageLoader: %s", error.c_str());
-                return false;
-            }
-
-            std::vector<uint32_t> indices;
-            indices.reserve(index_spec->as_list().size());
-            for (const nos::trent& idx : index_spec->as_list()) {
-                if (!idx.is_numer() || idx.as_numer() < 0) {
-                    error = "mesh '" + uuid + "' has invalid index data";
+                try {
+                    if (!read_binary_mesh_payload(reader, spec, *data_spec, floats_per_vertex, payload, error, uuid)) {
+                        return false;
+                    }
+                } catch (const std::exception& ex) {
+                    error = "failed to read mesh '" + uuid + "' data: " + ex.what();
                     tc_log_error("RuntimePackageLoader: %s", error.c_str());
                     return false;
                 }
-                indices.push_back(static_cast<uint32_t>(idx.as_numer()));
+            } else if (!parse_inline_mesh_payload(spec, floats_per_vertex, payload, error, uuid)) {
+                return false;
             }
-            if (indices.empty()) {
+            if (payload.index_count == 0) {
                 error = "mesh '" + uuid + "' has no indices";
                 tc_log_error("RuntimePackageLoader: %s", error.c_str());
                 return false;
             }
 
-            const size_t vertex_count = vertices.size() / floats_per_vertex;
             tc_draw_mode draw_mode = parse_draw_mode(string_field(spec, "draw_mode", "triangles"));
             std::vector<tc_submesh> submeshes;
-            if (!parse_mesh_submeshes(dict_get(spec, "submeshes"), indices.size(), draw_mode, submeshes, error, uuid)) {
+            if (!parse_mesh_submeshes(
+                    dict_get(spec, "submeshes"), payload.index_count, draw_mode, submeshes, error, uuid)) {
                 return false;
             }
 
             TcMeshCreateInfo create_info;
-            create_info.data =
-                TcMeshInterleavedDataView{vertices.data(), vertex_count, indices.data(), indices.size(), &layout};
+            create_info.data = TcMeshInterleavedDataView{
+                payload.vertices, payload.vertex_count, payload.indices, payload.index_count, &layout};
             if (!submeshes.empty()) {
                 create_info.submeshes = submeshes.data();
                 create_info.submesh_count = submeshes.size();
@@ -1709,7 +1880,7 @@ namespace termin::runtime {
                 return load_texture_resource(reader, entry, spec_path, spec, keepalive, error);
             }
             if (type == "mesh") {
-                return load_mesh_resource(spec, keepalive, error);
+                return load_mesh_resource(reader, spec, keepalive, error);
             }
             if (type == "sprite_asset") {
 #ifdef TERMIN_RUNTIME_RENDER_ONLY
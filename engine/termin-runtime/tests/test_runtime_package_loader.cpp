@@ -5,6 +5,7 @@ GUARD_TEST_MAIN();
 #include <cmath>
 #include <cstdint>
 #include <cstdio>
+#include <cstring>
 #include <filesystem>
 #include <fstream>
 #include <iterator>
@@ -431,6 +432,41 @@ void main() {
         write_text(root / "meshes" / "test.tmesh.json", mesh_spec());
     }
 
+    // Quad as a binary payload: 4 float3 positions, index block at offset 64.
+    std::vector<std::uint8_t> binary_mesh_payload() {
+        const float vertices[] = {0.0f, 0.0f, 0.0f, 1.0f, 0.0f, 0.0f, 1.0f, 1.0f, 0.0f, 0.0f, 1.0f, 0.0f};
+        const std::uint32_t indices[] = {0, 1, 2, 0, 2, 3};
+        std::vector<std::uint8_t> bytes(64 + sizeof(indices), 0);
+        std::memcpy(bytes.data(), vertices, sizeof(vertices));
+        std::memcpy(bytes.data() + 64, indices, sizeof(indices));
+        return bytes;
+    }
+
+    void write_test_package_with_binary_mesh(const std::filesystem::path& root) {
+        write_test_package(root);
+        write_text(root / "meshes" / "test.tmesh.json", R"({
+  "uuid": "runtime-loader-test-mesh",
+  "name": "RuntimeLoaderTestMesh",
+  "draw_mode": "triangles",
+  "layout": [
+    {"name": "position", "type": "float32", "components": 3, "location": 0}
+  ],
+  "submeshes": [],
+  "vertex_count": 4,
+  "index_count": 6,
+  "stride": 12,
+  "data": {
+    "path": "meshes/test.tmesh.bin",
+    "byte_order": "little",
+    "alignment": 64,
+    "vertices": {"type": "float32", "offset": 0, "size": 48},
+    "indices": {"type": "uint32", "offset": 64, "size": 24}
+  }
+}
+)");
+        write_binary(root / "meshes" / "test.tmesh.bin", binary_mesh_payload());
+    }
+
     void write_test_package_with_texture(const std::filesystem::path& root) {
         write_test_package(root);
         write_text(root / "manifest.json", manifest_with_packaged_texture());
@@ -1163,6 +1199,29 @@ TEST_CASE("RuntimePackageLoader keeps package meshes alive after scene entity re
     CHECK(tc_mesh_is_valid(still_loaded));
 }
 
+TEST_CASE("RuntimePackageLoader loads binary mesh payloads") {
+    const std::filesystem::path root = make_package_root();
+    write_test_package_with_binary_mesh(root);
+
+    {
+        termin::runtime::RuntimePackageLoadResult result = termin::runtime::load_runtime_package(root.string());
+        REQUIRE(result.ok);
+        REQUIRE(result.resources != nullptr);
+
+        tc_mesh* mesh = tc_mesh_get(tc_mesh_find_by_name(kMeshName));
+        REQUIRE(mesh != nullptr);
+        CHECK_EQ(mesh->vertex_count, 4u);
+        CHECK_EQ(mesh->index_count, 6u);
+    }
+
+    std::vector<std::uint8_t> truncated = binary_mesh_payload();
+    truncated.resize(truncated.size() - 4);
+    write_binary(root / "meshes" / "test.tmesh.bin", truncated);
+    termin::runtime::RuntimePackageLoadResult truncated_result = termin::runtime::load_runtime_package(root.string());
+    CHECK_FALSE(truncated_result.ok);
+    CHECK(truncated_result.message.find("indices is out of bounds") != std::string::npos);
+}
+
 TEST_CASE("RuntimePackageLoader loads packaged textures before dependent materials") {
     const std::filesystem::path root = make_package_root();
     write_test_package_with_texture(root);
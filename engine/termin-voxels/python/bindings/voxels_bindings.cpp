@@ -375,6 +375,19 @@ NB_MODULE(_voxels_native, m) {
         .def("get", &VoxelGrid::get)
         .def("set", &VoxelGrid::set)
         .def("clear", &VoxelGrid::clear)
+        .def("set_voxels",
+             [](VoxelGrid& grid, nb::ndarray<int, nb::c_contig, nb::device::cpu> coords, uint8_t value) {
+                 if (coords.ndim() != 2 || coords.shape(1) != 3) {
+                     throw std::runtime_error("Expected Nx3 array for voxel coordinates");
+                 }
+                 const int* ptr = coords.data();
+                 size_t n = coords.shape(0);
+                 for (size_t i = 0; i < n; i++) {
+                     grid.set(ptr[i * 3 + 0], ptr[i * 3 + 1], ptr[i * 3 + 2], value);
+                 }
+             },
+             nb::arg("coords"),
+             nb::arg("value"))
 
         .def("get_at_world",
              [](const VoxelGrid& grid, nb::ndarray<double, nb::c_contig, nb::device::cpu> pos) {
@@ -521,6 +534,25 @@ NB_MODULE(_voxels_native, m) {
                  grid.add_surface_normal(vx, vy, vz, Vec3(ptr[0], ptr[1], ptr[2]));
              })
 
+        .def("add_surface_normals",
+             [](VoxelGrid& grid,
+                nb::ndarray<int, nb::c_contig, nb::device::cpu> coords,
+                nb::ndarray<double, nb::c_contig, nb::device::cpu> normals) {
+                 if (coords.ndim() != 2 || coords.shape(1) != 3 || normals.ndim() != 2 || normals.shape(1) != 3 ||
+                     normals.shape(0) != coords.shape(0)) {
+                     throw std::runtime_error("Expected matching Nx3 arrays for voxel coordinates and normals");
+                 }
+                 const int* c = coords.data();
+                 const double* n = normals.data();
+                 size_t count = coords.shape(0);
+                 for (size_t i = 0; i < count; i++) {
+                     grid.add_surface_normal(c[i * 3 + 0], c[i * 3 + 1], c[i * 3 + 2],
+                                             Vec3(n[i * 3 + 0], n[i * 3 + 1], n[i * 3 + 2]));
+                 }
+             },
+             nb::arg("coords"),
+             nb::arg("normals"))
+
         .def("set_surface_normals",
              [](VoxelGrid& grid, int vx, int vy, int vz, nb::list normals) {
                  std::vector<Vec3> vec_normals;
@@ -717,6 +749,27 @@ NB_MODULE(_voxels_native, m) {
         nb::arg("source_path"),
         nb::arg("payload"));
 
+    m.def(
+        "clear_voxel_grid_asset_data",
+        [](const std::string& uuid) {
+            tc_voxel_grid_handle h = tc_voxel_grid_find(uuid.c_str());
+            if (tc_voxel_grid_handle_is_invalid(h)) {
+                return false;
+            }
+            return tc_voxel_grid_clear_payload(h);
+        },
+        nb::arg("uuid"),
+        "Free the registry copy of a voxel grid, keeping the declaration for lazy reload");
+
+    m.def(
+        "voxel_grid_asset_ref_count",
+        [](const std::string& uuid) -> uint32_t {
+            tc_voxel_grid* grid = tc_voxel_grid_get(tc_voxel_grid_find(uuid.c_str()));
+            return grid ? grid->ref_count : 0;
+        },
+        nb::arg("uuid"),
+        "Number of live TcVoxelGrid handles to the registry entry");
+
     m.attr("VoxelGridHandle") = m.attr("TcVoxelGrid");
 
     m.def("register_voxel_grid_kind_handlers",
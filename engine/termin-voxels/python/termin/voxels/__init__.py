@@ -132,6 +132,10 @@ def __getattr__(name: str):
         from termin.voxels.voxel_mesh import create_voxel_mesh
         return create_voxel_mesh
 
+    if name == "VoxelChunkMeshCache":
+        from termin.voxels.chunk_mesh import VoxelChunkMeshCache
+        return VoxelChunkMeshCache
+
     raise AttributeError(f"module 'termin.voxels' has no attribute {name!r}")
 
 __all__ = [
@@ -150,6 +154,7 @@ __all__ = [
     "VoxelizeSource",
     "VoxelDisplayComponent",
     "create_voxel_mesh",
+    "VoxelChunkMeshCache",
     "CHUNK_SIZE",
     "VOXEL_EMPTY",
     "VOXEL_SOLID",
@@ -0,0 +1,381 @@
+"""
+Меши отображения воксельной сетки по чанкам.
+
+Каждый чанк строится отдельно: грани между заполненными вокселями
+отбрасываются (в том числе на границе с соседним чанком), а соседние
+видимые грани с одинаковыми атрибутами сливаются в прямоугольники
+(greedy meshing). VoxelChunkMeshCache перестраивает только чанки, чьё
+содержимое или граничащие с ними соседи изменились, и переиспользует
+TcMesh остальных.
+
+Атрибуты вершин совпадают с прежним кубическим отображением:
+uv.x — тип вокселя, цвет — первая нормаль поверхности в [0, 1]
+(белый, если нормалей нет).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable
+
+import numpy as np
+
+from termin.voxels.chunk import CHUNK_SIZE
+
+
+ChunkKey = tuple[int, int, int]
+
+# Соседи по граням: (ось, направление)
+_FACE_DIRECTIONS = tuple((axis, sign) for axis in range(3) for sign in (1, -1))
+
+
+def _greedy_rectangles(mask: np.ndarray) -> list[tuple[int, int, int, int, int]]:
+    """
+    Разбить 2D маску атрибутов на прямоугольники одного значения.
+
+    Args:
+        mask: (U, V) int массив, 0 — нет грани.
+
+    Returns:
+        Список (u, v, du, dv, значение).
+    """
+    mask = mask.copy()
+    size_u, size_v = mask.shape
+    rects = []
+    for u, v in zip(*np.nonzero(mask), strict=True):
+        value = mask[u, v]
+        if value == 0:
+            continue  # уже поглощено предыдущим прямоугольником
+        row = mask[u, v:] != value
+        dv = int(np.argmax(row)) if row.any() else size_v - v
+        du = 1
+        while u + du < size_u and np.all(mask[u + du, v:v + dv] == value):
+            du += 1
+        mask[u:u + du, v:v + dv] = 0
+        rects.append((int(u), int(v), du, dv, int(value)))
+    return rects
+
+
+def greedy_chunk_quads(attributes: np.ndarray, occupied: np.ndarray) -> np.ndarray:
+    """
+    Видимые грани чанка, слитые в прямоугольники.
+
+    Args:
+        attributes: (S, S, S) int массив [x, y, z] атрибутов вокселей чанка,
+            0 — пусто. Слиты могут быть только грани с равными атрибутами.
+        occupied: (S+2, S+2, S+2) bool массив заполненности с рамкой в один
+            воксель из соседних чанков (используются только грани рамки).
+
+    Returns:
+        (Q, 8) int32: ось, направление (±1), слой, u, v, du, dv, атрибут.
+        u и v — две оставшиеся оси в порядке возрастания.
+    """
+    size = attributes.shape[0]
+    inner = occupied[1:-1, 1:-1, 1:-1]
+    quads = []
+    for axis, sign in _FACE_DIRECTIONS:
+        neighbor_slices = [slice(1, -1)] * 3
+        neighbor_slices[axis] = slice(1 + sign, size + 1 + sign)
+        visible = inner & ~occupied[tuple(neighbor_slices)]
+        faces = np.where(visible, attributes, 0)
+        for layer in np.flatnonzero(faces.any(axis=tuple(a for a in range(3) if a != axis))):
+            for u, v, du, dv, value in _greedy_rectangles(np.take(faces, layer, axis=axis)):
+                quads.append((axis, sign, layer, u, v, du, dv, value))
+    if not quads:
+        return np.zeros((0, 8), dtype=np.int32)
+    return np.array(quads, dtype=np.int32)
+
+
+def quads_to_mesh_arrays(
+    quads: np.ndarray,
+    voxel_offset: Iterable[int],
+    origin: np.ndarray,
+    cell_size: float,
+    attribute_types: np.ndarray,
+    attribute_colors: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Вершины прямоугольников greedy_chunk_quads в мировых координатах.
+
+    Args:
+        quads: Результат greedy_chunk_quads.
+        voxel_offset: Координаты вокселя (0, 0, 0) чанка.
+        origin: Origin сетки.
+        cell_size: Размер ячейки.
+        attribute_types: Тип вокселя по индексу атрибута.
+        attribute_colors: (A, 3) цвет по индексу атрибута.
+
+    Returns:
+        (vertices, triangles, normals, uvs, colors); по 4 вершины на
+        прямоугольник, обход против часовой стрелки снаружи.
+    """
+    count = len(quads)
+    axis = quads[:, 0]
+    sign = quads[:, 1]
+    u_axis = np.where(axis == 0, 1, 0)
+    v_axis = np.where(axis == 2, 1, 2)
+    rows = np.arange(count)
+
+    # Углы в порядке (u0,v0), (u1,v0), (u1,v1), (u0,v1)
+    corners = np.zeros((count, 4, 3), dtype=np.float64)
+    corners[rows, :, axis] = (quads[:, 2] + (sign > 0))[:, None]
+    u0 = quads[:, 3].astype(np.float64)
+    v0 = quads[:, 4].astype(np.float64)
+    u1 = u0 + quads[:, 5]
+    v1 = v0 + quads[:, 6]
+    corners[rows, :, u_axis] = np.stack((u0, u1, u1, u0), axis=1)
+    corners[rows, :, v_axis] = np.stack((v0, v0, v1, v1), axis=1)
+
+    # (u, v, ось) правая тройка для осей X и Z, левая для Y
+    reverse = (sign > 0) != (axis != 1)
+    corners[reverse] = corners[reverse][:, ::-1]
+
+    offset = np.asarray(tuple(voxel_offset), dtype=np.float64)
+    vertices = (np.asarray(origin, dtype=np.float64) + (corners.reshape(-1, 3) + offset) * cell_size).astype(np.float32)
+
+    face_normals = np.zeros((count, 3), dtype=np.float32)
+    face_normals[rows, axis] = sign
+    normals = np.repeat(face_normals, 4, axis=0)
+
+    attribute = quads[:, 7]
+    uvs = np.zeros((count * 4, 2), dtype=np.float32)
+    uvs[:, 0] = np.repeat(attribute_types[attribute], 4)
+    colors = np.repeat(attribute_colors[attribute], 4, axis=0).astype(np.float32)
+
+    base = (rows * 4)[:, None]
+    triangles = np.concatenate((base + [0, 1, 2], base + [0, 2, 3])).astype(np.int32)
+    return vertices, triangles, normals, uvs, colors
+
+
+def _chunk_volume(chunk) -> np.ndarray:
+    """Данные чанка как [x, y, z] (в памяти индекс x + y*S + z*S²)."""
+    return np.asarray(chunk.data, dtype=np.uint8).reshape(CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE).transpose(2, 1, 0)
+
+
+def voxel_world_bounds(
+    grid,
+    volumes: dict[ChunkKey, np.ndarray] | None = None,
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Мировые границы занятых вокселей (по граням ячеек), без округления до чанков.
+
+    Args:
+        grid: VoxelGrid (origin, cell_size и чанки, если volumes не заданы).
+        volumes: Данные [x, y, z] чанков по ключу, как в VoxelChunkMeshCache.
+
+    Returns:
+        (min, max) float32 или None, если заполненных вокселей нет.
+    """
+    if volumes is None:
+        volumes = {tuple(key): _chunk_volume(chunk) for key, chunk in grid.iter_chunks()}
+    low = None
+    high = None
+    for key, volume in volumes.items():
+        occupied = volume != 0
+        extents = []
+        for axis in range(3):
+            other = tuple(a for a in range(3) if a != axis)
+            filled = np.flatnonzero(occupied.any(axis=other))
+            if len(filled) == 0:
+                break
+            extents.append((filled[0], filled[-1]))
+        if len(extents) < 3:
+            continue
+        base = np.asarray(key, dtype=np.int64) * CHUNK_SIZE
+        chunk_low = base + [first for first, _last in extents]
+        chunk_high = base + [last for _first, last in extents]
+        low = chunk_low if low is None else np.minimum(low, chunk_low)
+        high = chunk_high if high is None else np.maximum(high, chunk_high)
+    if low is None:
+        return None
+    origin = np.asarray(grid.origin, dtype=np.float64)
+    return (
+        (origin + low * grid.cell_size).astype(np.float32),
+        (origin + (high + 1) * grid.cell_size).astype(np.float32),
+    )
+
+
+def _group_surface_normals(surface_normals: dict) -> dict[ChunkKey, list[tuple[int, int, int, np.ndarray]]]:
+    """Первая нормаль каждого поверхностного вокселя, по чанкам."""
+    grouped: dict[ChunkKey, list[tuple[int, int, int, np.ndarray]]] = {}
+    for (vx, vy, vz), normals_list in surface_normals.items():
+        if len(normals_list) == 0:
+            continue
+        key = (vx // CHUNK_SIZE, vy // CHUNK_SIZE, vz // CHUNK_SIZE)
+        grouped.setdefault(key, []).append(
+            (vx % CHUNK_SIZE, vy % CHUNK_SIZE, vz % CHUNK_SIZE, np.asarray(normals_list[0], dtype=np.float64))
+        )
+    return grouped
+
+
+def _chunk_attributes(
+    volume: np.ndarray,
+    normals: list[tuple[int, int, int, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Атрибуты вокселей чанка: пары (тип, цвет) пронумерованы с 1.
+
+    Returns:
+        (attributes [x, y, z], типы по атрибуту, цвета по атрибуту).
+    """
+    colors = np.ones(volume.shape + (3,), dtype=np.float64)
+    for lx, ly, lz, normal in normals:
+        colors[lx, ly, lz] = (normal + 1.0) * 0.5
+
+    occupied = volume != 0
+    rows = np.concatenate((volume[occupied][:, None].astype(np.float64), colors[occupied]), axis=1)
+    unique_rows, inverse = np.unique(rows, axis=0, return_inverse=True)
+
+    attributes = np.zeros(volume.shape, dtype=np.int32)
+    attributes[occupied] = inverse.reshape(-1) + 1
+    attribute_types = np.concatenate(([0.0], unique_rows[:, 0]))
+    attribute_colors = np.concatenate((np.ones((1, 3)), unique_rows[:, 1:]))
+    return attributes, attribute_types, attribute_colors
+
+
+def _padded_occupancy(key: ChunkKey, volumes: dict[ChunkKey, np.ndarray]) -> np.ndarray:
+    """Заполненность чанка с рамкой из граничных слоёв соседей."""
+    occupied = np.zeros((CHUNK_SIZE + 2,) * 3, dtype=bool)
+    occupied[1:-1, 1:-1, 1:-1] = volumes[key] != 0
+    for axis, sign in _FACE_DIRECTIONS:
+        neighbor_key = list(key)
+        neighbor_key[axis] += sign
+        neighbor = volumes.get(tuple(neighbor_key))
+        if neighbor is None:
+            continue
+        border = [slice(1, -1)] * 3
+        border[axis] = CHUNK_SIZE + 1 if sign > 0 else 0
+        occupied[tuple(border)] = np.take(neighbor, 0 if sign > 0 else CHUNK_SIZE - 1, axis=axis) != 0
+    return occupied
+
+
+def build_chunk_mesh_arrays(
+    grid,
+    key: ChunkKey,
+    volumes: dict[ChunkKey, np.ndarray],
+    normals: list[tuple[int, int, int, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """
+    Массивы меша одного чанка или None, если видимых граней нет.
+
+    Args:
+        grid: VoxelGrid (используются origin и cell_size).
+        key: Координаты чанка.
+        volumes: Данные [x, y, z] всех чанков сетки по ключу.
+        normals: Первые нормали вокселей чанка (локальные координаты).
+    """
+    attributes, attribute_types, attribute_colors = _chunk_attributes(volumes[key], normals)
+    quads = greedy_chunk_quads(attributes, _padded_occupancy(key, volumes))
+    if len(quads) == 0:
+        return None
+    return quads_to_mesh_arrays(
+        quads,
+        (key[0] * CHUNK_SIZE, key[1] * CHUNK_SIZE, key[2] * CHUNK_SIZE),
+        np.asarray(grid.origin, dtype=np.float64),
+        grid.cell_size,
+        attribute_types,
+        attribute_colors,
+    )
+
+
+class VoxelChunkMeshCache:
+    """
+    Меши отображения воксельной сетки, по одному на чанк.
+
+    update() сравнивает подпись каждого чанка (его данные, нормали и
+    данные шести соседей, а также origin и cell_size) с прошлой сборкой
+    и перестраивает только изменившиеся чанки.
+    """
+
+    def __init__(self, name: str = "voxel_display_mesh") -> None:
+        self._name = name
+        self._entries: dict[ChunkKey, tuple[bytes, object]] = {}
+        # Мировые границы занятых вокселей последней сборки (min, max)
+        self.bounds: tuple[np.ndarray, np.ndarray] | None = None
+        self.rebuilt_chunk_count: int = 0
+        self.reused_chunk_count: int = 0
+
+    @property
+    def meshes(self) -> list:
+        """TcMesh непустых чанков."""
+        return [mesh for _signature, mesh in self._entries.values() if mesh is not None]
+
+    @property
+    def quad_count(self) -> int:
+        return sum(mesh.vertex_count // 4 for mesh in self.meshes)
+
+    def clear(self) -> None:
+        self._entries = {}
+        self.bounds = None
+
+    def update(self, grid, uuid_prefix: str = "") -> None:
+        """
+        Привести меши к текущему состоянию сетки.
+
+        Args:
+            grid: VoxelGrid.
+            uuid_prefix: Префикс детерминированных UUID мешей. Если задан,
+                меш с той же подписью берётся из реестра TcMesh, даже если
+                его построил другой компонент.
+        """
+        from tmesh import TcMesh
+        from termin.voxels.voxel_mesh import create_voxel_mesh
+
+        volumes = {tuple(key): _chunk_volume(chunk) for key, chunk in grid.iter_chunks()}
+        self.bounds = voxel_world_bounds(grid, volumes)
+        normals_by_chunk = _group_surface_normals(grid.surface_normals)
+        layout = np.asarray(grid.origin, dtype=np.float64).tobytes() + np.float64(grid.cell_size).tobytes()
+
+        digests: dict[ChunkKey, bytes] = {}
+        for key, volume in volumes.items():
+            digest = hashlib.blake2b(volume.tobytes(), digest_size=16)
+            for lx, ly, lz, normal in normals_by_chunk.get(key, ()):
+                digest.update(np.array((lx, ly, lz), dtype=np.int32).tobytes())
+                digest.update(normal.tobytes())
+            digests[key] = digest.digest()
+
+        self.rebuilt_chunk_count = 0
+        self.reused_chunk_count = 0
+        entries: dict[ChunkKey, tuple[bytes, object]] = {}
+        for key, own_digest in digests.items():
+            signature = hashlib.blake2b(layout + own_digest, digest_size=16)
+            for axis, sign in _FACE_DIRECTIONS:
+                neighbor_key = list(key)
+                neighbor_key[axis] += sign
+                signature.update(digests.get(tuple(neighbor_key), b"\0" * 16))
+            signature = signature.digest()
+
+            previous = self._entries.get(key)
+            if previous is not None and previous[0] == signature and (previous[1] is None or previous[1].is_valid):
+                entries[key] = previous
+                self.reused_chunk_count += 1
+                continue
+
+            mesh_uuid = ""
+            if uuid_prefix:
+                mesh_uuid = hashlib.sha256(
+                    f"{uuid_prefix}:{key[0]},{key[1]},{key[2]}:{signature.hex()}".encode()
+                ).hexdigest()[:32]
+                cached = TcMesh.from_uuid(mesh_uuid)
+                if cached is not None and cached.is_valid:
+                    entries[key] = (signature, cached)
+                    self.reused_chunk_count += 1
+                    continue
+
+            arrays = build_chunk_mesh_arrays(grid, key, volumes, normals_by_chunk.get(key, []))
+            mesh = None
+            if arrays is not None:
+                vertices, triangles, normals, uvs, colors = arrays
+                mesh = create_voxel_mesh(
+                    vertices=vertices,
+                    triangles=triangles,
+                    uvs=uvs,
+                    vertex_colors=colors,
+                    vertex_normals=normals,
+                    name=f"{self._name}:{key[0]},{key[1]},{key[2]}",
+                    uuid=mesh_uuid,
+                )
+            entries[key] = (signature, mesh)
+            self.rebuilt_chunk_count += 1
+
+        self._entries = entries
@@ -141,6 +141,66 @@ def _axis_test_z(edge: np.ndarray, va: np.ndarray, vb: np.ndarray, hx: float, hy
     return not (min(p0, p1) > r + _EPSILON or max(p0, p1) < -r - _EPSILON)
 
 
+def triangles_aabb_intersect(
+    v0: np.ndarray,
+    v1: np.ndarray,
+    v2: np.ndarray,
+    box_centers: np.ndarray,
+    box_half_size: np.ndarray,
+) -> np.ndarray:
+    """
+    Пакетный тест пересечения треугольников и AABB одного размера.
+
+    Тот же SAT-тест, что и triangle_aabb_intersect, для массива пар
+    (треугольник, AABB): i-й треугольник проверяется с i-м AABB.
+
+    Args:
+        v0, v1, v2: Вершины треугольников, массивы (N, 3).
+        box_centers: Центры AABB, массив (N, 3).
+        box_half_size: Половина размера AABB по каждой оси (общая для всех).
+
+    Returns:
+        Булев массив (N,): True для пересекающихся пар.
+    """
+    box_centers = np.asarray(box_centers, dtype=np.float64)
+    a = np.asarray(v0, dtype=np.float64) - box_centers
+    b = np.asarray(v1, dtype=np.float64) - box_centers
+    c = np.asarray(v2, dtype=np.float64) - box_centers
+    h = np.asarray(box_half_size, dtype=np.float64)
+
+    # --- Тест 1: оси AABB ---
+    tri_min = np.minimum(np.minimum(a, b), c)
+    tri_max = np.maximum(np.maximum(a, b), c)
+    hit = np.all((tri_min <= h + _EPSILON) & (tri_max >= -h - _EPSILON), axis=1)
+
+    e0 = b - a
+    e1 = c - b
+    e2 = a - c
+
+    # --- Тест 2: нормаль треугольника ---
+    normal = np.cross(e0, e1)
+    d = -np.einsum("ij,ij->i", normal, a)
+    r = np.abs(normal) @ h
+    hit &= (d <= r + _EPSILON) & (d >= -r - _EPSILON)
+
+    # --- Тест 3: 9 осей cross(edge_i, axis_j), вершины как в скалярной версии ---
+    hx, hy, hz = h
+    for edge, va, vb in ((e0, a, c), (e1, b, a), (e2, c, b)):
+        ex, ey, ez = edge[:, 0], edge[:, 1], edge[:, 2]
+        abs_x, abs_y, abs_z = np.abs(ex), np.abs(ey), np.abs(ez)
+        for p0, p1, radius in (
+            # edge × X = (0, -edge.z, edge.y)
+            (-ez * va[:, 1] + ey * va[:, 2], -ez * vb[:, 1] + ey * vb[:, 2], hy * abs_z + hz * abs_y),
+            # edge × Y = (edge.z, 0, -edge.x)
+            (ez * va[:, 0] - ex * va[:, 2], ez * vb[:, 0] - ex * vb[:, 2], hx * abs_z + hz * abs_x),
+            # edge × Z = (-edge.y, edge.x, 0)
+            (-ey * va[:, 0] + ex * va[:, 1], -ey * vb[:, 0] + ex * vb[:, 1], hx * abs_y + hy * abs_x),
+        ):
+            hit &= (np.minimum(p0, p1) <= radius + _EPSILON) & (np.maximum(p0, p1) >= -radius - _EPSILON)
+
+    return hit
+
+
 def triangle_aabb(
     v0: np.ndarray,
     v1: np.ndarray,
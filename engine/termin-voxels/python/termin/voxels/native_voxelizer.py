@@ -116,7 +116,10 @@ def voxelize_mesh_native(
 
 def benchmark_voxelization(mesh: "Mesh3", cell_size: float = 0.25, iterations: int = 3):
     """
-    Benchmark native vs Python voxelization.
+    Benchmark per-triangle Python, batched Python and native voxelization.
+
+    All three paths voxelize the same mesh into grids with the same origin
+    and cell size; the voxel count of each path is printed next to its time.
 
     Args:
         mesh: Mesh to voxelize.
@@ -125,7 +128,7 @@ def benchmark_voxelization(mesh: "Mesh3", cell_size: float = 0.25, iterations: i
     """
     import time
     from termin.voxels.grid import VoxelGrid
-    from termin.voxels.voxelizer import MeshVoxelizer
+    from termin.voxels.voxelizer import VOXEL_SOLID, MeshVoxelizer
 
     vertices = mesh.vertices
     triangles = mesh.triangles
@@ -139,22 +142,33 @@ def benchmark_voxelization(mesh: "Mesh3", cell_size: float = 0.25, iterations: i
     print(f"Iterations: {iterations}")
     print()
 
-    # Python benchmark
-    print("Python voxelization:")
-    py_times = []
-    py_voxel_count = 0
-    for i in range(iterations):
-        grid = VoxelGrid(origin=(0, 0, 0), cell_size=cell_size)
+    def per_triangle(grid: "VoxelGrid") -> None:
         voxelizer = MeshVoxelizer(grid)
-        start = time.perf_counter()
-        voxelizer.voxelize_mesh(mesh, transform_matrix=None)
-        elapsed = time.perf_counter() - start
-        py_times.append(elapsed)
-        py_voxel_count = grid.voxel_count
-        print(f"  Run {i+1}: {elapsed:.4f}s ({py_voxel_count} voxels)")
-    py_avg = sum(py_times) / len(py_times)
-    print(f"  Average: {py_avg:.4f}s")
-    print()
+        for tri in triangles:
+            voxelizer._voxelize_triangle(
+                vertices[tri[0]], vertices[tri[1]], vertices[tri[2]], VOXEL_SOLID
+            )
+
+    def batched(grid: "VoxelGrid") -> None:
+        MeshVoxelizer(grid).voxelize_mesh(mesh, transform_matrix=None)
+
+    averages = {}
+    for label, voxelize in (
+        ("Python per-triangle", per_triangle),
+        ("Python batched", batched),
+    ):
+        print(f"{label} voxelization:")
+        times = []
+        for i in range(iterations):
+            grid = VoxelGrid(origin=(0, 0, 0), cell_size=cell_size)
+            start = time.perf_counter()
+            voxelize(grid)
+            elapsed = time.perf_counter() - start
+            times.append(elapsed)
+            print(f"  Run {i+1}: {elapsed:.4f}s ({grid.voxel_count} voxels)")
+        averages[label] = sum(times) / len(times)
+        print(f"  Average: {averages[label]:.4f}s")
+        print()
 
     # Native benchmark
     if HAS_NATIVE:
@@ -172,13 +186,16 @@ def benchmark_voxelization(mesh: "Mesh3", cell_size: float = 0.25, iterations: i
             native_grid.voxelize_mesh(vertices_f64, triangles_i32)
             elapsed = time.perf_counter() - start
             native_times.append(elapsed)
-            native_voxel_count = native_grid.voxel_count()
+            native_voxel_count = native_grid.voxel_count
             print(f"  Run {i+1}: {elapsed:.4f}s ({native_voxel_count} voxels)")
-        native_avg = sum(native_times) / len(native_times)
-        print(f"  Average: {native_avg:.4f}s")
+        averages["Native"] = sum(native_times) / len(native_times)
+        print(f"  Average: {averages['Native']:.4f}s")
         print()
-
-        speedup = py_avg / native_avg if native_avg > 0 else float('inf')
-        print(f"Speedup: {speedup:.1f}x")
     else:
         print("Native module not available")
+        print()
+
+    baseline = averages["Python per-triangle"]
+    for label, average in averages.items():
+        speedup = baseline / average if average > 0 else float('inf')
+        print(f"{label}: {speedup:.1f}x vs per-triangle")
@@ -1,25 +1,301 @@
 """
 Сохранение и загрузка воксельных сеток.
+
+Формат .voxels v2 — бинарный контейнер (little-endian):
+
+    заголовок   _HEADER: магия, версия, размер чанка, cell_size,
+                число чанков и вокселей, смещения каталога и нормалей
+    имя         UTF-8, name_size байт
+    каталог     chunk_count записей _DIRECTORY_DTYPE, отсортированных по
+                координатам: (cx, cy, cz, offset, compressed_size, count)
+    чанки       независимо сжатые zlib блоки по CHUNK_VOLUME байт,
+                индекс вокселя x + y * CHUNK_SIZE + z * CHUNK_SIZE²
+    нормали     один zlib блок: int32 координаты (N, 3), uint32 число
+                нормалей на воксель (N,), float64 нормали (M, 3)
+
+Каталог читается без чанков, так что get_info() и VoxelFile открываются
+сразу, а чанки распаковываются только при обращении. Формат v1 (JSON с
+gzip+base64 чанками) по-прежнему читается.
 """
 
 from __future__ import annotations
 
 import json
+import mmap
+import struct
+import zlib
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Union
+
+import numpy as np
 
+from termin.voxels.chunk import CHUNK_SIZE, CHUNK_VOLUME
 from termin.voxels.grid import VoxelGrid
 
 
 VOXEL_FILE_EXTENSION = ".voxels"
-VOXEL_FORMAT_VERSION = "1.2"  # 1.2: surface_normals as list of normals (not averaged)
+VOXEL_FORMAT_VERSION = "1.2"  # JSON v1; 1.2: surface_normals as list of normals (not averaged)
+VOXEL_BINARY_FORMAT_VERSION = 2
+
+VOXEL_BINARY_MAGIC = b"TVOXELS\0"
+
+# magic, version, chunk_size, cell_size, chunk_count, voxel_count,
+# directory_offset, normals_offset, normals_size, name_size
+_HEADER = struct.Struct("<8sIIdQQQQQI")
+_DIRECTORY_DTYPE = np.dtype([
+    ("cx", "<i4"),
+    ("cy", "<i4"),
+    ("cz", "<i4"),
+    ("offset", "<u8"),
+    ("compressed_size", "<u4"),
+    ("count", "<u4"),
+])
+_CHUNK_CACHE_SIZE = 64
+
+
+class VoxelFile:
+    """
+    Ленивый доступ к файлу .voxels v2.
+
+    Файл отображается в память через mmap; заголовок и каталог читаются
+    при открытии, чанки распаковываются по запросу. Последние
+    распакованные чанки кэшируются для запросов get().
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, *, content: bytes | None = None) -> None:
+        """
+        Args:
+            path: Путь к файлу .voxels v2.
+            content: Содержимое файла вместо пути (уже прочитанные байты).
+
+        Raises:
+            ValueError: Если содержимое не является файлом .voxels v2.
+        """
+        self._file = None
+        self._mmap = None
+        if content is None:
+            self._file = open(Path(path), "rb")
+            try:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Пустой файл нельзя отобразить
+                self._file.close()
+                raise ValueError(f"Voxel file is empty: {path}") from None
+            # Без локальных ссылок на буфер: иначе close() не закроет mmap
+            self._buffer = memoryview(self._mmap)
+        else:
+            self._buffer = memoryview(content)
+
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+        self._index: dict[tuple[int, int, int], int] | None = None
+        self._chunk_cache: dict[int, np.ndarray] = {}
+
+    def _read_header(self) -> None:
+        # Кадр с исключением живёт до close(), поэтому буфер не держим в
+        # локальных переменных
+        size = len(self._buffer)
+        if size < _HEADER.size or bytes(self._buffer[:8]) != VOXEL_BINARY_MAGIC:
+            raise ValueError("Not a binary voxel file")
+        (
+            _magic,
+            version,
+            chunk_size,
+            self.cell_size,
+            self.chunk_count,
+            self.voxel_count,
+            directory_offset,
+            self._normals_offset,
+            self._normals_size,
+            name_size,
+        ) = _HEADER.unpack_from(self._buffer)
+        if version != VOXEL_BINARY_FORMAT_VERSION:
+            raise ValueError(f"Unsupported voxel format version: {version}")
+        if chunk_size != CHUNK_SIZE:
+            raise ValueError(f"Voxel file chunk size {chunk_size} does not match CHUNK_SIZE {CHUNK_SIZE}")
+
+        name_end = _HEADER.size + name_size
+        directory_end = directory_offset + self.chunk_count * _DIRECTORY_DTYPE.itemsize
+        if name_end > size or directory_end > size:
+            raise ValueError("Voxel file is truncated")
+        if self._normals_offset + self._normals_size > size:
+            raise ValueError("Voxel file is truncated")
+        self.name = bytes(self._buffer[_HEADER.size:name_end]).decode("utf-8")
+        # Копия: каталог остаётся доступным и не держит mmap после close()
+        self.directory = np.frombuffer(
+            self._buffer, dtype=_DIRECTORY_DTYPE, count=self.chunk_count, offset=directory_offset
+        ).copy()
+        blob_ends = self.directory["offset"] + self.directory["compressed_size"]
+        if len(blob_ends) and int(blob_ends.max()) > size:
+            raise ValueError("Voxel file is truncated")
+
+    def __enter__(self) -> VoxelFile:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрыть файл. Массивы из read_chunk() и directory остаются валидными."""
+        self._chunk_cache = {}
+        self._buffer = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def chunk_keys(self) -> Iterator[tuple[int, int, int]]:
+        """Координаты чанков в порядке каталога."""
+        for cx, cy, cz in zip(
+            self.directory["cx"].tolist(),
+            self.directory["cy"].tolist(),
+            self.directory["cz"].tolist(),
+            strict=True,
+        ):
+            yield cx, cy, cz
+
+    def has_chunk(self, cx: int, cy: int, cz: int) -> bool:
+        return self._chunk_index(cx, cy, cz) is not None
+
+    def read_chunk(self, cx: int, cy: int, cz: int) -> np.ndarray | None:
+        """
+        Распаковать чанк.
+
+        Returns:
+            uint8 массив (CHUNK_VOLUME,) с индексом x + y*16 + z*256,
+            или None если чанка нет в файле.
+        """
+        index = self._chunk_index(cx, cy, cz)
+        if index is None:
+            return None
+        return self._read_chunk_at(index)
+
+    def get(self, vx: int, vy: int, vz: int) -> int:
+        """Тип вокселя; распаковывает только содержащий его чанк."""
+        cx, lx = divmod(vx, CHUNK_SIZE)
+        cy, ly = divmod(vy, CHUNK_SIZE)
+        cz, lz = divmod(vz, CHUNK_SIZE)
+        index = self._chunk_index(cx, cy, cz)
+        if index is None:
+            return 0
+        data = self._chunk_cache.get(index)
+        if data is None:
+            data = self._read_chunk_at(index)
+            if len(self._chunk_cache) >= _CHUNK_CACHE_SIZE:
+                self._chunk_cache.pop(next(iter(self._chunk_cache)))
+            self._chunk_cache[index] = data
+        return int(data[lx + ly * CHUNK_SIZE + lz * CHUNK_SIZE * CHUNK_SIZE])
+
+    def bounds(self) -> tuple[list[int], list[int]] | None:
+        """Границы в вокселях по чанкам каталога (min, max включительно)."""
+        if self.chunk_count == 0:
+            return None
+        coords = np.stack((self.directory["cx"], self.directory["cy"], self.directory["cz"]), axis=1)
+        bounds_min = (coords.min(axis=0) * CHUNK_SIZE).tolist()
+        bounds_max = ((coords.max(axis=0) + 1) * CHUNK_SIZE - 1).tolist()
+        return bounds_min, bounds_max
+
+    def read_surface_normals(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Нормали поверхностных вокселей.
+
+        Returns:
+            (координаты (N, 3) int32, число нормалей (N,) uint32,
+            нормали (M, 3) float64) — нормали идут подряд по вокселям.
+        """
+        if self._normals_size == 0:
+            return (
+                np.zeros((0, 3), dtype=np.int32),
+                np.zeros(0, dtype=np.uint32),
+                np.zeros((0, 3), dtype=np.float64),
+            )
+        raw = zlib.decompress(self._buffer[self._normals_offset:self._normals_offset + self._normals_size])
+        (voxel_count,) = struct.unpack_from("<Q", raw)
+        offset = 8
+        coords = np.frombuffer(raw, dtype="<i4", count=voxel_count * 3, offset=offset).reshape(-1, 3)
+        offset += coords.nbytes
+        counts = np.frombuffer(raw, dtype="<u4", count=voxel_count, offset=offset)
+        offset += counts.nbytes
+        normals = np.frombuffer(raw, dtype="<f8", count=int(counts.sum()) * 3, offset=offset).reshape(-1, 3)
+        return coords, counts, normals
+
+    def load_grid(self, chunks: Iterator[tuple[int, int, int]] | None = None) -> VoxelGrid:
+        """
+        Собрать VoxelGrid из файла.
+
+        Args:
+            chunks: Координаты чанков для загрузки; None — все чанки.
+                Нормали загружаются только для вокселей этих чанков.
+        """
+        grid = VoxelGrid(origin=(0, 0, 0), cell_size=self.cell_size, name=self.name)
+
+        if chunks is None:
+            indices = range(self.chunk_count)
+        else:
+            indices = [index for index in (self._chunk_index(*key) for key in chunks) if index is not None]
+
+        local = np.arange(CHUNK_VOLUME)
+        local_coords = np.stack(
+            (local % CHUNK_SIZE, (local // CHUNK_SIZE) % CHUNK_SIZE, local // (CHUNK_SIZE * CHUNK_SIZE)),
+            axis=1,
+        ).astype(np.int32)
+        coords_parts = []
+        values_parts = []
+        loaded_chunks = []
+        for index in indices:
+            entry = self.directory[index]
+            data = self._read_chunk_at(index)
+            occupied = np.flatnonzero(data)
+            chunk_origin = np.array([entry["cx"], entry["cy"], entry["cz"]], dtype=np.int32) * CHUNK_SIZE
+            coords_parts.append(local_coords[occupied] + chunk_origin)
+            values_parts.append(data[occupied])
+            loaded_chunks.append((int(entry["cx"]), int(entry["cy"]), int(entry["cz"])))
+
+        if coords_parts:
+            coords = np.concatenate(coords_parts)
+            values = np.concatenate(values_parts)
+            for value in np.unique(values).tolist():
+                grid.set_voxels(np.ascontiguousarray(coords[values == value]), value)
+
+        normal_coords, normal_counts, normals = self.read_surface_normals()
+        if len(normal_coords):
+            per_normal_coords = np.repeat(normal_coords, normal_counts, axis=0)
+            if chunks is not None:
+                wanted = set(loaded_chunks)
+                chunk_coords = per_normal_coords // CHUNK_SIZE
+                keep = np.array([tuple(key) in wanted for key in chunk_coords.tolist()], dtype=bool)
+                per_normal_coords = per_normal_coords[keep]
+                normals = normals[keep]
+            grid.add_surface_normals(
+                np.ascontiguousarray(per_normal_coords, dtype=np.int32),
+                np.ascontiguousarray(normals, dtype=np.float64),
+            )
+        return grid
+
+    def _chunk_index(self, cx: int, cy: int, cz: int) -> int | None:
+        if self._index is None:
+            self._index = {key: index for index, key in enumerate(self.chunk_keys())}
+        return self._index.get((cx, cy, cz))
+
+    def _read_chunk_at(self, index: int) -> np.ndarray:
+        entry = self.directory[index]
+        offset = int(entry["offset"])
+        raw = zlib.decompress(self._buffer[offset:offset + int(entry["compressed_size"])])
+        if len(raw) != CHUNK_VOLUME:
+            raise ValueError(f"Voxel chunk {index} has {len(raw)} bytes, expected {CHUNK_VOLUME}")
+        return np.frombuffer(raw, dtype=np.uint8)
 
 
 class VoxelPersistence:
     """
     Сохранение и загрузка VoxelGrid в файл .voxels.
 
-    Формат — JSON с gzip+base64 данными чанков.
+    Запись — бинарный формат v2; чтение поддерживает v2 и JSON v1.
     """
 
     @staticmethod
@@ -32,13 +308,54 @@ class VoxelPersistence:
             path: Путь к файлу (.voxels).
         """
         path = Path(path)
+        with open(path, "wb") as f:
+            f.write(VoxelPersistence.to_bytes(grid))
 
-        data: dict = grid.serialize()
-        data["version"] = VOXEL_FORMAT_VERSION
-        data["origin"] = [0, 0, 0]
+    @staticmethod
+    def to_bytes(grid: VoxelGrid) -> bytes:
+        """Сериализовать сетку в формат .voxels v2."""
+        chunks = sorted(
+            (tuple(key), chunk) for key, chunk in grid.iter_chunks()
+        )
+        name = (grid.name or "").encode("utf-8")
+
+        directory = np.zeros(len(chunks), dtype=_DIRECTORY_DTYPE)
+        directory_offset = _HEADER.size + len(name)
+        offset = directory_offset + directory.nbytes
+        blobs = []
+        voxel_count = 0
+        for index, ((cx, cy, cz), chunk) in enumerate(chunks):
+            blob = zlib.compress(np.ascontiguousarray(chunk.data, dtype=np.uint8).tobytes())
+            count = chunk.non_empty_count
+            directory[index] = (cx, cy, cz, offset, len(blob), count)
+            blobs.append(blob)
+            offset += len(blob)
+            voxel_count += count
+
+        normals_blob = _pack_surface_normals(grid.surface_normals)
+        header = _HEADER.pack(
+            VOXEL_BINARY_MAGIC,
+            VOXEL_BINARY_FORMAT_VERSION,
+            CHUNK_SIZE,
+            float(grid.cell_size),
+            len(chunks),
+            voxel_count,
+            directory_offset,
+            offset if normals_blob else 0,
+            len(normals_blob),
+            len(name),
+        )
+        return b"".join((header, name, directory.tobytes(), *blobs, normals_blob))
+
+    @staticmethod
+    def open(path: Union[str, Path]) -> VoxelFile:
+        """
+        Открыть файл .voxels v2 для ленивого чтения чанков.
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        Raises:
+            ValueError: Если файл не в формате v2.
+        """
+        return VoxelFile(path)
 
     @staticmethod
     def load(path: Union[str, Path]) -> VoxelGrid:
@@ -57,18 +374,22 @@ class VoxelPersistence:
         """
         path = Path(path)
 
+        if _is_binary_voxel_file(path):
+            with VoxelFile(path) as voxel_file:
+                return voxel_file.load_grid()
+
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
 
         return VoxelPersistence.load_from_content(content)
 
     @staticmethod
-    def load_from_content(content: str) -> VoxelGrid:
+    def load_from_content(content: Union[str, bytes]) -> VoxelGrid:
         """
-        Загрузить воксельную сетку из JSON содержимого.
+        Загрузить воксельную сетку из содержимого файла.
 
         Args:
-            content: JSON строка с данными сетки.
+            content: Байты файла v2 или JSON (v1) строка/байты.
 
         Returns:
             Загруженная VoxelGrid.
@@ -76,6 +397,12 @@ class VoxelPersistence:
         Raises:
             ValueError: Если формат файла неверный.
         """
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            if bytes(content[:8]) == VOXEL_BINARY_MAGIC:
+                with VoxelFile(content=content) as voxel_file:
+                    return voxel_file.load_grid()
+            content = bytes(content).decode("utf-8")
+
         data = json.loads(content)
 
         version = data.get("version", "")
@@ -89,6 +416,8 @@ class VoxelPersistence:
         """
         Получить информацию о воксельном файле без полной загрузки.
 
+        Для v2 читаются только заголовок и каталог чанков.
+
         Args:
             path: Путь к файлу.
 
@@ -97,6 +426,18 @@ class VoxelPersistence:
         """
         path = Path(path)
 
+        if _is_binary_voxel_file(path):
+            with VoxelFile(path) as voxel_file:
+                bounds = voxel_file.bounds()
+                return {
+                    "name": voxel_file.name,
+                    "cell_size": voxel_file.cell_size,
+                    "chunk_count": voxel_file.chunk_count,
+                    "voxel_count": voxel_file.voxel_count,
+                    "bounds_min": bounds[0] if bounds is not None else None,
+                    "bounds_max": bounds[1] if bounds is not None else None,
+                }
+
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
@@ -111,8 +452,6 @@ class VoxelPersistence:
         bounds_min = None
         bounds_max = None
 
-        from termin.voxels.chunk import CHUNK_SIZE
-
         for key in chunks.keys():
             parts = key.split(",")
             if len(parts) != 3:
@@ -138,3 +477,28 @@ class VoxelPersistence:
             "bounds_min": bounds_min,
             "bounds_max": bounds_max,
         }
+
+
+def _is_binary_voxel_file(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(VOXEL_BINARY_MAGIC)) == VOXEL_BINARY_MAGIC
+
+
+def _pack_surface_normals(surface_normals: dict) -> bytes:
+    """Сжатый блок нормалей; пустой для сетки без нормалей."""
+    if not surface_normals:
+        return b""
+    keys = sorted(surface_normals)
+    coords = np.array(keys, dtype="<i4").reshape(-1, 3)
+    counts = np.array([len(surface_normals[key]) for key in keys], dtype="<u4")
+    normals = np.array(
+        [normal for key in keys for normal in surface_normals[key]],
+        dtype="<f8",
+    ).reshape(-1, 3)
+    raw = b"".join((
+        struct.pack("<Q", len(keys)),
+        coords.tobytes(),
+        counts.tobytes(),
+        normals.tobytes(),
+    ))
+    return zlib.compress(raw)
@@ -63,35 +63,32 @@ def create_voxel_mesh(
     Returns:
         TcMesh registered in tc_mesh registry
     """
-    # Convert inputs to proper arrays
-    verts = np.asarray(vertices, dtype=np.float32)
-    tris = np.asarray(triangles, dtype=np.uint32).flatten()
+    verts = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+    tris = np.ascontiguousarray(triangles, dtype=np.uint32).reshape(-1)
 
     num_verts = verts.shape[0]
 
-    # Prepare optional arrays
+    # Interleaved buffer: pos(3) + normal(3) + uv(2) + color(3) = 11 floats.
+    # Filled in place: no intermediate stacked copy.
+    interleaved = np.empty((num_verts, 11), dtype=np.float32)
+    interleaved[:, 0:3] = verts
+    if vertex_normals is not None:
+        interleaved[:, 3:6] = vertex_normals
+    else:
+        interleaved[:, 3:6] = 0.0
     if uvs is not None:
-        uvs_arr = np.asarray(uvs, dtype=np.float32)
+        interleaved[:, 6:8] = uvs
     else:
-        uvs_arr = np.zeros((num_verts, 2), dtype=np.float32)
-
+        interleaved[:, 6:8] = 0.0
     if vertex_colors is not None:
-        colors_arr = np.asarray(vertex_colors, dtype=np.float32)
+        interleaved[:, 8:11] = vertex_colors
     else:
-        colors_arr = np.ones((num_verts, 3), dtype=np.float32)
-
-    if vertex_normals is not None:
-        normals_arr = np.asarray(vertex_normals, dtype=np.float32)
-    else:
-        normals_arr = np.zeros((num_verts, 3), dtype=np.float32)
-
-    # Build interleaved buffer: pos(3) + normal(3) + uv(2) + color(3) = 11 floats
-    interleaved = np.hstack([verts, normals_arr, uvs_arr, colors_arr]).astype(np.float32)
+        interleaved[:, 8:11] = 1.0
 
     layout = _get_voxel_layout()
 
     return TcMesh.from_interleaved(
-        interleaved.flatten(),
+        interleaved.reshape(-1),
         num_verts,
         tris,
         layout,
@@ -4,11 +4,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Callable
+from typing import TYPE_CHECKING, Iterator, Optional, Callable
 import numpy as np
 
 from termin.voxels.grid import VoxelGrid
-from termin.voxels.intersection import triangle_aabb_intersect, triangle_aabb
+from termin.voxels.intersection import (
+    triangle_aabb,
+    triangle_aabb_intersect,
+    triangles_aabb_intersect,
+)
 
 if TYPE_CHECKING:
     from termin.mesh.mesh import Mesh3
@@ -20,16 +24,23 @@ VOXEL_EMPTY = 0
 VOXEL_SOLID = 1      # Заполненный воксель (после вокселизации и fill)
 VOXEL_SURFACE = 2    # Поверхностный воксель (после mark_surface)
 
+# Максимум пар (треугольник, воксель) в одном пакете SAT-теста
+_PAIR_BATCH_SIZE = 1 << 18
 
-def _compute_triangle_normal(v0: np.ndarray, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
-    """Вычислить нормаль треугольника."""
-    edge1 = v1 - v0
-    edge2 = v2 - v0
-    normal = np.cross(edge1, edge2)
-    length = np.linalg.norm(normal)
-    if length > 1e-8:
-        normal /= length
-    return normal.astype(np.float32)
+
+def _compute_triangle_normals(corners: np.ndarray) -> np.ndarray:
+    """Единичные нормали треугольников по массиву вершин (T, 3, 3)."""
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > 1e-8
+    normals[valid] /= lengths[valid, None]
+    return normals.astype(np.float32)
+
+
+def _voxel_keys(voxels: np.ndarray, low: np.ndarray, dims: np.ndarray) -> np.ndarray:
+    """Скалярные ключи координат вокселей внутри бокса [low, low + dims)."""
+    local = voxels - low
+    return (local[:, 0] * dims[1] + local[:, 1]) * dims[2] + local[:, 2]
 
 
 class MeshVoxelizer:
@@ -54,13 +65,17 @@ class MeshVoxelizer:
         """
         Вокселизировать меш.
 
+        Пары (треугольник, воксель из AABB треугольника) проверяются
+        пакетами, пересечённые воксели записываются в сетку одним вызовом.
+
         Args:
             mesh: Меш для вокселизации.
             transform_matrix: Матрица трансформации 4x4 (world space).
             voxel_type: Тип вокселя для записи.
 
         Returns:
-            Количество записанных вокселей.
+            Количество пересечений (треугольник, воксель); воксель,
+            задетый несколькими треугольниками, учитывается каждым из них.
         """
         vertices = mesh.vertices
         triangles = mesh.triangles
@@ -73,16 +88,77 @@ class MeshVoxelizer:
             vertices = self._transform_vertices(vertices, transform_matrix)
 
         count = 0
+        hit_voxels = []
+        for _tri_indices, voxels in self._iter_triangle_voxel_hits(vertices, triangles):
+            count += len(voxels)
+            hit_voxels.append(voxels)
 
-        for tri in triangles:
-            v0 = vertices[tri[0]]
-            v1 = vertices[tri[1]]
-            v2 = vertices[tri[2]]
-
-            count += self._voxelize_triangle(v0, v1, v2, voxel_type)
+        if count:
+            voxels = np.unique(np.concatenate(hit_voxels), axis=0)
+            self._grid.set_voxels(voxels.astype(np.int32), voxel_type)
 
         return count
 
+    def _iter_triangle_voxel_hits(
+        self,
+        vertices: np.ndarray,
+        triangles: np.ndarray,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Пересечения треугольников с вокселями их AABB, пакетами.
+
+        Порядок пар тот же, что у поштучного обхода: по треугольникам,
+        внутри треугольника — по x, y, z.
+
+        Yields:
+            (индексы треугольников (K,), координаты вокселей (K, 3)).
+        """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        if len(triangles) == 0:
+            return
+
+        corners = vertices[triangles]
+        origin = np.asarray(self._grid.origin, dtype=np.float64)
+        cell_size = self._cell_size
+
+        # AABB треугольников с расширением, как в _voxelize_triangle
+        epsilon = cell_size * 0.01
+        voxel_min = np.floor((corners.min(axis=1) - epsilon - origin) / cell_size).astype(np.int64)
+        voxel_max = np.floor((corners.max(axis=1) + epsilon - origin) / cell_size).astype(np.int64)
+        extents = voxel_max - voxel_min + 1
+        pair_counts = extents.prod(axis=1)
+        pair_ends = np.cumsum(pair_counts)
+
+        start = 0
+        while start < len(triangles):
+            batch_base = pair_ends[start - 1] if start else 0
+            stop = int(np.searchsorted(pair_ends, batch_base + _PAIR_BATCH_SIZE, side="right"))
+            stop = max(stop, start + 1)
+
+            counts = pair_counts[start:stop]
+            tri_indices = np.repeat(np.arange(start, stop), counts)
+            pair_offsets = np.repeat(pair_ends[start:stop] - counts - batch_base, counts)
+            local = np.arange(len(tri_indices)) - pair_offsets
+            tri_extents = extents[tri_indices]
+            yz = tri_extents[:, 1] * tri_extents[:, 2]
+            voxels = voxel_min[tri_indices] + np.stack(
+                (local // yz, (local // tri_extents[:, 2]) % tri_extents[:, 1], local % tri_extents[:, 2]),
+                axis=1,
+            )
+
+            centers = origin + (voxels + 0.5) * cell_size
+            tri_corners = corners[tri_indices]
+            hit = triangles_aabb_intersect(
+                tri_corners[:, 0],
+                tri_corners[:, 1],
+                tri_corners[:, 2],
+                centers,
+                self._half_size,
+            )
+            yield tri_indices[hit], voxels[hit]
+            start = stop
+
     def _transform_vertices(
         self,
         vertices: np.ndarray,
@@ -107,7 +183,7 @@ class MeshVoxelizer:
         v2: np.ndarray,
         voxel_type: int,
     ) -> int:
-        """Вокселизировать один треугольник."""
+        """Вокселизировать один треугольник (поштучный эталон для бенчмарка)."""
         # AABB треугольника в мировых координатах
         tri_min, tri_max = triangle_aabb(v0, v1, v2)
 
@@ -170,44 +246,37 @@ class MeshVoxelizer:
         if transform_matrix is not None:
             vertices = self._transform_vertices(vertices, transform_matrix)
 
-        # Накапливаем нормали для каждого surface вокселя
-        voxels_with_normals: set[tuple[int, int, int]] = set()
-
-        for tri in triangles:
-            v0 = vertices[tri[0]]
-            v1 = vertices[tri[1]]
-            v2 = vertices[tri[2]]
-
-            # Нормаль треугольника
-            tri_normal = _compute_triangle_normal(v0, v1, v2)
-
-            # AABB треугольника
-            tri_min, tri_max = triangle_aabb(v0, v1, v2)
-            epsilon = self._cell_size * 0.01
-            tri_min = tri_min - epsilon
-            tri_max = tri_max + epsilon
-
-            voxel_min = self._grid.world_to_voxel(tri_min)
-            voxel_max = self._grid.world_to_voxel(tri_max)
-
-            # Проверяем воксели в AABB треугольника
-            for vx in range(voxel_min[0], voxel_max[0] + 1):
-                for vy in range(voxel_min[1], voxel_max[1] + 1):
-                    for vz in range(voxel_min[2], voxel_max[2] + 1):
-                        voxel_key = (vx, vy, vz)
-
-                        # Только surface воксели
-                        if voxel_key not in surface_voxels:
-                            continue
-
-                        # Проверяем пересечение
-                        center = self._grid.voxel_to_world(vx, vy, vz)
-                        if triangle_aabb_intersect(v0, v1, v2, center, self._half_size):
-                            # Добавляем нормаль треугольника к списку (без усреднения)
-                            self._grid.add_surface_normal(vx, vy, vz, tri_normal)
-                            voxels_with_normals.add(voxel_key)
+        vertices = np.asarray(vertices, dtype=np.float64)
+        triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        tri_normals = _compute_triangle_normals(vertices[triangles])
+
+        # Ключи surface вокселей для векторной проверки принадлежности
+        surface = np.array(sorted(surface_voxels), dtype=np.int64)
+        low = surface.min(axis=0)
+        dims = surface.max(axis=0) - low + 1
+        surface_keys = _voxel_keys(surface, low, dims)
+
+        hit_voxels = []
+        hit_normals = []
+        for tri_indices, voxels in self._iter_triangle_voxel_hits(vertices, triangles):
+            inside = np.all((voxels >= low) & (voxels < low + dims), axis=1)
+            inside[inside] = np.isin(_voxel_keys(voxels[inside], low, dims), surface_keys)
+            hit_voxels.append(voxels[inside])
+            hit_normals.append(tri_normals[tri_indices[inside]])
+
+        if not hit_voxels:
+            return 0
+        voxels = np.concatenate(hit_voxels)
+        if len(voxels) == 0:
+            return 0
 
-        return len(voxels_with_normals)
+        # Нормали треугольников добавляются к спискам (без усреднения),
+        # в порядке треугольников, как при поштучном обходе
+        self._grid.add_surface_normals(
+            voxels.astype(np.int32),
+            np.concatenate(hit_normals).astype(np.float64),
+        )
+        return len(np.unique(voxels, axis=0))
 
 
 class SceneVoxelizer:
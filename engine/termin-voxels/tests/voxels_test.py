@@ -7,7 +7,7 @@ import numpy as np
 
 from termin.voxels.chunk import VoxelChunk, CHUNK_SIZE
 from termin.voxels.grid import VoxelGrid
-from termin.voxels.intersection import triangle_aabb_intersect, triangle_aabb
+from termin.voxels.intersection import triangle_aabb_intersect, triangle_aabb, triangles_aabb_intersect
 from termin.voxels.voxelizer import MeshVoxelizer
 
 
@@ -362,6 +362,24 @@ class TriangleAABBIntersectTest(unittest.TestCase):
         self.assertTrue(triangle_aabb_intersect(v0, v1, v2, center, half_size))
 
 
+    def test_batch_matches_single_test(self):
+        """Пакетный тест совпадает с поштучным."""
+        rng = np.random.default_rng(1)
+        corners = rng.normal(size=(500, 3, 3)) * rng.uniform(0.05, 2.0, (500, 1, 1))
+        centers = rng.normal(size=(500, 3)) * 0.8
+        half_size = np.array([0.3, 0.3, 0.3])
+
+        batch = triangles_aabb_intersect(corners[:, 0], corners[:, 1], corners[:, 2], centers, half_size)
+        expected = [
+            triangle_aabb_intersect(v0, v1, v2, center, half_size)
+            for (v0, v1, v2), center in zip(corners, centers, strict=True)
+        ]
+
+        self.assertEqual(batch.tolist(), expected)
+        self.assertTrue(batch.any())
+        self.assertFalse(batch.all())
+
+
 class TriangleAABBTest(unittest.TestCase):
     """Тесты для triangle_aabb."""
 
@@ -497,6 +515,36 @@ class MeshVoxelizerTest(unittest.TestCase):
             "expected voxels near the sheared Y vertex",
         )
 
+    def test_batched_voxelization_matches_per_triangle(self):
+        """Пакетная вокселизация и нормали совпадают с поштучным обходом."""
+        from termin.mesh.mesh import Mesh3
+
+        rng = np.random.default_rng(3)
+        vertices = (rng.normal(size=(60, 3)) * 1.5).astype(np.float32)
+        triangles = np.array([rng.choice(60, 3, replace=False) for _ in range(80)], dtype=np.int32)
+        mesh = Mesh3(vertices=vertices, triangles=triangles)
+
+        grid = VoxelGrid(origin=(-1, 0.1, 0), cell_size=0.25)
+        count = MeshVoxelizer(grid).voxelize_mesh(mesh)
+
+        reference = VoxelGrid(origin=(-1, 0.1, 0), cell_size=0.25)
+        reference_voxelizer = MeshVoxelizer(reference)
+        reference_count = sum(
+            reference_voxelizer._voxelize_triangle(vertices[a], vertices[b], vertices[c], 1)
+            for a, b, c in triangles
+        )
+
+        self.assertEqual(count, reference_count)
+        self.assertEqual(sorted(grid.iter_non_empty()), sorted(reference.iter_non_empty()))
+
+        surface = {(vx, vy, vz) for vx, vy, vz, _vtype in grid.iter_non_empty()}
+        normals_count = MeshVoxelizer(grid).compute_surface_normals(mesh, surface)
+        self.assertEqual(normals_count, len(grid.surface_normals))
+        for key, normals in grid.surface_normals.items():
+            self.assertIn(key, surface)
+            for normal in normals:
+                self.assertAlmostEqual(float(np.linalg.norm(normal)), 1.0, places=5)
+
     def test_empty_mesh(self):
         """Пустой меш не должен создавать вокселей."""
         from termin.mesh.mesh import Mesh3
@@ -512,6 +560,8 @@ class MeshVoxelizerTest(unittest.TestCase):
 
         self.assertEqual(count, 0)
         self.assertEqual(grid.voxel_count, 0)
+        self.assertEqual(voxelizer.compute_surface_normals(mesh, {(0, 0, 0)}), 0)
+        self.assertEqual(len(grid.surface_normals), 0)
 
 
 class VoxelPersistenceTest(unittest.TestCase):
@@ -589,3 +639,177 @@ class VoxelPersistenceTest(unittest.TestCase):
             np.testing.assert_array_equal(loaded.origin, [0, 0, 0])
         finally:
             os.unlink(temp_path)
+
+    def test_binary_file_lazy_chunk_reads(self):
+        """Файл v2 открывается по каталогу, чанки читаются по запросу."""
+        import tempfile
+        import os
+        from termin.voxels.persistence import VOXEL_BINARY_MAGIC, VoxelPersistence
+
+        grid = VoxelGrid(origin=(0, 0, 0), cell_size=0.5, name="level")
+        grid.set(1, 2, 3, 1)
+        grid.set(40, 0, 0, 2)
+        grid.set(-1, -17, 5, 3)
+        grid.add_surface_normals(
+            np.array([[1, 2, 3], [1, 2, 3]], dtype=np.int32),
+            np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]]),
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".voxels", delete=False) as f:
+            temp_path = f.name
+
+        try:
+            VoxelPersistence.save(grid, temp_path)
+            with open(temp_path, "rb") as f:
+                self.assertEqual(f.read(len(VOXEL_BINARY_MAGIC)), VOXEL_BINARY_MAGIC)
+
+            info = VoxelPersistence.get_info(temp_path)
+            self.assertEqual(info["name"], "level")
+            self.assertEqual(info["chunk_count"], 3)
+            self.assertEqual(info["voxel_count"], 3)
+            self.assertEqual(info["bounds_min"], [-16, -32, 0])
+            self.assertEqual(info["bounds_max"], [47, 15, 15])
+
+            with VoxelPersistence.open(temp_path) as voxel_file:
+                self.assertEqual(sorted(voxel_file.chunk_keys()), [(-1, -2, 0), (0, 0, 0), (2, 0, 0)])
+                self.assertEqual(voxel_file.get(40, 0, 0), 2)
+                self.assertEqual(voxel_file.get(-1, -17, 5), 3)
+                self.assertEqual(voxel_file.get(100, 100, 100), 0)
+                self.assertIsNone(voxel_file.read_chunk(5, 5, 5))
+                self.assertEqual(int(voxel_file.read_chunk(0, 0, 0)[1 + 2 * 16 + 3 * 256]), 1)
+
+                partial = voxel_file.load_grid(chunks=[(0, 0, 0)])
+                self.assertEqual(partial.voxel_count, 1)
+                self.assertEqual(len(partial.surface_normals[(1, 2, 3)]), 2)
+
+            loaded = VoxelPersistence.load(temp_path)
+            self.assertEqual(loaded.name, "level")
+            self.assertEqual(loaded.voxel_count, 3)
+            self.assertEqual(loaded.get(-1, -17, 5), 3)
+            np.testing.assert_allclose(
+                loaded.surface_normals[(1, 2, 3)],
+                [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]],
+            )
+        finally:
+            os.unlink(temp_path)
+
+    def test_binary_file_rejects_bad_headers_and_closes(self):
+        """Битый заголовок даёт ValueError, файл закрывается."""
+        import struct
+        import tempfile
+        import os
+        from termin.voxels.persistence import _DIRECTORY_DTYPE, _HEADER, VoxelPersistence
+
+        grid = VoxelGrid(origin=(0, 0, 0), cell_size=0.5)
+        grid.set(1, 2, 3, 1)
+        grid.set(40, 0, 0, 2)
+        content = VoxelPersistence.to_bytes(grid)
+        # Версия сразу после 8 байт магии
+        wrong_version = content[:8] + struct.pack("<I", 99) + content[12:]
+        # Два чанка в каталоге, обрезано после первой записи
+        truncated = content[:_HEADER.size + _DIRECTORY_DTYPE.itemsize]
+
+        for payload, message in ((wrong_version, "version"), (truncated, "truncated")):
+            with tempfile.NamedTemporaryFile(suffix=".voxels", delete=False) as f:
+                f.write(payload)
+                temp_path = f.name
+            try:
+                with self.assertRaisesRegex(ValueError, message):
+                    VoxelPersistence.get_info(temp_path)
+                with self.assertRaisesRegex(ValueError, message):
+                    VoxelPersistence.load(temp_path)
+                with self.assertRaisesRegex(ValueError, message):
+                    VoxelPersistence.load_from_content(payload)
+            finally:
+                os.unlink(temp_path)
+
+    def test_binary_file_directory_survives_close(self):
+        """Каталог не держит mmap: close() проходит, каталог остаётся."""
+        import tempfile
+        import os
+        from termin.voxels.persistence import VoxelPersistence
+
+        grid = VoxelGrid(origin=(0, 0, 0), cell_size=0.5)
+        grid.set(1, 2, 3, 1)
+
+        with tempfile.NamedTemporaryFile(suffix=".voxels", delete=False) as f:
+            temp_path = f.name
+        try:
+            VoxelPersistence.save(grid, temp_path)
+            voxel_file = VoxelPersistence.open(temp_path)
+            directory = voxel_file.directory
+            voxel_file.close()
+            self.assertEqual(directory["count"].tolist(), [1])
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_from_content_accepts_json_v1(self):
+        """Старые JSON файлы загружаются из строки и из байтов."""
+        import json
+        from termin.voxels.persistence import VoxelPersistence
+
+        grid = VoxelGrid(origin=(0, 0, 0), cell_size=0.25)
+        grid.set(7, 8, 9, 1)
+        data = grid.serialize()
+        data["version"] = "1.2"
+        content = json.dumps(data)
+
+        for payload in (content, content.encode("utf-8")):
+            loaded = VoxelPersistence.load_from_content(payload)
+            self.assertEqual(loaded.get(7, 8, 9), 1)
+
+        loaded = VoxelPersistence.load_from_content(VoxelPersistence.to_bytes(grid))
+        self.assertEqual(loaded.get(7, 8, 9), 1)
+
+
+class VoxelChunkMeshTest(unittest.TestCase):
+    """Тесты greedy меширования чанков."""
+
+    def test_world_bounds_cover_occupied_voxels_not_chunks(self):
+        """Границы отображения — по занятым вокселям, меньше одного чанка."""
+        from termin.voxels.chunk_mesh import voxel_world_bounds
+
+        grid = VoxelGrid(origin=(1.0, 2.0, 3.0), cell_size=0.5)
+        grid.set(2, 3, 4, 1)
+        grid.set(5, 3, 7, 2)
+        grid.set(-1, 3, 4, 1)
+
+        bounds_min, bounds_max = voxel_world_bounds(grid)
+        np.testing.assert_allclose(bounds_min, [0.5, 3.5, 5.0])
+        np.testing.assert_allclose(bounds_max, [4.0, 4.0, 7.0])
+        self.assertIsNone(voxel_world_bounds(VoxelGrid()))
+
+    def test_solid_box_merges_into_six_quads(self):
+        """Сплошной блок одного типа даёт по одному прямоугольнику на грань."""
+        from termin.voxels.chunk_mesh import greedy_chunk_quads
+
+        attributes = np.zeros((CHUNK_SIZE,) * 3, dtype=np.int32)
+        attributes[2:5, 3:7, 4:9] = 1
+        occupied = np.zeros((CHUNK_SIZE + 2,) * 3, dtype=bool)
+        occupied[1:-1, 1:-1, 1:-1] = attributes != 0
+
+        quads = greedy_chunk_quads(attributes, occupied)
+
+        self.assertEqual(len(quads), 6)
+        areas = sorted((quads[:, 5] * quads[:, 6]).tolist())
+        self.assertEqual(areas, [12, 12, 15, 15, 20, 20])
+
+    def test_faces_hidden_by_neighbor_chunk_are_culled(self):
+        """Грань на границе с заполненным соседним чанком не строится."""
+        from termin.voxels.chunk_mesh import build_chunk_mesh_arrays, _chunk_volume
+
+        grid = VoxelGrid(origin=(0, 0, 0), cell_size=1.0)
+        grid.set(15, 0, 0, 1)
+        grid.set(16, 0, 0, 1)
+        volumes = {tuple(key): _chunk_volume(chunk) for key, chunk in grid.iter_chunks()}
+
+        vertices, triangles, normals, uvs, colors = build_chunk_mesh_arrays(grid, (0, 0, 0), volumes, [])
+
+        self.assertEqual(len(vertices), 5 * 4)
+        self.assertEqual(len(triangles), 5 * 2)
+        self.assertFalse(np.any(np.all(normals == [1, 0, 0], axis=1)))
+        np.testing.assert_array_equal(uvs[:, 0], 1.0)
+        # Обход против часовой стрелки снаружи
+        a, b, c = (vertices[triangles[:, i]] for i in range(3))
+        facing = np.einsum("ij,ij->i", np.cross(b - a, c - a), normals[triangles[:, 0]])
+        self.assertTrue(np.all(facing > 0))
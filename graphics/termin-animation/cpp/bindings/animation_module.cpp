@@ -137,6 +137,30 @@ void bind_tc_animation_clip(nb::module_& m) {
         .def_prop_ro("channel_count", &TcAnimationClip::channel_count)
         .def_prop_ro("track_count", &TcAnimationClip::track_count)
         .def_prop_ro("loop", &TcAnimationClip::loop)
+        .def_prop_ro("ref_count",
+                     [](const TcAnimationClip& self) -> uint32_t {
+                         tc_animation* animation = self.get();
+                         return animation ? animation->header.ref_count : 0;
+                     })
+        .def_prop_ro("memory_bytes",
+                     [](const TcAnimationClip& self) -> size_t {
+                         tc_animation* animation = self.get();
+                         if (!animation)
+                             return 0;
+                         size_t bytes = animation->channel_count * sizeof(tc_animation_channel) +
+                                        animation->track_count * sizeof(tc_animation_track);
+                         for (size_t i = 0; i < animation->channel_count; ++i) {
+                             const tc_animation_channel& ch = animation->channels[i];
+                             bytes += ch.translation_count * sizeof(tc_keyframe_vec3) +
+                                      ch.rotation_count * sizeof(tc_keyframe_quat) +
+                                      ch.scale_count * sizeof(tc_keyframe_scalar);
+                         }
+                         for (size_t i = 0; i < animation->track_count; ++i) {
+                             const tc_animation_track& track = animation->tracks[i];
+                             bytes += (track.key_count + track.value_count) * sizeof(double);
+                         }
+                         return bytes;
+                     })
         .def(
             "set_tps",
             [](TcAnimationClip& self, double value) {
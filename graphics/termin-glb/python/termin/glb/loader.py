@@ -656,6 +656,86 @@ def _decompose_node_matrix(matrix_values: Any, node_index: int) -> tuple[np.ndar
 
 # ---------- PARSING FUNCTIONS ----------
 
+def _deduplicate_vertices(
+    primitive_records: list[dict[str, Any]],
+    layout: list[tuple[str, int, Any]],
+) -> tuple[dict[str, np.ndarray], list[np.ndarray]]:
+    """Merge identical indexed vertices of all primitives of one mesh.
+
+    Two vertices are merged when every attribute in ``layout`` compares equal
+    (missing attributes count as zeros, ``-0.0 == 0.0``, NaN never matches).
+    Output vertices keep the order of their first use in the index streams.
+
+    Returns the deduplicated attribute arrays keyed by layout name and one
+    remapped index array per primitive record.
+    """
+    key_columns = sum(width for _, width, _ in layout)
+    source_keys: list[np.ndarray] = []
+    source_nan: list[np.ndarray] = []
+    source_values: dict[str, list[np.ndarray]] = {name: [] for name, _, _ in layout}
+    stream_chunks: list[np.ndarray] = []
+    source_offset = 0
+
+    for record in primitive_records:
+        present = [record[name] for name, _, _ in layout if record[name] is not None]
+        source_count = min(len(data) for data in present)
+        record_indices = np.asarray(record["indices"], dtype=np.int64)
+        if len(record_indices) and int(record_indices.max()) >= source_count:
+            raise IndexError(
+                f"primitive '{record['name']}' index {int(record_indices.max())} "
+                f"is out of bounds for {source_count} vertices"
+            )
+
+        key = np.empty((source_count, key_columns), dtype=np.uint32)
+        has_nan = np.zeros(source_count, dtype=bool)
+        column = 0
+        for name, width, dtype in layout:
+            data = record[name]
+            if data is None:
+                values = np.zeros((source_count, width), dtype=dtype)
+            else:
+                values = np.asarray(data[:source_count], dtype=dtype).reshape(source_count, width)
+            source_values[name].append(values)
+            if dtype == np.float32:
+                has_nan |= np.isnan(values).any(axis=1)
+                # +0.0 folds -0.0 into 0.0 so that the bit patterns compare like floats
+                key[:, column:column + width] = (values + np.float32(0.0)).view(np.uint32)
+            else:
+                key[:, column:column + width] = values
+            column += width
+
+        source_keys.append(key)
+        source_nan.append(has_nan)
+        stream_chunks.append(record_indices + source_offset)
+        source_offset += source_count
+
+    keys = np.ascontiguousarray(np.concatenate(source_keys, axis=0))
+    key_rows = keys.view(np.dtype((np.void, keys.dtype.itemsize * key_columns))).ravel()
+    _, source_ids = np.unique(key_rows, return_inverse=True)
+    source_ids = source_ids.ravel()
+
+    stream = np.concatenate(stream_chunks)
+    stream_ids = source_ids[stream]
+    nan_positions = np.flatnonzero(np.concatenate(source_nan)[stream])
+    if len(nan_positions):
+        # NaN != NaN: each use of such a vertex stays a separate vertex
+        stream_ids[nan_positions] = len(key_rows) + np.arange(len(nan_positions))
+
+    _, first_use, inverse = np.unique(stream_ids, return_index=True, return_inverse=True)
+    order = np.argsort(first_use, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    remapped = rank[inverse.ravel()].astype(np.uint32)
+    output_rows = stream[first_use[order]]
+
+    attributes_out = {
+        name: np.concatenate(source_values[name], axis=0)[output_rows]
+        for name, _, _ in layout
+    }
+    split_points = np.cumsum([len(chunk) for chunk in stream_chunks])[:-1]
+    return attributes_out, np.split(remapped, split_points)
+
+
 def _parse_meshes(
     gltf: dict,
     buffers: list[bytes],
@@ -675,7 +755,6 @@ def _parse_meshes(
         scene_data.mesh_index_map[mesh_idx] = []
 
         primitive_records: list[dict[str, Any]] = []
-        index_chunks: list[np.ndarray] = []
         submeshes: list[GLBSubmeshData] = []
         material_slot_for_index: Dict[int, int] = {}
         first_material_index = -1
@@ -815,22 +894,17 @@ def _parse_meshes(
                 )
             continue
 
-        vertex_map: dict[tuple, int] = {}
-        vertex_out: list[np.ndarray] = []
-        normal_out: list[np.ndarray] = []
-        uv_out: list[np.ndarray] = []
-        tangent_out: list[np.ndarray] = []
-        joint_out: list[np.ndarray] = []
-        weight_out: list[np.ndarray] = []
-
-        zero3 = (0.0, 0.0, 0.0)
-        zero2 = (0.0, 0.0)
-        zero4 = (0.0, 0.0, 0.0, 0.0)
-
-        def row_tuple(data: Optional[np.ndarray], index: int, fallback: tuple[float, ...]) -> tuple[float, ...]:
-            if data is None:
-                return fallback
-            return tuple(data[index].tolist())
+        layout = [("vertices", 3, np.float32)]
+        if has_normals:
+            layout.append(("normals", 3, np.float32))
+        if has_uvs:
+            layout.append(("uvs", 2, np.float32))
+        if has_tangents:
+            layout.append(("tangents", 4, np.float32))
+        if has_joints:
+            layout.append(("joint_indices", 4, np.uint32))
+        if has_weights:
+            layout.append(("joint_weights", 4, np.float32))
 
         total_source_indices = sum(len(record["indices"]) for record in primitive_records)
         deduplicate_started_at = time.perf_counter()
@@ -841,73 +915,24 @@ def _parse_meshes(
                 f"thread={trace.thread_id}"
             )
 
-        for record in primitive_records:
-            local_indices: list[int] = []
-            source_indices = record["indices"]
-            for source_index in source_indices:
-                idx = int(source_index)
-                key_parts = [row_tuple(record["vertices"], idx, zero3)]
-                if has_normals:
-                    key_parts.append(row_tuple(record["normals"], idx, zero3))
-                if has_uvs:
-                    key_parts.append(row_tuple(record["uvs"], idx, zero2))
-                if has_tangents:
-                    key_parts.append(row_tuple(record["tangents"], idx, zero4))
-                if has_joints:
-                    key_parts.append(row_tuple(record["joint_indices"], idx, zero4))
-                if has_weights:
-                    key_parts.append(row_tuple(record["joint_weights"], idx, zero4))
-                key = tuple(key_parts)
-
-                vertex_index = vertex_map.get(key)
-                if vertex_index is None:
-                    vertex_index = len(vertex_out)
-                    vertex_map[key] = vertex_index
-                    vertex_out.append(record["vertices"][idx])
-                    if has_normals:
-                        normal_out.append(
-                            record["normals"][idx] if record["normals"] is not None
-                            else np.zeros(3, dtype=np.float32)
-                        )
-                    if has_uvs:
-                        uv_out.append(
-                            record["uvs"][idx] if record["uvs"] is not None
-                            else np.zeros(2, dtype=np.float32)
-                        )
-                    if has_tangents:
-                        tangent_out.append(
-                            record["tangents"][idx] if record["tangents"] is not None
-                            else np.zeros(4, dtype=np.float32)
-                        )
-                    if has_joints:
-                        joint_out.append(
-                            record["joint_indices"][idx] if record["joint_indices"] is not None
-                            else np.zeros(4, dtype=np.float32)
-                        )
-                    if has_weights:
-                        weight_out.append(
-                            record["joint_weights"][idx] if record["joint_weights"] is not None
-                            else np.zeros(4, dtype=np.float32)
-                        )
-                local_indices.append(vertex_index)
-
-            index_chunks.append(np.asarray(local_indices, dtype=np.uint32))
+        attributes_out, index_chunks = _deduplicate_vertices(primitive_records, layout)
+        vertex_count = len(attributes_out["vertices"])
 
         if trace is not None:
             log.info(
                 f"[GLBLoad] deduplicate-end mesh_index={mesh_idx} name='{mesh_name}' "
-                f"source_indices={total_source_indices} unique_vertices={len(vertex_out)} "
+                f"source_indices={total_source_indices} unique_vertices={vertex_count} "
                 f"duration_ms="
                 f"{(time.perf_counter() - deduplicate_started_at) * 1000.0:.3f} "
                 f"source='{trace.source}' thread={trace.thread_id}"
             )
 
-        vertices = np.asarray(vertex_out, dtype=np.float32)
-        normals = np.asarray(normal_out, dtype=np.float32) if has_normals else None
-        uvs = np.asarray(uv_out, dtype=np.float32) if has_uvs else None
-        tangents = np.asarray(tangent_out, dtype=np.float32) if has_tangents else None
-        joint_indices = np.asarray(joint_out, dtype=np.uint32) if has_joints else None
-        joint_weights = np.asarray(weight_out, dtype=np.float32) if has_weights else None
+        vertices = attributes_out["vertices"]
+        normals = attributes_out.get("normals")
+        uvs = attributes_out.get("uvs")
+        tangents = attributes_out.get("tangents")
+        joint_indices = attributes_out.get("joint_indices")
+        joint_weights = attributes_out.get("joint_weights")
         indices = np.concatenate(index_chunks, axis=0).astype(np.uint32)
 
         our_mesh_idx = len(scene_data.meshes)
@@ -0,0 +1,167 @@
+import time
+
+import numpy as np
+
+from termin.glb.loader import GLBSceneData, _deduplicate_vertices, _parse_meshes
+
+
+_LAYOUT = [
+    ("vertices", 3, np.float32),
+    ("normals", 3, np.float32),
+    ("uvs", 2, np.float32),
+    ("tangents", 4, np.float32),
+    ("joint_indices", 4, np.uint32),
+    ("joint_weights", 4, np.float32),
+]
+
+
+def _reference_deduplicate(primitive_records, layout):
+    """Per-index dict lookup the loader used before vectorization."""
+    vertex_map = {}
+    out = {name: [] for name, _, _ in layout}
+    index_chunks = []
+    for record in primitive_records:
+        local_indices = []
+        for source_index in record["indices"]:
+            idx = int(source_index)
+            key = tuple(
+                tuple(record[name][idx].tolist()) if record[name] is not None else (0.0,) * width
+                for name, width, _ in layout
+            )
+            vertex_index = vertex_map.get(key)
+            if vertex_index is None:
+                vertex_index = len(out["vertices"])
+                vertex_map[key] = vertex_index
+                for name, width, dtype in layout:
+                    data = record[name]
+                    out[name].append(data[idx] if data is not None else np.zeros(width, dtype=dtype))
+            local_indices.append(vertex_index)
+        index_chunks.append(np.asarray(local_indices, dtype=np.uint32))
+    return {name: np.asarray(out[name], dtype=dtype) for name, _, dtype in layout}, index_chunks
+
+
+def _record(rng, vertex_count, index_count, drop=()):
+    # Small value alphabet so that many index rows collide
+    record = {
+        "vertices": rng.integers(0, 3, size=(vertex_count, 3)).astype(np.float32),
+        "normals": rng.integers(0, 2, size=(vertex_count, 3)).astype(np.float32),
+        "uvs": rng.integers(0, 2, size=(vertex_count, 2)).astype(np.float32) * 0.5,
+        "tangents": np.tile(np.array([1.0, 0.0, 0.0, 1.0], dtype=np.float32), (vertex_count, 1)),
+        "joint_indices": rng.integers(0, 2, size=(vertex_count, 4)).astype(np.uint32),
+        "joint_weights": np.tile(np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32), (vertex_count, 1)),
+        "indices": rng.integers(0, vertex_count, size=index_count).astype(np.uint32),
+        "name": "primitive",
+    }
+    for name in drop:
+        record[name] = None
+    return record
+
+
+def test_vectorized_dedup_matches_reference_loop():
+    rng = np.random.default_rng(7)
+    records = [
+        _record(rng, 40, 300),
+        _record(rng, 25, 120, drop=("normals", "joint_indices")),
+        _record(rng, 30, 200, drop=("tangents",)),
+    ]
+    # -0.0 merges with 0.0, NaN never merges
+    records[0]["vertices"][0] = [-0.0, 0.0, 0.0]
+    records[0]["vertices"][1] = [0.0, 0.0, 0.0]
+    records[0]["normals"][:2] = 0.0
+    records[0]["vertices"][2] = [np.nan, 1.0, 1.0]
+    records[0]["indices"][:6] = [0, 1, 2, 2, 1, 0]
+
+    expected, expected_indices = _reference_deduplicate(records, _LAYOUT)
+    actual, actual_indices = _deduplicate_vertices(records, _LAYOUT)
+
+    for name, _, dtype in _LAYOUT:
+        assert actual[name].dtype == dtype
+        np.testing.assert_array_equal(actual[name], expected[name])
+    assert len(actual_indices) == len(expected_indices)
+    for got, want in zip(actual_indices, expected_indices, strict=True):
+        np.testing.assert_array_equal(got, want)
+
+
+def _grid_gltf(side: int) -> tuple[dict, bytes]:
+    """Indexed grid where every triangle corner is duplicated, as in split-normal exports."""
+    xs, ys = np.meshgrid(np.arange(side + 1, dtype=np.float32), np.arange(side + 1, dtype=np.float32))
+    grid = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size, dtype=np.float32)], axis=1)
+    i, j = np.meshgrid(np.arange(side), np.arange(side))
+    a = (j * (side + 1) + i).ravel()
+    corners = np.stack([a, a + 1, a + side + 2, a, a + side + 2, a + side + 1], axis=1).ravel()
+    positions = grid[corners]
+    normals = np.tile(np.array([0.0, 0.0, 1.0], dtype=np.float32), (len(corners), 1))
+    uvs = positions[:, :2] / side
+    indices = np.arange(len(corners), dtype=np.uint32)
+
+    chunks = [positions.tobytes(), normals.tobytes(), uvs.astype(np.float32).tobytes(), indices.tobytes()]
+    offsets = np.concatenate(([0], np.cumsum([len(chunk) for chunk in chunks])))
+    count = len(corners)
+    gltf = {
+        "asset": {"version": "2.0"},
+        "meshes": [{"name": "Grid", "primitives": [{
+            "attributes": {"POSITION": 0, "NORMAL": 1, "TEXCOORD_0": 2},
+            "indices": 3,
+        }]}],
+        "accessors": [
+            {"bufferView": 0, "componentType": 5126, "count": count, "type": "VEC3"},
+            {"bufferView": 1, "componentType": 5126, "count": count, "type": "VEC3"},
+            {"bufferView": 2, "componentType": 5126, "count": count, "type": "VEC2"},
+            {"bufferView": 3, "componentType": 5125, "count": count, "type": "SCALAR"},
+        ],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": int(offsets[k]), "byteLength": len(chunks[k])}
+            for k in range(4)
+        ],
+    }
+    return gltf, b"".join(chunks)
+
+
+def _grid_reference_record(payload: bytes, index_count: int) -> dict:
+    return {
+        "vertices": np.frombuffer(payload, np.float32, index_count * 3).reshape(-1, 3),
+        "normals": np.frombuffer(payload, np.float32, index_count * 3, index_count * 12).reshape(-1, 3),
+        "uvs": np.frombuffer(payload, np.float32, index_count * 2, index_count * 24).reshape(-1, 2),
+        "indices": np.arange(index_count, dtype=np.uint32),
+    }
+
+
+def test_grid_mesh_import_matches_reference_loop():
+    gltf, payload = _grid_gltf(40)
+    index_count = gltf["accessors"][3]["count"]
+
+    scene_data = GLBSceneData()
+    _parse_meshes(gltf, [payload], scene_data)
+    mesh = scene_data.meshes[0]
+    assert mesh.vertices.shape == (41 * 41, 3)
+    assert len(mesh.indices) == index_count
+
+    expected, expected_indices = _reference_deduplicate([_grid_reference_record(payload, index_count)], _LAYOUT[:3])
+    np.testing.assert_array_equal(mesh.vertices, expected["vertices"])
+    np.testing.assert_array_equal(mesh.indices, expected_indices[0])
+
+
+def benchmark_mesh_import(side: int = 120) -> tuple[float, float]:
+    """Vertices/s of the GLB mesh import and of the per-index reference loop.
+
+    Not collected by pytest; run this file directly to print the numbers.
+    """
+    gltf, payload = _grid_gltf(side)
+    index_count = gltf["accessors"][3]["count"]
+
+    started = time.perf_counter()
+    _parse_meshes(gltf, [payload], GLBSceneData())
+    vectorized_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    _reference_deduplicate([_grid_reference_record(payload, index_count)], _LAYOUT[:3])
+    loop_seconds = time.perf_counter() - started
+    return index_count / vectorized_seconds, index_count / loop_seconds
+
+
+if __name__ == "__main__":
+    vectorized_rate, loop_rate = benchmark_mesh_import()
+    print(
+        f"GLB mesh import: {vectorized_rate:,.0f} vertices/s vectorized, "
+        f"{loop_rate:,.0f} vertices/s per-index loop"
+    )
@@ -37,6 +37,10 @@ TGFX_API bool tc_texture_ensure_loaded_ptr(tc_texture* tex);
 TGFX_API tc_texture* tc_texture_get(tc_texture_handle h);
 TGFX_API bool tc_texture_is_valid(tc_texture_handle h);
 TGFX_API bool tc_texture_destroy(tc_texture_handle h);
+// Free pixel data of a loaded texture but keep its UUID entry and handles
+// valid: the next tc_texture_ensure_loaded() goes through the resource loader
+// again. Destroy hooks fire so GPU-side caches drop their images too.
+TGFX_API bool tc_texture_unload(tc_texture_handle h);
 TGFX_API bool tc_texture_contains(const char* uuid);
 TGFX_API size_t tc_texture_count(void);
 
@@ -42,6 +42,11 @@ namespace tgfx_bindings {
             .def_prop_ro("transpose", &TcTexture::transpose)
             .def_prop_ro("source_path", &TcTexture::source_path)
             .def_prop_ro("data_size", &TcTexture::data_size)
+            .def_prop_ro("ref_count",
+                         [](const TcTexture& self) -> uint32_t {
+                             tc_texture* t = self.get();
+                             return t ? t->header.ref_count : 0;
+                         })
 
             // Data as numpy array (read-only, returns copy)
             .def_prop_ro("data",
@@ -212,6 +217,12 @@ namespace tgfx_bindings {
             [](TcTexture& handle) { return tc_texture_ensure_loaded(handle.handle); },
             nb::arg("handle"),
             "Ensure texture is loaded (triggers callback if needed)");
+
+        m.def(
+            "tc_texture_unload",
+            [](TcTexture& handle) { return tc_texture_unload(handle.handle); },
+            nb::arg("handle"),
+            "Free texture data, keeping the declaration for lazy reload");
     }
 
 } // namespace tgfx_bindings
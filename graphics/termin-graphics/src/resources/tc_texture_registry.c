@@ -334,6 +334,27 @@ bool tc_texture_destroy(tc_texture_handle h) {
     return tc_pool_free_slot(&g_texture_pool, h);
 }
 
+bool tc_texture_unload(tc_texture_handle h) {
+    if (!g_texture_initialized)
+        return false;
+
+    tc_texture* tex = tc_texture_get(h);
+    if (!tex)
+        return false;
+    if (!tex->header.is_loaded)
+        return true;
+
+    const uint32_t pool_index = tex->header.pool_index;
+    for (int i = 0; i < g_destroy_hook_count; i++) {
+        g_destroy_hooks[i](pool_index, g_destroy_hook_user[i]);
+    }
+
+    texture_free_data(tex);
+    tex->header.is_loaded = 0;
+    tex->header.version++;
+    return true;
+}
+
 void tc_texture_registry_add_destroy_hook(tc_texture_destroy_hook_fn cb, void* user_data) {
     if (!cb)
         return;
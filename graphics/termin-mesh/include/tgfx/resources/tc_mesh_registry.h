@@ -40,6 +40,10 @@ static inline const char* tc_mesh_name(tc_mesh_handle h) {
 
 TGFX_API bool tc_mesh_is_valid(tc_mesh_handle h);
 TGFX_API bool tc_mesh_destroy(tc_mesh_handle h);
+// Free CPU data of a loaded mesh but keep its UUID entry and handles valid:
+// the next tc_mesh_ensure_loaded() goes through the resource loader again.
+// Destroy hooks fire so GPU-side caches drop their buffers too.
+TGFX_API bool tc_mesh_unload(tc_mesh_handle h);
 TGFX_API bool tc_mesh_contains(const char* uuid);
 TGFX_API size_t tc_mesh_count(void);
 
@@ -374,6 +374,11 @@ namespace tmesh_bindings {
             .def_prop_ro("submesh_count", &TcMesh::submesh_count)
             .def_prop_ro("triangle_count", &TcMesh::triangle_count)
             .def_prop_ro("stride", &TcMesh::stride)
+            .def_prop_ro("ref_count",
+                         [](const TcMesh& h) -> uint32_t {
+                             tc_mesh* m = h.get();
+                             return m ? m->header.ref_count : 0;
+                         })
             .def_prop_rw("draw_mode", &TcMesh::draw_mode, &TcMesh::set_draw_mode)
             .def_prop_ro("mesh",
                          [](const TcMesh& h) -> nb::object {
@@ -757,6 +762,12 @@ namespace tmesh_bindings {
             [](TcMesh& handle) { return tc_mesh_ensure_loaded(handle.handle); },
             nb::arg("handle"),
             "Ensure mesh is loaded (triggers callback if needed)");
+
+        m.def(
+            "tc_mesh_unload",
+            [](TcMesh& handle) { return tc_mesh_unload(handle.handle); },
+            nb::arg("handle"),
+            "Free mesh data, keeping the declaration for lazy reload");
     }
 
 } // namespace tmesh_bindings
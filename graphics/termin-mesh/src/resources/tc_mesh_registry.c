@@ -371,6 +371,29 @@ bool tc_mesh_destroy(tc_mesh_handle h) {
     return tc_pool_free_slot(&g_mesh_pool, h);
 }
 
+bool tc_mesh_unload(tc_mesh_handle h) {
+    if (!g_initialized)
+        return false;
+
+    tc_mesh* mesh = tc_mesh_get(h);
+    if (!mesh)
+        return false;
+    if (!mesh->header.is_loaded)
+        return true;
+
+    const uint32_t pool_index = mesh->header.pool_index;
+    for (int i = 0; i < g_destroy_hook_count; i++) {
+        g_destroy_hooks[i](pool_index, g_destroy_hook_user[i]);
+    }
+
+    mesh_free_data(mesh);
+    mesh->vertex_count = 0;
+    mesh->index_count = 0;
+    mesh->header.is_loaded = 0;
+    mesh->header.version++;
+    return true;
+}
+
 void tc_mesh_registry_add_destroy_hook(tc_mesh_destroy_hook_fn cb, void* user_data) {
     if (!cb)
         return;
@@ -152,6 +152,12 @@ def __getattr__(name: str):
         globals()["PolygonBuilder"] = PolygonBuilder
         return PolygonBuilder
 
+    if name == "TiledNavMeshBuilder":
+        from termin.navmesh.tiled_builder import TiledNavMeshBuilder
+
+        globals()["TiledNavMeshBuilder"] = TiledNavMeshBuilder
+        return TiledNavMeshBuilder
+
     if name in _DATA_EXPORT_NAMES:
         return _load_data_exports()[name]
 
@@ -167,6 +173,7 @@ __all__ = [
     "NavPolygon",
     "PolygonBuilder",
     "Portal",
+    "TiledNavMeshBuilder",
     "DetourClosestPointResult",
     "DetourNavMeshTileBuildResult",
     "DetourPathfindingWorldComponent",
@@ -16,6 +16,7 @@ from termin.input import MouseButtonEvent
 from termin.inspect import InspectField
 
 if TYPE_CHECKING:
+    from termin.navmesh.crowd_component import NavMeshCrowdComponent
     from termin.navmesh.pathfinding_world_component import PathfindingWorldComponent
 
 
@@ -27,6 +28,9 @@ class NavMeshAgentComponent(InputComponent):
     1. Добавить компонент к entity агента
     2. ЛКМ клик по NavMesh — агент идёт к точке клика
     3. Или вызвать set_destination(target) программно
+
+    С use_crowd=True движением управляет NavMeshCrowdComponent сцены:
+    агент регистрируется в нём при получении пути и не обновляется поштучно.
     """
 
     component_category = "Navigation"
@@ -58,9 +62,14 @@ class NavMeshAgentComponent(InputComponent):
             label="Click To Move",
             kind="bool",
         ),
+        "use_crowd": InspectField(
+            path="use_crowd",
+            label="Use Crowd",
+            kind="bool",
+        ),
     }
 
-    serializable_fields = ["speed", "stopping_distance", "debug_draw_path", "click_to_move"]
+    serializable_fields = ["speed", "stopping_distance", "debug_draw_path", "click_to_move", "use_crowd"]
 
     def __init__(
         self,
@@ -68,6 +77,7 @@ class NavMeshAgentComponent(InputComponent):
         stopping_distance: float = 0.1,
         debug_draw_path: bool = True,
         click_to_move: bool = True,
+        use_crowd: bool = False,
     ) -> None:
         super().__init__(enabled=True)
 
@@ -77,12 +87,16 @@ class NavMeshAgentComponent(InputComponent):
         self.stopping_distance: float = stopping_distance
         self.debug_draw_path: bool = debug_draw_path
         self.click_to_move: bool = click_to_move
+        self.use_crowd: bool = use_crowd
 
         self._pathfinding_world: Optional["PathfindingWorldComponent"] = None
         self._current_path: List[np.ndarray] = []
         self._current_path_index: int = 0
         self._destination: Optional[np.ndarray] = None
         self._is_moving: bool = False
+        # Толпа, которая двигает агента (use_crowd), и слот в ней
+        self._crowd: Optional["NavMeshCrowdComponent"] = None
+        self._crowd_slot: int = -1
 
     @property
     def is_moving(self) -> bool:
@@ -136,6 +150,24 @@ class NavMeshAgentComponent(InputComponent):
 
         log.warn("[NavMeshAgent] PathfindingWorldComponent not found in scene")
 
+    def _find_crowd(self) -> Optional["NavMeshCrowdComponent"]:
+        """Найти NavMeshCrowdComponent сцены."""
+        from termin.navmesh.crowd_component import NavMeshCrowdComponent
+
+        scene = self.entity.scene if self.entity else None
+        if scene is None:
+            return None
+
+        for entity in scene.get_all_entities():
+            comp = entity.get_component(NavMeshCrowdComponent)
+            if comp is None:
+                comp = self._search_in_children(entity, NavMeshCrowdComponent)
+            if comp is not None:
+                return comp
+
+        log.warn("[NavMeshAgent] use_crowd is set but NavMeshCrowdComponent not found in scene")
+        return None
+
     def _search_in_children(self, entity, component_class):
         """Рекурсивный поиск компонента в детях."""
         for child_transform in entity.transform.children:
@@ -170,18 +202,70 @@ class NavMeshAgentComponent(InputComponent):
             return False
 
         # Получаем текущую позицию агента (мировые координаты)
-        position = self.entity.transform.global_position
-        start = np.array([position.x, position.y, position.z], dtype=np.float32)
-        log.info(f"[NavMeshAgent] agent position: ({position.x:.2f}, {position.y:.2f}, {position.z:.2f})")
+        start = self._world_position()
+        log.info(f"[NavMeshAgent] agent position: ({start[0]:.2f}, {start[1]:.2f}, {start[2]:.2f})")
 
         # Ищем путь
         log.info("[NavMeshAgent] calling find_path")
         path = self._pathfinding_world.find_path(start, target)
         log.info(f"[NavMeshAgent] find_path returned: {path}")
+        return self._apply_path(target, path)
+
+    @staticmethod
+    def set_destinations(
+        agents: List["NavMeshAgentComponent"],
+        targets: np.ndarray,
+    ) -> List[bool]:
+        """
+        Установить цели группе агентов одним пакетным запросом.
+
+        Пути ищутся через PathfindingWorldComponent.find_paths: агенты с общей
+        целью разделяют поиск треугольника цели и поле направлений.
+
+        Args:
+            agents: Агенты.
+            targets: (N, 3) — цели для каждого агента, или (3,) — общая цель.
+
+        Returns:
+            Для каждого агента True, если путь найден.
+        """
+        targets = np.asarray(targets, dtype=np.float32)
+        if targets.ndim == 1:
+            targets = np.broadcast_to(targets.reshape(1, 3), (len(agents), 3))
+
+        results = [False] * len(agents)
+        # Группируем по миру навигации — обычно он один на сцену
+        batches: dict[int, tuple["PathfindingWorldComponent", List[int]]] = {}
+        for i, agent in enumerate(agents):
+            if agent._pathfinding_world is None:
+                agent._find_pathfinding_world()
+            if agent._pathfinding_world is None or agent.entity is None:
+                log.warn("[NavMeshAgent] set_destinations: agent has no PathfindingWorld or entity")
+                continue
+            world = agent._pathfinding_world
+            batches.setdefault(id(world), (world, []))[1].append(i)
+
+        for world, indices in batches.values():
+            starts = np.array([agents[i]._world_position() for i in indices], dtype=np.float32)
+            paths = world.find_paths(starts, targets[indices])
+            for i, path in zip(indices, paths, strict=True):
+                results[i] = agents[i]._apply_path(np.array(targets[i]), path)
+
+        return results
+
+    def _world_position(self) -> np.ndarray:
+        """Текущая позиция агента в мировых координатах."""
+        position = self.entity.transform.global_position
+        return np.array([position.x, position.y, position.z], dtype=np.float32)
+
+    def _apply_path(self, target: np.ndarray, path: Optional[List[np.ndarray]]) -> bool:
+        """Принять найденный путь (или его отсутствие) как текущий."""
         if path is None or len(path) == 0:
             log.info(f"[NavMeshAgent] no path found to ({target[0]:.2f}, {target[1]:.2f}, {target[2]:.2f})")
             self._current_path = []
             self._is_moving = False
+            if self._crowd is not None:
+                self._crowd.stop_agent(self)
             return False
 
         self._destination = target.copy()
@@ -189,6 +273,13 @@ class NavMeshAgentComponent(InputComponent):
         self._current_path_index = 0
         self._is_moving = True
 
+        if self.use_crowd:
+            crowd = self._crowd if self._crowd is not None else self._find_crowd()
+            if crowd is not None:
+                crowd.set_agent_path(self, path)
+        elif self._crowd is not None:
+            self._crowd.unregister(self)
+
         log.info(f"[NavMeshAgent] path found with {len(path)} waypoints")
         return True
 
@@ -198,9 +289,20 @@ class NavMeshAgentComponent(InputComponent):
         self._current_path = []
         self._current_path_index = 0
         self._destination = None
+        if self._crowd is not None:
+            self._crowd.stop_agent(self)
+
+    def on_removed(self) -> None:
+        if self._crowd is not None:
+            self._crowd.unregister(self)
+        super().on_removed()
 
     def update(self, dt: float) -> None:
         """Обновление — движение к следующей точке пути."""
+        if self._crowd is not None:
+            # Движение выполняет NavMeshCrowdComponent
+            return
+
         if not self._is_moving or not self.has_path:
             return
 
@@ -33,8 +33,18 @@ from tcbase import log
 
 if TYPE_CHECKING:
     from termin.voxels.grid import VoxelGrid
-    from termin.navmesh.types import NavMesh
+    from termin.navmesh.types import NavMesh, NavMeshConfig
     from termin.navmesh.polygon_builder import PolygonBuilder
+    from termin.navmesh.tiled_builder import TiledNavMeshBuilder
+
+
+# PolygonBuilder options shared by the full and the tiled build
+_NAVMESH_BUILD_OPTIONS = {
+    "do_expand_regions": False,
+    "share_boundary": False,
+    "project_contours": False,
+    "stitch_contours": False,
+}
 
 
 def _build_navmesh_action(component: "NavMeshBuilderComponent") -> None:
@@ -74,6 +84,22 @@ class NavMeshBuilderComponent(DrawableComponent):
         "voxelize_source": make_voxelize_source_field(),
         # --- NavMesh parameters ---
         **make_navmesh_polygon_build_fields(include_watershed=True),
+        "tile_size": InspectField(
+            path="tile_size",
+            label="Tile Size (voxels, 0 = off)",
+            kind="int",
+            min=0,
+            max=4096,
+            step=8,
+        ),
+        "bake_workers": InspectField(
+            path="bake_workers",
+            label="Bake Processes (0 = all cores)",
+            kind="int",
+            min=0,
+            max=256,
+            step=1,
+        ),
         "build_btn": make_button_field("Build NavMesh", _build_navmesh_action),
         # --- Debug ---
         **make_navmesh_debug_fields((
@@ -94,6 +120,7 @@ class NavMeshBuilderComponent(DrawableComponent):
         "min_edge_length", "min_contour_edge_length", "max_vertex_valence",
         "use_delaunay_flip", "use_valence_flip", "use_angle_flip", "use_cvt_smoothing",
         "use_edge_collapse", "use_second_pass", "use_watershed", "watershed_smoothing",
+        "tile_size", "bake_workers",
         "show_region_voxels", "show_simplified_contours", "show_triangulated",
         "show_distance_field", "show_local_maxima", "show_peaks", "show_watershed_regions",
         "color_seed",
@@ -119,6 +146,8 @@ class NavMeshBuilderComponent(DrawableComponent):
         use_second_pass: bool = False,
         use_watershed: bool = False,
         watershed_smoothing: int = 0,
+        tile_size: int = 0,
+        bake_workers: int = 1,
         show_region_voxels: bool = False,
         show_simplified_contours: bool = False,
         show_triangulated: bool = False,
@@ -147,6 +176,8 @@ class NavMeshBuilderComponent(DrawableComponent):
         self.use_second_pass = use_second_pass
         self.use_watershed = use_watershed
         self.watershed_smoothing = watershed_smoothing
+        self.tile_size = tile_size
+        self.bake_workers = bake_workers
 
         # Debug visualization
         self.show_region_voxels: bool = show_region_voxels
@@ -185,6 +216,8 @@ class NavMeshBuilderComponent(DrawableComponent):
 
         # Generated NavMesh artifact (loaded from ArtifactStore or built)
         self._navmesh: Optional["NavMesh"] = None
+        # Tile cache of the last tiled build (tile_size > 0)
+        self._tiled_builder: Optional["TiledNavMeshBuilder"] = None
 
         log.warning("NavMeshBuilderComponent: " + str(self))
 
@@ -617,33 +650,105 @@ class NavMeshBuilderComponent(DrawableComponent):
         Build NavMesh from entity mesh.
 
         Performs voxelization and NavMesh building in one step.
-        Voxels are not saved to file.
+        Voxels are not saved to file. With tile_size > 0 the NavMesh is built
+        per tile and later edits can be applied with mark_dirty_bounds() +
+        rebuild_dirty().
 
         Returns:
             True if successful, False on error.
         """
-        from termin.voxels.native_voxelizer import voxelize_mesh_native
-        from termin.navmesh import PolygonBuilder, NavMeshConfig
-        import math
-
         log.warning("NavMeshBuilderComponent: starting build")
 
-        if self.entity is None:
-            log.error("NavMeshBuilderComponent: no entity")
+        grid = self._voxelize()
+        if grid is None:
             return False
 
-        # Get agent type info
-        manager = NavigationSettingsManager.instance()
-        agent_type = manager.settings.get_agent_type(self.agent_type_name)
-        if agent_type is not None:
-            log.warning(f"NavMeshBuilderComponent: using agent type '{agent_type.name}' "
-                  f"(radius={agent_type.radius}, height={agent_type.height}, max_slope={agent_type.max_slope}°)")
-            max_slope_cos = math.cos(math.radians(agent_type.max_slope))
-            agent_radius = agent_type.radius
+        # Build NavMesh
+        log.warning("NavMeshBuilderComponent: building NavMesh...")
+        config = self._make_config(grid)
+
+        if self.tile_size > 0:
+            from termin.navmesh.tiled_builder import TiledNavMeshBuilder
+
+            tiled = TiledNavMeshBuilder(config, tile_size=self.tile_size, **_NAVMESH_BUILD_OPTIONS)
+            navmesh = tiled.build(grid)
+            self._tiled_builder = tiled
+            builder = tiled._builder
         else:
-            log.warning(f"NavMeshBuilderComponent: agent type '{self.agent_type_name}' not found, using defaults")
-            max_slope_cos = 0.0  # Без фильтрации по наклону
-            agent_radius = 0.0  # Без эрозии
+            from termin.navmesh import PolygonBuilder
+
+            self._tiled_builder = None
+            builder = PolygonBuilder(config)
+            navmesh = builder.build(grid, **_NAVMESH_BUILD_OPTIONS)
+
+        self._publish(navmesh, grid, builder)
+        return True
+
+    def mark_dirty_bounds(self, bounds_min: np.ndarray, bounds_max: np.ndarray) -> int:
+        """
+        Mark NavMesh tiles overlapping a world-space AABB as dirty.
+
+        Call with the old and the new bounds of a moved or edited object,
+        then rebuild_dirty(). Has no effect until a tiled build exists.
+
+        Returns:
+            Number of tiles marked.
+        """
+        if self._tiled_builder is None or self.entity is None:
+            return 0
+
+        # Меши вокселизуются в локальных координатах entity
+        root_inv = np.linalg.inv(self.entity.model_matrix())
+        lo = np.asarray(bounds_min, dtype=np.float64)
+        hi = np.asarray(bounds_max, dtype=np.float64)
+        corners = np.array([
+            [x, y, z, 1.0]
+            for x in (lo[0], hi[0])
+            for y in (lo[1], hi[1])
+            for z in (lo[2], hi[2])
+        ])
+        local = (root_inv @ corners.T).T[:, :3]
+        keys = self._tiled_builder.mark_dirty(local.min(axis=0), local.max(axis=0))
+        return len(keys)
+
+    def rebuild_dirty(self) -> bool:
+        """
+        Rebuild only the dirty tiles and re-register the NavMesh.
+
+        Falls back to a full build() when there is no tiled build yet.
+
+        Returns:
+            True if successful, False on error.
+        """
+        tiled = self._tiled_builder
+        if tiled is None or self.tile_size <= 0:
+            return self.build()
+
+        grid = self._voxelize()
+        if grid is None:
+            return False
+
+        tiled.config = self._make_config(grid)
+        tiled._builder.config = tiled.config
+        navmesh = tiled.update(grid)
+        log.warning(f"NavMeshBuilderComponent: rebuilt tiles {tiled.last_rebuilt_tiles}")
+
+        self._publish(navmesh, grid, tiled._builder)
+
+        # Граф поиска пути переиспользует регионы неизменённых тайлов
+        from termin.navmesh.pathfinding_world_component import PathfindingWorldComponent
+        world = PathfindingWorldComponent.instance()
+        if world is not None:
+            world.rebuild()
+        return True
+
+    def _voxelize(self) -> Optional["VoxelGrid"]:
+        """Voxelize the entity meshes (with surface normals for NavMesh)."""
+        from termin.voxels.native_voxelizer import voxelize_mesh_native
+
+        if self.entity is None:
+            log.error("NavMeshBuilderComponent: no entity")
+            return None
 
         # Collect meshes
         root_world = self.entity.model_matrix()
@@ -654,7 +759,7 @@ class NavMeshBuilderComponent(DrawableComponent):
 
         if not meshes:
             log.error("NavMeshBuilderComponent: no meshes found")
-            return False
+            return None
 
         if len(meshes) > 1:
             log.warning(f"NavMeshBuilderComponent: found {len(meshes)} meshes")
@@ -662,7 +767,7 @@ class NavMeshBuilderComponent(DrawableComponent):
         mesh = self._create_combined_mesh(meshes)
         if mesh is None:
             log.error("NavMeshBuilderComponent: failed to create combined mesh")
-            return False
+            return None
 
         # Voxelize (with normals for NavMesh)
         log.warning("NavMeshBuilderComponent: voxelizing...")
@@ -675,25 +780,44 @@ class NavMeshBuilderComponent(DrawableComponent):
             compute_normals=True,
         )
 
-        name = self.navmesh_name.strip()
-        if not name:
-            name = self.entity.name or "navmesh"
-
-        grid.name = name
+        grid.name = self._navmesh_display_name()
         self._debug_grid = grid
 
         log.warning(f"NavMeshBuilderComponent: voxelized {grid.voxel_count} voxels")
 
         if not grid.surface_normals:
             log.error("NavMeshBuilderComponent: voxel grid has no surface normals")
-            return False
+            return None
+        return grid
+
+    def _navmesh_display_name(self) -> str:
+        name = self.navmesh_name.strip()
+        if not name:
+            name = self.entity.name or "navmesh"
+        return name
+
+    def _make_config(self, grid: "VoxelGrid") -> "NavMeshConfig":
+        """NavMeshConfig from component fields and the selected agent type."""
+        from termin.navmesh import NavMeshConfig
+        import math
+
+        # Get agent type info
+        manager = NavigationSettingsManager.instance()
+        agent_type = manager.settings.get_agent_type(self.agent_type_name)
+        if agent_type is not None:
+            log.warning(f"NavMeshBuilderComponent: using agent type '{agent_type.name}' "
+                  f"(radius={agent_type.radius}, height={agent_type.height}, max_slope={agent_type.max_slope}°)")
+            max_slope_cos = math.cos(math.radians(agent_type.max_slope))
+            agent_radius = agent_type.radius
+        else:
+            log.warning(f"NavMeshBuilderComponent: agent type '{self.agent_type_name}' not found, using defaults")
+            max_slope_cos = 0.0  # Без фильтрации по наклону
+            agent_radius = 0.0  # Без эрозии
 
-        # Build NavMesh
-        log.warning("NavMeshBuilderComponent: building NavMesh...")
         normal_threshold = math.cos(math.radians(self.normal_angle))
         contour_epsilon = self.contour_simplify * grid.cell_size
 
-        config = NavMeshConfig(
+        return NavMeshConfig(
             max_slope_cos=max_slope_cos,
             agent_radius=agent_radius,
             normal_threshold=normal_threshold,
@@ -710,17 +834,11 @@ class NavMeshBuilderComponent(DrawableComponent):
             use_second_pass=self.use_second_pass,
             use_watershed=self.use_watershed,
             watershed_smoothing=self.watershed_smoothing,
-        )
-        builder = PolygonBuilder(config)
-
-        navmesh = builder.build(
-            grid,
-            do_expand_regions=False,
-            share_boundary=False,
-            project_contours=False,
-            stitch_contours=False,
+            bake_workers=self.bake_workers,
         )
 
+    def _publish(self, navmesh: "NavMesh", grid: "VoxelGrid", builder: "PolygonBuilder") -> None:
+        """Save debug data, store the artifact and register the NavMesh."""
         # Save debug data
         self._debug_regions = builder._last_regions
         self._debug_watershed_regions = builder._last_watershed_regions
@@ -737,7 +855,7 @@ class NavMeshBuilderComponent(DrawableComponent):
         log.warning(f"NavMeshBuilderComponent: built NavMesh with {navmesh.polygon_count()} polygons, {navmesh.triangle_count()} triangles")
 
         # Set navmesh name
-        navmesh.name = name
+        navmesh.name = grid.name
         self._navmesh = navmesh
 
         # Save generated artifact
@@ -750,8 +868,6 @@ class NavMeshBuilderComponent(DrawableComponent):
             registry.register(self.agent_type_name, navmesh, self.entity)
             log.warning(f"NavMeshBuilderComponent: registered in NavMeshRegistry for agent type '{self.agent_type_name}'")
 
-        return True
-
     # --- Debug mesh building ---
 
     def _rebuild_debug_meshes(self) -> None:
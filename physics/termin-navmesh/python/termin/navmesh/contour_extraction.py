@@ -17,6 +17,136 @@ from tcbase import log
 from termin.navmesh.triangulation import build_2d_basis
 
 
+# Максимальный объём плотного bbox (в ячейках), при котором алгоритмы
+# работают на ndarray. Для больших регионов используется разреженный путь
+# на множествах кортежей.
+DENSE_REGION_MAX_CELLS = 16 * 1024 * 1024
+
+_SQRT2 = math.sqrt(2.0)
+_SQRT3 = math.sqrt(3.0)
+
+
+def _chamfer_pass_rows(distance: np.ndarray, forward: bool) -> None:
+    """
+    Один проход 2D chamfer-преобразования (веса 1 и sqrt(2)) по строкам.
+
+    Прямой проход учитывает соседей (v-1, u-1..u+1) и (v, u-1) в порядке
+    растровой развёртки, обратный — зеркально. Вклад предыдущей строки
+    считается векторно, распространение внутри строки — через cumulative
+    minimum. Модифицирует distance на месте.
+    """
+    height, width = distance.shape
+    idx = np.arange(width, dtype=np.float64)
+    rows = range(height) if forward else range(height - 1, -1, -1)
+    prev_v = -1
+
+    for v in rows:
+        row = distance[v]
+        if prev_v >= 0:
+            prev = distance[prev_v]
+            np.minimum(row, prev + 1.0, out=row)
+            if width > 1:
+                np.minimum(row[1:], prev[:-1] + _SQRT2, out=row[1:])
+                np.minimum(row[:-1], prev[1:] + _SQRT2, out=row[:-1])
+        if forward:
+            # row[u] = min_{k <= u} row[k] + (u - k)
+            distance[v] = np.minimum.accumulate(row - idx) + idx
+        else:
+            # row[u] = min_{k >= u} row[k] + (k - u)
+            distance[v] = np.minimum.accumulate((row + idx)[::-1])[::-1] - idx
+        prev_v = v
+
+
+def chamfer_distance_transform_2d(seeds: np.ndarray) -> np.ndarray:
+    """
+    Точное 8-связное chamfer-расстояние (веса 1, sqrt(2)) до ближайшего seed.
+
+    Args:
+        seeds: 2D булев массив, True — ячейки с нулевым расстоянием.
+
+    Returns:
+        2D массив float64 той же формы (inf, если seed нет).
+    """
+    distance = np.where(seeds, 0.0, np.inf)
+    if distance.size == 0:
+        return distance
+    _chamfer_pass_rows(distance, forward=True)
+    _chamfer_pass_rows(distance, forward=False)
+    return distance
+
+
+def chamfer_distance_transform_3d(seeds: np.ndarray) -> np.ndarray:
+    """
+    Точное 26-связное chamfer-расстояние (веса 1, sqrt(2), sqrt(3)) до seed.
+
+    Двухпроходная растровая развёртка по осям (0, 1, 2): вклад соседнего
+    слоя считается векторно, внутри слоя — 2D проход по строкам.
+
+    Args:
+        seeds: 3D булев массив, True — ячейки с нулевым расстоянием.
+
+    Returns:
+        3D массив float64 той же формы (inf, если seed нет).
+    """
+    distance = np.where(seeds, 0.0, np.inf)
+    if distance.size == 0:
+        return distance
+
+    depth = distance.shape[0]
+    # (d1, d2, weight) для соседей в соседнем слое
+    slab_offsets = [
+        (d1, d2, 1.0 if d1 == 0 and d2 == 0 else (_SQRT2 if d1 == 0 or d2 == 0 else _SQRT3))
+        for d1 in (-1, 0, 1)
+        for d2 in (-1, 0, 1)
+    ]
+
+    def apply_slab(target: np.ndarray, source: np.ndarray) -> None:
+        n1, n2 = target.shape
+        for d1, d2, weight in slab_offsets:
+            t1 = slice(max(0, d1), n1 + min(0, d1))
+            s1 = slice(max(0, -d1), n1 + min(0, -d1))
+            t2 = slice(max(0, d2), n2 + min(0, d2))
+            s2 = slice(max(0, -d2), n2 + min(0, -d2))
+            np.minimum(target[t1, t2], source[s1, s2] + weight, out=target[t1, t2])
+
+    for k in range(depth):
+        if k > 0:
+            apply_slab(distance[k], distance[k - 1])
+        _chamfer_pass_rows(distance[k], forward=True)
+    for k in range(depth - 1, -1, -1):
+        if k < depth - 1:
+            apply_slab(distance[k], distance[k + 1])
+        _chamfer_pass_rows(distance[k], forward=False)
+    return distance
+
+
+def compute_distance_field_3d_dense(occupancy: np.ndarray) -> np.ndarray:
+    """
+    Distance field для плотного 3D массива занятости.
+
+    Семантика совпадает с compute_distance_field_3d: граничные воксели
+    (с пустым 6-соседом или на краю массива) имеют distance = 0, остальные —
+    кратчайший 26-связный путь до границы. Кратчайший путь до границы
+    никогда не выходит за занятые воксели, поэтому он совпадает с
+    неограниченным chamfer-расстоянием.
+
+    Args:
+        occupancy: 3D булев массив.
+
+    Returns:
+        3D массив float64; пустые ячейки имеют distance = 0.
+    """
+    occupied = np.asarray(occupancy, dtype=bool)
+    padded = np.pad(occupied, 1, constant_values=False)
+    interior = occupied.copy()
+    for axis in range(3):
+        for shift in (-1, 1):
+            interior &= np.roll(padded, shift, axis=axis)[1:-1, 1:-1, 1:-1]
+    distance = chamfer_distance_transform_3d(occupied & ~interior)
+    distance[~occupied] = 0.0
+    return distance
+
+
 def compute_distance_field_3d(
     voxels: set[tuple[int, int, int]],
 ) -> dict[tuple[int, int, int], float]:
@@ -24,7 +154,9 @@ def compute_distance_field_3d(
     Вычислить distance field для набора вокселей в 3D.
 
     Расстояние = кратчайший путь до границы (вокселя с пустым соседом).
-    Использует Dijkstra с весами рёбер (1.0 для осевых, sqrt(2) для диагональных).
+    Веса рёбер: 1.0 для осевых, sqrt(2) и sqrt(3) для диагональных.
+    Если bbox набора помещается в DENSE_REGION_MAX_CELLS, считается через
+    compute_distance_field_3d_dense, иначе — Dijkstra по множеству.
 
     Args:
         voxels: Набор координат вокселей.
@@ -36,8 +168,27 @@ def compute_distance_field_3d(
     if not voxels:
         return {}
 
-    sqrt2 = math.sqrt(2)
-    sqrt3 = math.sqrt(3)
+    keys = list(voxels)
+    coords = np.array(keys, dtype=np.int64).reshape(-1, 3)
+    lo = coords.min(axis=0)
+    shape = coords.max(axis=0) - lo + 1
+    if int(np.prod(shape)) > DENSE_REGION_MAX_CELLS:
+        return _compute_distance_field_3d_sparse(voxels)
+
+    local = coords - lo
+    occupancy = np.zeros(tuple(int(s) for s in shape), dtype=bool)
+    occupancy[local[:, 0], local[:, 1], local[:, 2]] = True
+    distance = compute_distance_field_3d_dense(occupancy)
+    values = distance[local[:, 0], local[:, 1], local[:, 2]]
+    return dict(zip(keys, values.tolist(), strict=True))
+
+
+def _compute_distance_field_3d_sparse(
+    voxels: set[tuple[int, int, int]],
+) -> dict[tuple[int, int, int], float]:
+    """Dijkstra по множеству вокселей (для регионов с огромным bbox и как эталон)."""
+    if not voxels:
+        return {}
 
     # 6-связность для определения границы
     cardinal_6 = [
@@ -57,9 +208,9 @@ def compute_distance_field_3d(
                 if count == 1:
                     weight = 1.0
                 elif count == 2:
-                    weight = sqrt2
+                    weight = _SQRT2
                 else:
-                    weight = sqrt3
+                    weight = _SQRT3
                 directions_26.append((dx, dy, dz, weight))
 
     distance: dict[tuple[int, int, int], float] = {v: float('inf') for v in voxels}
@@ -104,8 +255,9 @@ def compute_distance_field_2d(
     """
     Вычислить distance field для 2D бинарной маски.
 
-    Расстояние = кратчайший путь до границы через заполненные ячейки.
-    Использует Dijkstra с весами рёбер.
+    Расстояние = кратчайший путь до границы через заполненные ячейки
+    (8-связность, веса 1 и sqrt(2)). Кратчайший путь до границы не выходит
+    из маски, поэтому считается chamfer-преобразованием всего массива.
 
     Args:
         mask: 2D массив (height, width), 1 = занято, 0 = пусто.
@@ -116,19 +268,34 @@ def compute_distance_field_2d(
         Граничные заполненные ячейки имеют distance = 0.
         Внутренние ячейки имеют distance > 0.
     """
-    import heapq
-    import math
+    filled = np.asarray(mask) != 0
+    # Граница: заполненная ячейка с пустым 4-соседом или на краю маски
+    padded = np.pad(filled, 1, constant_values=False)
+    interior = (
+        filled
+        & padded[1:-1, 2:]
+        & padded[1:-1, :-2]
+        & padded[2:, 1:-1]
+        & padded[:-2, 1:-1]
+    )
+    distance = chamfer_distance_transform_2d(filled & ~interior)
+    distance[~filled] = 0.0
+    return distance.astype(np.float32)
+
 
+def _compute_distance_field_2d_dijkstra(
+    mask: np.ndarray,
+) -> np.ndarray:
+    """Эталонный Dijkstra для compute_distance_field_2d (поячеечный)."""
     height, width = mask.shape
     distance = np.full((height, width), np.inf, dtype=np.float32)
     distance[mask == 0] = 0.0
 
     # 8-связность с весами
-    sqrt2 = math.sqrt(2)
     directions = [
         # (du, dv, weight)
         (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
-        (1, 1, sqrt2), (1, -1, sqrt2), (-1, 1, sqrt2), (-1, -1, sqrt2),
+        (1, 1, _SQRT2), (1, -1, _SQRT2), (-1, 1, _SQRT2), (-1, -1, _SQRT2),
     ]
 
     # 4-связность для определения границы
@@ -179,6 +346,20 @@ def compute_distance_field_2d(
     return distance
 
 
+# 8-связность (du, dv) в порядке обхода исходных поячеечных алгоритмов
+_DIRECTIONS_8 = [
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+    (1, 1), (1, -1), (-1, 1), (-1, -1),
+]
+
+
+def _shifted(array: np.ndarray, du: int, dv: int, fill) -> np.ndarray:
+    """array[v + dv, u + du] для каждой ячейки, fill за пределами массива."""
+    height, width = array.shape
+    padded = np.pad(array, 1, constant_values=fill)
+    return padded[1 + dv:1 + dv + height, 1 + du:1 + du + width]
+
+
 def smooth_distance_field_2d(
     distance_field: np.ndarray,
     mask: np.ndarray,
@@ -198,37 +379,25 @@ def smooth_distance_field_2d(
     Returns:
         Сглаженный distance field.
     """
-    height, width = distance_field.shape
+    mask = np.asarray(mask)
+    filled = mask != 0
     result = distance_field.copy()
 
-    # 8-связность
-    directions = [
-        (1, 0), (-1, 0), (0, 1), (0, -1),
-        (1, 1), (1, -1), (-1, 1), (-1, -1),
-    ]
+    # Число заполненных соседей не меняется между итерациями
+    count = np.ones(result.shape, dtype=result.dtype)
+    neighbor_masks = []
+    for du, dv in _DIRECTIONS_8:
+        neighbor_mask = _shifted(mask == 1, du, dv, False)
+        neighbor_masks.append(neighbor_mask)
+        count += neighbor_mask
 
+    zero = result.dtype.type(0)
     for _ in range(int(iterations)):
-        new_result = result.copy()
-
-        for v in range(height):
-            for u in range(width):
-                if mask[v, u] == 0:
-                    continue
-
-                # Собираем значения соседей
-                total = result[v, u]
-                count = 1
-
-                for du, dv in directions:
-                    nu, nv = u + du, v + dv
-                    if 0 <= nu < width and 0 <= nv < height:
-                        if mask[nv, nu] == 1:
-                            total += result[nv, nu]
-                            count += 1
-
-                new_result[v, u] = total / count
-
-        result = new_result
+        # Суммирование в том же порядке, что и поячеечный вариант
+        total = result.copy()
+        for (du, dv), neighbor_mask in zip(_DIRECTIONS_8, neighbor_masks, strict=True):
+            total += np.where(neighbor_mask, _shifted(result, du, dv, zero), zero)
+        result = np.where(filled, total / count, result).astype(distance_field.dtype, copy=False)
 
     return result
 
@@ -252,33 +421,17 @@ def find_distance_field_peaks_2d(
             all_local_maxima: Все локальные максимумы (до фильтрации плато).
             plateau_peaks: По одному пику на каждое плато.
     """
-    height, width = distance_field.shape
-
-    # 8-связность
-    directions = [
-        (1, 0), (-1, 0), (0, 1), (0, -1),
-        (1, 1), (1, -1), (-1, 1), (-1, -1),
-    ]
-
-    # Находим все ячейки, которые являются локальными максимумами или частью plateau
-    peak_candidates: set[tuple[int, int]] = set()
-
-    for v in range(height):
-        for u in range(width):
-            dist = distance_field[v, u]
-            if dist <= 0:
-                continue
+    directions = _DIRECTIONS_8
 
-            is_peak = True
-            for du, dv in directions:
-                nu, nv = u + du, v + dv
-                if 0 <= nu < width and 0 <= nv < height:
-                    if distance_field[nv, nu] > dist:
-                        is_peak = False
-                        break
+    # Кандидаты (локальные максимумы и plateau) — векторно по всему массиву
+    is_peak = distance_field > 0
+    for du, dv in directions:
+        is_peak &= ~(_shifted(distance_field, du, dv, -np.inf) > distance_field)
 
-            if is_peak:
-                peak_candidates.add((u, v))
+    # Тот же порядок вставки (v, затем u), что и у поячеечного обхода —
+    # от него зависит порядок обхода plateau ниже
+    peak_vs, peak_us = np.nonzero(is_peak)
+    peak_candidates: set[tuple[int, int]] = set(zip(peak_us.tolist(), peak_vs.tolist(), strict=True))
 
     if debug:
         log.warning(f"    peaks: candidates={len(peak_candidates)}")
@@ -388,29 +541,36 @@ def watershed_split_2d(
         labels[pv, pu] = idx + 1
 
     # 4-связность для flooding
-    directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    directions = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int64)
+    fillable = mask == 1
 
     # BFS для равномерного роста всех регионов
-    # Все регионы растут на один слой за итерацию
-    frontier: list[tuple[int, int]] = list(peaks)
-
-    while frontier:
-        next_frontier: list[tuple[int, int]] = []
-
-        for u, v in frontier:
-            current_label = labels[v, u]
-
-            for du, dv in directions:
-                nu, nv = u + du, v + dv
-                if 0 <= nu < width and 0 <= nv < height:
-                    if mask[nv, nu] == 1 and labels[nv, nu] == 0:
-                        labels[nv, nu] = current_label
-                        next_frontier.append((nu, nv))
+    # Все регионы растут на один слой за итерацию. Слой обрабатывается
+    # целиком массивами: кандидаты идут в порядке (ячейка фронта, направление),
+    # и спорную ячейку получает первый кандидат — как при поячеечном обходе.
+    frontier = np.array(peaks, dtype=np.int64).reshape(-1, 2)
+
+    while len(frontier) > 0:
+        current_labels = labels[frontier[:, 1], frontier[:, 0]]
+        nu = (frontier[:, 0:1] + directions[:, 0]).ravel()
+        nv = (frontier[:, 1:2] + directions[:, 1]).ravel()
+        source_labels = np.repeat(current_labels, len(directions))
+
+        inside = (nu >= 0) & (nu < width) & (nv >= 0) & (nv < height)
+        nu, nv, source_labels = nu[inside], nv[inside], source_labels[inside]
+        free = fillable[nv, nu] & (labels[nv, nu] == 0)
+        nu, nv, source_labels = nu[free], nv[free], source_labels[free]
+        if len(nu) == 0:
+            break
 
-        frontier = next_frontier
+        _, first = np.unique(nv * width + nu, return_index=True)
+        first.sort()
+        nu, nv = nu[first], nv[first]
+        labels[nv, nu] = source_labels[first]
+        frontier = np.stack([nu, nv], axis=1)
 
     # Перенумеруем метки
-    unique_labels = sorted(set(labels.flat) - {0})
+    unique_labels = np.unique(labels[labels > 0])
 
     if len(unique_labels) != len(peaks):
         log.warning(f"  watershed: WARNING peaks={len(peaks)}, but unique_labels={len(unique_labels)}")
@@ -419,12 +579,9 @@ def watershed_split_2d(
             count = int(np.sum(labels == label))
             log.warning(f"    peak {idx}: ({pu}, {pv}) -> label {label}, count={count}")
 
-    label_remap = {old: new for new, old in enumerate(unique_labels, 1)}
-    label_remap[0] = 0
-
-    new_labels = np.zeros_like(labels)
-    for old, new in label_remap.items():
-        new_labels[labels == old] = new
+    label_remap = np.zeros(int(labels.max()) + 1, dtype=labels.dtype)
+    label_remap[unique_labels] = np.arange(1, len(unique_labels) + 1, dtype=labels.dtype)
+    new_labels = label_remap[labels]
 
     return Watershed2DResult(
         labels=new_labels,
@@ -435,6 +592,177 @@ def watershed_split_2d(
     )
 
 
+# Смещения к 26-соседям, лексикографически большим (0, 0, 0): каждая пара
+# соседей региона рассматривается один раз, от меньшего вокселя к большему
+_FORWARD_NEIGHBOR_OFFSETS_26 = np.array([
+    (dx, dy, dz)
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    for dz in (-1, 0, 1)
+    if (dx, dy, dz) > (0, 0, 0)
+], dtype=np.int64)
+
+
+@dataclass
+class _RegionProjection:
+    """
+    Проекция воксельного региона на 2D маску.
+
+    Воксели проецируются на плоскость региона; ячейки между проекциями
+    соседних вокселей заполняются линиями Брезенхема, чтобы маска оставалась
+    связной.
+    """
+    region_voxels: list[tuple[int, int, int]]
+    mask: np.ndarray
+    """2D маска (height, width), 1 = занято. Вокруг — рамка из пустых ячеек."""
+    voxel_u: np.ndarray
+    """Столбец маски для каждого вокселя (в порядке region_voxels)."""
+    voxel_v: np.ndarray
+    """Строка маски для каждого вокселя."""
+    gap_cells: dict[tuple[int, int], tuple[int, int, int]]
+    """Ячейки, заполненные Брезенхемом -> воксель, который их нарисовал."""
+
+    @property
+    def width(self) -> int:
+        return self.mask.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.mask.shape[0]
+
+    def sample(self, field_2d: np.ndarray) -> dict[tuple[int, int, int], float]:
+        """Значения 2D поля в ячейках вокселей: {voxel: value}."""
+        values = field_2d[self.voxel_v, self.voxel_u]
+        return dict(zip(self.region_voxels, values.tolist(), strict=True))
+
+    def voxels_at(self, points_2d) -> set[tuple[int, int, int]]:
+        """Воксели, чьи ячейки маски попали в points_2d ((u, v) в координатах маски)."""
+        result: set[tuple[int, int, int]] = set()
+        points = list(points_2d)
+        if not points:
+            return result
+
+        cell_ids = self.voxel_v * self.width + self.voxel_u
+        order = np.argsort(cell_ids, kind="stable")
+        sorted_ids = cell_ids[order]
+
+        query = np.array(points, dtype=np.int64).reshape(-1, 2)
+        query_ids = query[:, 1] * self.width + query[:, 0]
+        starts = np.searchsorted(sorted_ids, query_ids, side="left").tolist()
+        ends = np.searchsorted(sorted_ids, query_ids, side="right").tolist()
+
+        for point, start, end in zip(points, starts, ends, strict=True):
+            if start < end:
+                for i in order[start:end].tolist():
+                    result.add(self.region_voxels[i])
+            else:
+                voxel = self.gap_cells.get((int(point[0]), int(point[1])))
+                if voxel is not None:
+                    result.add(voxel)
+        return result
+
+
+def _project_region(
+    region_voxels: list[tuple[int, int, int]],
+    region_normal: np.ndarray,
+    cell_size: float,
+    origin: np.ndarray,
+) -> _RegionProjection:
+    """
+    Спроецировать регион на 2D маску (см. _RegionProjection).
+
+    Проекция, центроид и округление считаются массивами с той же
+    арифметикой, что и поштучный вариант; соседние пары ищутся через
+    отсортированные линейные ключи, Брезенхем рисуется только для пар,
+    проекции которых не соприкасаются.
+    """
+    coords = np.array(region_voxels, dtype=np.int64).reshape(-1, 3)
+
+    u_axis, v_axis = build_2d_basis(region_normal)
+
+    # Центроид региона
+    world = origin + (coords + 0.5) * cell_size
+    centroid = world.astype(np.float32).mean(axis=0)
+
+    # Проецируем воксели на 2D
+    rel = world - centroid
+    u = rel[:, 0] * u_axis[0] + rel[:, 1] * u_axis[1] + rel[:, 2] * u_axis[2]
+    v = rel[:, 0] * v_axis[0] + rel[:, 1] * v_axis[1] + rel[:, 2] * v_axis[2]
+    grid_u = np.floor(u / cell_size + 0.5).astype(np.int64)
+    grid_v = np.floor(v / cell_size + 0.5).astype(np.int64)
+
+    # Брезенхем лежит внутри bbox своих концов, поэтому маску можно
+    # разметить по проекциям вокселей
+    min_u = int(grid_u.min())
+    max_u = int(grid_u.max())
+    min_v = int(grid_v.min())
+    max_v = int(grid_v.max())
+
+    width = max_u - min_u + 3
+    height = max_v - min_v + 3
+    offset_u = -min_u + 1
+    offset_v = -min_v + 1
+
+    voxel_u = grid_u + offset_u
+    voxel_v = grid_v + offset_v
+    mask = np.zeros((height, width), dtype=np.uint8)
+    mask[voxel_v, voxel_u] = 1
+
+    # Соседние пары в 3D: линейные ключи в bbox с рамкой в одну ячейку
+    local = coords - coords.min(axis=0) + 1
+    dims = local.max(axis=0) + 2
+    keys = (local[:, 0] * dims[1] + local[:, 1]) * dims[2] + local[:, 2]
+    key_order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[key_order]
+
+    pair_first: list[np.ndarray] = []
+    pair_second: list[np.ndarray] = []
+    pair_offset: list[np.ndarray] = []
+    for k, (dx, dy, dz) in enumerate(_FORWARD_NEIGHBOR_OFFSETS_26.tolist()):
+        neighbor_keys = keys + (dx * dims[1] + dy) * dims[2] + dz
+        pos = np.minimum(np.searchsorted(sorted_keys, neighbor_keys), len(keys) - 1)
+        found = sorted_keys[pos] == neighbor_keys
+        first = np.flatnonzero(found)
+        second = key_order[pos[found]]
+        # Концы, чьи проекции соприкасаются, не добавляют новых ячеек
+        far = np.maximum(
+            np.abs(grid_u[second] - grid_u[first]),
+            np.abs(grid_v[second] - grid_v[first]),
+        ) > 1
+        pair_first.append(first[far])
+        pair_second.append(second[far])
+        pair_offset.append(np.full(int(np.count_nonzero(far)), k, dtype=np.int64))
+
+    gap_cells: dict[tuple[int, int], tuple[int, int, int]] = {}
+    first = np.concatenate(pair_first)
+    if len(first) > 0:
+        second = np.concatenate(pair_second)
+        offsets = np.concatenate(pair_offset)
+        # Порядок поштучного обхода: воксель региона, затем смещение
+        order = np.lexsort((offsets, first))
+        first = first[order].tolist()
+        second = second[order].tolist()
+
+        occupied = set(zip(voxel_u.tolist(), voxel_v.tolist(), strict=True))
+        for a, b in zip(first, second, strict=True):
+            line_cells = bresenham_line(
+                int(voxel_u[a]), int(voxel_v[a]), int(voxel_u[b]), int(voxel_v[b]),
+            )
+            for cell in line_cells:
+                if cell not in occupied:
+                    occupied.add(cell)
+                    gap_cells[cell] = region_voxels[a]
+                    mask[cell[1], cell[0]] = 1
+
+    return _RegionProjection(
+        region_voxels=region_voxels,
+        mask=mask,
+        voxel_u=voxel_u,
+        voxel_v=voxel_v,
+        gap_cells=gap_cells,
+    )
+
+
 @dataclass
 class WatershedResult:
     """Результат watershed разбиения региона."""
@@ -468,24 +796,7 @@ def watershed_split_region(
     Returns:
         WatershedResult с под-регионами и промежуточными данными.
     """
-    # Вспомогательная функция для конвертации 2D точек в 3D воксели
-    def map_2d_to_3d(
-        points_2d,
-        grid_2d_to_voxels: dict[tuple[int, int], list[tuple[int, int, int]]],
-        offset_u: int,
-        offset_v: int,
-    ) -> set[tuple[int, int, int]]:
-        result: set[tuple[int, int, int]] = set()
-        for (pu, pv) in points_2d:
-            grid_u = pu - offset_u
-            grid_v = pv - offset_v
-            if (grid_u, grid_v) in grid_2d_to_voxels:
-                for voxel in grid_2d_to_voxels[(grid_u, grid_v)]:
-                    result.add(voxel)
-        return result
-
-    # Пустой результат для граничных случаев
-    def empty_result() -> WatershedResult:
+    if len(region_voxels) < 2:
         return WatershedResult(
             sub_regions=[region_voxels],
             distance_field={v: 0.0 for v in region_voxels},
@@ -493,71 +804,8 @@ def watershed_split_region(
             all_local_maxima=set(),
         )
 
-    if len(region_voxels) < 2:
-        return empty_result()
-
-    # Строим 2D проекцию
-    u_axis, v_axis = build_2d_basis(region_normal)
-
-    centers_3d = np.array([
-        origin + (np.array(v) + 0.5) * cell_size
-        for v in region_voxels
-    ], dtype=np.float32)
-    centroid = centers_3d.mean(axis=0)
-
-    # Проецируем воксели
-    voxel_to_2d: dict[tuple[int, int, int], tuple[int, int]] = {}
-    grid_2d_to_voxels: dict[tuple[int, int], list[tuple[int, int, int]]] = {}
-
-    for voxel in region_voxels:
-        vx, vy, vz = voxel
-        world_pos = origin + (np.array([vx, vy, vz]) + 0.5) * cell_size
-        rel_pos = world_pos - centroid
-        u = float(np.dot(rel_pos, u_axis))
-        v = float(np.dot(rel_pos, v_axis))
-        grid_u = _round_half_up(u / cell_size)
-        grid_v = _round_half_up(v / cell_size)
-        voxel_to_2d[voxel] = (grid_u, grid_v)
-        if (grid_u, grid_v) not in grid_2d_to_voxels:
-            grid_2d_to_voxels[(grid_u, grid_v)] = []
-        grid_2d_to_voxels[(grid_u, grid_v)].append(voxel)
-
-    # Связность через Bresenham
-    region_set = set(region_voxels)
-    for voxel in region_voxels:
-        vx, vy, vz = voxel
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                for dz in (-1, 0, 1):
-                    if dx == 0 and dy == 0 and dz == 0:
-                        continue
-                    neighbor = (vx + dx, vy + dy, vz + dz)
-                    if neighbor in region_set and neighbor > voxel:
-                        u1, v1 = voxel_to_2d[voxel]
-                        u2, v2 = voxel_to_2d[neighbor]
-                        line_cells = bresenham_line(u1, v1, u2, v2)
-                        for cell in line_cells:
-                            if cell not in grid_2d_to_voxels:
-                                grid_2d_to_voxels[cell] = [voxel]
-
-    # Создаём маску
-    all_2d = list(grid_2d_to_voxels.keys())
-    if not all_2d:
-        return empty_result()
-
-    min_u = min(p[0] for p in all_2d)
-    max_u = max(p[0] for p in all_2d)
-    min_v = min(p[1] for p in all_2d)
-    max_v = max(p[1] for p in all_2d)
-
-    width = max_u - min_u + 3
-    height = max_v - min_v + 3
-    offset_u = -min_u + 1
-    offset_v = -min_v + 1
-
-    mask = np.zeros((height, width), dtype=np.uint8)
-    for (gu, gv) in all_2d:
-        mask[gv + offset_v, gu + offset_u] = 1
+    projection = _project_region(region_voxels, region_normal, cell_size, origin)
+    mask = projection.mask
 
     # Distance field
     distance_field_2d = compute_distance_field_2d(mask)
@@ -565,20 +813,10 @@ def watershed_split_region(
     # Watershed (возвращает сглаженный df и пики)
     ws_result = watershed_split_2d(mask, distance_field_2d, smoothing)
 
-    # Конвертируем 2D distance field в 3D
-    distance_field_3d: dict[tuple[int, int, int], float] = {}
-    for voxel in region_voxels:
-        grid_u, grid_v = voxel_to_2d[voxel]
-        mask_u = grid_u + offset_u
-        mask_v = grid_v + offset_v
-        if 0 <= mask_u < width and 0 <= mask_v < height:
-            distance_field_3d[voxel] = float(ws_result.smoothed_distance_field[mask_v, mask_u])
-        else:
-            distance_field_3d[voxel] = 0.0
-
-    # Конвертируем пики в 3D
-    peaks_3d = map_2d_to_3d(ws_result.peaks, grid_2d_to_voxels, offset_u, offset_v)
-    all_local_maxima_3d = map_2d_to_3d(ws_result.all_local_maxima, grid_2d_to_voxels, offset_u, offset_v)
+    # Конвертируем 2D distance field и пики в 3D
+    distance_field_3d = projection.sample(ws_result.smoothed_distance_field)
+    peaks_3d = projection.voxels_at(ws_result.peaks)
+    all_local_maxima_3d = projection.voxels_at(ws_result.all_local_maxima)
 
     if ws_result.num_regions <= 1:
         return WatershedResult(
@@ -589,18 +827,12 @@ def watershed_split_region(
         )
 
     # Собираем воксели по меткам
-    sub_regions: dict[int, list[tuple[int, int, int]]] = {i: [] for i in range(1, ws_result.num_regions + 1)}
-
-    for voxel in region_voxels:
-        grid_u, grid_v = voxel_to_2d[voxel]
-        mask_u = grid_u + offset_u
-        mask_v = grid_v + offset_v
-        if 0 <= mask_u < width and 0 <= mask_v < height:
-            label = ws_result.labels[mask_v, mask_u]
-            if label > 0:
-                sub_regions[label].append(voxel)
-
-    result_regions = [voxels for voxels in sub_regions.values() if voxels]
+    voxel_labels = ws_result.labels[projection.voxel_v, projection.voxel_u]
+    result_regions = [
+        [region_voxels[i] for i in np.flatnonzero(voxel_labels == label).tolist()]
+        for label in range(1, ws_result.num_regions + 1)
+    ]
+    result_regions = [voxels for voxels in result_regions if voxels]
     if not result_regions:
         result_regions = [region_voxels]
 
@@ -640,69 +872,8 @@ def find_peaks_for_region(
     if len(region_voxels) < 1:
         return set(), set()
 
-    # Строим локальную 2D систему координат
-    u_axis, v_axis = build_2d_basis(region_normal)
-
-    # Центроид региона
-    centers_3d = np.array([
-        origin + (np.array(v) + 0.5) * cell_size
-        for v in region_voxels
-    ], dtype=np.float32)
-    centroid = centers_3d.mean(axis=0)
-
-    # Проецируем воксели на 2D
-    voxel_to_2d: dict[tuple[int, int, int], tuple[int, int]] = {}
-    grid_2d_to_voxels: dict[tuple[int, int], list[tuple[int, int, int]]] = {}
-
-    for voxel in region_voxels:
-        vx, vy, vz = voxel
-        world_pos = origin + (np.array([vx, vy, vz]) + 0.5) * cell_size
-        rel_pos = world_pos - centroid
-        u = float(np.dot(rel_pos, u_axis))
-        v = float(np.dot(rel_pos, v_axis))
-        grid_u = _round_half_up(u / cell_size)
-        grid_v = _round_half_up(v / cell_size)
-        voxel_to_2d[voxel] = (grid_u, grid_v)
-        if (grid_u, grid_v) not in grid_2d_to_voxels:
-            grid_2d_to_voxels[(grid_u, grid_v)] = []
-        grid_2d_to_voxels[(grid_u, grid_v)].append(voxel)
-
-    # Bresenham для связности
-    region_set = set(region_voxels)
-    for voxel in region_voxels:
-        vx, vy, vz = voxel
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                for dz in (-1, 0, 1):
-                    if dx == 0 and dy == 0 and dz == 0:
-                        continue
-                    neighbor = (vx + dx, vy + dy, vz + dz)
-                    if neighbor in region_set and neighbor > voxel:
-                        u1, v1 = voxel_to_2d[voxel]
-                        u2, v2 = voxel_to_2d[neighbor]
-                        line_cells = bresenham_line(u1, v1, u2, v2)
-                        for cell in line_cells:
-                            if cell not in grid_2d_to_voxels:
-                                grid_2d_to_voxels[cell] = [voxel]
-
-    # Создаём маску
-    all_2d = list(grid_2d_to_voxels.keys())
-    if not all_2d:
-        return set(), set()
-
-    min_u = min(p[0] for p in all_2d)
-    max_u = max(p[0] for p in all_2d)
-    min_v = min(p[1] for p in all_2d)
-    max_v = max(p[1] for p in all_2d)
-
-    width = max_u - min_u + 3
-    height = max_v - min_v + 3
-    offset_u = -min_u + 1
-    offset_v = -min_v + 1
-
-    mask = np.zeros((height, width), dtype=np.uint8)
-    for (gu, gv) in all_2d:
-        mask[gv + offset_v, gu + offset_u] = 1
+    projection = _project_region(region_voxels, region_normal, cell_size, origin)
+    mask = projection.mask
 
     # Distance field в 2D
     distance_2d = compute_distance_field_2d(mask)
@@ -713,24 +884,14 @@ def find_peaks_for_region(
 
     if debug:
         max_dist = float(np.max(distance_2d))
-        log.warning(f"  region: voxels={len(region_voxels)}, mask={width}x{height}, max_dist={max_dist:.2f}, smoothing={smoothing}")
+        log.warning(f"  region: voxels={len(region_voxels)}, mask={projection.width}x{projection.height}, max_dist={max_dist:.2f}, smoothing={smoothing}")
 
     # Находим пики в 2D
     all_maxima_2d, plateau_peaks_2d = find_distance_field_peaks_2d(distance_2d, debug=debug)
 
     # Маппим пики обратно в 3D воксели
-    def map_2d_to_3d(points_2d):
-        result: set[tuple[int, int, int]] = set()
-        for (pu, pv) in points_2d:
-            grid_u = pu - offset_u
-            grid_v = pv - offset_v
-            if (grid_u, grid_v) in grid_2d_to_voxels:
-                for voxel in grid_2d_to_voxels[(grid_u, grid_v)]:
-                    result.add(voxel)
-        return result
-
-    all_maxima_voxels = map_2d_to_3d(all_maxima_2d)
-    plateau_peaks_voxels = map_2d_to_3d(plateau_peaks_2d)
+    all_maxima_voxels = projection.voxels_at(all_maxima_2d)
+    plateau_peaks_voxels = projection.voxels_at(plateau_peaks_2d)
 
     return all_maxima_voxels, plateau_peaks_voxels
 
@@ -759,88 +920,11 @@ def compute_distance_field_for_region(
     if len(region_voxels) < 1:
         return {}
 
-    # Строим локальную 2D систему координат
-    u_axis, v_axis = build_2d_basis(region_normal)
+    projection = _project_region(region_voxels, region_normal, cell_size, origin)
 
-    # Центроид региона
-    centers_3d = np.array([
-        origin + (np.array(v) + 0.5) * cell_size
-        for v in region_voxels
-    ], dtype=np.float32)
-    centroid = centers_3d.mean(axis=0)
-
-    # Проецируем воксели на 2D
-    voxel_to_2d: dict[tuple[int, int, int], tuple[int, int]] = {}
-    grid_2d_to_voxels: dict[tuple[int, int], list[tuple[int, int, int]]] = {}
-
-    for voxel in region_voxels:
-        vx, vy, vz = voxel
-        world_pos = origin + (np.array([vx, vy, vz]) + 0.5) * cell_size
-        rel_pos = world_pos - centroid
-        u = float(np.dot(rel_pos, u_axis))
-        v = float(np.dot(rel_pos, v_axis))
-        grid_u = _round_half_up(u / cell_size)
-        grid_v = _round_half_up(v / cell_size)
-        voxel_to_2d[voxel] = (grid_u, grid_v)
-        if (grid_u, grid_v) not in grid_2d_to_voxels:
-            grid_2d_to_voxels[(grid_u, grid_v)] = []
-        grid_2d_to_voxels[(grid_u, grid_v)].append(voxel)
-
-    # Находим соседей в 3D и рисуем линии Брезенхема в 2D
-    region_set = set(region_voxels)
-
-    for voxel in region_voxels:
-        vx, vy, vz = voxel
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                for dz in (-1, 0, 1):
-                    if dx == 0 and dy == 0 and dz == 0:
-                        continue
-                    neighbor = (vx + dx, vy + dy, vz + dz)
-                    if neighbor in region_set and neighbor > voxel:
-                        u1, v1 = voxel_to_2d[voxel]
-                        u2, v2 = voxel_to_2d[neighbor]
-                        line_cells = bresenham_line(u1, v1, u2, v2)
-
-                        for cell in line_cells:
-                            if cell not in grid_2d_to_voxels:
-                                grid_2d_to_voxels[cell] = [voxel]
-
-    # Создаём бинарную маску
-    all_2d = list(grid_2d_to_voxels.keys())
-    if not all_2d:
-        return {}
-
-    min_u = min(p[0] for p in all_2d)
-    max_u = max(p[0] for p in all_2d)
-    min_v = min(p[1] for p in all_2d)
-    max_v = max(p[1] for p in all_2d)
-
-    width = max_u - min_u + 3
-    height = max_v - min_v + 3
-    offset_u = -min_u + 1
-    offset_v = -min_v + 1
-
-    mask = np.zeros((height, width), dtype=np.uint8)
-    for (gu, gv) in all_2d:
-        mask[gv + offset_v, gu + offset_u] = 1
-
-    # Вычисляем distance field в 2D
-    distance_2d = compute_distance_field_2d(mask)
-
-    # Конвертируем обратно в 3D
-    result: dict[tuple[int, int, int], float] = {}
-
-    for voxel in region_voxels:
-        grid_u, grid_v = voxel_to_2d[voxel]
-        mask_u = grid_u + offset_u
-        mask_v = grid_v + offset_v
-        if 0 <= mask_u < width and 0 <= mask_v < height:
-            result[voxel] = float(distance_2d[mask_v, mask_u])
-        else:
-            result[voxel] = 0.0
-
-    return result
+    # Вычисляем distance field в 2D и конвертируем обратно в 3D
+    distance_2d = compute_distance_field_2d(projection.mask)
+    return projection.sample(distance_2d)
 
 
 @dataclass
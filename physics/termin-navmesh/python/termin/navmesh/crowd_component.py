@@ -0,0 +1,318 @@
+"""
+NavMeshCrowdComponent — общий векторизованный шаг движения агентов.
+
+Агенты NavMeshAgentComponent с use_crowd=True не двигаются сами в update():
+их пути и позиции хранятся в CrowdState в виде массивов (struct-of-arrays),
+и NavMeshCrowdComponent продвигает всех агентов одним шагом NumPy за кадр,
+после чего записывает позиции в трансформы.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+import numpy as np
+
+from tcbase import log
+from termin.scene import PythonComponent
+from termin.inspect import InspectField
+
+if TYPE_CHECKING:
+    from termin.navmesh.agent_component import NavMeshAgentComponent
+
+
+class CrowdState:
+    """
+    Состояние толпы в виде массивов (struct-of-arrays).
+
+    Каждый агент занимает слот. Пути всех агентов лежат в одном плоском
+    буфере waypoints; path_offset/path_length задают отрезок слота.
+    Не зависит от сцены — шаг симуляции тестируется отдельно.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        capacity = max(1, int(capacity))
+        self.positions = np.zeros((capacity, 3), dtype=np.float64)
+        self.speeds = np.zeros(capacity, dtype=np.float64)
+        self.stopping_distances = np.zeros(capacity, dtype=np.float64)
+        self.waypoint_index = np.zeros(capacity, dtype=np.int64)
+        self.path_offset = np.zeros(capacity, dtype=np.int64)
+        self.path_length = np.zeros(capacity, dtype=np.int64)
+        # Слот занят агентом
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Агент движется по пути
+        self.moving = np.zeros(capacity, dtype=bool)
+
+        self.waypoints = np.zeros((0, 3), dtype=np.float64)
+        self._paths: list[np.ndarray | None] = [None] * capacity
+        self._waypoints_dirty = False
+        self._free: list[int] = []
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.alive)
+
+    @property
+    def size(self) -> int:
+        """Граница занятых слотов (включая освобождённые внутри неё)."""
+        return self._size
+
+    @property
+    def agent_count(self) -> int:
+        return int(np.count_nonzero(self.alive[:self._size]))
+
+    def add(self, position: np.ndarray, speed: float, stopping_distance: float) -> int:
+        """Занять слот под агента. Возвращает индекс слота."""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == self.capacity:
+                self._grow(self.capacity * 2)
+            slot = self._size
+            self._size += 1
+
+        self.positions[slot] = np.asarray(position, dtype=np.float64).reshape(3)
+        self.speeds[slot] = speed
+        self.stopping_distances[slot] = stopping_distance
+        self.waypoint_index[slot] = 0
+        self.path_length[slot] = 0
+        self.alive[slot] = True
+        self.moving[slot] = False
+        self._paths[slot] = None
+        return slot
+
+    def remove(self, slot: int) -> None:
+        """Освободить слот."""
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = False
+        self.moving[slot] = False
+        self.path_length[slot] = 0
+        self._paths[slot] = None
+        self._waypoints_dirty = True
+        self._free.append(slot)
+
+    def set_path(
+        self,
+        slot: int,
+        path: List[np.ndarray],
+        position: np.ndarray | None = None,
+    ) -> None:
+        """Задать путь агенту и начать движение с первой точки."""
+        waypoints = np.asarray(path, dtype=np.float64).reshape(-1, 3)
+        if position is not None:
+            self.positions[slot] = np.asarray(position, dtype=np.float64).reshape(3)
+        self._paths[slot] = waypoints
+        self.path_length[slot] = len(waypoints)
+        self.waypoint_index[slot] = 0
+        self.moving[slot] = len(waypoints) > 0
+        self._waypoints_dirty = True
+
+    def stop(self, slot: int) -> None:
+        """Остановить агента и сбросить путь."""
+        self.moving[slot] = False
+        self.path_length[slot] = 0
+        self.waypoint_index[slot] = 0
+        if self._paths[slot] is not None:
+            self._paths[slot] = None
+            self._waypoints_dirty = True
+
+    def step(self, dt: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Продвинуть всех движущихся агентов на dt.
+
+        Поведение совпадает с поштучным NavMeshAgentComponent.update: агент,
+        оказавшийся ближе stopping_distance к текущей точке, в этом кадре
+        только переключается на следующую точку (или останавливается в конце
+        пути); остальные смещаются на min(speed * dt, distance).
+
+        Returns:
+            (moved, advanced) — индексы слотов, чья позиция изменилась,
+            и слотов, у которых сменилась текущая точка или закончился путь.
+        """
+        n = self._size
+        active = np.flatnonzero(self.moving[:n])
+        if len(active) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        self._flush_waypoints()
+
+        targets = self.waypoints[self.path_offset[active] + self.waypoint_index[active]]
+        delta = targets - self.positions[active]
+        distance = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+
+        arrived = distance < self.stopping_distances[active]
+        advanced = active[arrived]
+        if len(advanced) > 0:
+            self.waypoint_index[advanced] += 1
+            finished = advanced[self.waypoint_index[advanced] >= self.path_length[advanced]]
+            self.moving[finished] = False
+
+        walking = ~arrived
+        moved = active[walking]
+        if len(moved) > 0:
+            dist = distance[walking]
+            step = np.minimum(self.speeds[moved] * dt, dist)
+            self.positions[moved] += delta[walking] * (step / dist)[:, None]
+
+        return moved, advanced
+
+    def _flush_waypoints(self) -> None:
+        """Пересобрать плоский буфер путей после изменений."""
+        if not self._waypoints_dirty:
+            return
+        paths = [p for p in self._paths[:self._size] if p is not None]
+        lengths = np.array([len(p) if p is not None else 0 for p in self._paths[:self._size]], dtype=np.int64)
+        self.path_offset[:self._size] = np.cumsum(lengths) - lengths
+        self.waypoints = np.concatenate(paths) if paths else np.zeros((0, 3), dtype=np.float64)
+        self._waypoints_dirty = False
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        self.positions = np.concatenate([self.positions, np.zeros((extra, 3), dtype=np.float64)])
+        self.speeds = np.concatenate([self.speeds, np.zeros(extra, dtype=np.float64)])
+        self.stopping_distances = np.concatenate([self.stopping_distances, np.zeros(extra, dtype=np.float64)])
+        self.waypoint_index = np.concatenate([self.waypoint_index, np.zeros(extra, dtype=np.int64)])
+        self.path_offset = np.concatenate([self.path_offset, np.zeros(extra, dtype=np.int64)])
+        self.path_length = np.concatenate([self.path_length, np.zeros(extra, dtype=np.int64)])
+        self.alive = np.concatenate([self.alive, np.zeros(extra, dtype=bool)])
+        self.moving = np.concatenate([self.moving, np.zeros(extra, dtype=bool)])
+        self._paths.extend([None] * extra)
+
+
+class NavMeshCrowdComponent(PythonComponent):
+    """
+    Системный компонент толпы: двигает всех подписанных агентов за один шаг.
+
+    Использование:
+    1. Добавить компонент к любой сущности в сцене
+    2. Включить use_crowd у NavMeshAgentComponent
+    3. Агенты регистрируются при первом set_destination и перестают
+       обновляться поштучно
+
+    Доступ через статический instance:
+        NavMeshCrowdComponent.instance()
+    """
+
+    component_category = "Navigation"
+
+    _instance: "NavMeshCrowdComponent | None" = None
+
+    @classmethod
+    def instance(cls) -> "NavMeshCrowdComponent | None":
+        """Get the global NavMeshCrowdComponent instance."""
+        return cls._instance
+
+    inspect_fields = {
+        "initial_capacity": InspectField(
+            path="initial_capacity",
+            label="Initial Capacity",
+            kind="int",
+            min=1,
+            max=100000,
+        ),
+    }
+
+    serializable_fields = ["initial_capacity"]
+
+    def __init__(self, initial_capacity: int = 256) -> None:
+        super().__init__(enabled=True)
+
+        self.initial_capacity = initial_capacity
+        self._state = CrowdState(initial_capacity)
+        # slot -> agent
+        self._agents: list[Optional["NavMeshAgentComponent"]] = []
+
+    @property
+    def state(self) -> CrowdState:
+        """Массивы состояния толпы."""
+        return self._state
+
+    @property
+    def agent_count(self) -> int:
+        return self._state.agent_count
+
+    def on_added(self) -> None:
+        super().on_added()
+        NavMeshCrowdComponent._instance = self
+
+    def start(self) -> None:
+        super().start()
+        NavMeshCrowdComponent._instance = self
+
+    def on_removed(self) -> None:
+        for agent in list(self._agents):
+            if agent is not None:
+                self.unregister(agent)
+        if NavMeshCrowdComponent._instance is self:
+            NavMeshCrowdComponent._instance = None
+        super().on_removed()
+
+    def register(self, agent: "NavMeshAgentComponent") -> int:
+        """Подписать агента на общий шаг. Возвращает слот."""
+        if agent._crowd is self and agent._crowd_slot >= 0:
+            return agent._crowd_slot
+
+        slot = self._state.add(agent._world_position(), agent.speed, agent.stopping_distance)
+        while len(self._agents) <= slot:
+            self._agents.append(None)
+        self._agents[slot] = agent
+        agent._crowd = self
+        agent._crowd_slot = slot
+        # Поштучный update больше не нужен — двигает толпа
+        agent.has_update = False
+        return slot
+
+    def unregister(self, agent: "NavMeshAgentComponent") -> None:
+        """Вернуть агента к поштучному обновлению."""
+        if agent._crowd is not self or agent._crowd_slot < 0:
+            return
+        slot = agent._crowd_slot
+        self._state.remove(slot)
+        self._agents[slot] = None
+        agent._crowd = None
+        agent._crowd_slot = -1
+        agent.has_update = True
+
+    def set_agent_path(self, agent: "NavMeshAgentComponent", path: List[np.ndarray]) -> None:
+        """Передать путь агента в толпу (позиция и скорость берутся из агента)."""
+        slot = self.register(agent)
+        self._state.speeds[slot] = agent.speed
+        self._state.stopping_distances[slot] = agent.stopping_distance
+        self._state.set_path(slot, path, agent._world_position())
+
+    def stop_agent(self, agent: "NavMeshAgentComponent") -> None:
+        if agent._crowd is self and agent._crowd_slot >= 0:
+            self._state.stop(agent._crowd_slot)
+
+    def update(self, dt: float) -> None:
+        """Один векторизованный шаг для всех агентов и запись трансформов."""
+        moved, advanced = self._state.step(dt)
+
+        if len(advanced) > 0:
+            waypoint_index = self._state.waypoint_index
+            moving = self._state.moving
+            for slot in advanced.tolist():
+                agent = self._agents[slot]
+                if agent is None:
+                    continue
+                agent._current_path_index = int(waypoint_index[slot])
+                if not moving[slot]:
+                    log.info("[NavMeshCrowd] destination reached")
+                    agent._is_moving = False
+
+        if len(moved) == 0:
+            return
+
+        from termin.geombase._geom_native import Vec3
+
+        for slot, (x, y, z) in zip(moved.tolist(), self._state.positions[moved].tolist(), strict=True):
+            agent = self._agents[slot]
+            if agent is None:
+                continue
+            entity = agent.entity
+            if entity is None:
+                continue
+            # Как и NavMeshAgentComponent.update: мировая позиция пишется как локальная
+            entity.transform.set_local_position(Vec3(x, y, z))
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import heapq
+import math
 import numpy as np
 
 
@@ -22,6 +23,8 @@ class RegionGraph:
     triangles: np.ndarray     # (M, 3) — индексы вершин треугольников
     neighbors: np.ndarray     # (M, 3) — соседи по каждому ребру, -1 = нет соседа
     centroids: np.ndarray     # (M, 3) — центры треугольников
+    # Пространственный индекс для find_triangle; строится лениво, если не задан
+    locator: TriangleLocator | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_mesh(
@@ -29,9 +32,19 @@ class RegionGraph:
         vertices: np.ndarray,
         triangles: np.ndarray,
         region_id: int = 0,
+        neighbors: np.ndarray | None = None,
+        locator: TriangleLocator | None = None,
     ) -> RegionGraph:
-        """Построить граф из меша."""
-        neighbors = build_adjacency(triangles)
+        """
+        Построить граф из меша.
+
+        neighbors и locator можно передать готовыми (например, загруженными
+        из бинарного navmesh), тогда они не пересчитываются.
+        """
+        if neighbors is None:
+            neighbors = build_adjacency(triangles)
+        if locator is None:
+            locator = TriangleLocator.from_mesh(vertices, triangles)
         centroids = compute_centroids(vertices, triangles)
         return cls(
             region_id=region_id,
@@ -39,11 +52,14 @@ class RegionGraph:
             triangles=triangles,
             neighbors=neighbors,
             centroids=centroids,
+            locator=locator,
         )
 
     def find_triangle(self, point: np.ndarray) -> int:
         """Найти треугольник, содержащий точку. Возвращает -1 если не найден."""
-        return find_triangle_containing_point(point, self.vertices, self.triangles)
+        if self.locator is None:
+            self.locator = TriangleLocator.from_mesh(self.vertices, self.triangles)
+        return self.locator.locate(point)
 
     def find_path(self, start: np.ndarray, end: np.ndarray) -> list[int] | None:
         """
@@ -244,27 +260,37 @@ def build_adjacency(triangles: np.ndarray) -> np.ndarray:
                    neighbors[t, e] = индекс соседнего треугольника по ребру e, или -1.
                    Ребро 0: вершины (0, 1), ребро 1: (1, 2), ребро 2: (2, 0).
     """
-    m = len(triangles)
+    tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    m = len(tris)
     neighbors = np.full((m, 3), -1, dtype=np.int32)
-
-    # edge -> (triangle_idx, edge_idx)
-    edge_to_tri: dict[tuple[int, int], tuple[int, int]] = {}
-
-    for tri_idx in range(m):
-        t = triangles[tri_idx]
-        for edge_idx in range(3):
-            v0 = int(t[edge_idx])
-            v1 = int(t[(edge_idx + 1) % 3])
-            # Нормализуем ребро (меньший индекс первым)
-            edge = (min(v0, v1), max(v0, v1))
-
-            if edge in edge_to_tri:
-                # Нашли соседа
-                other_tri, other_edge = edge_to_tri[edge]
-                neighbors[tri_idx, edge_idx] = other_tri
-                neighbors[other_tri, other_edge] = tri_idx
-            else:
-                edge_to_tri[edge] = (tri_idx, edge_idx)
+    if m == 0:
+        return neighbors
+
+    # Рёбра в порядке обхода (tri_idx, edge_idx), нормализованные: меньший индекс первым
+    a = tris.ravel()
+    b = tris[:, [1, 2, 0]].ravel()
+    lo = np.minimum(a, b)
+    hi = np.maximum(a, b)
+    keys = lo * (int(hi.max()) + 1) + hi
+
+    # Стабильная сортировка сохраняет порядок обхода внутри группы одинаковых рёбер
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    group_start = np.ones(len(order), dtype=bool)
+    group_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    group_id = np.cumsum(group_start) - 1
+    first = order[group_start][group_id]
+    last = order[np.append(group_start[1:], True)][group_id]
+
+    # Как и при последовательном обходе: каждое повторное вхождение ребра
+    # связывается с первым, а первое — с последним из повторных.
+    flat = neighbors.reshape(-1)
+    repeat = ~group_start
+    flat[order[repeat]] = first[repeat] // 3
+    owners = order[group_start]
+    owner_last = last[group_start]
+    shared = owner_last != owners
+    flat[owners[shared]] = owner_last[shared] // 3
 
     return neighbors
 
@@ -290,6 +316,9 @@ def find_triangle_containing_point(
     1. Расстояние до плоскости < tolerance
     2. Проекция внутри треугольника
 
+    Проверка векторизована по всем треугольникам. Для повторных запросов
+    к одному мешу используйте TriangleLocator (RegionGraph.find_triangle).
+
     Args:
         point: (3,) — точка в 3D.
         vertices: (N, 3) — вершины.
@@ -299,6 +328,366 @@ def find_triangle_containing_point(
     Returns:
         Индекс треугольника или -1.
     """
+    frames = _TriangleFrames.from_mesh(vertices, triangles)
+    candidates = np.arange(len(frames.origins), dtype=np.int64)
+    return _locate_in_candidates(point, frames, candidates, tolerance)
+
+
+# Допуск point_in_triangle_2d, используемый при поиске треугольника
+_POINT_LOCATION_EPSILON = 0.05
+
+
+@dataclass
+class _TriangleFrames:
+    """Предвычисленные локальные 2D-базисы плоскостей треугольников."""
+
+    origins: np.ndarray   # (M, 3) — вершина v0
+    normals: np.ndarray   # (M, 3) — единичная нормаль
+    u_axes: np.ndarray    # (M, 3) — ось u (вдоль ребра v0->v1)
+    v_axes: np.ndarray    # (M, 3) — ось v = normal x u
+    b2d: np.ndarray       # (M, 2) — v1 в локальных координатах
+    c2d: np.ndarray       # (M, 2) — v2 в локальных координатах
+    valid: np.ndarray     # (M,) — False для вырожденных треугольников
+
+    @classmethod
+    def from_mesh(cls, vertices: np.ndarray, triangles: np.ndarray) -> _TriangleFrames:
+        verts = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+
+        v0 = verts[tris[:, 0]]
+        edge1 = verts[tris[:, 1]] - v0
+        edge2 = verts[tris[:, 2]] - v0
+
+        normals = np.cross(edge1, edge2)
+        normal_len = np.linalg.norm(normals, axis=1)
+        valid = normal_len >= 1e-10
+        safe_normal_len = np.where(valid, normal_len, 1.0)
+        normals = normals / safe_normal_len[:, None]
+
+        edge1_len = np.linalg.norm(edge1, axis=1)
+        u_axes = edge1 / np.where(edge1_len > 0.0, edge1_len, 1.0)[:, None]
+        v_axes = np.cross(normals, u_axes)
+
+        b2d = np.stack([_rowdot(edge1, u_axes), _rowdot(edge1, v_axes)], axis=1)
+        c2d = np.stack([_rowdot(edge2, u_axes), _rowdot(edge2, v_axes)], axis=1)
+
+        return cls(
+            origins=v0,
+            normals=normals,
+            u_axes=u_axes,
+            v_axes=v_axes,
+            b2d=b2d,
+            c2d=c2d,
+            valid=valid,
+        )
+
+
+def _rowdot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Построчное скалярное произведение (K, 3) x (K, 3) -> (K,)."""
+    return np.einsum("ij,ij->i", a, b)
+
+
+def _locate_in_candidates(
+    point: np.ndarray,
+    frames: _TriangleFrames,
+    candidates: np.ndarray,
+    tolerance: float,
+) -> int:
+    """
+    Векторизованная проверка точки против набора треугольников-кандидатов.
+
+    Повторяет семантику поштучной проверки: проекция на плоскость,
+    point_in_triangle_2d с допуском, выбор треугольника с минимальным
+    расстоянием до плоскости (при равенстве — с меньшим индексом,
+    поэтому candidates должны быть отсортированы по возрастанию).
+    """
+    if len(candidates) == 0:
+        return -1
+
+    p = np.asarray(point, dtype=np.float64).reshape(3)
+    rel = p - frames.origins[candidates]
+    normals = frames.normals[candidates]
+
+    d = _rowdot(rel, normals)
+    abs_d = np.abs(d)
+    keep = frames.valid[candidates] & (abs_d < tolerance)
+    if not np.any(keep):
+        return -1
+
+    rel_proj = rel - d[:, None] * normals
+    pu = _rowdot(rel_proj, frames.u_axes[candidates])
+    pv = _rowdot(rel_proj, frames.v_axes[candidates])
+    bu, bv = frames.b2d[candidates, 0], frames.b2d[candidates, 1]
+    cu, cv = frames.c2d[candidates, 0], frames.c2d[candidates, 1]
+
+    # Те же знаковые площади, что и в point_in_triangle_2d с (x0, y0) = (0, 0)
+    area = bu * cv - cu * bv
+    s = (-pu) * (bv - pv) - (bu - pu) * (-pv)
+    t = (bu - pu) * (cv - pv) - (cu - pu) * (bv - pv)
+    u = (cu - pu) * (-pv) - (-pu) * (cv - pv)
+    threshold = _POINT_LOCATION_EPSILON * np.abs(area)
+
+    inside_ccw = (s >= -threshold) & (t >= -threshold) & (u >= -threshold)
+    inside_cw = (s <= threshold) & (t <= threshold) & (u <= threshold)
+    inside = np.where(area > 0, inside_ccw, inside_cw) & (np.abs(area) >= 1e-10)
+
+    hits = np.flatnonzero(keep & inside)
+    if len(hits) == 0:
+        return -1
+    best = hits[int(np.argmin(abs_d[hits]))]
+    return int(candidates[best])
+
+
+def _triangle_aabbs(
+    verts: np.ndarray,
+    tris: np.ndarray,
+    tolerance: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """AABB треугольников: (tri_min, tri_max) и расширенные на допуск (aabb_min, aabb_max)."""
+    corners = verts[tris]  # (M, 3, 3)
+    tri_min = corners.min(axis=1)
+    tri_max = corners.max(axis=1)
+    # Допуск point_in_triangle_2d выводит проекцию за границу треугольника
+    # не дальше чем на epsilon * высоту, высота <= наибольшей стороны AABB.
+    pad = tolerance + 2.0 * _POINT_LOCATION_EPSILON * (tri_max - tri_min).max(axis=1)
+    return tri_min, tri_max, tri_min - pad[:, None], tri_max + pad[:, None]
+
+
+@dataclass
+class TriangleLocator:
+    """
+    Пространственный индекс для поиска треугольника, содержащего точку.
+
+    Равномерная 2D-сетка над AABB треугольников в плоскости двух осей
+    с наибольшим разбросом вершин. Каждая ячейка хранит индексы треугольников,
+    чьи AABB (расширенные на tolerance) её перекрывают. Запрос берёт кандидатов
+    из одной ячейки и проверяет их векторизованно.
+    """
+
+    frames: _TriangleFrames
+    tolerance: float
+    axes: tuple[int, int]       # оси сетки (индексы x/y/z)
+    grid_origin: np.ndarray     # (2,) — минимум сетки по axes
+    cell_size: float
+    grid_shape: tuple[int, int]  # (nx, ny)
+    cell_start: np.ndarray      # (nx * ny + 1,) — смещения в cell_items
+    cell_items: np.ndarray      # индексы треугольников, сгруппированные по ячейкам
+    aabb_min: np.ndarray        # (M, 3) — расширенные AABB треугольников
+    aabb_max: np.ndarray        # (M, 3)
+
+    @classmethod
+    def from_mesh(
+        cls,
+        vertices: np.ndarray,
+        triangles: np.ndarray,
+        tolerance: float = 0.5,
+    ) -> TriangleLocator:
+        """Построить индекс по мешу. tolerance — максимальный допуск запросов."""
+        frames = _TriangleFrames.from_mesh(vertices, triangles)
+        verts = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        m = len(tris)
+
+        if m == 0:
+            return cls(
+                frames=frames,
+                tolerance=tolerance,
+                axes=(0, 1),
+                grid_origin=np.zeros(2, dtype=np.float64),
+                cell_size=1.0,
+                grid_shape=(0, 0),
+                cell_start=np.zeros(1, dtype=np.int64),
+                cell_items=np.zeros(0, dtype=np.int64),
+                aabb_min=np.zeros((0, 3), dtype=np.float64),
+                aabb_max=np.zeros((0, 3), dtype=np.float64),
+            )
+
+        tri_min, tri_max, aabb_min, aabb_max = _triangle_aabbs(verts, tris, tolerance)
+
+        extent = aabb_max.max(axis=0) - aabb_min.min(axis=0)
+        order = np.argsort(-extent, kind="stable")
+        axes = (int(min(order[0], order[1])), int(max(order[0], order[1])))
+        lo2 = aabb_min[:, axes]
+        hi2 = aabb_max[:, axes]
+        grid_origin = lo2.min(axis=0)
+        span = hi2.max(axis=0) - grid_origin
+
+        mean_tri_size = float(np.mean((tri_max - tri_min)[:, axes].max(axis=1)))
+        cell_size = max(mean_tri_size, math.sqrt(max(float(span[0] * span[1]), 1e-12) / m), 1e-6)
+        max_cells = 4 * m + 16
+        while True:
+            nx = int(span[0] // cell_size) + 1
+            ny = int(span[1] // cell_size) + 1
+            if nx * ny <= max_cells:
+                break
+            cell_size *= 2.0
+
+        cell_lo = np.clip(((lo2 - grid_origin) // cell_size).astype(np.int64), 0, [nx - 1, ny - 1])
+        cell_hi = np.clip(((hi2 - grid_origin) // cell_size).astype(np.int64), 0, [nx - 1, ny - 1])
+        widths = cell_hi[:, 0] - cell_lo[:, 0] + 1
+        heights = cell_hi[:, 1] - cell_lo[:, 1] + 1
+        counts = widths * heights
+
+        tri_ids = np.repeat(np.arange(m, dtype=np.int64), counts)
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        offsets = np.arange(len(tri_ids), dtype=np.int64) - first
+        rep_widths = np.repeat(widths, counts)
+        cx = np.repeat(cell_lo[:, 0], counts) + offsets % rep_widths
+        cy = np.repeat(cell_lo[:, 1], counts) + offsets // rep_widths
+        cells = cy * nx + cx
+
+        # Стабильная сортировка сохраняет возрастание индексов внутри ячейки
+        sort = np.argsort(cells, kind="stable")
+        cell_items = tri_ids[sort]
+        cell_start = np.zeros(nx * ny + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=nx * ny), out=cell_start[1:])
+
+        return cls(
+            frames=frames,
+            tolerance=tolerance,
+            axes=axes,
+            grid_origin=grid_origin,
+            cell_size=cell_size,
+            grid_shape=(nx, ny),
+            cell_start=cell_start,
+            cell_items=cell_items,
+            aabb_min=aabb_min,
+            aabb_max=aabb_max,
+        )
+
+    @classmethod
+    def from_grid(
+        cls,
+        vertices: np.ndarray,
+        triangles: np.ndarray,
+        tolerance: float,
+        axes: tuple[int, int],
+        grid_origin: np.ndarray,
+        cell_size: float,
+        grid_shape: tuple[int, int],
+        cell_start: np.ndarray,
+        cell_items: np.ndarray,
+    ) -> TriangleLocator:
+        """
+        Восстановить индекс по готовой сетке (см. NavMeshPersistence).
+
+        Базисы и AABB треугольников пересчитываются векторизованно,
+        распределение треугольников по ячейкам берётся как есть.
+        """
+        frames = _TriangleFrames.from_mesh(vertices, triangles)
+        verts = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        tris = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        _, _, aabb_min, aabb_max = _triangle_aabbs(verts, tris, tolerance)
+        return cls(
+            frames=frames,
+            tolerance=tolerance,
+            axes=(int(axes[0]), int(axes[1])),
+            grid_origin=np.asarray(grid_origin, dtype=np.float64),
+            cell_size=float(cell_size),
+            grid_shape=(int(grid_shape[0]), int(grid_shape[1])),
+            cell_start=cell_start,
+            cell_items=cell_items,
+            aabb_min=aabb_min,
+            aabb_max=aabb_max,
+        )
+
+    @property
+    def triangle_count(self) -> int:
+        return len(self.frames.origins)
+
+    def candidates(self, point: np.ndarray) -> np.ndarray:
+        """Индексы треугольников, чьи расширенные AABB содержат точку (по возрастанию)."""
+        nx, ny = self.grid_shape
+        if nx == 0:
+            return self.cell_items
+        p = np.asarray(point, dtype=np.float64).reshape(3)
+        gx = (p[self.axes[0]] - self.grid_origin[0]) / self.cell_size
+        gy = (p[self.axes[1]] - self.grid_origin[1]) / self.cell_size
+        if not (0.0 <= gx < nx and 0.0 <= gy < ny):
+            return self.cell_items[:0]
+        cell = int(gy) * nx + int(gx)
+        items = self.cell_items[self.cell_start[cell]:self.cell_start[cell + 1]]
+        inside = np.all((self.aabb_min[items] <= p) & (p <= self.aabb_max[items]), axis=1)
+        return items[inside]
+
+    def locate(self, point: np.ndarray, tolerance: float | None = None) -> int:
+        """
+        Найти треугольник, содержащий точку (семантика find_triangle_containing_point).
+
+        Если tolerance больше допуска, с которым построен индекс, выполняется
+        полный векторизованный перебор.
+        """
+        if tolerance is None:
+            tolerance = self.tolerance
+        if tolerance > self.tolerance:
+            candidates = np.arange(self.triangle_count, dtype=np.int64)
+        else:
+            candidates = self.candidates(point)
+        return _locate_in_candidates(point, self.frames, candidates, tolerance)
+
+
+def benchmark_point_location(
+    triangle_counts: tuple[int, ...] = (512, 2048, 8192, 32768),
+    queries: int = 200,
+    seed: int = 0,
+) -> None:
+    """
+    Benchmark point-location: поштучный перебор vs векторизованный перебор vs TriangleLocator.
+
+    Меш — регулярная сетка в плоскости XY, точки запросов случайны внутри неё.
+    """
+    import time
+
+    rng = np.random.default_rng(seed)
+
+    print(f"Queries per mesh: {queries}")
+    print(f"{'triangles':>10} {'loop us':>12} {'vector us':>12} {'index us':>12} {'build ms':>10}")
+
+    for count in triangle_counts:
+        side = max(1, int(math.sqrt(count / 2)))
+        xs, ys = np.meshgrid(np.arange(side + 1, dtype=np.float64), np.arange(side + 1, dtype=np.float64))
+        vertices = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)], axis=1)
+        i, j = np.meshgrid(np.arange(side), np.arange(side))
+        a = (j * (side + 1) + i).ravel()
+        b = a + 1
+        c = a + side + 1
+        d = c + 1
+        triangles = np.concatenate([np.stack([a, b, d], axis=1), np.stack([a, d, c], axis=1)]).astype(np.int32)
+        points = np.column_stack([rng.uniform(0.0, side, (queries, 2)), np.zeros(queries)])
+
+        start = time.perf_counter()
+        locator = TriangleLocator.from_mesh(vertices, triangles)
+        build_time = time.perf_counter() - start
+
+        loop_queries = min(queries, 10)
+        start = time.perf_counter()
+        for point in points[:loop_queries]:
+            _find_triangle_containing_point_loop(point, vertices, triangles)
+        loop_time = (time.perf_counter() - start) / loop_queries
+
+        start = time.perf_counter()
+        for point in points:
+            find_triangle_containing_point(point, vertices, triangles)
+        vector_time = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        for point in points:
+            locator.locate(point)
+        index_time = (time.perf_counter() - start) / queries
+
+        print(
+            f"{len(triangles):>10} {loop_time * 1e6:>12.1f} {vector_time * 1e6:>12.1f} "
+            f"{index_time * 1e6:>12.1f} {build_time * 1e3:>10.2f}"
+        )
+
+
+def _find_triangle_containing_point_loop(
+    point: np.ndarray,
+    vertices: np.ndarray,
+    triangles: np.ndarray,
+    tolerance: float = 0.5,
+) -> int:
+    """Поштучная эталонная реализация find_triangle_containing_point."""
     best_tri = -1
     best_dist = tolerance
 
@@ -946,3 +1335,92 @@ def astar_triangles(
                 heapq.heappush(open_set, (f, counter, neighbor))
 
     return None
+
+
+def reverse_dijkstra_triangles(
+    goal_tri: int,
+    neighbors: np.ndarray,
+    centroids: np.ndarray,
+    targets: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Поле направлений (flow field) к целевому треугольнику.
+
+    Dijkstra от goal_tri по графу смежности с весами — расстояниями между
+    центроидами. Одно поле обслуживает любое число стартов с общей целью.
+
+    Args:
+        goal_tri: индекс целевого треугольника.
+        neighbors: (M, 3) — массив соседей.
+        centroids: (M, 3) — центры треугольников.
+        targets: индексы стартовых треугольников. Если заданы, поиск
+                 останавливается, как только все они достигнуты.
+
+    Returns:
+        next_tri: (M,) — для каждого достигнутого треугольника индекс следующего
+                  треугольника на пути к цели; next_tri[goal_tri] = goal_tri;
+                  -1 для недостигнутых.
+    """
+    m = len(neighbors)
+    next_tri = np.full(m, -1, dtype=np.int32)
+    if goal_tri < 0 or goal_tri >= m:
+        return next_tri
+
+    pending: set[int] | None = None
+    if targets is not None:
+        pending = {int(t) for t in np.asarray(targets).reshape(-1) if 0 <= int(t) < m}
+
+    dist = np.full(m, np.inf, dtype=np.float64)
+    settled = np.zeros(m, dtype=bool)
+    dist[goal_tri] = 0.0
+    next_tri[goal_tri] = goal_tri
+
+    # Списки заранее — без обращения к numpy-скалярам в горячем цикле
+    neighbor_lists = neighbors.tolist()
+    centroid_list = np.asarray(centroids, dtype=np.float64).tolist()
+
+    open_set: list[tuple[float, int]] = [(0.0, goal_tri)]
+    while open_set:
+        current_dist, current = heapq.heappop(open_set)
+        if settled[current]:
+            continue
+        settled[current] = True
+
+        if pending is not None:
+            pending.discard(current)
+            if not pending:
+                break
+
+        cx, cy, cz = centroid_list[current]
+        for neighbor in neighbor_lists[current]:
+            if neighbor < 0 or settled[neighbor]:
+                continue
+            nx, ny, nz = centroid_list[neighbor]
+            tentative = current_dist + math.sqrt((nx - cx) ** 2 + (ny - cy) ** 2 + (nz - cz) ** 2)
+            if tentative < dist[neighbor]:
+                dist[neighbor] = tentative
+                next_tri[neighbor] = current
+                heapq.heappush(open_set, (tentative, neighbor))
+
+    return next_tri
+
+
+def follow_flow_field(start_tri: int, next_tri: np.ndarray) -> list[int] | None:
+    """
+    Восстановить путь по полю направлений из reverse_dijkstra_triangles.
+
+    Returns:
+        Список индексов треугольников от start_tri до цели, или None.
+    """
+    if start_tri < 0 or start_tri >= len(next_tri) or next_tri[start_tri] < 0:
+        return None
+
+    path = [int(start_tri)]
+    current = int(start_tri)
+    for _ in range(len(next_tri)):
+        step = int(next_tri[current])
+        if step == current:
+            return path
+        path.append(step)
+        current = step
+    return None
@@ -6,7 +6,7 @@ PathfindingWorldComponent — глобальный компонент для п
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
 import numpy as np
 
 from tcbase import log
@@ -19,8 +19,10 @@ from termin.navmesh.pathfinding import (
     get_portals_from_path,
     funnel_algorithm,
     navmesh_line_of_sight,
+    reverse_dijkstra_triangles,
+    follow_flow_field,
 )
-from termin.navmesh.types import NavMesh, Portal
+from termin.navmesh.types import NavMesh, NavPolygon, Portal
 from termin.navmesh.region_growing import NEIGHBORS_26
 
 if TYPE_CHECKING:
@@ -30,7 +32,7 @@ if TYPE_CHECKING:
 
 def _rebuild_graph_action(component: "PathfindingWorldComponent") -> None:
     """Rebuild graph button action."""
-    component.rebuild()
+    component.rebuild(incremental=False)
 
 
 def _entity_affine(entity: "Entity") -> Affine3d:
@@ -175,6 +177,13 @@ class PathfindingWorldComponent(PythonComponent):
         self._portals: List[Portal] = []
         # Маппинг region_id -> navmesh info для вычисления порталов
         self._region_navmesh_info: dict[int, tuple[NavMesh, int]] = {}
+        # Кэш для инкрементальной перестройки (ключ — id(NavPolygon)).
+        # Полигоны неизменённых тайлов приходят теми же объектами, поэтому
+        # их RegionGraph и порталы между ними переиспользуются.
+        self._region_cache: dict[int, tuple[NavPolygon, RegionGraph]] = {}
+        self._portal_cache: dict[tuple[int, int], List[Portal]] = {}
+        # region_id, чьи полигоны пересчитаны в последнем _build_graph
+        self._changed_regions: set[int] = set()
 
     @property
     def navmesh_graph(self) -> NavMeshGraph:
@@ -226,14 +235,27 @@ class PathfindingWorldComponent(PythonComponent):
             f"[PathfindingWorld] collected {len(self._navmesh_sources)} NavMesh for agent '{self.agent_type_name}'"
         )
 
-    def _build_graph(self) -> None:
-        """Построить NavMeshGraph из собранных NavMesh."""
+    def _build_graph(self, incremental: bool = True) -> None:
+        """
+        Построить NavMeshGraph из собранных NavMesh.
+
+        Args:
+            incremental: Переиспользовать RegionGraph и порталы для полигонов,
+                которые не изменились с прошлой сборки (тот же объект).
+        """
         self._navmesh_graph = NavMeshGraph()
         self._region_entities.clear()
         self._region_navmesh_info.clear()
         self._portals.clear()
 
+        previous_cache = self._region_cache if incremental else {}
+        if not incremental:
+            self._portal_cache = {}
+        self._region_cache = {}
+        self._changed_regions = set()
+
         region_id = 0
+        reused = 0
         for navmesh, entity in self._navmesh_sources:
             for poly_idx, polygon in enumerate(navmesh.polygons):
                 verts_count = len(polygon.vertices) if polygon.vertices is not None else 0
@@ -241,15 +263,25 @@ class PathfindingWorldComponent(PythonComponent):
                 if verts_count == 0 or tris_count == 0:
                     continue
 
-                # Вершины в локальных координатах entity
-                local_verts = polygon.vertices
-
-                # Создаём RegionGraph для каждого полигона
-                region = RegionGraph.from_mesh(
-                    vertices=local_verts,
-                    triangles=polygon.triangles,
-                    region_id=region_id,
-                )
+                cached = previous_cache.get(id(polygon))
+                if cached is not None and cached[0] is polygon:
+                    region = cached[1]
+                    region.region_id = region_id
+                    reused += 1
+                else:
+                    # Вершины в локальных координатах entity
+                    local_verts = polygon.vertices
+
+                    # Создаём RegionGraph для каждого полигона
+                    region = RegionGraph.from_mesh(
+                        vertices=local_verts,
+                        triangles=polygon.triangles,
+                        region_id=region_id,
+                        neighbors=polygon.adjacency,
+                        locator=polygon.locator,
+                    )
+                    self._changed_regions.add(region_id)
+                self._region_cache[id(polygon)] = (polygon, region)
                 self._navmesh_graph.add_region(region)
 
                 # Сохраняем entity для получения актуальной трансформации
@@ -258,12 +290,12 @@ class PathfindingWorldComponent(PythonComponent):
                 self._region_navmesh_info[region_id] = (navmesh, poly_idx)
                 region_id += 1
 
-        log.warning(f"[PathfindingWorld] built graph with {region_id} regions")
+        log.warning(f"[PathfindingWorld] built graph with {region_id} regions ({reused} reused)")
 
         # Вычисляем порталы между регионами
-        self._compute_portals()
+        self._compute_portals(incremental=incremental and reused > 0)
 
-    def _compute_portals(self) -> None:
+    def _compute_portals(self, incremental: bool = False) -> None:
         """
         Вычислить порталы между соседними регионами.
 
@@ -272,14 +304,25 @@ class PathfindingWorldComponent(PythonComponent):
         2. Находим соседние воксели между разными регионами
         3. Кластеризуем границу по связности
         4. Каждый кластер становится порталом
+
+        При incremental граница ищется только от вокселей изменённых
+        регионов (self._changed_regions); порталы между неизменёнными
+        регионами берутся из кэша.
         """
         from collections import deque
+        from dataclasses import replace
 
         self._portals.clear()
 
         if not self._region_navmesh_info:
+            self._portal_cache = {}
             return
 
+        region_polygons = {
+            region_id: navmesh.polygons[poly_idx]
+            for region_id, (navmesh, poly_idx) in self._region_navmesh_info.items()
+        }
+
         # Шаг 1: Построить voxel_to_region map
         voxel_to_region: dict[tuple[int, int, int], int] = {}
         for region_id, (navmesh, poly_idx) in self._region_navmesh_info.items():
@@ -294,8 +337,11 @@ class PathfindingWorldComponent(PythonComponent):
         # Шаг 2: Найти все пары соседних регионов и граничные воксели
         # Структура: {(region_a, region_b): set of voxels from region_a on boundary}
         boundary_pairs: dict[tuple[int, int], set[tuple[int, int, int]]] = {}
+        scan_all = not incremental
 
         for voxel, region_id in voxel_to_region.items():
+            if not scan_all and region_id not in self._changed_regions:
+                continue
             vx, vy, vz = voxel
             for dx, dy, dz in NEIGHBORS_26:
                 neighbor = (vx + dx, vy + dy, vz + dz)
@@ -338,6 +384,26 @@ class PathfindingWorldComponent(PythonComponent):
                     portal = self._create_portal(region_a, region_b, cluster)
                     self._portals.append(portal)
 
+        # Порталы между неизменёнными регионами — из кэша, с новыми region_id
+        if incremental:
+            region_by_polygon = {id(polygon): region_id for region_id, polygon in region_polygons.items()}
+            for (poly_a, poly_b), cached_portals in self._portal_cache.items():
+                region_a = region_by_polygon.get(poly_a)
+                region_b = region_by_polygon.get(poly_b)
+                if region_a is None or region_b is None:
+                    continue
+                if region_a in self._changed_regions or region_b in self._changed_regions:
+                    continue
+                low, high = min(region_a, region_b), max(region_a, region_b)
+                for portal in cached_portals:
+                    self._portals.append(replace(portal, region_a=low, region_b=high))
+            self._portals.sort(key=lambda p: (p.region_a, p.region_b))
+
+        self._portal_cache = {}
+        for portal in self._portals:
+            key = (id(region_polygons[portal.region_a]), id(region_polygons[portal.region_b]))
+            self._portal_cache.setdefault(key, []).append(portal)
+
         # log.debug(f"[PathfindingWorld] computed {len(self._portals)} portals")
 
         # Строим граф смежности регионов
@@ -414,12 +480,19 @@ class PathfindingWorldComponent(PythonComponent):
         # Возвращаем xyz
         return transformed[:, :3].astype(np.float32)
 
-    def rebuild(self) -> None:
-        """Перестроить граф (вызывать после изменения NavMesh)."""
+    def rebuild(self, incremental: bool = True) -> None:
+        """
+        Перестроить граф (вызывать после изменения NavMesh).
+
+        Args:
+            incremental: Переиспользовать регионы и порталы полигонов, которые
+                остались теми же объектами (например, чистые тайлы
+                TiledNavMeshBuilder). False — полная перестройка.
+        """
         if self.scene is None:
             return
         self._collect_navmeshes(self.scene)
-        self._build_graph()
+        self._build_graph(incremental=incremental)
         self._initialized = True
 
     def find_path(
@@ -467,6 +540,86 @@ class PathfindingWorldComponent(PythonComponent):
         # Путь внутри одного региона
         return self._find_single_region_path(start, end, start_region, start_tri_idx, end_tri_idx)
 
+    def find_paths(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+    ) -> List[Optional[List[np.ndarray]]]:
+        """
+        Найти пути для группы агентов за один вызов.
+
+        Запросы группируются по целевой точке: поиск треугольника цели и
+        поле направлений (обратный Dijkstra от цели) считаются один раз на
+        группу, после чего каждый путь восстанавливается по полю и
+        сглаживается так же, как в find_path. Межрегиональные запросы
+        обрабатываются поштучно через порталы.
+
+        Args:
+            starts: (N, 3) — начальные точки в мировых координатах.
+            ends: (N, 3) — конечные точки, или (3,) — общая цель для всех.
+
+        Returns:
+            Список длины N: путь (как у find_path) или None для каждого запроса.
+        """
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float64)
+        if ends.ndim == 1:
+            ends = np.broadcast_to(ends.reshape(1, 3), starts.shape)
+        else:
+            ends = ends.reshape(-1, 3)
+        if len(ends) != len(starts):
+            raise ValueError(
+                f"PathfindingWorldComponent.find_paths expects matching starts/ends, got {len(starts)} and {len(ends)}"
+            )
+
+        results: List[Optional[List[np.ndarray]]] = [None] * len(starts)
+        if not self._initialized:
+            log.warn("[PathfindingWorld] not initialized")
+            return results
+        if len(starts) == 0:
+            return results
+
+        unique_ends, inverse = np.unique(ends, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        start_tris = [self.find_containing_triangle(start) for start in starts]
+
+        for goal_idx, goal in enumerate(unique_ends):
+            end_tri = self.find_containing_triangle(goal)
+            if end_tri is None:
+                continue
+            end_region, end_tri_idx = end_tri
+            members = np.flatnonzero(inverse == goal_idx)
+
+            same_region = [
+                int(i) for i in members
+                if start_tris[i] is not None and start_tris[i][0] == end_region
+            ]
+            flow_field = None
+            if same_region:
+                region = self._navmesh_graph.regions[end_region]
+                flow_field = reverse_dijkstra_triangles(
+                    end_tri_idx,
+                    region.neighbors,
+                    region.centroids,
+                    targets=np.array([start_tris[i][1] for i in same_region], dtype=np.int64),
+                )
+
+            for i in members:
+                start_tri = start_tris[i]
+                if start_tri is None:
+                    continue
+                start_region, start_tri_idx = start_tri
+                if start_region != end_region:
+                    results[i] = self._find_cross_region_path(
+                        starts[i], goal.copy(), start_region, end_region, start_tri_idx, end_tri_idx
+                    )
+                else:
+                    results[i] = self._find_single_region_path(
+                        starts[i], goal.copy(), start_region, start_tri_idx, end_tri_idx, flow_field=flow_field
+                    )
+
+        return results
+
     def _find_single_region_path(
         self,
         start: np.ndarray,
@@ -474,8 +627,14 @@ class PathfindingWorldComponent(PythonComponent):
         region_id: int,
         start_tri_idx: int,
         end_tri_idx: int,
+        flow_field: Optional[np.ndarray] = None,
     ) -> Optional[List[np.ndarray]]:
-        """Найти путь внутри одного региона."""
+        """
+        Найти путь внутри одного региона.
+
+        flow_field — поле направлений к end_tri_idx (reverse_dijkstra_triangles);
+        если задано, используется вместо A*.
+        """
         region = self._navmesh_graph.regions[region_id]
 
         # Получаем entity для трансформации
@@ -509,6 +668,10 @@ class PathfindingWorldComponent(PythonComponent):
 
         if start_tri_idx == end_tri_idx:
             path_indices = [start_tri_idx]
+        elif flow_field is not None:
+            path_indices = follow_flow_field(start_tri_idx, flow_field)
+            if path_indices is None:
+                return None
         else:
             from termin.navmesh.pathfinding import astar_triangles
 
@@ -568,7 +731,8 @@ class PathfindingWorldComponent(PythonComponent):
         # Оптимизация через line of sight
         if self.use_los_optimization and len(local_path) > 2:
             local_path = self._optimize_path_los(
-                local_path, start_tri_idx, region.triangles, region.vertices, region.neighbors
+                local_path, start_tri_idx, region.triangles, region.vertices, region.neighbors,
+                find_triangle=region.find_triangle,
             )
             # log.debug(f"[PathfindingWorld] LOS optimized: {len(local_path)} points")
 
@@ -780,15 +944,8 @@ class PathfindingWorldComponent(PythonComponent):
             local_point = point
 
         # Находим ближайший центроид
-        best_idx = 0
-        best_dist = float("inf")
-        for i, centroid in enumerate(region.centroids):
-            dist = float(np.linalg.norm(local_point - centroid))
-            if dist < best_dist:
-                best_dist = dist
-                best_idx = i
-
-        return best_idx
+        dists = np.linalg.norm(region.centroids - local_point, axis=1)
+        return int(np.argmin(dists))
 
     def _closest_point_on_segment_to_line(
         self,
@@ -1058,16 +1215,23 @@ class PathfindingWorldComponent(PythonComponent):
         triangles: np.ndarray,
         vertices: np.ndarray,
         neighbors: np.ndarray,
+        find_triangle: Optional[Callable[[np.ndarray], int]] = None,
     ) -> List[np.ndarray]:
         """
         Оптимизировать путь через проверку прямой видимости.
 
         Пробует срезать промежуточные точки, если есть прямая видимость.
+        find_triangle — поиск треугольника по точке (обычно RegionGraph.find_triangle
+        с пространственным индексом); по умолчанию полный перебор.
         """
         if len(path) <= 2:
             return path
 
-        from termin.navmesh.pathfinding import find_triangle_containing_point
+        if find_triangle is None:
+            from termin.navmesh.pathfinding import find_triangle_containing_point
+
+            def find_triangle(point: np.ndarray) -> int:
+                return find_triangle_containing_point(point, vertices, triangles)
 
         optimized: List[np.ndarray] = [path[0]]
         current_idx = 0
@@ -1095,7 +1259,7 @@ class PathfindingWorldComponent(PythonComponent):
             optimized.append(next_point)
 
             # Находим треугольник для новой текущей точки
-            next_tri = find_triangle_containing_point(next_point, vertices, triangles)
+            next_tri = find_triangle(next_point)
             if next_tri >= 0:
                 current_tri = next_tri
             # Если не нашли — оставляем предыдущий (не идеально, но лучше чем start_tri)
@@ -2,6 +2,13 @@
 Сохранение и загрузка NavMesh.
 
 Supports both JSON (.navmesh) and binary formats.
+
+Binary v2 stores all polygons in contiguous global arrays (vertices,
+triangles, triangle adjacency, voxels, spatial index grid), each section
+aligned to NAVMESH_BINARY_ALIGNMENT bytes. Loading maps the sections with
+np.frombuffer (or np.memmap via load_binary) without copying, and the
+stored adjacency and index are attached to NavPolygon, so building the
+pathfinding graph does not recompute them.
 """
 
 from __future__ import annotations
@@ -20,7 +27,60 @@ NAVMESH_FORMAT_VERSION = "1.0"
 
 # Binary format magic and version
 NAVMESH_BINARY_MAGIC = b"TNAV"
-NAVMESH_BINARY_VERSION = 1
+NAVMESH_BINARY_VERSION = 2
+NAVMESH_BINARY_SUPPORTED_VERSIONS = (1, 2)
+
+# Выравнивание секций v2 в байтах
+NAVMESH_BINARY_ALIGNMENT = 64
+
+# magic, version, polygon count, name length, cell_size, origin, section count, reserved
+_V2_HEADER = struct.Struct("<4sIIIf3fII")
+# offset, size in bytes
+_V2_SECTION_ENTRY = struct.Struct("<QQ")
+
+# Запись полигона v2: смещения в глобальных массивах и параметры сетки индекса
+_V2_POLYGON_DTYPE = np.dtype([
+    ("vertex_offset", "<i8"),
+    ("vertex_count", "<i8"),
+    ("triangle_offset", "<i8"),
+    ("triangle_count", "<i8"),
+    ("voxel_offset", "<i8"),
+    ("voxel_count", "<i8"),
+    ("neighbor_offset", "<i8"),
+    ("neighbor_count", "<i8"),
+    ("cell_start_offset", "<i8"),
+    ("cell_item_offset", "<i8"),
+    ("cell_item_count", "<i8"),
+    ("grid_axes", "<i4", (2,)),
+    ("grid_shape", "<i4", (2,)),
+    ("grid_origin", "<f8", (2,)),
+    ("grid_cell_size", "<f8"),
+    ("locator_tolerance", "<f8"),
+    ("normal", "<f4", (3,)),
+    ("reserved", "<u4"),
+])
+
+# Секции v2 в порядке таблицы: (имя, dtype, форма строки)
+_V2_SECTIONS: tuple[tuple[str, np.dtype, tuple[int, ...]], ...] = (
+    ("polygons", _V2_POLYGON_DTYPE, ()),
+    ("vertices", np.dtype("<f4"), (3,)),
+    ("triangles", np.dtype("<i4"), (3,)),
+    ("adjacency", np.dtype("<i4"), (3,)),
+    ("voxel_coords", np.dtype("<i4"), (3,)),
+    ("neighbors", np.dtype("<i4"), ()),
+    ("cell_start", np.dtype("<i8"), ()),
+    ("cell_items", np.dtype("<i4"), ()),
+)
+
+
+def _align(offset: int) -> int:
+    return (offset + NAVMESH_BINARY_ALIGNMENT - 1) // NAVMESH_BINARY_ALIGNMENT * NAVMESH_BINARY_ALIGNMENT
+
+
+def _concat(parts: list[np.ndarray], dtype: np.dtype, row_shape: tuple[int, ...]) -> np.ndarray:
+    if not parts:
+        return np.zeros((0, *row_shape), dtype=dtype)
+    return np.ascontiguousarray(np.concatenate(parts), dtype=dtype)
 
 
 class NavMeshPersistence:
@@ -28,6 +88,8 @@ class NavMeshPersistence:
     Сохранение и загрузка NavMesh в файл .navmesh.
 
     Формат — JSON с массивами вершин и треугольников.
+    Бинарный формат (to_bytes/from_bytes, save_binary/load_binary) —
+    для артефактов сцены и быстрой загрузки.
     """
 
     @staticmethod
@@ -161,11 +223,253 @@ class NavMeshPersistence:
     # === Binary serialization ===
 
     @staticmethod
-    def to_bytes(navmesh: NavMesh) -> bytes:
+    def to_bytes(navmesh: NavMesh, version: int = NAVMESH_BINARY_VERSION) -> bytes:
         """
         Serialize NavMesh to binary format.
 
-        Binary format:
+        Args:
+            navmesh: NavMesh to serialize.
+            version: Binary format version (1 or 2).
+
+        Returns:
+            Binary data.
+        """
+        if version == 1:
+            return NavMeshPersistence._to_bytes_v1(navmesh)
+        if version == 2:
+            return NavMeshPersistence._to_bytes_v2(navmesh)
+        raise ValueError(f"Unsupported navmesh binary version: {version}")
+
+    @staticmethod
+    def from_bytes(data) -> NavMesh:
+        """
+        Deserialize NavMesh from binary format.
+
+        For v2, polygon arrays are read-only views into data (bytes,
+        memoryview, mmap or np.memmap), which must stay alive while the
+        NavMesh is in use.
+
+        Args:
+            data: Binary data.
+
+        Returns:
+            Deserialized NavMesh.
+
+        Raises:
+            ValueError: If data format is invalid.
+        """
+        magic = bytes(data[0:4])
+        if magic != NAVMESH_BINARY_MAGIC:
+            raise ValueError(f"Invalid navmesh binary magic: {magic!r}")
+
+        version, = struct.unpack_from("<I", data, 4)
+        if version == 1:
+            return NavMeshPersistence._from_bytes_v1(bytes(data))
+        if version == 2:
+            return NavMeshPersistence._from_bytes_v2(data)
+        raise ValueError(f"Unsupported navmesh binary version: {version}")
+
+    @staticmethod
+    def save_binary(
+        navmesh: NavMesh,
+        path: Union[str, Path],
+        version: int = NAVMESH_BINARY_VERSION,
+    ) -> None:
+        """Сохранить NavMesh в бинарный файл."""
+        Path(path).write_bytes(NavMeshPersistence.to_bytes(navmesh, version=version))
+
+    @staticmethod
+    def load_binary(path: Union[str, Path], mmap: bool = True) -> NavMesh:
+        """
+        Загрузить NavMesh из бинарного файла.
+
+        Args:
+            path: Путь к файлу.
+            mmap: Отобразить файл в память (np.memmap) вместо чтения целиком.
+                Массивы полигонов v2 ссылаются на отображение без копирования.
+
+        Returns:
+            Загруженный NavMesh.
+        """
+        path = Path(path)
+        if mmap:
+            data = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            data = path.read_bytes()
+        return NavMeshPersistence.from_bytes(data)
+
+    @staticmethod
+    def _to_bytes_v2(navmesh: NavMesh) -> bytes:
+        """
+        Binary format v2 (little-endian):
+            - header: magic "TNAV", version, polygon count, name length,
+              cell_size (float32), origin (3 x float32), section count
+            - section table: (offset, size) as 2 x uint64 per section
+            - name (utf-8)
+            - sections, each aligned to NAVMESH_BINARY_ALIGNMENT:
+                - polygons: per-polygon records (_V2_POLYGON_DTYPE)
+                - vertices: (V, 3) float32, all polygons
+                - triangles: (T, 3) int32, indices local to the polygon
+                - adjacency: (T, 3) int32, build_adjacency per polygon
+                - voxel_coords: (N, 3) int32
+                - neighbors: (K,) int32
+                - cell_start: TriangleLocator.cell_start per polygon, int64
+                - cell_items: TriangleLocator.cell_items per polygon, int32
+        """
+        from termin.navmesh.pathfinding import TriangleLocator, build_adjacency
+
+        polygons = navmesh.polygons
+        records = np.zeros(len(polygons), dtype=_V2_POLYGON_DTYPE)
+        parts: dict[str, list[np.ndarray]] = {name: [] for name, _, _ in _V2_SECTIONS[1:]}
+        counts = dict.fromkeys(parts, 0)
+
+        for i, polygon in enumerate(polygons):
+            vertices = np.asarray(polygon.vertices, dtype=np.float32).reshape(-1, 3)
+            triangles = np.asarray(polygon.triangles, dtype=np.int32).reshape(-1, 3)
+            adjacency = polygon.adjacency
+            if adjacency is None or len(adjacency) != len(triangles):
+                adjacency = build_adjacency(triangles)
+            voxels = np.asarray(polygon.voxel_coords, dtype=np.int32).reshape(-1, 3)
+            neighbors = np.asarray(polygon.neighbors, dtype=np.int32).reshape(-1)
+            # Индекс строится по float32-вершинам — тем же, что увидит загрузка
+            locator = TriangleLocator.from_mesh(vertices, triangles)
+
+            record = records[i]
+            record["vertex_offset"] = counts["vertices"]
+            record["vertex_count"] = len(vertices)
+            record["triangle_offset"] = counts["triangles"]
+            record["triangle_count"] = len(triangles)
+            record["voxel_offset"] = counts["voxel_coords"]
+            record["voxel_count"] = len(voxels)
+            record["neighbor_offset"] = counts["neighbors"]
+            record["neighbor_count"] = len(neighbors)
+            record["cell_start_offset"] = counts["cell_start"]
+            record["cell_item_offset"] = counts["cell_items"]
+            record["cell_item_count"] = len(locator.cell_items)
+            record["grid_axes"] = locator.axes
+            record["grid_shape"] = locator.grid_shape
+            record["grid_origin"] = locator.grid_origin
+            record["grid_cell_size"] = locator.cell_size
+            record["locator_tolerance"] = locator.tolerance
+            record["normal"] = np.asarray(polygon.normal, dtype=np.float32).reshape(3)
+
+            for name, array in (
+                ("vertices", vertices),
+                ("triangles", triangles),
+                ("adjacency", adjacency),
+                ("voxel_coords", voxels),
+                ("neighbors", neighbors),
+                ("cell_start", locator.cell_start),
+                ("cell_items", locator.cell_items),
+            ):
+                parts[name].append(array)
+                counts[name] += len(array)
+
+        arrays = [records] + [
+            _concat(parts[name], dtype, row_shape) for name, dtype, row_shape in _V2_SECTIONS[1:]
+        ]
+
+        name_bytes = navmesh.name.encode("utf-8")
+        origin = np.asarray(navmesh.origin, dtype=np.float32).reshape(3)
+        header = _V2_HEADER.pack(
+            NAVMESH_BINARY_MAGIC, 2, len(polygons), len(name_bytes),
+            navmesh.cell_size, *origin.tolist(), len(_V2_SECTIONS), 0,
+        )
+
+        offset = _V2_HEADER.size + _V2_SECTION_ENTRY.size * len(arrays) + len(name_bytes)
+        table: list[bytes] = []
+        layout: list[tuple[int, bytes]] = []
+        for array in arrays:
+            offset = _align(offset)
+            payload = array.tobytes()
+            table.append(_V2_SECTION_ENTRY.pack(offset, len(payload)))
+            layout.append((offset, payload))
+            offset += len(payload)
+
+        out = bytearray(offset)
+        head = header + b"".join(table) + name_bytes
+        out[:len(head)] = head
+        for start, payload in layout:
+            out[start:start + len(payload)] = payload
+        return bytes(out)
+
+    @staticmethod
+    def _from_bytes_v2(data) -> NavMesh:
+        from termin.navmesh.pathfinding import TriangleLocator
+
+        if len(data) < _V2_HEADER.size:
+            raise ValueError("Truncated navmesh binary header")
+        (
+            _, _, polygon_count, name_len, cell_size, ox, oy, oz, section_count, _,
+        ) = _V2_HEADER.unpack_from(data, 0)
+        if section_count < len(_V2_SECTIONS):
+            raise ValueError(f"Navmesh binary has {section_count} sections, expected {len(_V2_SECTIONS)}")
+
+        sections: dict[str, np.ndarray] = {}
+        for index, (name, dtype, row_shape) in enumerate(_V2_SECTIONS):
+            offset, size = _V2_SECTION_ENTRY.unpack_from(data, _V2_HEADER.size + index * _V2_SECTION_ENTRY.size)
+            if offset + size > len(data) or size % dtype.itemsize != 0:
+                raise ValueError(f"Invalid navmesh binary section '{name}'")
+            array = np.frombuffer(data, dtype=dtype, count=size // dtype.itemsize, offset=offset)
+            if row_shape:
+                array = array.reshape(-1, *row_shape)
+            sections[name] = array
+
+        name_offset = _V2_HEADER.size + section_count * _V2_SECTION_ENTRY.size
+        name = bytes(data[name_offset:name_offset + name_len]).decode("utf-8")
+
+        records = sections["polygons"]
+        if len(records) != polygon_count:
+            raise ValueError(f"Navmesh binary polygon table has {len(records)} entries, expected {polygon_count}")
+
+        vertices = sections["vertices"]
+        triangles = sections["triangles"]
+        adjacency = sections["adjacency"]
+        voxel_coords = sections["voxel_coords"]
+        neighbors = sections["neighbors"]
+        cell_start = sections["cell_start"]
+        cell_items = sections["cell_items"]
+
+        polygons: list[NavPolygon] = []
+        for i, record in enumerate(records.tolist()):
+            (
+                vo, vc, to, tc, xo, xc, no, nc, so, io, ic,
+                axes, shape, grid_origin, grid_cell_size, tolerance, _, _,
+            ) = record
+            poly_vertices = vertices[vo:vo + vc]
+            poly_triangles = triangles[to:to + tc]
+            locator = TriangleLocator.from_grid(
+                poly_vertices,
+                poly_triangles,
+                tolerance=tolerance,
+                axes=axes,
+                grid_origin=np.array(grid_origin, dtype=np.float64),
+                cell_size=grid_cell_size,
+                grid_shape=shape,
+                cell_start=cell_start[so:so + shape[0] * shape[1] + 1],
+                cell_items=cell_items[io:io + ic],
+            )
+            polygons.append(NavPolygon(
+                vertices=poly_vertices,
+                triangles=poly_triangles,
+                normal=records["normal"][i],
+                voxel_coords=list(map(tuple, voxel_coords[xo:xo + xc].tolist())),
+                neighbors=neighbors[no:no + nc].tolist(),
+                adjacency=adjacency[to:to + tc],
+                locator=locator,
+            ))
+
+        return NavMesh(
+            polygons=polygons,
+            cell_size=cell_size,
+            origin=np.array([ox, oy, oz], dtype=np.float32),
+            name=name,
+        )
+
+    @staticmethod
+    def _to_bytes_v1(navmesh: NavMesh) -> bytes:
+        """
+        Binary format v1:
             - 4 bytes: magic "TNAV"
             - 4 bytes: version (uint32)
             - 4 bytes: name length (uint32)
@@ -181,18 +485,12 @@ class NavMeshPersistence:
                 - 12 bytes: normal (3 x float32)
                 - 4 bytes: neighbor count (uint32)
                 - K*4 bytes: neighbors (K x int32)
-
-        Args:
-            navmesh: NavMesh to serialize.
-
-        Returns:
-            Binary data.
         """
         parts: list[bytes] = []
 
         # Header
         parts.append(NAVMESH_BINARY_MAGIC)
-        parts.append(struct.pack("<I", NAVMESH_BINARY_VERSION))
+        parts.append(struct.pack("<I", 1))
 
         # Name
         name_bytes = navmesh.name.encode("utf-8")
@@ -228,32 +526,9 @@ class NavMeshPersistence:
         return b"".join(parts)
 
     @staticmethod
-    def from_bytes(data: bytes) -> NavMesh:
-        """
-        Deserialize NavMesh from binary format.
-
-        Args:
-            data: Binary data.
-
-        Returns:
-            Deserialized NavMesh.
-
-        Raises:
-            ValueError: If data format is invalid.
-        """
-        offset = 0
-
-        # Magic
-        magic = data[offset:offset + 4]
-        offset += 4
-        if magic != NAVMESH_BINARY_MAGIC:
-            raise ValueError(f"Invalid navmesh binary magic: {magic!r}")
-
-        # Version
-        version, = struct.unpack_from("<I", data, offset)
-        offset += 4
-        if version != NAVMESH_BINARY_VERSION:
-            raise ValueError(f"Unsupported navmesh binary version: {version}")
+    def _from_bytes_v1(data: bytes) -> NavMesh:
+        # Magic и версия проверены в from_bytes
+        offset = 8
 
         # Name
         name_len, = struct.unpack_from("<I", data, offset)
@@ -12,11 +12,19 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import multiprocessing
+import os
+from pathlib import Path
+import sys
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from tcbase import log
+from termin_nanobind.runtime import find_sdk, is_python_executable, sdk_python_executable
 from termin.navmesh.types import NavPolygon, NavMesh, NavMeshConfig
 
 from termin.navmesh.region_growing import (
@@ -110,6 +118,33 @@ def merge_duplicate_vertices(
     return unique_vertices, remapped_triangles
 
 
+def clip_regions_to_bounds(
+    regions: list[tuple[list[tuple[int, int, int]], np.ndarray]],
+    bounds_min: np.ndarray,
+    bounds_max: np.ndarray,
+) -> list[tuple[list[tuple[int, int, int]], np.ndarray]]:
+    """
+    Оставить в регионах только воксели внутри [bounds_min, bounds_max].
+
+    Порядок вокселей внутри региона сохраняется, пустые регионы удаляются.
+    """
+    bounds_min = np.asarray(bounds_min, dtype=np.int64)
+    bounds_max = np.asarray(bounds_max, dtype=np.int64)
+
+    result: list[tuple[list[tuple[int, int, int]], np.ndarray]] = []
+    for region_voxels, region_normal in regions:
+        if not region_voxels:
+            continue
+        coords = np.array(region_voxels, dtype=np.int64).reshape(-1, 3)
+        inside = np.all((coords >= bounds_min) & (coords <= bounds_max), axis=1)
+        if inside.all():
+            result.append((region_voxels, region_normal))
+        elif inside.any():
+            kept = [region_voxels[i] for i in np.flatnonzero(inside).tolist()]
+            result.append((kept, region_normal))
+    return result
+
+
 class PolygonBuilder:
     """
     Строит NavMesh из VoxelGrid.
@@ -156,14 +191,58 @@ class PolygonBuilder:
         # Фильтруем по максимальному углу наклона (если задан)
         surface_voxels = collect_surface_voxels(grid, max_slope_cos=self.config.max_slope_cos)
 
+        return self.build_from_surface_voxels(
+            surface_voxels,
+            grid.cell_size,
+            grid.origin,
+            do_expand_regions=do_expand_regions,
+            share_boundary=share_boundary,
+            project_contours=project_contours,
+            stitch_contours=stitch_contours,
+        )
+
+    def build_from_surface_voxels(
+        self,
+        surface_voxels: dict[tuple[int, int, int], list[np.ndarray]],
+        cell_size: float,
+        origin: np.ndarray,
+        do_expand_regions: bool = True,
+        share_boundary: bool = False,
+        project_contours: bool = False,
+        stitch_contours: bool = False,
+        core_bounds: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> NavMesh:
+        """
+        Построить NavMesh из уже собранных поверхностных вокселей (шаги 2-7).
+
+        Args:
+            surface_voxels: {(vx, vy, vz): [normal, ...]} (см. collect_surface_voxels).
+            cell_size: Размер вокселя.
+            origin: Начало координат сетки.
+            do_expand_regions: Расширять регионы (шаг 2.5).
+            share_boundary: Граничные воксели добавляются в соседние регионы.
+            project_contours: Проецировать контуры на плоскость региона.
+            stitch_contours: Сшивать контуры на границах регионов.
+            core_bounds: (min, max) включительно в координатах вокселей.
+                Если задано, воксели вне этих границ участвуют в построении
+                регионов, distance field и эрозии, но отбрасываются перед
+                извлечением контуров. Используется тайловым построением:
+                тайл строится с полем вокруг, чтобы края тайла не считались
+                краями поверхности.
+
+        Returns:
+            Навигационная сетка.
+        """
+        origin = np.asarray(origin)
+
         if not surface_voxels:
             return NavMesh(
-                cell_size=grid.cell_size,
-                origin=grid.origin.copy(),
+                cell_size=cell_size,
+                origin=origin.copy(),
             )
 
-        self._last_cell_size = grid.cell_size
-        self._last_origin = np.array(grid.origin, dtype=np.float32)
+        self._last_cell_size = cell_size
+        self._last_origin = np.array(origin, dtype=np.float32)
         self._last_eroded_voxels = set()
 
         # Шаг 2: Region Growing — разбиваем на группы
@@ -209,8 +288,8 @@ class PolygonBuilder:
                 ws_result = watershed_split_region(
                     region_voxels,
                     region_normal,
-                    grid.cell_size,
-                    np.array(grid.origin, dtype=np.float32),
+                    cell_size,
+                    np.array(origin, dtype=np.float32),
                     smoothing=self.config.watershed_smoothing,
                 )
                 # Сохраняем данные из watershed
@@ -231,8 +310,8 @@ class PolygonBuilder:
                 df = compute_distance_field_for_region(
                     region_voxels,
                     region_normal,
-                    grid.cell_size,
-                    np.array(grid.origin, dtype=np.float32),
+                    cell_size,
+                    np.array(origin, dtype=np.float32),
                 )
                 self._last_distance_fields.append(df)
 
@@ -242,7 +321,7 @@ class PolygonBuilder:
             # Центр вокселя с distance=d находится на (d + 0.5) * cell_size от края
             # Для агента нужно: (d + 0.5) * cell_size >= agent_radius
             # Поэтому: d >= agent_radius / cell_size - 0.5
-            min_distance = max(0.0, self.config.agent_radius / grid.cell_size - 0.5)
+            min_distance = max(0.0, self.config.agent_radius / cell_size - 0.5)
 
             # Объединяем все distance fields в один словарь
             combined_df: dict[tuple[int, int, int], float] = {}
@@ -274,6 +353,13 @@ class PolygonBuilder:
             if self._last_watershed_regions:
                 self._last_watershed_regions = regions
 
+        # Шаг 2.95: Обрезка по ядру тайла (поле вокруг тайла нужно только
+        # для регионов и distance field)
+        if core_bounds is not None:
+            regions = clip_regions_to_bounds(regions, core_bounds[0], core_bounds[1])
+            if self._last_watershed_regions:
+                self._last_watershed_regions = regions
+
         # Шаг 2.10: Общие граничные воксели между под-регионами
         # После watershed/erosion добавляем граничные воксели в оба соседних региона
         # Это необходимо для согласованного упрощения контуров
@@ -285,7 +371,7 @@ class PolygonBuilder:
 
         # Создаём общую карту меток для согласованного извлечения контуров
         self._shared_label_map = create_shared_label_map(
-            regions, grid.cell_size, np.array(grid.origin, dtype=np.float32)
+            regions, cell_size, np.array(origin, dtype=np.float32)
         )
 
         # Для сшивки контуров: находим какие воксели в каких регионах
@@ -302,14 +388,24 @@ class PolygonBuilder:
             # Вычисляем плоскости для каждого региона
             for region_voxels, region_normal in regions:
                 centers_3d = np.array([
-                    grid.origin + (np.array(v) + 0.5) * grid.cell_size
+                    origin + (np.array(v) + 0.5) * cell_size
                     for v in region_voxels
                 ], dtype=np.float32)
                 centroid = centers_3d.mean(axis=0)
                 region_planes.append((centroid, region_normal))
 
         # Для каждого региона извлекаем контур напрямую из вокселей
-        polygons: list[NavPolygon] = []
+        # и триангулируем его. Регионы независимы, поэтому при
+        # config.bake_workers != 1 они обрабатываются пулом процессов.
+        context = _RegionBakeContext(
+            cell_size=cell_size,
+            grid_origin=origin.copy(),
+            project_contours=project_contours,
+            stitch_contours=stitch_contours,
+            voxel_to_regions=voxel_to_regions,
+            region_planes=region_planes,
+            shared_label_map=self._shared_label_map,
+        )
         stats = {
             "total_regions": len(regions),
             "skipped_small": 0,
@@ -317,52 +413,26 @@ class PolygonBuilder:
             "built": 0,
         }
 
+        tasks: list[_RegionBakeTask] = []
         for region_idx, (region_voxels, region_normal) in enumerate(regions):
             if len(region_voxels) < self.config.min_region_voxels:
                 stats["skipped_small"] += 1
                 continue
-
-            # Извлекаем контур напрямую из вокселей
-            polygon = self._extract_contour_from_voxels(
+            tasks.append(_RegionBakeTask.pack(
+                region_idx,
                 region_voxels,
                 region_normal,
-                grid,
-                region_idx=region_idx,
-                project_contours=project_contours,
-                stitch_contours=stitch_contours,
-                voxel_to_regions=voxel_to_regions,
-                region_planes=region_planes,
-            )
-            if polygon is not None:
-                # Триангулируем полигон
-                boundary_voxels = inter_region_boundaries.get(region_idx, set())
-                vertices, triangles = self.triangulate_region(
-                    region_voxels,
-                    region_normal,
-                    grid.cell_size,
-                    np.array(grid.origin, dtype=np.float32),
-                    simplify_epsilon=self.config.contour_epsilon,
-                    max_edge_length=self.config.max_edge_length,
-                    min_edge_length=self.config.min_edge_length if self.config.use_edge_collapse else 0.0,
-                    min_contour_edge_length=self.config.min_contour_edge_length if self.config.use_edge_collapse else 0.0,
-                    max_vertex_valence=self.config.max_vertex_valence,
-                    use_delaunay_flip=self.config.use_delaunay_flip,
-                    use_valence_flip=self.config.use_valence_flip,
-                    use_angle_flip=self.config.use_angle_flip,
-                    use_cvt_smoothing=self.config.use_cvt_smoothing,
-                    use_second_pass=self.config.use_second_pass,
-                    boundary_voxels=boundary_voxels,
-                    use_edge_contours=True,
-                    shared_label_map=self._shared_label_map,
-                    region_idx=region_idx,
-                )
-                if len(vertices) > 0 and len(triangles) > 0:
-                    polygon.vertices = vertices
-                    polygon.triangles = triangles
-                    # Обновляем outer_contour для соответствия новым вершинам
-                    polygon.outer_contour = list(range(len(vertices)))
-                    polygon.holes = []
+                inter_region_boundaries.get(region_idx, set()),
+            ))
 
+        results = self._bake_regions(tasks, context)
+
+        # Сборка в порядке индексов регионов — результат не зависит от
+        # числа процессов и порядка их завершения
+        polygons: list[NavPolygon] = []
+        for task in tasks:
+            polygon = results[task.region_idx]
+            if polygon is not None:
                 polygons.append(polygon)
                 stats["built"] += 1
             else:
@@ -372,9 +442,94 @@ class PolygonBuilder:
 
         return NavMesh(
             polygons=polygons,
-            cell_size=grid.cell_size,
-            origin=grid.origin.copy(),
+            cell_size=cell_size,
+            origin=origin.copy(),
+        )
+
+    def _bake_regions(
+        self,
+        tasks: list[_RegionBakeTask],
+        context: _RegionBakeContext,
+    ) -> dict[int, NavPolygon | None]:
+        """
+        Построить полигоны для регионов: последовательно или пулом процессов.
+
+        Returns:
+            {region_idx: NavPolygon или None}.
+        """
+        workers = self.config.bake_workers
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(tasks))
+
+        if workers > 1:
+            executable = _bake_worker_executable()
+            if executable is None:
+                log.warning("PolygonBuilder: no Python interpreter for bake workers, baking regions serially")
+            else:
+                try:
+                    return _bake_regions_parallel(self.config, context, tasks, workers, executable)
+                except (OSError, BrokenProcessPool) as e:
+                    log.warning(f"PolygonBuilder: process pool failed ({e}), baking regions serially")
+
+        return {
+            task.region_idx: self._bake_region(task, context)
+            for task in tasks
+        }
+
+    def _bake_region(
+        self,
+        task: _RegionBakeTask,
+        context: _RegionBakeContext,
+    ) -> NavPolygon | None:
+        """Контур + триангуляция одного региона (шаг 3-7 пайплайна)."""
+        region_voxels, region_normal, boundary_voxels = task.unpack()
+        region_idx = task.region_idx
+
+        # Извлекаем контур напрямую из вокселей
+        polygon = self._extract_contour_from_voxels(
+            region_voxels,
+            region_normal,
+            context.cell_size,
+            context.grid_origin,
+            region_idx=region_idx,
+            project_contours=context.project_contours,
+            stitch_contours=context.stitch_contours,
+            voxel_to_regions=context.voxel_to_regions,
+            region_planes=context.region_planes,
+        )
+        if polygon is None:
+            return None
+
+        # Триангулируем полигон
+        vertices, triangles = self.triangulate_region(
+            region_voxels,
+            region_normal,
+            context.cell_size,
+            np.array(context.grid_origin, dtype=np.float32),
+            simplify_epsilon=self.config.contour_epsilon,
+            max_edge_length=self.config.max_edge_length,
+            min_edge_length=self.config.min_edge_length if self.config.use_edge_collapse else 0.0,
+            min_contour_edge_length=self.config.min_contour_edge_length if self.config.use_edge_collapse else 0.0,
+            max_vertex_valence=self.config.max_vertex_valence,
+            use_delaunay_flip=self.config.use_delaunay_flip,
+            use_valence_flip=self.config.use_valence_flip,
+            use_angle_flip=self.config.use_angle_flip,
+            use_cvt_smoothing=self.config.use_cvt_smoothing,
+            use_second_pass=self.config.use_second_pass,
+            boundary_voxels=boundary_voxels,
+            use_edge_contours=True,
+            shared_label_map=context.shared_label_map,
+            region_idx=region_idx,
         )
+        if len(vertices) > 0 and len(triangles) > 0:
+            polygon.vertices = vertices
+            polygon.triangles = triangles
+            # Обновляем outer_contour для соответствия новым вершинам
+            polygon.outer_contour = list(range(len(vertices)))
+            polygon.holes = []
+
+        return polygon
 
     def get_distance_field_points(
         self,
@@ -497,7 +652,8 @@ class PolygonBuilder:
         self,
         voxels: list[tuple[int, int, int]],
         normal: np.ndarray,
-        grid: VoxelGrid,
+        cell_size: float,
+        origin: np.ndarray,
         region_idx: int = 0,
         project_contours: bool = False,
         stitch_contours: bool = False,
@@ -516,7 +672,8 @@ class PolygonBuilder:
         Args:
             voxels: Список координат вокселей региона.
             normal: Нормаль региона.
-            grid: Воксельная сетка.
+            cell_size: Размер вокселя.
+            origin: Начало координат сетки.
             region_idx: Индекс текущего региона.
             project_contours: Проецировать вершины контура на плоскость региона.
             stitch_contours: Сшивать контуры на границах регионов.
@@ -526,9 +683,6 @@ class PolygonBuilder:
         if len(voxels) < 1:
             return None
 
-        cell_size = grid.cell_size
-        origin = grid.origin
-
         # Определяем доминантную ось
         abs_normal = np.abs(normal)
         dominant_axis = int(np.argmax(abs_normal))
@@ -1180,3 +1334,116 @@ class PolygonBuilder:
 
         else:
             return np.array([]).reshape(0, 3), []
+
+
+@dataclass
+class _RegionBakeContext:
+    """Общие для всех регионов данные шага построения полигонов."""
+    cell_size: float
+    grid_origin: np.ndarray
+    project_contours: bool
+    stitch_contours: bool
+    voxel_to_regions: dict[tuple[int, int, int], list[int]]
+    region_planes: list[tuple[np.ndarray, np.ndarray]]
+    shared_label_map: SharedLabelMap | None
+
+
+@dataclass
+class _RegionBakeTask:
+    """
+    Регион для обработки в отдельном процессе.
+
+    Воксели передаются компактными массивами int32 вместо списков кортежей.
+    """
+    region_idx: int
+    voxels: np.ndarray
+    """(N, 3) int32 — воксели региона в исходном порядке."""
+    normal: np.ndarray
+    boundary_voxels: np.ndarray
+    """(M, 3) int32 — воксели на границе с другими регионами."""
+
+    @staticmethod
+    def pack(
+        region_idx: int,
+        region_voxels: list[tuple[int, int, int]],
+        region_normal: np.ndarray,
+        boundary_voxels: set[tuple[int, int, int]],
+    ) -> _RegionBakeTask:
+        return _RegionBakeTask(
+            region_idx=region_idx,
+            voxels=np.array(region_voxels, dtype=np.int32).reshape(-1, 3),
+            normal=np.asarray(region_normal),
+            boundary_voxels=np.array(sorted(boundary_voxels), dtype=np.int32).reshape(-1, 3),
+        )
+
+    def unpack(
+        self,
+    ) -> tuple[list[tuple[int, int, int]], np.ndarray, set[tuple[int, int, int]]]:
+        voxels = [tuple(v) for v in self.voxels.tolist()]
+        boundary = {tuple(v) for v in self.boundary_voxels.tolist()}
+        return voxels, self.normal, boundary
+
+
+# Состояние процесса пула: builder и общий контекст передаются один раз
+# при старте процесса, задачи несут только данные региона
+_worker_builder: PolygonBuilder | None = None
+_worker_context: _RegionBakeContext | None = None
+
+
+def _init_bake_worker(config: NavMeshConfig, context: _RegionBakeContext) -> None:
+    global _worker_builder, _worker_context
+    _worker_builder = PolygonBuilder(config)
+    _worker_context = context
+
+
+def _bake_region_in_worker(task: _RegionBakeTask) -> tuple[int, NavPolygon | None]:
+    assert _worker_builder is not None and _worker_context is not None
+    return task.region_idx, _worker_builder._bake_region(task, _worker_context)
+
+
+def _bake_worker_executable() -> str | None:
+    """
+    Интерпретатор Python для spawn-процессов бейка.
+
+    Во встроенном редакторе sys.executable — бинарник редактора, и spawn
+    перезапускал бы редактор в каждом процессе. Берём Python из SDK, иначе
+    sys.executable, если это интерпретатор; None — бейкать последовательно.
+    """
+    prefix_root = find_sdk()
+    if prefix_root is not None:
+        sdk_python = sdk_python_executable(prefix_root)
+        if sdk_python is not None:
+            return str(sdk_python)
+    if is_python_executable(Path(sys.executable)):
+        return sys.executable
+    return None
+
+
+def _bake_regions_parallel(
+    config: NavMeshConfig,
+    context: _RegionBakeContext,
+    tasks: list[_RegionBakeTask],
+    workers: int,
+    executable: str,
+) -> dict[int, NavPolygon | None]:
+    """
+    Обработать регионы пулом процессов.
+
+    Крупные регионы отправляются первыми, чтобы хвост из одного большого
+    региона не держал остальные процессы без работы.
+    """
+    ordered = sorted(tasks, key=lambda t: len(t.voxels), reverse=True)
+    chunksize = max(1, len(ordered) // (workers * 8))
+
+    # spawn: редактор держит нативные потоки, fork их не переносит
+    mp_context = multiprocessing.get_context("spawn")
+    mp_context.set_executable(executable)
+    log.warning(f"PolygonBuilder: baking {len(tasks)} regions in {workers} processes")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_init_bake_worker,
+        initargs=(config, context),
+    ) as executor:
+        return dict(executor.map(_bake_region_in_worker, ordered, chunksize=chunksize))
@@ -212,6 +212,7 @@ class NavMeshRegistry:
                     neighbors=new_neighbors,
                     outer_contour=list(polygon.outer_contour) if polygon.outer_contour else None,
                     holes=[list(h) for h in polygon.holes] if polygon.holes else [],
+                    adjacency=polygon.adjacency,
                 )
                 merged.polygons.append(new_polygon)
             polygon_offset += len(mesh.polygons)
@@ -0,0 +1,272 @@
+"""
+Тайловое построение NavMesh с инкрементальной перестройкой.
+
+Воксельное пространство делится на кубические тайлы фиксированного размера
+(в вокселях). Каждый тайл строится отдельно через
+PolygonBuilder.build_from_surface_voxels и кэширует свои полигоны.
+Изменение геометрии помечает грязными только тайлы, пересекающие её bounds;
+update() перестраивает только их, остальные полигоны переиспользуются
+как есть (те же объекты NavPolygon), поэтому PathfindingWorldComponent
+может не пересчитывать для них RegionGraph и порталы.
+
+Чтобы края тайла не считались краями поверхности (эрозия по радиусу
+агента, distance field), тайл строится с полем в halo вокселей вокруг,
+а перед извлечением контуров регионы обрезаются по ядру тайла.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from tcbase import log
+from termin.navmesh.types import NavMesh, NavMeshConfig, NavPolygon
+from termin.navmesh.polygon_builder import PolygonBuilder
+from termin.navmesh.region_growing import collect_surface_voxels
+
+if TYPE_CHECKING:
+    from termin.voxels.grid import VoxelGrid
+
+
+TileKey = tuple[int, int, int]
+
+
+@dataclass
+class NavMeshTile:
+    """Закэшированный результат построения одного тайла."""
+
+    key: TileKey
+    """Координаты тайла (voxel // tile_size)."""
+
+    polygons: list[NavPolygon] = field(default_factory=list)
+    """Полигоны тайла (воксели только из ядра тайла)."""
+
+    voxel_count: int = 0
+    """Число поверхностных вокселей в ядре тайла."""
+
+
+class TiledNavMeshBuilder:
+    """
+    Строит NavMesh по тайлам и перестраивает только грязные тайлы.
+
+    Использование:
+        builder = TiledNavMeshBuilder(config, tile_size=32)
+        navmesh = builder.build(grid)
+        ...
+        builder.mark_dirty(bounds_min, bounds_max)  # bounds изменённого объекта
+        navmesh = builder.update(new_grid)
+    """
+
+    def __init__(
+        self,
+        config: NavMeshConfig | None = None,
+        tile_size: int = 32,
+        halo: int | None = None,
+        **build_kwargs,
+    ) -> None:
+        """
+        Args:
+            config: Конфигурация NavMesh.
+            tile_size: Размер тайла в вокселях.
+            halo: Поле вокруг тайла в вокселях. По умолчанию — радиус агента
+                в вокселях + 2.
+            build_kwargs: Дополнительные аргументы build_from_surface_voxels
+                (do_expand_regions, share_boundary и т.д.).
+        """
+        if tile_size < 1:
+            raise ValueError(f"tile_size must be >= 1, got {tile_size}")
+
+        self.config = config or NavMeshConfig()
+        self.tile_size = int(tile_size)
+        self.build_kwargs = build_kwargs
+        self._builder = PolygonBuilder(self.config)
+        self._halo = halo
+
+        self._tiles: dict[TileKey, NavMeshTile] = {}
+        self._dirty: set[TileKey] = set()
+        self._all_dirty = True
+        self._cell_size: float | None = None
+        self._origin: np.ndarray | None = None
+        self.last_rebuilt_tiles: list[TileKey] = []
+
+    @property
+    def halo(self) -> int:
+        """Поле вокруг тайла в вокселях."""
+        if self._halo is not None:
+            return self._halo
+        cell_size = self._cell_size or 1.0
+        return int(math.ceil(self.config.agent_radius / cell_size)) + 2
+
+    @property
+    def tiles(self) -> dict[TileKey, NavMeshTile]:
+        """Закэшированные тайлы."""
+        return self._tiles
+
+    @property
+    def dirty_tiles(self) -> set[TileKey]:
+        """Тайлы, помеченные для перестройки."""
+        return set(self._dirty)
+
+    def tile_key(self, voxel: tuple[int, int, int]) -> TileKey:
+        """Тайл, содержащий воксель."""
+        size = self.tile_size
+        return (voxel[0] // size, voxel[1] // size, voxel[2] // size)
+
+    def tile_voxel_bounds(self, key: TileKey) -> tuple[np.ndarray, np.ndarray]:
+        """(min, max) ядра тайла в координатах вокселей, включительно."""
+        lo = np.array(key, dtype=np.int64) * self.tile_size
+        return lo, lo + self.tile_size - 1
+
+    def tiles_in_bounds(self, bounds_min: np.ndarray, bounds_max: np.ndarray) -> set[TileKey]:
+        """
+        Тайлы, пересекающие AABB в координатах сетки.
+
+        Требует, чтобы размер ячейки был известен (после первого build).
+        """
+        if self._cell_size is None or self._origin is None:
+            return set()
+
+        cell_size = self._cell_size
+        lo = np.floor((np.asarray(bounds_min, dtype=np.float64) - self._origin) / cell_size).astype(np.int64)
+        hi = np.floor((np.asarray(bounds_max, dtype=np.float64) - self._origin) / cell_size).astype(np.int64)
+        # Изменение поверхности влияет на соседей через поле тайлов
+        lo -= self.halo
+        hi += self.halo
+        tile_lo = np.floor_divide(np.minimum(lo, hi), self.tile_size)
+        tile_hi = np.floor_divide(np.maximum(lo, hi), self.tile_size)
+
+        return {
+            (tx, ty, tz)
+            for tx in range(int(tile_lo[0]), int(tile_hi[0]) + 1)
+            for ty in range(int(tile_lo[1]), int(tile_hi[1]) + 1)
+            for tz in range(int(tile_lo[2]), int(tile_hi[2]) + 1)
+        }
+
+    def mark_dirty(self, bounds_min: np.ndarray, bounds_max: np.ndarray) -> set[TileKey]:
+        """
+        Пометить грязными тайлы, пересекающие AABB (в координатах сетки).
+
+        Вызывать для старых и новых bounds изменённого объекта.
+
+        Returns:
+            Помеченные тайлы.
+        """
+        if self._cell_size is None:
+            self._all_dirty = True
+            return set()
+        keys = self.tiles_in_bounds(bounds_min, bounds_max)
+        self._dirty.update(keys)
+        return keys
+
+    def mark_all_dirty(self) -> None:
+        """Перестроить все тайлы при следующем update()."""
+        self._all_dirty = True
+
+    def build(self, grid: VoxelGrid) -> NavMesh:
+        """Построить все тайлы заново."""
+        self.mark_all_dirty()
+        return self.update(grid)
+
+    def update(self, grid: VoxelGrid) -> NavMesh:
+        """
+        Перестроить грязные тайлы и собрать NavMesh из всех тайлов.
+
+        Args:
+            grid: Актуальная воксельная сетка.
+
+        Returns:
+            NavMesh; полигоны чистых тайлов — те же объекты, что и раньше.
+        """
+        surface_voxels = collect_surface_voxels(grid, max_slope_cos=self.config.max_slope_cos)
+        return self.update_from_surface_voxels(surface_voxels, grid.cell_size, grid.origin)
+
+    def update_from_surface_voxels(
+        self,
+        surface_voxels: dict[tuple[int, int, int], list[np.ndarray]],
+        cell_size: float,
+        origin: np.ndarray,
+    ) -> NavMesh:
+        """См. update(); принимает уже собранные поверхностные воксели."""
+        origin = np.array(origin, dtype=np.float64)
+        if (
+            self._cell_size != cell_size
+            or self._origin is None
+            or not np.array_equal(self._origin, origin)
+        ):
+            self._all_dirty = True
+        self._cell_size = cell_size
+        self._origin = origin
+
+        keys = list(surface_voxels.keys())
+        coords = np.array(keys, dtype=np.int64).reshape(-1, 3)
+        tile_coords = np.floor_divide(coords, self.tile_size)
+
+        if self._all_dirty:
+            dirty = {tuple(t) for t in np.unique(tile_coords, axis=0).tolist()}
+            dirty.update(self._tiles.keys())
+        else:
+            dirty = set(self._dirty)
+
+        rebuilt: list[TileKey] = []
+        for key in sorted(dirty):
+            tile = self._build_tile(key, keys, coords, surface_voxels, cell_size, origin)
+            if tile is None:
+                self._tiles.pop(key, None)
+            else:
+                self._tiles[key] = tile
+            rebuilt.append(key)
+
+        self._dirty.clear()
+        self._all_dirty = False
+        self.last_rebuilt_tiles = rebuilt
+
+        log.warning(
+            f"TiledNavMeshBuilder: rebuilt {len(rebuilt)} tiles, {len(self._tiles)} tiles total"
+        )
+        return self.assemble()
+
+    def assemble(self) -> NavMesh:
+        """Собрать NavMesh из закэшированных тайлов (в порядке ключей)."""
+        polygons: list[NavPolygon] = []
+        for key in sorted(self._tiles):
+            polygons.extend(self._tiles[key].polygons)
+
+        return NavMesh(
+            polygons=polygons,
+            cell_size=self._cell_size if self._cell_size is not None else 0.25,
+            origin=(self._origin if self._origin is not None else np.zeros(3)).copy(),
+        )
+
+    def _build_tile(
+        self,
+        key: TileKey,
+        keys: list[tuple[int, int, int]],
+        coords: np.ndarray,
+        surface_voxels: dict[tuple[int, int, int], list[np.ndarray]],
+        cell_size: float,
+        origin: np.ndarray,
+    ) -> NavMeshTile | None:
+        core_min, core_max = self.tile_voxel_bounds(key)
+        if len(coords) == 0:
+            return None
+
+        in_core = np.all((coords >= core_min) & (coords <= core_max), axis=1)
+        core_count = int(np.count_nonzero(in_core))
+        if core_count == 0:
+            return None
+
+        halo = self.halo
+        in_halo = np.all((coords >= core_min - halo) & (coords <= core_max + halo), axis=1)
+        tile_voxels = {keys[i]: surface_voxels[keys[i]] for i in np.flatnonzero(in_halo).tolist()}
+
+        navmesh = self._builder.build_from_surface_voxels(
+            tile_voxels,
+            cell_size,
+            origin,
+            core_bounds=(core_min, core_max),
+            **self.build_kwargs,
+        )
+        return NavMeshTile(key=key, polygons=list(navmesh.polygons), voxel_count=core_count)
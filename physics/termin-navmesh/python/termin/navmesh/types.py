@@ -5,9 +5,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import numpy as np
 
+if TYPE_CHECKING:
+    from termin.navmesh.pathfinding import TriangleLocator
+
 
 @dataclass
 class NavMeshConfig:
@@ -66,6 +69,10 @@ class NavMeshConfig:
     watershed_smoothing: int = 0
     """Количество итераций сглаживания distance field для watershed."""
 
+    bake_workers: int = 1
+    """Число процессов для обработки регионов (контуры + триангуляция).
+    1 = последовательно в текущем процессе, 0 = по числу ядер."""
+
 
 @dataclass
 class Portal:
@@ -126,6 +133,13 @@ class NavPolygon:
     holes: list[list[int]] = field(default_factory=list)
     """Дыры — список контуров, каждый контур — список индексов вершин (CW)."""
 
+    adjacency: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    """Смежность треугольников (M, 3) в формате build_adjacency.
+    None — вычисляется при построении графа."""
+
+    locator: Optional["TriangleLocator"] = field(default=None, repr=False, compare=False)
+    """Пространственный индекс треугольников. None — строится при построении графа."""
+
 
 @dataclass
 class NavMesh:
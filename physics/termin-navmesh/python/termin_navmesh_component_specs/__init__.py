@@ -7,6 +7,7 @@ COMPONENT_SPECS: tuple[tuple[str, str], ...] = (
     ("termin.navmesh.material_component", "NavMeshMaterialComponent"),
     ("termin.navmesh.pathfinding_world_component", "PathfindingWorldComponent"),
     ("termin.navmesh.agent_component", "NavMeshAgentComponent"),
+    ("termin.navmesh.crowd_component", "NavMeshCrowdComponent"),
     ("termin.navmesh.builder_component", "NavMeshBuilderComponent"),
     ("termin.navmesh", "DetourPathfindingWorldComponent"),
     ("termin.navmesh", "NavMeshKeeperComponent"),
@@ -9,9 +9,26 @@ from termin.navmesh.pathfinding import (
     find_triangle_containing_point,
     point_in_triangle_2d,
     astar_triangles,
+    TriangleLocator,
+    _find_triangle_containing_point_loop,
+    reverse_dijkstra_triangles,
+    follow_flow_field,
 )
 
 
+def _grid_mesh(side: int, height: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """Регулярная сетка side x side квадратов в плоскости XZ на высоте height."""
+    xs, zs = np.meshgrid(np.arange(side + 1, dtype=np.float64), np.arange(side + 1, dtype=np.float64))
+    vertices = np.stack([xs.ravel(), np.full(xs.size, height), zs.ravel()], axis=1)
+    i, j = np.meshgrid(np.arange(side), np.arange(side))
+    a = (j * (side + 1) + i).ravel()
+    b = a + 1
+    c = a + side + 1
+    d = c + 1
+    triangles = np.concatenate([np.stack([a, b, d], axis=1), np.stack([a, d, c], axis=1)]).astype(np.int32)
+    return vertices, triangles
+
+
 class BuildAdjacencyTest(unittest.TestCase):
     """Тесты для build_adjacency."""
 
@@ -129,6 +146,56 @@ class FindTriangleTest(unittest.TestCase):
         self.assertEqual(result, -1)
 
 
+class TriangleLocatorTest(unittest.TestCase):
+    """Тесты для TriangleLocator."""
+
+    def test_matches_linear_scan(self):
+        """Индекс даёт тот же треугольник, что и поштучный перебор."""
+        vertices, triangles = _grid_mesh(12)
+        # Второй этаж над первым — проверка выбора по расстоянию до плоскости
+        upper_vertices, upper_triangles = _grid_mesh(6, height=0.8)
+        triangles = np.concatenate([triangles, upper_triangles + len(vertices)])
+        vertices = np.concatenate([vertices, upper_vertices])
+
+        locator = TriangleLocator.from_mesh(vertices, triangles)
+        rng = np.random.default_rng(7)
+        points = np.column_stack([
+            rng.uniform(-1.0, 13.0, 120),
+            rng.uniform(-0.2, 1.0, 120),
+            rng.uniform(-1.0, 13.0, 120),
+        ])
+
+        for point in points:
+            expected = _find_triangle_containing_point_loop(point, vertices, triangles)
+            self.assertEqual(locator.locate(point), expected)
+            self.assertEqual(find_triangle_containing_point(point, vertices, triangles), expected)
+
+    def test_point_outside_grid(self):
+        """Точка за пределами сетки индекса."""
+        vertices, triangles = _grid_mesh(4)
+        locator = TriangleLocator.from_mesh(vertices, triangles)
+
+        self.assertEqual(locator.locate(np.array([50.0, 0.0, 50.0])), -1)
+        self.assertEqual(locator.locate(np.array([np.nan, 0.0, 1.0])), -1)
+
+    def test_empty_mesh(self):
+        """Пустой меш — ничего не найдено."""
+        locator = TriangleLocator.from_mesh(np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int32))
+        self.assertEqual(locator.locate(np.array([0.0, 0.0, 0.0])), -1)
+
+    def test_larger_tolerance_falls_back_to_full_scan(self):
+        """Допуск больше, чем при построении индекса, не теряет треугольники."""
+        vertices, triangles = _grid_mesh(4)
+        locator = TriangleLocator.from_mesh(vertices, triangles, tolerance=0.1)
+        point = np.array([1.5, 2.0, 1.5])
+
+        self.assertEqual(locator.locate(point), -1)
+        self.assertEqual(
+            locator.locate(point, tolerance=3.0),
+            _find_triangle_containing_point_loop(point, vertices, triangles, tolerance=3.0),
+        )
+
+
 class AStarTest(unittest.TestCase):
     """Тесты для A* поиска."""
 
@@ -188,6 +255,55 @@ class AStarTest(unittest.TestCase):
         self.assertEqual(path, [0, 1, 2, 3])
 
 
+class FlowFieldTest(unittest.TestCase):
+    """Тесты для reverse_dijkstra_triangles / follow_flow_field."""
+
+    def test_paths_match_astar_cost(self):
+        """Путь по полю направлений не длиннее пути A* по центроидам."""
+        vertices, triangles = _grid_mesh(6)
+        graph = RegionGraph.from_mesh(vertices, triangles)
+        goal = 0
+        next_tri = reverse_dijkstra_triangles(goal, graph.neighbors, graph.centroids)
+
+        def cost(path):
+            return sum(
+                float(np.linalg.norm(graph.centroids[a] - graph.centroids[b]))
+                for a, b in zip(path, path[1:], strict=False)
+            )
+
+        for start in range(len(triangles)):
+            path = follow_flow_field(start, next_tri)
+            self.assertIsNotNone(path)
+            self.assertEqual(path[0], start)
+            self.assertEqual(path[-1], goal)
+            if start != goal:
+                expected = astar_triangles(start, goal, graph.neighbors, graph.centroids)
+                self.assertAlmostEqual(cost(path), cost(expected), places=6)
+
+    def test_unreachable_triangle(self):
+        """Несвязный треугольник не получает направления."""
+        triangles = np.array([[0, 1, 2], [3, 4, 5]], dtype=np.int32)
+        vertices = np.array([
+            [0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0],
+            [5.0, 0.0, 5.0], [6.0, 0.0, 5.0], [5.0, 0.0, 6.0],
+        ])
+        graph = RegionGraph.from_mesh(vertices, triangles)
+        next_tri = reverse_dijkstra_triangles(0, graph.neighbors, graph.centroids)
+
+        self.assertEqual(follow_flow_field(0, next_tri), [0])
+        self.assertIsNone(follow_flow_field(1, next_tri))
+
+    def test_early_stop_settles_targets(self):
+        """С заданными targets поле строится как минимум до всех стартов."""
+        vertices, triangles = _grid_mesh(8)
+        graph = RegionGraph.from_mesh(vertices, triangles)
+        full = reverse_dijkstra_triangles(0, graph.neighbors, graph.centroids)
+        partial = reverse_dijkstra_triangles(0, graph.neighbors, graph.centroids, targets=np.array([5, 9]))
+
+        for start in (5, 9):
+            self.assertEqual(follow_flow_field(start, partial), follow_flow_field(start, full))
+
+
 class RegionGraphTest(unittest.TestCase):
     """Тесты для RegionGraph."""
 
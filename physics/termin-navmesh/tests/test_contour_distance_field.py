@@ -0,0 +1,91 @@
+import numpy as np
+
+from termin.navmesh.contour_extraction import (
+    _compute_distance_field_2d_dijkstra,
+    _compute_distance_field_3d_sparse,
+    compute_distance_field_2d,
+    compute_distance_field_3d,
+    compute_distance_field_for_region,
+    smooth_distance_field_2d,
+    watershed_split_2d,
+    watershed_split_region,
+)
+
+
+def _disk_mask(height: int, width: int) -> np.ndarray:
+    yy, xx = np.mgrid[:height, :width]
+    radius = min(height, width) / 2
+    return (((yy - height / 2) ** 2 + (xx - width / 2) ** 2) < radius ** 2).astype(np.uint8)
+
+
+def _dumbbell_mask() -> np.ndarray:
+    mask = np.zeros((20, 40), dtype=np.uint8)
+    mask[2:18, 2:16] = 1
+    mask[2:18, 24:38] = 1
+    mask[9:11, 16:24] = 1
+    return mask
+
+
+def test_distance_field_2d_matches_dijkstra():
+    rng = np.random.default_rng(7)
+    masks = [_disk_mask(31, 24), _dumbbell_mask(), np.zeros((4, 5), dtype=np.uint8)]
+    masks += [(rng.random((h, w)) < 0.8).astype(np.uint8) for h, w in [(12, 17), (25, 9), (1, 6)]]
+
+    for mask in masks:
+        result = compute_distance_field_2d(mask)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, _compute_distance_field_2d_dijkstra(mask), rtol=0, atol=1e-5)
+
+
+def test_distance_field_3d_matches_dijkstra():
+    rng = np.random.default_rng(3)
+    voxels = {tuple(v) for v in rng.integers(0, 7, (200, 3)).tolist()}
+    voxels |= {(x, y, z) for x in range(10, 16) for y in range(5) for z in range(6)}
+
+    result = compute_distance_field_3d(voxels)
+    expected = _compute_distance_field_3d_sparse(voxels)
+
+    assert result.keys() == expected.keys()
+    for voxel, distance in expected.items():
+        assert abs(result[voxel] - distance) < 1e-9
+
+
+def test_smoothing_keeps_empty_cells():
+    mask = _dumbbell_mask()
+    distance = compute_distance_field_2d(mask)
+    smoothed = smooth_distance_field_2d(distance, mask, iterations=2)
+
+    assert smoothed.dtype == distance.dtype
+    assert np.all(smoothed[mask == 0] == distance[mask == 0])
+    assert smoothed[10, 8] <= distance[10, 8]
+
+
+def test_watershed_splits_dumbbell():
+    mask = _dumbbell_mask()
+    result = watershed_split_2d(mask, compute_distance_field_2d(mask), smoothing=1)
+
+    assert result.num_regions == 2
+    assert set(np.unique(result.labels).tolist()) == {0, 1, 2}
+    assert np.all((result.labels > 0) == (mask == 1))
+    # Каждая гиря целиком в своём регионе
+    assert len(set(result.labels[2:18, 2:12].ravel().tolist())) == 1
+    assert len(set(result.labels[2:18, 28:38].ravel().tolist())) == 1
+    assert result.labels[10, 5] != result.labels[10, 35]
+
+
+def test_region_split_covers_all_voxels():
+    voxels = [(x, 3, z) for x in range(14) for z in range(14)]
+    voxels += [(x, 3, z) for x in range(14, 22) for z in range(6, 8)]
+    voxels += [(x, 3, z) for x in range(22, 36) for z in range(14)]
+    normal = np.array([0.0, 1.0, 0.0])
+    origin = np.zeros(3, dtype=np.float32)
+
+    result = watershed_split_region(voxels, normal, 0.25, origin, smoothing=1)
+    distances = compute_distance_field_for_region(voxels, normal, 0.25, origin)
+
+    assert len(result.sub_regions) == 2
+    assert sorted(v for region in result.sub_regions for v in region) == sorted(voxels)
+    assert distances.keys() == set(voxels)
+    assert distances[(0, 3, 0)] == 0.0
+    assert distances[(7, 3, 7)] > 0.0
+    assert result.peaks <= set(voxels)
@@ -0,0 +1,95 @@
+"""Tests for the vectorized navmesh crowd state."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from termin.navmesh.crowd_component import CrowdState
+
+
+def _reference_step(position, path, index, speed, stopping_distance, dt):
+    """Single-agent step equivalent to NavMeshAgentComponent.update."""
+    target = path[index]
+    direction = target - position
+    distance = float(np.linalg.norm(direction))
+    if distance < stopping_distance:
+        index += 1
+        return position, index, index < len(path)
+    move = min(speed * dt, distance)
+    return position + direction / distance * move, index, True
+
+
+def test_crowd_step_matches_per_agent_update() -> None:
+    rng = np.random.default_rng(3)
+    state = CrowdState(capacity=2)
+    agents = []
+    for _ in range(17):
+        position = rng.uniform(-5.0, 5.0, 3)
+        path = [position + rng.uniform(-3.0, 3.0, 3) for _ in range(int(rng.integers(1, 5)))]
+        speed = float(rng.uniform(0.5, 4.0))
+        slot = state.add(position, speed, 0.1)
+        state.set_path(slot, path)
+        agents.append([slot, position.copy(), np.asarray(path), 0, speed, True])
+
+    for _ in range(200):
+        state.step(1.0 / 60.0)
+        for agent in agents:
+            slot, position, path, index, speed, moving = agent
+            if not moving:
+                continue
+            position, index, moving = _reference_step(position, path, index, speed, 0.1, 1.0 / 60.0)
+            agent[1:4] = [position, path, index]
+            agent[5] = moving
+
+    for slot, position, _, index, _, moving in agents:
+        np.testing.assert_allclose(state.positions[slot], position, atol=1.0e-9)
+        assert state.waypoint_index[slot] == index
+        assert bool(state.moving[slot]) == moving
+
+
+def test_crowd_reports_moved_and_advanced_slots() -> None:
+    state = CrowdState()
+    walker = state.add(np.zeros(3), 1.0, 0.1)
+    arriving = state.add(np.zeros(3), 1.0, 0.1)
+    idle = state.add(np.zeros(3), 1.0, 0.1)
+    state.set_path(walker, [np.array([10.0, 0.0, 0.0])])
+    state.set_path(arriving, [np.array([0.05, 0.0, 0.0])])
+
+    moved, advanced = state.step(0.5)
+
+    assert moved.tolist() == [walker]
+    assert advanced.tolist() == [arriving]
+    assert not state.moving[arriving]
+    assert not state.moving[idle]
+    np.testing.assert_allclose(state.positions[walker], [0.5, 0.0, 0.0])
+
+
+def test_crowd_reuses_freed_slots_and_rebuilds_waypoints() -> None:
+    state = CrowdState(capacity=1)
+    first = state.add(np.zeros(3), 1.0, 0.1)
+    second = state.add(np.zeros(3), 1.0, 0.1)
+    state.set_path(first, [np.array([1.0, 0.0, 0.0]), np.array([2.0, 0.0, 0.0])])
+    state.set_path(second, [np.array([0.0, 3.0, 0.0])])
+    state.step(0.1)
+
+    state.remove(first)
+    assert state.agent_count == 1
+    assert state.add(np.zeros(3), 2.0, 0.1) == first
+
+    moved, _ = state.step(0.1)
+    assert moved.tolist() == [second]
+    np.testing.assert_allclose(state.positions[second], [0.0, 0.2, 0.0])
+
+
+def test_crowd_stop_clears_movement() -> None:
+    state = CrowdState()
+    slot = state.add(np.zeros(3), 1.0, 0.1)
+    state.set_path(slot, [np.array([5.0, 0.0, 0.0])])
+    state.stop(slot)
+
+    moved, advanced = state.step(1.0)
+
+    assert len(moved) == 0
+    assert len(advanced) == 0
+    assert state.positions[slot] == pytest.approx([0.0, 0.0, 0.0])
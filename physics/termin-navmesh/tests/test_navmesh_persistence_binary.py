@@ -0,0 +1,122 @@
+"""Tests for NavMeshPersistence binary formats."""
+
+import numpy as np
+
+from termin.navmesh.pathfinding import RegionGraph, TriangleLocator, build_adjacency
+from termin.navmesh.persistence import NAVMESH_BINARY_ALIGNMENT, NavMeshPersistence
+from termin.navmesh.types import NavMesh, NavPolygon
+
+
+def _grid_polygon(side: int, offset: float) -> NavPolygon:
+    xs, ys = np.meshgrid(np.arange(side + 1, dtype=np.float32), np.arange(side + 1, dtype=np.float32))
+    vertices = np.stack([xs.ravel() + offset, ys.ravel(), np.zeros(xs.size, dtype=np.float32)], axis=1)
+    i, j = np.meshgrid(np.arange(side), np.arange(side))
+    a = (j * (side + 1) + i).ravel()
+    b = a + 1
+    c = a + side + 1
+    d = c + 1
+    triangles = np.concatenate([np.stack([a, b, d], axis=1), np.stack([a, d, c], axis=1)]).astype(np.int32)
+    return NavPolygon(
+        vertices=vertices,
+        triangles=triangles,
+        normal=np.array([0.0, 0.0, 1.0], dtype=np.float32),
+        voxel_coords=[(x, y, 0) for x in range(side) for y in range(side)],
+    )
+
+
+def _navmesh() -> NavMesh:
+    polygons = [_grid_polygon(4, 0.0), _grid_polygon(3, 10.0), _grid_polygon(6, 20.0)]
+    polygons[0].neighbors = [1]
+    polygons[1].neighbors = [0, 2]
+    polygons[2].neighbors = [1]
+    return NavMesh(
+        polygons=polygons,
+        cell_size=0.5,
+        origin=np.array([1.0, 2.0, 3.0], dtype=np.float32),
+        name="level",
+    )
+
+
+def test_v2_roundtrip_and_zero_copy():
+    navmesh = _navmesh()
+    data = NavMeshPersistence.to_bytes(navmesh)
+    loaded = NavMeshPersistence.from_bytes(data)
+
+    assert loaded.name == "level"
+    assert loaded.cell_size == 0.5
+    np.testing.assert_array_equal(loaded.origin, navmesh.origin)
+    assert loaded.polygon_count() == navmesh.polygon_count()
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    for original, polygon in zip(navmesh.polygons, loaded.polygons, strict=True):
+        np.testing.assert_array_equal(polygon.vertices, original.vertices)
+        np.testing.assert_array_equal(polygon.triangles, original.triangles)
+        np.testing.assert_array_equal(polygon.normal, original.normal)
+        assert polygon.voxel_coords == original.voxel_coords
+        assert polygon.neighbors == original.neighbors
+        np.testing.assert_array_equal(polygon.adjacency, build_adjacency(original.triangles))
+        for array in (polygon.vertices, polygon.triangles, polygon.adjacency):
+            assert np.shares_memory(array, buffer)
+            assert array.ctypes.data % 4 == 0
+
+
+def test_v2_sections_are_aligned():
+    data = NavMeshPersistence.to_bytes(_navmesh())
+    loaded = NavMeshPersistence.from_bytes(data)
+    base = np.frombuffer(data, dtype=np.uint8).ctypes.data
+    first = loaded.polygons[0]
+    assert (first.vertices.ctypes.data - base) % NAVMESH_BINARY_ALIGNMENT == 0
+    assert (first.triangles.ctypes.data - base) % NAVMESH_BINARY_ALIGNMENT == 0
+
+
+def test_v2_spatial_index_matches_rebuilt_locator():
+    loaded = NavMeshPersistence.from_bytes(NavMeshPersistence.to_bytes(_navmesh()))
+    rng = np.random.default_rng(3)
+    for polygon in loaded.polygons:
+        rebuilt = TriangleLocator.from_mesh(polygon.vertices, polygon.triangles)
+        stored = polygon.locator
+        assert stored.grid_shape == rebuilt.grid_shape
+        np.testing.assert_array_equal(stored.cell_start, rebuilt.cell_start)
+        np.testing.assert_array_equal(stored.cell_items, rebuilt.cell_items)
+
+        lo = polygon.vertices.min(axis=0) - 0.5
+        hi = polygon.vertices.max(axis=0) + 0.5
+        for point in rng.uniform(lo, hi, size=(50, 3)):
+            assert stored.locate(point) == rebuilt.locate(point)
+
+        region = RegionGraph.from_mesh(
+            polygon.vertices, polygon.triangles, neighbors=polygon.adjacency, locator=polygon.locator
+        )
+        assert region.neighbors is polygon.adjacency
+        assert region.locator is polygon.locator
+
+
+def test_load_binary_memmap(tmp_path):
+    navmesh = _navmesh()
+    path = tmp_path / "level.navbin"
+    NavMeshPersistence.save_binary(navmesh, path)
+
+    loaded = NavMeshPersistence.load_binary(path)
+    polygon = loaded.polygons[2]
+    assert polygon.vertices.base is not None
+    assert not polygon.vertices.flags.writeable
+    np.testing.assert_array_equal(polygon.triangles, navmesh.polygons[2].triangles)
+
+
+def test_v1_still_readable():
+    navmesh = _navmesh()
+    data = NavMeshPersistence.to_bytes(navmesh, version=1)
+    loaded = NavMeshPersistence.from_bytes(data)
+
+    assert loaded.name == "level"
+    for original, polygon in zip(navmesh.polygons, loaded.polygons, strict=True):
+        np.testing.assert_array_equal(polygon.vertices, original.vertices)
+        np.testing.assert_array_equal(polygon.triangles, original.triangles)
+        assert polygon.neighbors == original.neighbors
+        assert polygon.adjacency is None
+
+
+def test_empty_navmesh_roundtrip():
+    loaded = NavMeshPersistence.from_bytes(NavMeshPersistence.to_bytes(NavMesh(name="empty")))
+    assert loaded.name == "empty"
+    assert loaded.polygons == []
@@ -364,3 +364,44 @@ def test_triangle_center_only_requires_a_valid_forward_affine() -> None:
     assert center is not None
     expected = np.asarray(affine.transform_point(Vec3(1.0 / 3.0, 1.0 / 3.0, 0.0)))
     np.testing.assert_allclose(center, expected, rtol=0.0, atol=1.0e-12)
+
+
+def test_batched_paths_match_single_queries() -> None:
+    side = 6
+    xs, ys = np.meshgrid(np.arange(side + 1, dtype=np.float64), np.arange(side + 1, dtype=np.float64))
+    vertices = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)], axis=1)
+    i, j = np.meshgrid(np.arange(side), np.arange(side))
+    a = (j * (side + 1) + i).ravel()
+    triangles = np.concatenate(
+        [np.stack([a, a + 1, a + side + 2], axis=1), np.stack([a, a + side + 2, a + side + 1], axis=1)]
+    ).astype(np.int32)
+
+    world = PathfindingWorldComponent(skip_astar_if_los=False, use_los_optimization=False)
+    world._navmesh_graph = NavMeshGraph()
+    world._navmesh_graph.add_region(RegionGraph.from_mesh(vertices, triangles, region_id=0))
+    world._region_entities[0] = _StaticEntity(Affine3d.identity())
+    world._initialized = True
+
+    starts = np.array([[0.5, 0.2, 0.0], [5.5, 0.3, 0.0], [0.4, 5.6, 0.0], [50.0, 50.0, 0.0]])
+    goal = np.array([3.2, 3.7, 0.0])
+
+    batched = world.find_paths(starts, goal)
+
+    assert len(batched) == len(starts)
+    assert batched[3] is None
+    for start, path in zip(starts[:3], batched[:3], strict=True):
+        single = world.find_path(start, goal)
+        assert path is not None and single is not None
+        np.testing.assert_allclose(path[0], start, atol=1.0e-9)
+        np.testing.assert_allclose(path[-1], goal, atol=1.0e-9)
+        length = sum(float(np.linalg.norm(b - a)) for a, b in zip(path, path[1:], strict=False))
+        single_length = sum(float(np.linalg.norm(b - a)) for a, b in zip(single, single[1:], strict=False))
+        assert length == pytest.approx(single_length, rel=1.0e-6)
+
+
+def test_batched_paths_reject_mismatched_inputs() -> None:
+    world = _single_triangle_world(Affine3d.identity())
+    world._initialized = True
+
+    with pytest.raises(ValueError, match="matching starts/ends"):
+        world.find_paths(np.zeros((3, 3)), np.zeros((2, 3)))
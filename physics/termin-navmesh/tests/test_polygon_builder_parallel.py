@@ -0,0 +1,97 @@
+import numpy as np
+
+from termin.navmesh.contour_extraction import create_shared_label_map
+from termin.navmesh.polygon_builder import (
+    PolygonBuilder,
+    _RegionBakeContext,
+    _RegionBakeTask,
+)
+from termin.navmesh.types import NavMeshConfig
+
+
+def _floor_regions() -> list[tuple[list[tuple[int, int, int]], np.ndarray]]:
+    up = np.array([0.0, 1.0, 0.0])
+    regions = []
+    for i, (width, depth) in enumerate([(12, 9), (5, 14), (20, 4), (7, 7)]):
+        x0 = i * 22
+        voxels = [(x0 + x, 2, z) for x in range(width) for z in range(depth)]
+        if i == 0:
+            # Дырка в первом регионе
+            voxels = [v for v in voxels if not (4 <= v[0] - x0 < 7 and 3 <= v[2] < 6)]
+        regions.append((voxels, up.copy()))
+    return regions
+
+
+def _bake(bake_workers: int):
+    regions = _floor_regions()
+    cell_size = 0.25
+    origin = np.array([1.0, 0.0, -2.0], dtype=np.float32)
+    builder = PolygonBuilder(NavMeshConfig(contour_epsilon=0.1, bake_workers=bake_workers))
+    context = _RegionBakeContext(
+        cell_size=cell_size,
+        grid_origin=origin.copy(),
+        project_contours=False,
+        stitch_contours=False,
+        voxel_to_regions={},
+        region_planes=[],
+        shared_label_map=create_shared_label_map(regions, cell_size, origin),
+    )
+    tasks = [
+        _RegionBakeTask.pack(idx, voxels, normal, set())
+        for idx, (voxels, normal) in enumerate(regions)
+    ]
+    return tasks, builder._bake_regions(tasks, context)
+
+
+def test_region_task_roundtrip_keeps_voxel_order():
+    voxels = [(3, 1, 2), (0, 0, 0), (-4, 7, 9)]
+    task = _RegionBakeTask.pack(5, voxels, np.array([0.0, 1.0, 0.0]), {(0, 0, 0)})
+
+    unpacked, normal, boundary = task.unpack()
+
+    assert task.voxels.dtype == np.int32
+    assert unpacked == voxels
+    assert boundary == {(0, 0, 0)}
+    assert normal.tolist() == [0.0, 1.0, 0.0]
+
+
+def test_parallel_bake_matches_serial(monkeypatch):
+    import termin.navmesh.polygon_builder as polygon_builder
+
+    pool_runs = []
+    bake_regions_parallel = polygon_builder._bake_regions_parallel
+
+    def spy_parallel(*args, **kwargs):
+        result = bake_regions_parallel(*args, **kwargs)
+        pool_runs.append(args[3])
+        return result
+
+    monkeypatch.setattr(polygon_builder, "_bake_regions_parallel", spy_parallel)
+    tasks, serial = _bake(bake_workers=1)
+    assert pool_runs == []
+    _, parallel = _bake(bake_workers=2)
+    # Тихий откат на последовательный бейк не должен проходить тест
+    assert pool_runs == [2]
+
+    assert sorted(serial) == sorted(parallel) == [t.region_idx for t in tasks]
+    for idx, polygon in serial.items():
+        other = parallel[idx]
+        assert polygon is not None and other is not None
+        assert len(polygon.triangles) > 0
+        np.testing.assert_array_equal(polygon.vertices, other.vertices)
+        np.testing.assert_array_equal(polygon.triangles, other.triangles)
+        assert polygon.voxel_coords == other.voxel_coords
+
+
+def test_bake_without_worker_interpreter_falls_back_to_serial(monkeypatch):
+    import termin.navmesh.polygon_builder as polygon_builder
+
+    def fail_parallel(*args, **kwargs):
+        raise AssertionError("process pool must not start without a Python interpreter")
+
+    monkeypatch.setattr(polygon_builder, "_bake_worker_executable", lambda: None)
+    monkeypatch.setattr(polygon_builder, "_bake_regions_parallel", fail_parallel)
+    tasks, result = _bake(bake_workers=2)
+
+    assert sorted(result) == [t.region_idx for t in tasks]
+    assert all(polygon is not None for polygon in result.values())
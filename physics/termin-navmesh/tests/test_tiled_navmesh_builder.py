@@ -0,0 +1,79 @@
+import numpy as np
+
+from termin.navmesh.tiled_builder import TiledNavMeshBuilder
+from termin.navmesh.types import NavMeshConfig
+
+
+UP = np.array([0.0, 0.0, 1.0], dtype=np.float32)
+CELL_SIZE = 0.5
+ORIGIN = np.zeros(3)
+
+
+def _floor(width: int, depth: int, holes=()) -> dict[tuple[int, int, int], list[np.ndarray]]:
+    voxels = {}
+    for x in range(width):
+        for y in range(depth):
+            if any(x0 <= x < x1 and y0 <= y < y1 for x0, y0, x1, y1 in holes):
+                continue
+            voxels[(x, y, 0)] = [UP]
+    return voxels
+
+
+def _covered_voxels(navmesh) -> set[tuple[int, int, int]]:
+    return {tuple(v) for polygon in navmesh.polygons for v in polygon.voxel_coords}
+
+
+def test_tiles_cover_the_whole_surface():
+    surface = _floor(24, 20)
+    builder = TiledNavMeshBuilder(NavMeshConfig(contour_epsilon=0.0), tile_size=8)
+
+    navmesh = builder.update_from_surface_voxels(surface, CELL_SIZE, ORIGIN)
+
+    assert sorted(builder.tiles) == [(x, y, 0) for x in range(3) for y in range(3)]
+    assert _covered_voxels(navmesh) == set(surface)
+    assert all(len(p.triangles) > 0 for p in navmesh.polygons)
+
+
+def test_only_dirty_tiles_are_rebuilt():
+    builder = TiledNavMeshBuilder(NavMeshConfig(contour_epsilon=0.0), tile_size=8, halo=1)
+    first = builder.update_from_surface_voxels(_floor(32, 32), CELL_SIZE, ORIGIN)
+
+    # Ящик на полу в тайле (1, 1): дырка в поверхности
+    crate = (10, 10, 13, 13)
+    marked = builder.mark_dirty(
+        np.array([crate[0], crate[1], 0.0]) * CELL_SIZE,
+        np.array([crate[2], crate[3], 1.0]) * CELL_SIZE,
+    )
+    second = builder.update_from_surface_voxels(_floor(32, 32, holes=[crate]), CELL_SIZE, ORIGIN)
+
+    assert builder.last_rebuilt_tiles == sorted(marked)
+    assert len(marked) < len(builder.tiles)
+    assert (10, 10, 0) not in _covered_voxels(second)
+
+    rebuilt = set(builder.last_rebuilt_tiles)
+    kept_first = [p for p in first.polygons if builder.tile_key(p.voxel_coords[0]) not in rebuilt]
+    kept_second = [p for p in second.polygons if builder.tile_key(p.voxel_coords[0]) not in rebuilt]
+    assert kept_first and len(kept_first) == len(kept_second)
+    assert all(a is b for a, b in zip(kept_first, kept_second, strict=True))
+
+
+def test_erosion_ignores_tile_borders():
+    config = NavMeshConfig(contour_epsilon=0.0, agent_radius=1.0)
+    builder = TiledNavMeshBuilder(config, tile_size=8)
+
+    navmesh = builder.update_from_surface_voxels(_floor(24, 24), CELL_SIZE, ORIGIN)
+    covered = _covered_voxels(navmesh)
+
+    # Воксели у внутренних границ тайлов не эродируются
+    assert {(7, 12, 0), (8, 12, 0), (12, 15, 0), (12, 16, 0)} <= covered
+    # Края пола эродируются
+    assert (0, 12, 0) not in covered
+
+
+def test_new_grid_parameters_rebuild_everything():
+    builder = TiledNavMeshBuilder(NavMeshConfig(contour_epsilon=0.0), tile_size=8)
+    builder.update_from_surface_voxels(_floor(16, 8), CELL_SIZE, ORIGIN)
+
+    builder.update_from_surface_voxels(_floor(16, 8), CELL_SIZE * 2, ORIGIN)
+
+    assert builder.last_rebuilt_tiles == [(0, 0, 0), (1, 0, 0)]
@@ -129,7 +129,9 @@ class FEMPhysicsWorldComponent(PythonComponent):
 
     def _rebuild_simulation(self):
         """Пересобрать симуляцию: создать assembler и зарегистрировать все тела/joints."""
-        self._assembler = DynamicMatrixAssembler()
+        # Кэш шага: постоянные матрицы тел и разложение KKT-системы
+        # переиспользуются между подшагами, пока не меняется набор тел/joints
+        self._assembler = DynamicMatrixAssembler(step_cache=True)
         self._assembler.time_step = self.time_step
 
         self._bodies.clear()
@@ -212,8 +214,8 @@ class FEMPhysicsWorldComponent(PythonComponent):
 
         # 3. Решить систему
         try:
-            x_ext = np.linalg.solve(A_ext, b_ext)
-        except np.linalg.LinAlgError:
+            x_ext = self._assembler.solve_step_system(A_ext, b_ext)
+        except (np.linalg.LinAlgError, RuntimeError):
             logging.getLogger(__name__).warning("Singular matrix in FEM solver — skipping simulation step")
             return
 
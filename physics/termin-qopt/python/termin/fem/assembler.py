@@ -12,6 +12,18 @@ import numpy as np
 from typing import List, Dict, Tuple, Optional
 
 import termin.linalg.subspaces
+from termin.fem.sparse import (
+    SPARSE_SOLVERS,
+    BandedFactorization,
+    SparseMatrixBuilder,
+    as_csr,
+    as_dense,
+    bmat,
+    cgls,
+    conjugate_gradient,
+    estimate_condition,
+    is_sparse,
+)
 
 
 class Variable:
@@ -89,6 +101,11 @@ class Contribution:
     - Граничное условие
     - Уравнение связи между переменными
     """
+
+    # False — матрицы вклада (mass, stiffness, holonomic, ...) не зависят
+    # от состояния и времени: кэш шага DynamicMatrixAssembler собирает их
+    # один раз. Векторы (load, rhs, ошибки связей) пересобираются всегда.
+    time_varying = True
     
     def __init__(self, variables: List[Variable], domain = "mechanic", assembler=None):
         self.variables = variables
@@ -285,10 +302,25 @@ class MatrixAssembler:
     
     Основной класс системы - собирает глобальную матрицу A и вектор b
     из множества локальных вкладов.
+
+    Бэкенд сборки:
+    - "dense" — плотные np.ndarray (эталонная реализация);
+    - "sparse" — вклады пишутся в COO-триплеты (SparseMatrixBuilder),
+      собранные матрицы — CSRMatrix, системы решаются разреженным
+      решателем sparse_solver ("direct", "cg" или "dense").
     """
     
-    def __init__(self):
+    def __init__(self, backend: str = "dense", sparse_solver: str = "direct"):
+        if backend not in ("dense", "sparse"):
+            raise ValueError(f"Unknown assembler backend '{backend}', expected 'dense' or 'sparse'")
+        if sparse_solver not in SPARSE_SOLVERS:
+            raise ValueError(f"Unknown sparse solver '{sparse_solver}', expected one of {SPARSE_SOLVERS}")
+        self.backend = backend
+        self.sparse_solver = sparse_solver
+
         self._dirty_index_map = True
+        # Растёт при каждом изменении состава переменных/вкладов/связей
+        self._topology_version = 0
         self.variables: List[Variable] = []
         self.contributions: List[Contribution] = []
         self.constraints: List[Constraint] = []  # Связи через множители Лагранжа
@@ -366,6 +398,7 @@ class MatrixAssembler:
             var._assembler = self
             self.variables.append(var)
             self._dirty_index_map = True
+            self._topology_version += 1
             if var.tag not in self._variables_by_tag:
                 self._variables_by_tag[var.tag] = []
             self._variables_by_tag[var.tag].append(var)
@@ -389,6 +422,7 @@ class MatrixAssembler:
             var._assembler = self
             self._holonomic_constraint_vars.append(var)
             self._dirty_index_map = True
+            self._topology_version += 1
         elif var._assembler is not self:
             raise ValueError(f"Переменная {var.name} уже зарегистрирована в другом assembler")
         
@@ -403,6 +437,7 @@ class MatrixAssembler:
             var._assembler = self
             self._nonholonomic_constraint_vars.append(var)
             self._dirty_index_map = True
+            self._topology_version += 1
         elif var._assembler is not self:
             raise ValueError(f"Переменная {var.name} уже зарегистрирована в другом assembler")
     
@@ -419,6 +454,7 @@ class MatrixAssembler:
         
         contribution._assembler = self  # регистрируем assembler
         self.contributions.append(contribution)
+        self._topology_version += 1
     
     def add_constraint(self, constraint: Constraint):
         """
@@ -436,6 +472,7 @@ class MatrixAssembler:
 
         constraint._assembler = self  # регистрируем assembler
         self.constraints.append(constraint)
+        self._topology_version += 1
 
     def _build_index_map(self, variables) -> Dict[Variable, List[int]]:
         """
@@ -498,6 +535,24 @@ class MatrixAssembler:
     def total_dofs(self) -> int:
         """Общее количество степеней свободы в системе"""
         return sum(var.size for var in self.variables)
+
+    def _zeros_matrix(self, n_rows: int, n_cols: int):
+        """Пустая глобальная матрица для вкладов (плотная или накопитель триплетов)."""
+        if self.backend == "sparse":
+            return SparseMatrixBuilder((n_rows, n_cols))
+        return np.zeros((n_rows, n_cols))
+
+    @staticmethod
+    def _finalize_matrix(A):
+        """Перевести накопленные триплеты в CSR; плотные матрицы и векторы не меняются."""
+        if isinstance(A, SparseMatrixBuilder):
+            return A.tocsr()
+        return A
+
+    def _finalize_matrices(self, matrices: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        for key, value in matrices.items():
+            matrices[key] = self._finalize_matrix(value)
+        return matrices
     
     def assemble(self) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -511,7 +566,7 @@ class MatrixAssembler:
         
         # Создать глобальные матрицу и вектор
         n_dofs = self.total_dofs()
-        A = np.zeros((n_dofs, n_dofs))
+        A = self._zeros_matrix(n_dofs, n_dofs)
         b = np.zeros(n_dofs)
         
         # Собрать вклады
@@ -519,7 +574,7 @@ class MatrixAssembler:
             contribution.contribute_to_stiffness(A, index_map)
             contribution.contribute_to_load(b, index_map)
         
-        return A, b
+        return self._finalize_matrix(A), b
 
     def assemble_dynamic_system(self) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -534,9 +589,9 @@ class MatrixAssembler:
         # Создать глобальные матрицы и вектор
         n_dofs = self.total_dofs()
         
-        A = np.zeros((n_dofs, n_dofs))
-        C = np.zeros((n_dofs, n_dofs))
-        K = np.zeros((n_dofs, n_dofs))
+        A = self._zeros_matrix(n_dofs, n_dofs)
+        C = self._zeros_matrix(n_dofs, n_dofs)
+        K = self._zeros_matrix(n_dofs, n_dofs)
         b = np.zeros(n_dofs)
 
         matrices = {
@@ -549,7 +604,7 @@ class MatrixAssembler:
         for contribution in self.contributions:
             contribution.contribute(matrices, index_map)
 
-        return matrices
+        return self._finalize_matrices(matrices)
 
 
     def assemble_stiffness_problem(self) -> Tuple[np.ndarray, np.ndarray]:
@@ -564,7 +619,7 @@ class MatrixAssembler:
         
         # Создать глобальные матрицу и вектор
         n_dofs = self.total_dofs()
-        K = np.zeros((n_dofs, n_dofs))
+        K = self._zeros_matrix(n_dofs, n_dofs)
         b = np.zeros(n_dofs)
         
         # Собрать вклады
@@ -572,7 +627,7 @@ class MatrixAssembler:
             contribution.contribute_to_stiffness(K, index_map)
             contribution.contribute_to_load(b, index_map)
         
-        return K, b
+        return self._finalize_matrix(K), b
     
     def assemble_static_problem(self) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -586,7 +641,7 @@ class MatrixAssembler:
         
         # Создать глобальные матрицу и вектор
         n_dofs = self.total_dofs()
-        K = np.zeros((n_dofs, n_dofs))
+        K = self._zeros_matrix(n_dofs, n_dofs)
         b = np.zeros(n_dofs)
         
         # Собрать вклады
@@ -594,7 +649,7 @@ class MatrixAssembler:
             contribution.contribute_to_mass(K, index_map)
             contribution.contribute_to_load(b, index_map)
         
-        return K, b
+        return self._finalize_matrix(K), b
     
     def assemble_dynamic_problem(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -608,9 +663,9 @@ class MatrixAssembler:
 
         # Создать глобальные матрицы и вектор
         n_dofs = self.total_dofs()
-        A = np.zeros((n_dofs, n_dofs))
-        C = np.zeros((n_dofs, n_dofs))
-        K = np.zeros((n_dofs, n_dofs))
+        A = self._zeros_matrix(n_dofs, n_dofs)
+        C = self._zeros_matrix(n_dofs, n_dofs)
+        K = self._zeros_matrix(n_dofs, n_dofs)
         b = np.zeros(n_dofs)
         
         # Собрать вклады
@@ -620,7 +675,7 @@ class MatrixAssembler:
             contribution.contribute_to_stiffness(K, index_map)
             contribution.contribute_to_load(b, index_map)
 
-        return A, C, K, b
+        return self._finalize_matrix(A), self._finalize_matrix(C), self._finalize_matrix(K), b
 
     def assemble_constraints(self) -> Tuple[np.ndarray, np.ndarray]:    
         index_map = self.index_map()
@@ -631,8 +686,8 @@ class MatrixAssembler:
         n_dofs = self.total_dofs()
 
         # Создать матрицу связей (n_constraints × n_dofs)
-        H = np.zeros((n_hconstraints, n_dofs))
-        N = np.zeros((n_nhconstraints, n_dofs))
+        H = self._zeros_matrix(n_hconstraints, n_dofs)
+        N = self._zeros_matrix(n_nhconstraints, n_dofs)
         dH = np.zeros(n_hconstraints)
         dN = np.zeros(n_nhconstraints)
 
@@ -642,7 +697,7 @@ class MatrixAssembler:
             constraint.contribute_to_nonholonomic(N, index_map, self._nonholonomic_index_map)
             constraint.contribute_to_holonomic_load(dH, self._holonomic_index_map)
 
-        return H, N, dH, dN
+        return self._finalize_matrix(H), self._finalize_matrix(N), dH, dN
 
     def make_extended_system(
             self, A, C, K, b, H, N, dH, dN, q, q_d) -> Tuple[np.ndarray, np.ndarray]:
@@ -651,6 +706,16 @@ class MatrixAssembler:
         """
         n_dofs = A.shape[0] + H.shape[0] + N.shape[0]
 
+        if is_sparse(A):
+            sizes = [A.shape[0], H.shape[0], N.shape[0]]
+            A_ext = bmat([
+                [A, as_csr(H).T, as_csr(N).T],
+                [H, None, None],
+                [N, None, None],
+            ], sizes, sizes)
+            b_ext = np.concatenate([b - C @ q_d - K @ q, dH, dN])
+            return A_ext, b_ext
+
         A_ext = np.zeros((n_dofs, n_dofs))
         b_ext = np.zeros(n_dofs)
 
@@ -749,25 +814,15 @@ class MatrixAssembler:
         Returns:
             x: Вектор решения
         """
+        if is_sparse(A):
+            if self.sparse_solver == "dense":
+                A = as_dense(A)
+            else:
+                return self._solve_sparse_system(as_csr(A), b, check_conditioning, use_least_squares)
+
         # Проверка обусловленности
         if check_conditioning:
-            cond_number = np.linalg.cond(A)
-            if cond_number > 1e10:
-                import warnings
-                warnings.warn(
-                    f"Матрица плохо обусловлена: cond(A) = {cond_number:.2e}. "
-                    f"Это может быть из-за penalty method в граничных условиях. "
-                    f"Рассмотрите использование use_least_squares=True",
-                    RuntimeWarning,
-                    stacklevel=2,
-                )
-            elif cond_number > 1e6:
-                import warnings
-                warnings.warn(
-                    f"Матрица имеет высокое число обусловленности: cond(A) = {cond_number:.2e}",
-                    RuntimeWarning,
-                    stacklevel=2,
-                )
+            self._warn_conditioning(np.linalg.cond(A), "cond(A)")
 
         # Решение системы
         if use_least_squares:
@@ -795,6 +850,86 @@ class MatrixAssembler:
         
         return x
 
+    @staticmethod
+    def _warn_conditioning(cond_number: float, label: str):
+        """Предупредить о плохой обусловленности."""
+        import warnings
+        if cond_number > 1e10:
+            warnings.warn(
+                f"Матрица плохо обусловлена: {label} = {cond_number:.2e}. "
+                f"Это может быть из-за penalty method в граничных условиях. "
+                f"Рассмотрите использование use_least_squares=True",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        elif cond_number > 1e6:
+            warnings.warn(
+                f"Матрица имеет высокое число обусловленности: {label} = {cond_number:.2e}",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+    def _solve_sparse_system(self, A, b,
+                             check_conditioning: bool = True,
+                             use_least_squares: bool = False) -> np.ndarray:
+        """
+        Решить разреженную систему A*x = b методом self.sparse_solver.
+
+        Обусловленность оценивается дёшево (Hager-Higham, cond₁) по уже
+        построенному разложению вместо SVD; для "cg" вместо неё проверяется
+        сходимость. use_least_squares решает задачу наименьших квадратов CGLS.
+        """
+        import warnings
+
+        if use_least_squares:
+            x, info = cgls(A, b)
+            if check_conditioning and info != 0:
+                warnings.warn(
+                    f"CGLS не сошёлся за {info} итераций: матрица вырожденная "
+                    f"или очень плохо обусловлена",
+                    RuntimeWarning,
+                    stacklevel=3,
+                )
+            return x
+
+        if self.sparse_solver == "cg":
+            x, info = conjugate_gradient(A, b)
+            if info != 0:
+                raise RuntimeError(
+                    f"Метод сопряжённых градиентов не сошёлся за {info} итераций. "
+                    f"CG применим только к симметричным положительно определённым матрицам; "
+                    f"используйте sparse_solver='direct'"
+                )
+            return x
+
+        try:
+            factorization = BandedFactorization(A)
+        except np.linalg.LinAlgError as e:
+            raise RuntimeError(
+                f"Не удалось решить систему: {e}. "
+                f"Возможно, матрица вырожденная (не хватает граничных условий?) "
+                f"или плохо обусловлена. Попробуйте use_least_squares=True"
+            ) from e
+
+        if check_conditioning:
+            self._warn_conditioning(estimate_condition(A, factorization), "cond₁(A) ≈")
+        return factorization.solve(b)
+
+    def solve_system(self, A, b,
+                     check_conditioning: bool = True,
+                     use_least_squares: bool = False) -> np.ndarray:
+        """
+        Решить систему A*x = b (плотную или разреженную) решателем assembler-а.
+
+        Args:
+            A: Матрица системы (np.ndarray или CSRMatrix)
+            b: Вектор правой части
+            check_conditioning: Проверить обусловленность матрицы и выдать предупреждение
+            use_least_squares: Решать задачу наименьших квадратов
+        """
+        return self._solve_system(A, b, check_conditioning=check_conditioning,
+                                  use_least_squares=use_least_squares)
+
     # def state_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
     #     """
     #     Собрать векторы состояния x и x_dot из текущих значений переменных
@@ -921,6 +1056,7 @@ class MatrixAssembler:
             - max_eigenvalue: максимальное собственное значение
         """
         A, b = self.assemble()
+        A = as_dense(A)
         
         info = {}
         
@@ -977,6 +1113,7 @@ class MatrixAssembler:
         Returns:
             Строковое представление системы
         """
+        A_ext = as_dense(A_ext)
         lines = []
         for i in range(A_ext.shape[0]):
             row_terms = []
@@ -1032,6 +1169,7 @@ class MatrixAssembler:
         """
         import numpy as np
 
+        A = as_dense(A)
         U, S, Vt = np.linalg.svd(A)
         rank = np.sum(S > tol)
         nullity = A.shape[0] - rank
@@ -1,12 +1,172 @@
 from termin.fem.assembler import MatrixAssembler, Variable
-from typing import Dict, List, Tuple
+from termin.fem.sparse import BandedFactorization, SparseMatrixBuilder, as_csr, bmat, is_sparse
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 from termin.linalg.subspaces import project_onto_affine, metric_project_onto_constraints 
 
+
+class _DiscardMatrix:
+    """Приёмник A[key] += value, который ничего не сохраняет."""
+
+    ndim = 2
+
+    def __init__(self, shape: Tuple[int, int]):
+        self.shape = shape
+
+    def __getitem__(self, key):
+        return self
+
+    def __setitem__(self, key, value):
+        pass
+
+    def __iadd__(self, value):
+        return self
+
+    def __isub__(self, value):
+        return self
+
+
+class _StepCache:
+    """
+    Данные, переживающие шаг по времени, пока не меняется топология
+    (состав переменных, вкладов и связей).
+    """
+
+    def __init__(self, topology_version: int):
+        self.topology_version = topology_version
+        # kind -> {имя матрицы -> сумма вкладов с time_varying = False}
+        self.constant_matrices: Dict[str, Dict[str, np.ndarray]] = {}
+        # kind -> последнее разложение (символическая часть + численная)
+        self.factorizations: Dict[str, BandedFactorization] = {}
+        # (M, M⁻¹) для плотной метрической проекции
+        self.mass_inverse: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+
+def _is_matrix(value) -> bool:
+    return isinstance(value, SparseMatrixBuilder) or (isinstance(value, np.ndarray) and value.ndim == 2)
+
+
 class DynamicMatrixAssembler(MatrixAssembler):
-    def __init__(self):
-        super().__init__()
+    """
+    Сборщик динамических (многотельных, электрических) систем.
+
+    step_cache=True включает кэш между шагами по времени:
+    - матрицы вкладов с time_varying = False собираются один раз,
+      на следующих шагах пересобираются только их векторы;
+    - разложение расширенной системы и KKT-систем проекции хранится:
+      если матрица не изменилась, выполняются только прямой и обратный ход,
+      если изменились только значения — только численное разложение
+      (RCM-перестановка и раскладка по блокам переиспользуются).
+    Кэш сбрасывается сам при изменении топологии; после изменения
+    параметров вклада (масса, геометрия шарнира) вызовите invalidate_step_cache().
+    """
+
+    def __init__(self, backend: str = "dense", sparse_solver: str = "direct", step_cache: bool = False):
+        super().__init__(backend=backend, sparse_solver=sparse_solver)
         self.time_step = 0.01
+        self.step_cache = step_cache
+        self._step_cache: Optional[_StepCache] = None
+        self.step_cache_stats = {"symbolic": 0, "numeric": 0, "reused": 0}
+
+    def invalidate_step_cache(self):
+        """Сбросить кэш шага (собранные постоянные матрицы и разложения)."""
+        self._step_cache = None
+
+    def _active_step_cache(self) -> Optional[_StepCache]:
+        if not self.step_cache:
+            return None
+        if self._step_cache is None or self._step_cache.topology_version != self._topology_version:
+            self._step_cache = _StepCache(self._topology_version)
+        return self._step_cache
+
+    def _contribute_all(self, kind: str, matrices: Dict[str, np.ndarray],
+                        index_maps: Dict[str, Dict[Variable, List[int]]],
+                        correction: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Собрать вклады всех contributions в matrices.
+
+        С кэшем шага матрицы постоянных вкладов берутся из кэша: на первом
+        шаге они собираются отдельно, на следующих их запись в матрицы
+        отбрасывается, а векторы собираются как обычно.
+        """
+        def contribute(contribution, target):
+            if correction:
+                contribution.contribute_for_constraints_correction(target, index_maps)
+            else:
+                contribution.contribute(target, index_maps)
+
+        cache = self._active_step_cache()
+        if cache is None:
+            for contribution in self.contributions:
+                contribute(contribution, matrices)
+            return self._finalize_matrices(matrices)
+
+        matrix_keys = [key for key, value in matrices.items() if _is_matrix(value)]
+        constant = cache.constant_matrices.get(kind)
+        if constant is None:
+            collect = {key: self._zeros_matrix(*matrices[key].shape) for key in matrix_keys}
+        else:
+            collect = {key: _DiscardMatrix(matrices[key].shape) for key in matrix_keys}
+        constant_target = dict(matrices, **collect)
+
+        for contribution in self.contributions:
+            contribute(contribution, matrices if contribution.time_varying else constant_target)
+
+        if constant is None:
+            constant = self._finalize_matrices(collect)
+            cache.constant_matrices[kind] = constant
+
+        self._finalize_matrices(matrices)
+        for key in matrix_keys:
+            varying = matrices[key]
+            if is_sparse(varying) and varying.nnz == 0:
+                matrices[key] = constant[key]
+            else:
+                matrices[key] = varying + constant[key]
+        return matrices
+
+    def solve_step_system(self, A, b: np.ndarray, kind: str = "step") -> np.ndarray:
+        """
+        Решить систему шага по времени (расширенную или KKT-систему проекции).
+
+        Без кэша шага — обычный _solve_system без проверки обусловленности.
+        С кэшем — прямое ленточное разложение, хранящееся между шагами
+        отдельно для каждого kind.
+        """
+        cache = self._active_step_cache()
+        if cache is None:
+            return self._solve_system(A, b, check_conditioning=False)
+        return self._step_factorization(cache, kind, A).solve(b)
+
+    def _step_factorization(self, cache: _StepCache, kind: str, A) -> BandedFactorization:
+        A = as_csr(A)
+        previous = cache.factorizations.get(kind)
+        try:
+            if previous is not None and previous.symbolic.matches(A):
+                if np.array_equal(previous.A.data, A.data):
+                    self.step_cache_stats["reused"] += 1
+                    return previous
+                factorization = previous.refactor(A)
+                self.step_cache_stats["numeric"] += 1
+            else:
+                factorization = BandedFactorization(A)
+                self.step_cache_stats["symbolic"] += 1
+        except np.linalg.LinAlgError as e:
+            raise RuntimeError(
+                f"Не удалось решить систему: {e}. "
+                f"Возможно, матрица вырожденная (не хватает граничных условий?)"
+            ) from e
+        cache.factorizations[kind] = factorization
+        return factorization
+
+    def _mass_inverse(self, M: np.ndarray) -> np.ndarray:
+        """M⁻¹ для плотной проекции; с кэшем шага пересчитывается только при изменении M."""
+        cache = self._active_step_cache()
+        if cache is None:
+            return np.linalg.inv(M)
+        if cache.mass_inverse is None or not np.array_equal(cache.mass_inverse[0], M):
+            cache.mass_inverse = (M.copy(), np.linalg.inv(M))
+        return cache.mass_inverse[1]
 
     def _build_index_maps(self) -> Dict[Variable, List[int]]:
         """
@@ -89,19 +249,16 @@ class DynamicMatrixAssembler(MatrixAssembler):
         #n_charge = self.total_variables_by_tag(tag="charge")
 
         matrices = {
-            "conductance": np.zeros((n_voltage, n_voltage)),
-            "electric_holonomic": np.zeros((n_currents, n_voltage)),
+            "conductance": self._zeros_matrix(n_voltage, n_voltage),
+            "electric_holonomic": self._zeros_matrix(n_currents, n_voltage),
             "electric_holonomic_rhs": np.zeros(n_currents),
             "rhs": np.zeros(n_voltage),
-            "current_to_current": np.zeros((n_currents, n_currents)),
+            "current_to_current": self._zeros_matrix(n_currents, n_currents),
             #"charge_constraint": np.zeros((n_charge, n_voltage)),
             #"charge_constraint_rhs": np.zeros((n_charge)),
         }
 
-        for contribution in self.contributions:
-            contribution.contribute(matrices, index_maps)
-
-        return matrices
+        return self._contribute_all("electric", matrices, index_maps)
 
     def assemble_electromechanic_domain(self):
         # Построить карту индексов
@@ -119,23 +276,20 @@ class DynamicMatrixAssembler(MatrixAssembler):
         n_force = self.total_variables_by_tag(tag="force")
 
         matrices = {
-            "conductance": np.zeros((n_voltage, n_voltage)),
-            "mass": np.zeros((n_acceleration, n_acceleration)),
+            "conductance": self._zeros_matrix(n_voltage, n_voltage),
+            "mass": self._zeros_matrix(n_acceleration, n_acceleration),
             "load" : np.zeros(n_acceleration),
-            "electric_holonomic": np.zeros((n_currents, n_voltage)),
+            "electric_holonomic": self._zeros_matrix(n_currents, n_voltage),
             "electric_holonomic_rhs": np.zeros(n_currents),
-            "current_to_current": np.zeros((n_currents, n_currents)),
-            "holonomic": np.zeros((n_force, n_acceleration)),
-            "electromechanic_coupling": np.zeros((n_acceleration, n_currents)),
-            "electromechanic_coupling_damping": np.zeros((n_acceleration, n_currents)),
+            "current_to_current": self._zeros_matrix(n_currents, n_currents),
+            "holonomic": self._zeros_matrix(n_force, n_acceleration),
+            "electromechanic_coupling": self._zeros_matrix(n_acceleration, n_currents),
+            "electromechanic_coupling_damping": self._zeros_matrix(n_acceleration, n_currents),
             "holonomic_load": np.zeros(n_force),
             "rhs": np.zeros(n_voltage),
         }
 
-        for contribution in self.contributions:
-            contribution.contribute(matrices, index_maps)
-
-        return matrices
+        return self._contribute_all("electromechanic", matrices, index_maps)
 
     def names_from_variables(self, variables: List[Variable]) -> List[str]:
         """Получить список имен переменных из списка Variable"""
@@ -150,9 +304,6 @@ class DynamicMatrixAssembler(MatrixAssembler):
         n_acceleration = self.total_variables_by_tag(tag="acceleration")
         n_force = self.total_variables_by_tag(tag="force")
 
-        A_ext = np.zeros((n_voltage + n_currents + n_acceleration + n_force,
-                          n_voltage + n_currents + n_acceleration + n_force))
-
         b_ext = np.zeros(n_voltage + n_currents + n_acceleration + n_force)
         variables = (
             list(self.index_map_by_tag("voltage").keys()) +
@@ -162,6 +313,18 @@ class DynamicMatrixAssembler(MatrixAssembler):
         )
         variables = self.names_from_variables(variables)
 
+        if is_sparse(matrices["mass"]):
+            sizes = [n_voltage, n_currents, n_acceleration, n_force]
+            A_ext = bmat([
+                [matrices["conductance"], as_csr(matrices["electric_holonomic"]).T, None, None],
+                [matrices["electric_holonomic"], matrices["current_to_current"], None, None],
+                [None, matrices["electromechanic_coupling"], matrices["mass"], as_csr(matrices["holonomic"]).T],
+                [None, None, matrices["holonomic"], None],
+            ], sizes, sizes)
+        else:
+            A_ext = np.zeros((n_voltage + n_currents + n_acceleration + n_force,
+                              n_voltage + n_currents + n_acceleration + n_force))
+
         r0 = n_voltage
         r1 = n_voltage + n_currents
         r2 = n_voltage + n_currents + n_acceleration
@@ -171,17 +334,18 @@ class DynamicMatrixAssembler(MatrixAssembler):
         #c = [r0:r1]
         #a = [r1:r2]
         #f = [r2:r3]
-        A_ext[0:r0, 0:r0] = matrices["conductance"]
-        A_ext[r0:r1, 0:r0] = matrices["electric_holonomic"]
-        A_ext[0:r0, r0:r1] = matrices["electric_holonomic"].T
-        A_ext[r0:r1, r0:r1] = matrices["current_to_current"]
+        if not is_sparse(A_ext):
+            A_ext[0:r0, 0:r0] = matrices["conductance"]
+            A_ext[r0:r1, 0:r0] = matrices["electric_holonomic"]
+            A_ext[0:r0, r0:r1] = matrices["electric_holonomic"].T
+            A_ext[r0:r1, r0:r1] = matrices["current_to_current"]
 
-        A_ext[r1:r2, r1:r2] = matrices["mass"]        
-        A_ext[r2:r3, r1:r2] = matrices["holonomic"]
-        A_ext[r1:r2, r2:r3] = matrices["holonomic"].T
+            A_ext[r1:r2, r1:r2] = matrices["mass"]        
+            A_ext[r2:r3, r1:r2] = matrices["holonomic"]
+            A_ext[r1:r2, r2:r3] = matrices["holonomic"].T
 
-        A_ext[r1:r2, r0:r1] = matrices["electromechanic_coupling"]
-        #A_ext[r0:r1, r1:r2] = matrices["electromechanic_coupling"].T
+            A_ext[r1:r2, r0:r1] = matrices["electromechanic_coupling"]
+            #A_ext[r0:r1, r1:r2] = matrices["electromechanic_coupling"].T
 
         b_ext[0:r0] = matrices["rhs"]
         b_ext[r0:r1] = matrices["electric_holonomic_rhs"]
@@ -199,7 +363,6 @@ class DynamicMatrixAssembler(MatrixAssembler):
         n_voltage = self.total_variables_by_tag(tag="voltage")
         n_currents = self.total_variables_by_tag(tag="current")
 
-        A_ext = np.zeros((n_voltage + n_currents, n_voltage + n_currents))
         b_ext = np.zeros(n_voltage + n_currents)
         variables = (
             list(self.index_map_by_tag("voltage").keys()) +
@@ -211,14 +374,23 @@ class DynamicMatrixAssembler(MatrixAssembler):
         c0 = n_voltage
         c1 = n_voltage + n_currents
 
+        b_ext[0:r0] = matrices["rhs"]
+        b_ext[r0:r1] = matrices["electric_holonomic_rhs"]
+
+        if is_sparse(matrices["conductance"]):
+            sizes = [n_voltage, n_currents]
+            A_ext = bmat([
+                [matrices["conductance"], as_csr(matrices["electric_holonomic"]).T],
+                [matrices["electric_holonomic"], matrices["current_to_current"]],
+            ], sizes, sizes)
+            return A_ext, b_ext, variables
+
+        A_ext = np.zeros((n_voltage + n_currents, n_voltage + n_currents))
         A_ext[0:r0, 0:c0] = matrices["conductance"]
         A_ext[r0:r1, 0:c0] = matrices["electric_holonomic"]
         A_ext[0:r0, c0:c1] = matrices["electric_holonomic"].T
         A_ext[c0:c1, c0:c1] = matrices["current_to_current"]
 
-        b_ext[0:r0] = matrices["rhs"]
-        b_ext[r0:r1] = matrices["electric_holonomic_rhs"]
-
         return A_ext, b_ext, variables 
 
     def assemble(self):
@@ -231,21 +403,18 @@ class DynamicMatrixAssembler(MatrixAssembler):
         n_constraints = self.total_variables_by_tag(tag="force")
 
         matrices = {
-            "mass": np.zeros((n_dofs, n_dofs)),
-            "damping": np.zeros((n_dofs, n_dofs)),
-            "stiffness": np.zeros((n_dofs, n_positions)),
+            "mass": self._zeros_matrix(n_dofs, n_dofs),
+            "damping": self._zeros_matrix(n_dofs, n_dofs),
+            "stiffness": self._zeros_matrix(n_dofs, n_positions),
             "load": np.zeros(n_dofs),
-            "holonomic": np.zeros((n_constraints, n_dofs)),
+            "holonomic": self._zeros_matrix(n_constraints, n_dofs),
             "holonomic_rhs": np.zeros(n_constraints),
             #"old_q": self.collect_variables(index_maps["acceleration"]),
             #"old_q_dot": self.collect_current_q_dot(index_maps["acceleration"]),
             #"holonomic_velocity_rhs": np.zeros(n_constraints),
         }
 
-        for contribution in self.contributions:
-            contribution.contribute(matrices, index_maps)
-
-        return matrices
+        return self._contribute_all("dynamic", matrices, index_maps)
 
     def assemble_for_constraints_correction(self):
         # Построить карту индексов
@@ -256,16 +425,13 @@ class DynamicMatrixAssembler(MatrixAssembler):
         n_constraints = self.total_variables_by_tag(tag="force")
 
         matrices = {
-            "mass": np.zeros((n_dofs, n_dofs)),
-            "holonomic": np.zeros((n_constraints, n_dofs)),
+            "mass": self._zeros_matrix(n_dofs, n_dofs),
+            "holonomic": self._zeros_matrix(n_constraints, n_dofs),
             "position_error": np.zeros(n_constraints),
             "holonomic_velocity_rhs": np.zeros(n_constraints),
         }
 
-        for contribution in self.contributions:
-            contribution.contribute_for_constraints_correction(matrices, index_maps)
-
-        return matrices
+        return self._contribute_all("correction", matrices, index_maps, correction=True)
 
     def assemble_extended_system(self, matrices: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
         A = matrices["mass"]
@@ -286,7 +452,6 @@ class DynamicMatrixAssembler(MatrixAssembler):
         n_holonomic = self.total_variables_by_tag(tag="force")
 
         # Расширенная система
-        A_ext = np.zeros((size, size))
         b_ext = np.zeros(size)
 
         r0 = A.shape[0]
@@ -295,11 +460,19 @@ class DynamicMatrixAssembler(MatrixAssembler):
         c0 = A.shape[1]
         c1 = A.shape[1] + n_holonomic
 
+        b_ext[0:r0] = b - C @ old_q_dot - K @ old_q
+        b_ext[r0:r1] = h
+
+        if is_sparse(A):
+            # KKT-система [[A, Hᵀ], [H, 0]] в CSR
+            sizes = [r0, n_holonomic]
+            A_ext = bmat([[A, as_csr(H).T], [H, None]], sizes, sizes)
+            return A_ext, b_ext, variables
+
+        A_ext = np.zeros((size, size))
         A_ext[0:r0, 0:c0] = A
         A_ext[0:r0, c0:c1] = H.T
         A_ext[r0:r1, 0:c0] = H
-        b_ext[0:r0] = b - C @ old_q_dot - K @ old_q
-        b_ext[r0:r1] = h
 
         return A_ext, b_ext, variables
 
@@ -308,7 +481,9 @@ class DynamicMatrixAssembler(MatrixAssembler):
         H = matrices["holonomic"]
         h = matrices["holonomic_velocity_rhs"]
         M = matrices["mass"]
-        M_inv = np.linalg.inv(M)
+        if is_sparse(M):
+            return self._metric_project_sparse(q_dot, H, M, H @ q_dot - h)
+        M_inv = self._mass_inverse(M)
         return metric_project_onto_constraints(q_dot, H, M_inv, h=h)
 
     def coords_project_onto_constraints(self, q: np.ndarray, matrices: Dict[str, np.ndarray]) -> np.ndarray:
@@ -316,28 +491,43 @@ class DynamicMatrixAssembler(MatrixAssembler):
         H = matrices["holonomic"]
         f = matrices["position_error"]
         M = matrices["mass"]
-        M_inv = np.linalg.inv(M)
+        if is_sparse(M):
+            return self._metric_project_sparse(q, H, M, f)
+        M_inv = self._mass_inverse(M)
         return metric_project_onto_constraints(q, H, M_inv, error=f)
 
+    def _metric_project_sparse(self, q: np.ndarray, H, M, error: np.ndarray) -> np.ndarray:
+        """
+        Метрическая проекция (как metric_project_onto_constraints) без M⁻¹:
+        решается KKT-система [[M, Hᵀ], [H, 0]] [dq, λ] = [0, -error], q + dq.
+        """
+        n_dofs = M.shape[0]
+        n_constraints = H.shape[0]
+        if n_constraints == 0:
+            return q
+        sizes = [n_dofs, n_constraints]
+        K = bmat([[M, as_csr(H).T], [H, None]], sizes, sizes)
+        rhs = np.concatenate([np.zeros(n_dofs), -np.asarray(error, dtype=float)])
+        dq = self.solve_step_system(K, rhs, kind="projection")[:n_dofs]
+        return q + dq
+
     def collect_variables(self, tag: str) -> np.ndarray:
         """Собрать текущее значение переменных с заданным тегом из всех переменных"""
         q = np.zeros(self.total_variables_by_tag(tag))
         index_map = self.index_map_by_tag(tag)
-        for var in self.variables:
-            if var.tag == tag:
-                indices = index_map[var]
-                q[indices] = var.value  # текущее значение
+        for var in self._variables_by_tag.get(tag, []):
+            indices = index_map[var]
+            q[indices] = var.value  # текущее значение
         return q
 
     def upload_variables(self, tag: str, values: np.ndarray):
         """Загрузить значения переменных с заданным тегом обратно в переменные"""
         index_map = self.index_map_by_tag(tag)
         count = 0
-        for var in self.variables:
-            if var.tag == tag:
-                indices = index_map[var]
-                var.set_value(values[indices])
-                count += var.size
+        for var in self._variables_by_tag.get(tag, []):
+            indices = index_map[var]
+            var.set_value(values[indices])
+            count += var.size
         if count != len(values):
             raise ValueError("Количество загруженных значений не соответствует количеству переменных с заданным тегом")
 
@@ -38,6 +38,8 @@ class RigidBody2D(Contribution):
     Глобальная поза хранится отдельно и используется только для обновления геометрии.
     """
 
+    time_varying = False
+
     def __init__(
         self,
         inertia: SpatialInertia2D,
@@ -142,6 +144,9 @@ class RigidBody2D(Contribution):
 
 class ForceOnBody2D(Contribution):
     """Внешняя сила и момент в локальной СК тела."""
+
+    time_varying = False
+
     def __init__(self, body: RigidBody2D, wrench: Screw2,
                  in_local_frame: bool = True, assembler=None):
         self.body = body
@@ -161,6 +166,9 @@ class FixedRotationJoint2D(Contribution):
     Все уравнения формулируются в локальной СК тела.
     Лямбда — сила, действующая на тело, в локальной СК тела.
     """
+
+    time_varying = False
+
     def __init__(self,
                  body: RigidBody2D,
                  coords_of_joint: np.ndarray = None,
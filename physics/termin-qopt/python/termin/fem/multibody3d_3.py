@@ -69,6 +69,8 @@ class RigidBody3D(Contribution):
         [ v_x, v_y, v_z, ω_x, ω_y, ω_z ]
     """
 
+    time_varying = False
+
     def __init__(
         self,
         inertia: SpatialInertia3D,
@@ -195,6 +197,8 @@ class RigidBody3D(Contribution):
 class ForceOnBody3D(Contribution):
     """Внешний пространственный винт (сила+момент) в локальной СК тела."""
 
+    time_varying = False
+
     def __init__(self,
                  body: RigidBody3D,
                  wrench: Screw3,
@@ -225,6 +229,8 @@ class FixedRotationJoint3D(Contribution):
     - лямбда — линейная сила в локальной СК тела (3 компоненты).
     """
 
+    time_varying = False
+
     def __init__(self,
                  body: RigidBody3D,
                  coords_of_joint: np.ndarray = None,
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# coding:utf-8
+
+import itertools
+import unittest
+import warnings
+import numpy as np
+
+from termin.fem.assembler import (
+    MatrixAssembler,
+    Contribution,
+    Variable,
+    LoadContribution,
+    ConstraintContribution,
+)
+from termin.fem.dynamic_assembler import DynamicMatrixAssembler
+from termin.fem.electrical_2 import Resistor, VoltageSource, Ground, ElectricalNode
+from termin.fem.mechanic import BeamElement2D
+from termin.fem.sparse import (
+    BandedFactorization,
+    CSRMatrix,
+    SparseMatrixBuilder,
+    conjugate_gradient,
+    estimate_condition,
+)
+
+
+def _chain_kkt(n_bodies: int, seed: int = 0):
+    """KKT-матрица цепочки тел (6 DOF) с шарнирами (3 связи) между соседями."""
+    rng = np.random.default_rng(seed)
+    n = 6 * n_bodies
+    m = 3 * (n_bodies - 1)
+    M = np.zeros((n, n))
+    for k in range(n_bodies):
+        R = rng.normal(size=(6, 6))
+        M[6 * k:6 * k + 6, 6 * k:6 * k + 6] = R @ R.T + 6.0 * np.eye(6)
+    H = np.zeros((m, n))
+    for k in range(n_bodies - 1):
+        H[3 * k:3 * k + 3, 6 * k:6 * k + 12] = rng.normal(size=(3, 12))
+    K = np.block([[M, H.T], [H, np.zeros((m, m))]])
+    return K, rng.normal(size=n + m)
+
+
+class ChainBodyContribution(Contribution):
+    """Тело цепочки: блок массы и нагрузка."""
+
+    def __init__(self, acceleration: Variable, mass: np.ndarray, load: np.ndarray, assembler):
+        self.mass = mass
+        self.load = load
+        super().__init__([acceleration], assembler=assembler)
+
+    def contribute(self, matrices, index_maps):
+        idx = index_maps["acceleration"][self.variables[0]]
+        matrices["mass"][np.ix_(idx, idx)] += self.mass
+        matrices["load"][idx] += self.load
+
+    def contribute_for_constraints_correction(self, matrices, index_maps):
+        idx = index_maps["acceleration"][self.variables[0]]
+        matrices["mass"][np.ix_(idx, idx)] += self.mass
+
+
+class ChainJointContribution(Contribution):
+    """Связь между соседними телами: J_a·a_a - J_b·a_b = 0."""
+
+    def __init__(self, body_a: Variable, body_b: Variable, force: Variable, J: np.ndarray, assembler):
+        self.J = J
+        self.force = force
+        super().__init__([body_a, body_b, force], assembler=assembler)
+
+    def contribute(self, matrices, index_maps):
+        a = index_maps["acceleration"][self.variables[0]]
+        b = index_maps["acceleration"][self.variables[1]]
+        f = index_maps["force"][self.force]
+        matrices["holonomic"][np.ix_(f, a)] += self.J
+        matrices["holonomic"][np.ix_(f, b)] -= self.J
+
+    def contribute_for_constraints_correction(self, matrices, index_maps):
+        a = index_maps["acceleration"][self.variables[0]]
+        b = index_maps["acceleration"][self.variables[1]]
+        f = index_maps["force"][self.force]
+        matrices["holonomic"][np.ix_(f, a)] += self.J
+        matrices["holonomic"][np.ix_(f, b)] -= self.J
+        matrices["position_error"][f] += 0.01 * (np.arange(len(f)) + 1.0)
+
+
+def _build_chain(backend: str, n_bodies: int = 20) -> DynamicMatrixAssembler:
+    rng = np.random.default_rng(7)
+    assembler = DynamicMatrixAssembler(backend=backend)
+    bodies = []
+    for k in range(n_bodies):
+        acc = Variable(f"a{k}", size=3, tag="acceleration")
+        acc.value = np.zeros(3)
+        R = rng.normal(size=(3, 3))
+        ChainBodyContribution(acc, R @ R.T + 3.0 * np.eye(3), rng.normal(size=3), assembler)
+        bodies.append(acc)
+    for k in range(n_bodies - 1):
+        force = Variable(f"f{k}", size=2, tag="force")
+        ChainJointContribution(bodies[k], bodies[k + 1], force, rng.normal(size=(2, 3)), assembler)
+    for tag in ("velocity", "position"):
+        for k in range(n_bodies):
+            var = Variable(f"{tag}{k}", size=3, tag=tag)
+            var.value = np.zeros(3)
+            assembler._register_variable(var)
+    return assembler
+
+
+class TestSparseMatrixBuilder(unittest.TestCase):
+    """Накопитель триплетов повторяет семантику A[key] += value плотной матрицы"""
+
+    def test_index_forms_match_dense(self):
+        builder = SparseMatrixBuilder((5, 6))
+        dense = np.zeros((5, 6))
+        for A in (builder, dense):
+            A[1, 2] += 3.0
+            A[np.ix_([0, 4], [1, 5])] += np.array([[1.0, 2.0], [3.0, 4.0]])
+            A[[2, 3], [3, 4]] -= 1.5
+            A[0:2, 0] += 2.0
+            A[4, 1] += 1.0
+        np.testing.assert_array_equal(builder.toarray(), dense)
+
+    def test_assignment_is_rejected(self):
+        builder = SparseMatrixBuilder((2, 2))
+        with self.assertRaises(TypeError):
+            builder[0, 0] = 1.0
+
+    def test_csr_products(self):
+        rng = np.random.default_rng(1)
+        dense = rng.normal(size=(6, 4)) * (rng.random((6, 4)) < 0.5)
+        A = CSRMatrix.from_dense(dense)
+        x = rng.normal(size=4)
+        y = rng.normal(size=6)
+        np.testing.assert_allclose(A @ x, dense @ x)
+        np.testing.assert_allclose(y @ A, y @ dense)
+        np.testing.assert_allclose((A.T @ A).toarray(), dense.T @ dense)
+        np.testing.assert_allclose(A.T.toarray(), dense.T)
+
+
+class TestSparseSolvers(unittest.TestCase):
+    """Разреженные решатели совпадают с плотным эталоном"""
+
+    def test_banded_factorization_kkt(self):
+        K, b = _chain_kkt(40)
+        factorization = BandedFactorization(CSRMatrix.from_dense(K))
+        x = factorization.solve(b)
+        np.testing.assert_allclose(x, np.linalg.solve(K, b), rtol=1e-9, atol=1e-9)
+        # Лента цепочки после RCM не зависит от её длины
+        self.assertLess(factorization.bandwidth, 20)
+
+    def test_banded_factorization_unsymmetric(self):
+        K, b = _chain_kkt(10, seed=3)
+        K[0, -1] += 0.5
+        x = BandedFactorization(CSRMatrix.from_dense(K)).solve(b)
+        np.testing.assert_allclose(x, np.linalg.solve(K, b), rtol=1e-9, atol=1e-9)
+
+    def test_condition_estimate(self):
+        K, _ = _chain_kkt(15, seed=5)
+        estimate = estimate_condition(CSRMatrix.from_dense(K))
+        exact = np.linalg.cond(K, 1)
+        self.assertLessEqual(estimate, exact * (1.0 + 1e-6))
+        self.assertGreater(estimate, exact / 10.0)
+
+    def test_conjugate_gradient_spd(self):
+        rng = np.random.default_rng(2)
+        R = rng.normal(size=(30, 30))
+        S = R @ R.T + 30.0 * np.eye(30)
+        b = rng.normal(size=30)
+        x, info = conjugate_gradient(CSRMatrix.from_dense(S), b)
+        self.assertEqual(info, 0)
+        np.testing.assert_allclose(x, np.linalg.solve(S, b), rtol=1e-8, atol=1e-10)
+
+
+class TestSparseAssembler(unittest.TestCase):
+    """Бэкенд sparse даёт те же системы и решения, что и dense"""
+
+    def _beam(self, backend: str, sparse_solver: str = "direct") -> MatrixAssembler:
+        """Консольная балка из 20 элементов с нагрузкой на конце."""
+        assembler = MatrixAssembler(backend=backend, sparse_solver=sparse_solver)
+        nodes = []
+        for i in range(21):
+            nodes.append((assembler.add_variable(f"v{i}"), assembler.add_variable(f"theta{i}")))
+        for (v1, t1), (v2, t2) in itertools.pairwise(nodes):
+            assembler.add_contribution(BeamElement2D(v1, t1, v2, t2, 200e9, 1e-6, 0.1))
+        assembler.add_contribution(ConstraintContribution(nodes[0][0], value=0.0))
+        assembler.add_contribution(ConstraintContribution(nodes[0][1], value=0.0))
+        assembler.add_contribution(LoadContribution(nodes[-1][0], load=[-100.0]))
+        return assembler
+
+    def test_stiffness_problem_matches_dense(self):
+        K_dense, b_dense = self._beam("dense").assemble_stiffness_problem()
+        K_sparse, b_sparse = self._beam("sparse").assemble_stiffness_problem()
+        self.assertIsInstance(K_sparse, CSRMatrix)
+        np.testing.assert_allclose(K_sparse.toarray(), K_dense)
+        np.testing.assert_allclose(b_sparse, b_dense)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            x_dense = self._beam("dense").solve_stiffness_problem()
+            for solver in ("direct", "cg", "dense"):
+                x_sparse = self._beam("sparse", solver).solve_stiffness_problem()
+                np.testing.assert_allclose(x_sparse, x_dense, rtol=1e-6, atol=1e-12)
+
+    def test_sparse_conditioning_warning(self):
+        assembler = self._beam("sparse")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assembler.solve_stiffness_problem()
+        self.assertTrue(any("cond₁(A)" in str(w.message) for w in caught))
+
+    def test_extended_system_matches_dense(self):
+        dense = _build_chain("dense")
+        sparse = _build_chain("sparse")
+
+        A_dense, b_dense, names = dense.assemble_extended_system(dense.assemble())
+        A_sparse, b_sparse, sparse_names = sparse.assemble_extended_system(sparse.assemble())
+        self.assertIsInstance(A_sparse, CSRMatrix)
+        self.assertEqual(names, sparse_names)
+        np.testing.assert_allclose(A_sparse.toarray(), A_dense)
+        np.testing.assert_allclose(b_sparse, b_dense)
+
+        x = sparse.solve_system(A_sparse, b_sparse)
+        np.testing.assert_allclose(x, np.linalg.solve(A_dense, b_dense), rtol=1e-9, atol=1e-9)
+
+    def test_constraint_projection_matches_dense(self):
+        dense = _build_chain("dense")
+        sparse = _build_chain("sparse")
+        q = np.random.default_rng(4).normal(size=dense.total_variables_by_tag("acceleration"))
+
+        projected_dense = dense.coords_project_onto_constraints(q, dense.assemble_for_constraints_correction())
+        projected_sparse = sparse.coords_project_onto_constraints(q, sparse.assemble_for_constraints_correction())
+        np.testing.assert_allclose(projected_sparse, projected_dense, rtol=1e-9, atol=1e-12)
+
+    def test_electric_extended_system(self):
+        v1 = ElectricalNode("V1")
+        v2 = ElectricalNode("V2")
+        assembler = DynamicMatrixAssembler(backend="sparse")
+        VoltageSource(v1, v2, 5.0, assembler)
+        Resistor(v1, v2, 10.0, assembler)
+        Ground(v2, assembler)
+
+        A_ext, b_ext, _ = assembler.assemble_extended_system_for_electric(assembler.assemble_electric_domain())
+        x = assembler.solve_system(A_ext, b_ext, check_conditioning=False)
+        np.testing.assert_allclose(x, [5.0, 0.0, 0.5, 0.0], atol=1e-12)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            MatrixAssembler(backend="gpu")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# coding:utf-8
+
+import unittest
+import numpy as np
+
+from termin.fem.assembler import Contribution, Variable
+from termin.fem.dynamic_assembler import DynamicMatrixAssembler
+from termin.fem.sparse import BandedFactorization, CSRMatrix, as_dense
+
+
+class ConstantBody(Contribution):
+    """Тело с постоянной массой; нагрузка зависит от текущей скорости."""
+
+    time_varying = False
+
+    def __init__(self, acceleration: Variable, velocity: Variable, mass: np.ndarray, assembler):
+        self.mass = mass
+        self.velocity = velocity
+        super().__init__([acceleration, velocity], assembler=assembler)
+
+    def contribute(self, matrices, index_maps):
+        idx = index_maps["acceleration"][self.variables[0]]
+        matrices["mass"][np.ix_(idx, idx)] += self.mass
+        matrices["load"][idx] += 1.0 - self.velocity.value
+
+    def contribute_for_constraints_correction(self, matrices, index_maps):
+        idx = index_maps["acceleration"][self.variables[0]]
+        matrices["mass"][np.ix_(idx, idx)] += self.mass
+
+
+class TurningJoint(Contribution):
+    """Связь с якобианом, поворачивающимся на каждом шаге."""
+
+    def __init__(self, body_a: Variable, body_b: Variable, force: Variable, assembler):
+        self.angle = 0.1
+        self.force = force
+        super().__init__([body_a, body_b, force], assembler=assembler)
+
+    def jacobian(self) -> np.ndarray:
+        c, s = np.cos(self.angle), np.sin(self.angle)
+        return np.array([[c, -s, 0.5], [s, c, 0.0]])
+
+    def contribute(self, matrices, index_maps):
+        a = index_maps["acceleration"][self.variables[0]]
+        b = index_maps["acceleration"][self.variables[1]]
+        f = index_maps["force"][self.force]
+        matrices["holonomic"][np.ix_(f, a)] += self.jacobian()
+        matrices["holonomic"][np.ix_(f, b)] -= np.eye(2, 3)
+        matrices["holonomic_rhs"][f] += self.angle
+
+
+def _build(backend: str, step_cache: bool, n_bodies: int = 6) -> DynamicMatrixAssembler:
+    rng = np.random.default_rng(11)
+    assembler = DynamicMatrixAssembler(backend=backend, step_cache=step_cache)
+    accelerations = []
+    for k in range(n_bodies):
+        acc = Variable(f"a{k}", size=3, tag="acceleration")
+        vel = Variable(f"v{k}", size=3, tag="velocity")
+        pos = Variable(f"p{k}", size=3, tag="position")
+        vel.value = rng.normal(size=3)
+        pos.value = np.zeros(3)
+        R = rng.normal(size=(3, 3))
+        ConstantBody(acc, vel, R @ R.T + 3.0 * np.eye(3), assembler)
+        assembler._register_variable(pos)
+        accelerations.append(acc)
+    for k in range(n_bodies - 1):
+        force = Variable(f"f{k}", size=2, tag="force")
+        TurningJoint(accelerations[k], accelerations[k + 1], force, assembler)
+    return assembler
+
+
+def _advance(assembler: DynamicMatrixAssembler, turn: bool):
+    for contribution in assembler.contributions:
+        if isinstance(contribution, ConstantBody):
+            contribution.velocity.value = contribution.velocity.value * 0.9
+        elif turn:
+            contribution.angle += 0.05
+
+
+def _step(assembler: DynamicMatrixAssembler) -> np.ndarray:
+    A_ext, b_ext, _ = assembler.assemble_extended_system(assembler.assemble())
+    return assembler.solve_step_system(A_ext, b_ext)
+
+
+class TestStepCache(unittest.TestCase):
+    """Кэш шага даёт те же системы и решения, что и полная пересборка"""
+
+    def test_cached_steps_match_uncached(self):
+        for backend in ("dense", "sparse"):
+            reference = _build(backend, step_cache=False)
+            cached = _build(backend, step_cache=True)
+            for _ in range(4):
+                np.testing.assert_allclose(_step(cached), _step(reference), rtol=1e-9, atol=1e-12)
+
+                m_ref = reference.assemble()
+                m_cached = cached.assemble()
+                for key in ("mass", "holonomic", "load", "holonomic_rhs"):
+                    np.testing.assert_allclose(as_dense(m_cached[key]), as_dense(m_ref[key]))
+                _advance(reference, turn=True)
+                _advance(cached, turn=True)
+
+    def test_factorization_reuse(self):
+        assembler = _build("sparse", step_cache=True)
+        for _ in range(3):
+            _step(assembler)
+            _advance(assembler, turn=False)
+        # Матрица не менялась: одно разложение, дальше только прямой/обратный ход
+        self.assertEqual(assembler.step_cache_stats, {"symbolic": 1, "numeric": 0, "reused": 2})
+
+        _advance(assembler, turn=True)
+        _step(assembler)
+        # Изменились значения, но не шаблон: только численное разложение
+        self.assertEqual(assembler.step_cache_stats["symbolic"], 1)
+        self.assertEqual(assembler.step_cache_stats["numeric"], 1)
+
+    def test_topology_change_resets_cache(self):
+        assembler = _build("sparse", step_cache=True)
+        _step(assembler)
+        n_dofs = assembler.total_variables_by_tag("acceleration")
+
+        acc = Variable("extra", size=3, tag="acceleration")
+        vel = Variable("extra_v", size=3, tag="velocity")
+        ConstantBody(acc, vel, 2.0 * np.eye(3), assembler)
+
+        matrices = assembler.assemble()
+        self.assertEqual(matrices["mass"].shape, (n_dofs + 3, n_dofs + 3))
+        np.testing.assert_allclose(matrices["mass"].toarray()[-3:, -3:], 2.0 * np.eye(3))
+        self.assertEqual(len(_step(assembler)), n_dofs + 3 + assembler.total_variables_by_tag("force"))
+        self.assertEqual(assembler.step_cache_stats["symbolic"], 2)
+
+    def test_refactor_reuses_symbolic(self):
+        rng = np.random.default_rng(5)
+        dense = np.diag(rng.uniform(2.0, 3.0, size=12)) + np.diag(rng.normal(size=11), 1) + np.diag(rng.normal(size=11), -1)
+        first = BandedFactorization(CSRMatrix.from_dense(dense))
+        second = first.refactor(CSRMatrix.from_dense(2.0 * dense))
+        self.assertIs(second.symbolic, first.symbolic)
+        b = rng.normal(size=12)
+        np.testing.assert_allclose(second.solve(b), np.linalg.solve(2.0 * dense, b), rtol=1e-10)
+
+
+if __name__ == "__main__":
+    unittest.main()